@@ -19,6 +19,7 @@ setup(
         "Operating System :: OS Independent",
     ],
     description="Some collections types for working with rapidfuzz library",
+    extras_require={ 'numpy': [ 'numpy', ], },
     install_requires=[ 'rapidfuzz >= 3.6.1', ],
     license="MIT License",
     long_description=long_description,
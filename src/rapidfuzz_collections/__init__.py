@@ -1,11 +1,19 @@
 
+from .coalescer import QueryCoalescer
 from .enums import (
+    IndexType,
     ScorerType,
     Strategy
 )
+from .mapped import MappedCollection
 from .normatlization import Normalizer
 from .rapidfuzz_dict import RapidFuzzDict
 from .rapidfuzz_list import RapidFuzzList
 from .rapidfuzz_set import RapidFuzzSet
 from .rapidfuzz_frozenset import RapidFuzzFrozenSet
 from .rapidfuzz_tuple import RapidFuzzTuple
+from .snapshot import SnapshotCollection
+from .views import (
+    ChoicesGroupView,
+    ChoicesView
+)
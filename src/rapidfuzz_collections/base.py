@@ -1,22 +1,177 @@
 
+from asyncio import get_running_loop
+from collections import (
+    OrderedDict,
+    deque
+)
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor
+)
+from functools import (
+    lru_cache,
+    partial
+)
+from gc import (
+    disable as gc_disable,
+    enable as gc_enable,
+    isenabled as gc_isenabled
+)
+from hashlib import sha256
+from heapq import merge
+from importlib import import_module
+from itertools import (
+    chain,
+    islice
+)
+from os import (
+    PathLike,
+    cpu_count,
+    fspath,
+    replace as os_replace
+)
+from pickle import (
+    HIGHEST_PROTOCOL,
+    PicklingError,
+    dump as pickle_dump,
+    dumps as pickle_dumps,
+    load as pickle_load,
+    loads as pickle_loads
+)
+from threading import Event
+from rapidfuzz import distance as rapidfuzz_distance
 from rapidfuzz.fuzz import WRatio
+from rapidfuzz.process import cdist
 from typing import (
     Any,
-    Generator
+    AsyncGenerator,
+    Callable,
+    Collection,
+    Generator,
+    Iterable,
+    Self,
+    Sequence
 )
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+try:
+    from sys import _is_gil_enabled
+except ImportError:  # pragma: no cover
+    def _is_gil_enabled() -> bool:
+        return True
+
 from .enums import (
+    IndexType,
     ScorerType,
     Strategy
 )
-from .normatlization import Normalizer
+from .indexes import (
+    BKTree,
+    LengthIndex,
+    QGramIndex,
+    SymSpellIndex,
+    has_length_bound,
+    is_deletion_scorer,
+    is_metric_scorer
+)
+from .normatlization import (
+    Normalizer,
+    stable_repr
+)
 from .types import (
+    IndexInfo,
     NormalizerProtocol,
+    ResultCacheInfo,
     ScorerProtocol,
     ScorerResultListType
 )
 
 
+# Maximum number of cells of the scores matrix computed by one `cdist` call.
+CDIST_CHUNK_CELLS = 2 ** 22
+
+# Minimal number of choices for scoring a single query by chunks of choices in parallel threads.
+PARALLEL_MIN_CHOICES = 2 ** 14
+
+# Default number of results in one chunk of `aget_fuzzy_score_iter`.
+ASYNC_CHUNK_SIZE = 2 ** 10
+
+# Number of values in one chunk of normalization of all values (a task of a worker, a step of progress).
+NORMALIZE_CHUNK_SIZE = 2 ** 14
+
+# Minimal number of values for normalization of all values in parallel workers.
+PARALLEL_NORMALIZE_MIN_VALUES = 2 ** 17
+
+# Maximum number of chunks of normalization submitted to workers at once, per worker.
+NORMALIZE_CHUNKS_PER_WORKER = 2
+
+# Signature and version of the format of files of `save` and `load`.
+FILE_MAGIC = b'RFCOLL'
+FILE_VERSION = 1
+
+# Functions of metrics of `rapidfuzz.distance` are compiled in a private module where `pickle` can not find them,
+# so they are pickled by the module of the metric and the name of the function.
+PICKLED_SCORERS: dict[Callable, tuple[str, str]] = {
+    getattr(getattr(rapidfuzz_distance, metric), name): ( f'rapidfuzz.distance.{metric}', name, )
+    for metric in (
+        'DamerauLevenshtein', 'Hamming', 'Indel', 'Jaro', 'JaroWinkler', 'LCSseq', 'Levenshtein', 'OSA', 'Postfix',
+        'Prefix',
+    )
+    for name in ( 'distance', 'normalized_distance', 'normalized_similarity', 'similarity', )
+}
+
+
+# Compiled normalizer of a process of parallel normalization (see `RapidfuzzCollection._normalize_values`).
+_process_normalize = None
+
+
+def _init_normalize_process(normalizer: NormalizerProtocol):
+    global _process_normalize
+    _process_normalize = normalizer.compile() if isinstance(normalizer, Normalizer) else normalizer
+
+
+def _normalize_chunk(values: list, normalize: NormalizerProtocol | None = None) -> list[str | None]:
+    return list(map(_process_normalize if normalize is None else normalize, values))
+
+
+def _map_chunks(
+    executor: Executor,
+    func: Callable[[list], list],
+    chunks: Iterable[list],
+    fallback: Callable[[list], list],
+    limit: int
+) -> Generator[list, None, None]:
+    """
+    Yield results of `func` for chunks in their order. At most `limit` chunks are submitted to the executor at once.
+    If a chunk can not be passed to a process or returned from it (e.g. a value can not be pickled),
+    the executor is shut down and this chunk and the remaining ones are processed by `fallback` in this thread.
+    """
+
+    chunks = iter(chunks)
+    pending = deque()
+    while True:
+        for chunk in islice(chunks, limit - len(pending)):
+            pending.append(( chunk, executor.submit(func, chunk), ))
+        if not pending:
+            return
+
+        chunk, future = pending.popleft()
+        try:
+            result = future.result()
+        except ( AttributeError, PicklingError, TypeError, ):
+            executor.shutdown(cancel_futures=True)
+            for chunk in chain(( chunk, ), ( i for i, _ in pending ), chunks):
+                yield fallback(chunk)
+            return
+
+        yield result
+
+
 class RapidfuzzCollection:
     """
     Base class for extending the collection with fuzzy search functionality.
@@ -30,7 +185,17 @@ class RapidfuzzCollection:
         scorer: ScorerProtocol = WRatio,
         scorer_kwargs: dict[str, Any] | None = None,
         scorer_type: ScorerType = ScorerType.SIMILARITY,
-        strategy: Strategy = Strategy.FIRST_FROM_BEST
+        strategy: Strategy = Strategy.FIRST_FROM_BEST,
+        query_cache_size: int | None = None,
+        result_cache_size: int | None = None,
+        qgram_size: int | None = None,
+        qgram_strictness: int | float = 1,
+        index_type: IndexType | None = None,
+        symspell_distance: int = 2,
+        symspell_max_entries: int | None = None,
+        workers: int = 1,
+        executor: Executor | None = None,
+        progress: Callable[[int, int], Any] | None = None
     ):
         """
         :param normalizer:
@@ -60,6 +225,56 @@ class RapidfuzzCollection:
 
         :param strategy:
         Strategy for searching and returning values.
+
+        :param query_cache_size:
+        Maximum size of the LRU cache of normalized queries (value -> normalized value) for searching.
+        Repeated queries skip the normalizer. Unhashable queries are not cached. `None` deactivates this behaviour.
+
+        :param result_cache_size:
+        Maximum size of the LRU cache of results of `fuzzy_contains`, `fuzzy_get` and `fuzzy_index`
+        by normalized query and search arguments. The cache is invalidated by any change of the collection.
+        `None` deactivates this behaviour.
+
+        :param qgram_size:
+        Length of q-grams of the inverted index of normalized values (e.g. `3` for trigrams).
+        Searching with `score_cutoff` scores only choices which share enough q-grams with the query
+        for scorers with the known bound of the number of edits (see `indexes.QGRAM_EDITS`).
+        It falls back to scoring of all choices for other scorers (e.g. `WRatio`) and when a choice can pass
+        `score_cutoff` without common q-grams (e.g. the query is too short). Only collections with choices
+        by normalized value (dict, set, frozenset) support it. `None` deactivates this behaviour.
+
+        :param qgram_strictness:
+        Share (0, 1] of the estimated minimal number of common q-grams which a choice must have with the query.
+        Lower values select more choices (higher recall) and are slower.
+
+        :param index_type:
+        Type of index of normalized values for searching with `score_cutoff`.
+        `IndexType.BK_TREE` is used by edit distance scorers (see `indexes.METRIC_SCORERS`) without `scorer_kwargs`.
+        `IndexType.SYMSPELL` is used by edit distance scorers (see `indexes.DELETION_SCORERS`) without `scorer_kwargs`
+        when `score_cutoff` is not greater than `symspell_distance`. `None` deactivates this behaviour.
+
+        :param symspell_distance:
+        Maximum edit distance of `IndexType.SYMSPELL` index. Memory of the index grows fast with the distance
+        and the length of normalized values, so it is intended for distances 1-2 and short values.
+
+        :param symspell_max_entries:
+        Memory cap of `IndexType.SYMSPELL` index: the maximum number of deletions in it (see `index_info`).
+        The index is dropped and all choices are scanned when it overflows. `None` deactivates this behaviour.
+
+        :param workers:
+        Default number of threads for scoring, `-1` means all available cores. Batch queries pass it to `cdist`.
+        Single queries of `fuzzy_get` and `get_fuzzy_scores` with more than one thread are scored by `cdist`
+        in chunks of choices in parallel (requires `numpy`).
+        Normalization of all values (by the constructor and the `normalizer` setter) uses the same number
+        of processes, or threads on free-threaded builds (see `PARALLEL_NORMALIZE_MIN_VALUES`).
+
+        :param executor:
+        Default `concurrent.futures.Executor` of async methods (`afuzzy_get` etc.).
+        `None` means the default executor of the running event loop.
+
+        :param progress:
+        Callable `progress(done, total)` which is called after each chunk of normalization of all values
+        (see `NORMALIZE_CHUNK_SIZE`). `None` deactivates this behaviour.
         """
 
         self._normalizer = None
@@ -69,7 +284,30 @@ class RapidfuzzCollection:
         self._scorer_kwargs = None
         self._scorer_type = None
         self._strategy = None
+        self._query_cache_size = None
+        self._query_normalizer = None
+        self._generation = 0
+        self._result_cache_size = None
+        self._result_cache = None
+        self._length_index = None
+        self._length_index_generation = None
+        self._unique_choices = None
+        self._unique_choices_generation = None
+        self._qgram_size = None
+        self._qgram_strictness = None
+        self._qgram_index = None
+        self._index_type = None
+        self._index = None
+        self._symspell_distance = None
+        self._symspell_max_entries = None
+        self._workers = None
+        self._executor = None
+        self._progress = None
+        self._frozen = False
 
+        # settings of normalization of all values
+        self.default_workers = workers
+        self.progress = progress
         self.normalizer = Normalizer.default() if normalizer is None else normalizer
         self.default_score_cutoff = score_cutoff
         self.default_score_hint = score_hint
@@ -77,6 +315,26 @@ class RapidfuzzCollection:
         self.default_scorer_kwargs = scorer_kwargs
         self.default_scorer_type = scorer_type
         self.default_strategy = strategy
+        self.query_cache_size = query_cache_size
+        self.result_cache_size = result_cache_size
+        self.qgram_size = qgram_size
+        self.qgram_strictness = qgram_strictness
+        self.index_type = index_type
+        self.symspell_distance = symspell_distance
+        self.symspell_max_entries = symspell_max_entries
+        self.default_executor = executor
+
+    def __reduce__(self) -> tuple[Callable, tuple]:
+        """
+        Return the state for `pickle` (e.g. for sending the collection to processes): the data and
+        the normalized values (pickled separately, see `_unpickle_choices`), the normalizer and the settings,
+        so the normalizer is not called by unpickling.
+        Indexes and caches are not pickled, they are built again by queries.
+        The executor is not pickled, `default_executor` of the unpickled collection is `None`.
+        """
+
+        payload = pickle_dumps(( self._data, self._choices, ), protocol=HIGHEST_PROTOCOL)
+        return self.__class__._from_pickle, ( payload, self._normalizer, self._pickle_settings(), )
 
     @property
     def normalizer(self) -> NormalizerProtocol:
@@ -86,6 +344,9 @@ class RapidfuzzCollection:
     def normalizer(self, normalizer: NormalizerProtocol):
         self._normalizer = self._check_normalizer(normalizer)
         self._normalize_choices()
+        self._reset_query_cache()
+        self._reset_indexes()
+        self._generation += 1
 
     @property
     def default_score_cutoff(self) -> int | float | None:
@@ -135,12 +396,182 @@ class RapidfuzzCollection:
     def default_strategy(self, value: Strategy):
         self._strategy = self._check_strategy(value)
 
+    @property
+    def default_workers(self) -> int:
+        return self._workers
+
+    @default_workers.setter
+    def default_workers(self, value: int):
+        self._workers = self._check_workers(value)
+
+    @property
+    def default_executor(self) -> Executor | None:
+        return self._executor
+
+    @default_executor.setter
+    def default_executor(self, value: Executor | None):
+        self._executor = self._check_executor(value)
+
+    @property
+    def progress(self) -> Callable[[int, int], Any] | None:
+        return self._progress
+
+    @progress.setter
+    def progress(self, value: Callable[[int, int], Any] | None):
+        self._progress = self._check_progress(value)
+
+    @property
+    def query_cache_size(self) -> int | None:
+        return self._query_cache_size
+
+    @query_cache_size.setter
+    def query_cache_size(self, value: int | None):
+        self._query_cache_size = self._check_query_cache_size(value)
+        self._reset_query_cache()
+
+    @property
+    def result_cache_size(self) -> int | None:
+        return self._result_cache_size
+
+    @result_cache_size.setter
+    def result_cache_size(self, value: int | None):
+        self._result_cache_size = self._check_result_cache_size(value)
+        self._reset_result_cache()
+
+    @property
+    def index_type(self) -> IndexType | None:
+        return self._index_type
+
+    @index_type.setter
+    def index_type(self, value: IndexType | None):
+        self._index_type = self._check_index_type(value)
+        self._index = None
+
+    @property
+    def qgram_size(self) -> int | None:
+        return self._qgram_size
+
+    @qgram_size.setter
+    def qgram_size(self, value: int | None):
+        self._qgram_size = self._check_qgram_size(value)
+        self._qgram_index = None
+
+    @property
+    def qgram_strictness(self) -> int | float:
+        return self._qgram_strictness
+
+    @qgram_strictness.setter
+    def qgram_strictness(self, value: int | float):
+        self._qgram_strictness = self._check_qgram_strictness(value)
+
+    @property
+    def symspell_distance(self) -> int:
+        return self._symspell_distance
+
+    @symspell_distance.setter
+    def symspell_distance(self, value: int):
+        self._symspell_distance = self._check_symspell_distance(value)
+        if isinstance(self._index, SymSpellIndex):
+            self._index = None
+
+    @property
+    def symspell_max_entries(self) -> int | None:
+        return self._symspell_max_entries
+
+    @symspell_max_entries.setter
+    def symspell_max_entries(self, value: int | None):
+        self._symspell_max_entries = self._check_symspell_max_entries(value)
+        if isinstance(self._index, SymSpellIndex):
+            self._index = None
+
+    @staticmethod
+    def _check_chunk_size(value: int) -> int:
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"Need: `int`. Got: `{str(value)}` type=`{type(value)}`")
+        if value < 1:
+            raise ValueError(f"Need: value greater than 0. Got: `{value}`")
+        return value
+
+    @staticmethod
+    def _check_executor(value: Executor | None) -> Executor | None:
+        if value is not None and not isinstance(value, Executor):
+            raise TypeError(f"Need: `Executor` or `None`. Got: `{str(value)}` type=`{type(value)}`")
+        return value
+
+    @staticmethod
+    def _check_index_type(value: IndexType | None) -> IndexType | None:
+        if not (value is None or isinstance(value, IndexType)):
+            raise TypeError(f"Need: `IndexType` | `None`. Got: `{str(value)}` type=`{type(value)}`")
+        return value
+
     @staticmethod
     def _check_normalizer(value: NormalizerProtocol) -> NormalizerProtocol:
         if not callable(value):
             raise TypeError(f"normalizer=`{str(value)}` type=`{type(value)}` not supported")
         return value
 
+    @staticmethod
+    def _check_progress(value: Callable[[int, int], Any] | None) -> Callable[[int, int], Any] | None:
+        if value is not None and not callable(value):
+            raise TypeError(f"Need: `Callable` or `None`. Got: `{str(value)}` type=`{type(value)}`")
+        return value
+
+    @staticmethod
+    def _check_qgram_size(value: int | None) -> int | None:
+        if value is None:
+            return value
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"Need: `int` | `None`. Got: `{str(value)}` type=`{type(value)}`")
+        if value < 1:
+            raise ValueError(f"Need: value greater than 0. Got: `{value}`")
+        return value
+
+    @staticmethod
+    def _check_qgram_strictness(value: int | float) -> int | float:
+        if not isinstance(value, ( int, float, )) or isinstance(value, bool):
+            raise TypeError(f"Need: `int` | `float`. Got: `{str(value)}` type=`{type(value)}`")
+        if not 0 < value <= 1:
+            raise ValueError(f"Need: value greater than 0 and less than or equal to 1. Got: `{value}`")
+        return value
+
+    @staticmethod
+    def _check_symspell_distance(value: int) -> int:
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"Need: `int`. Got: `{str(value)}` type=`{type(value)}`")
+        if value < 0:
+            raise ValueError(f"Need: value greater than or equal to 0. Got: `{value}`")
+        return value
+
+    @staticmethod
+    def _check_symspell_max_entries(value: int | None) -> int | None:
+        if value is None:
+            return value
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"Need: `int` | `None`. Got: `{str(value)}` type=`{type(value)}`")
+        if value < 1:
+            raise ValueError(f"Need: value greater than 0. Got: `{value}`")
+        return value
+
+    @staticmethod
+    def _check_query_cache_size(value: int | None) -> int | None:
+        if value is None:
+            return value
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"Need: `int` | `None`. Got: `{str(value)}` type=`{type(value)}`")
+        if value < 1:
+            raise ValueError(f"Need: value greater than 0. Got: `{value}`")
+        return value
+
+    @staticmethod
+    def _check_result_cache_size(value: int | None) -> int | None:
+        if value is None:
+            return value
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"Need: `int` | `None`. Got: `{str(value)}` type=`{type(value)}`")
+        if value < 1:
+            raise ValueError(f"Need: value greater than 0. Got: `{value}`")
+        return value
+
     @staticmethod
     def _check_score_cutoff(value: int | float | None) -> int | float | None:
         if not (value is None or isinstance(value, ( int, float, ))):
@@ -177,6 +608,705 @@ class RapidfuzzCollection:
             raise TypeError(f"Need: `Strategy`. Got: `{str(value)}` type=`{type(value)}`")
         return value
 
+    @staticmethod
+    def _check_top_k(value: int) -> int:
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"Need: `int`. Got: `{str(value)}` type=`{type(value)}`")
+        if value < 1:
+            raise ValueError(f"Need: value greater than 0. Got: `{value}`")
+        return value
+
+    @staticmethod
+    def _check_unscored(value: bool) -> bool:
+        if not isinstance(value, bool):
+            raise TypeError(f"Need: `bool`. Got: `{str(value)}` type=`{type(value)}`")
+        return value
+
+    @staticmethod
+    def _check_workers(value: int) -> int:
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"Need: `int`. Got: `{str(value)}` type=`{type(value)}`")
+        if value == 0 or value < -1:
+            raise ValueError(f"Need: value greater than 0 or `-1`. Got: `{value}`")
+        return value
+
+    @staticmethod
+    def _cdist(
+        queries: Sequence[str],
+        choices: Sequence[str],
+        scorer: ScorerProtocol,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer_kwargs: dict[str, Any] | None,
+        dtype: Any,
+        workers: int
+    ) -> Any:
+        """
+        Calculate the scores matrix between queries and choices by `cdist`.
+        `cdist` runs its threads by rows (queries), so when there are fewer queries than threads,
+        chunks of choices are scored by `cdist` in parallel threads (it releases the GIL) and the columns are joined.
+        """
+
+        threads = ( cpu_count() or 1 ) if workers == -1 else workers
+        if threads == 1 or len(queries) >= threads or len(choices) < PARALLEL_MIN_CHOICES:
+            return cdist(
+                queries,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs,
+                dtype=dtype,
+                workers=workers
+            )
+
+        chunk_size = -(-len(choices) // threads)
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            columns = list(executor.map(
+                lambda offset: cdist(
+                    queries,
+                    choices[offset:offset + chunk_size],
+                    scorer=scorer,
+                    score_cutoff=score_cutoff,
+                    score_hint=score_hint,
+                    scorer_kwargs=scorer_kwargs,
+                    dtype=dtype,
+                    workers=1
+                ),
+                range(0, len(choices), chunk_size)
+            ))
+
+        return numpy.hstack(columns)
+
+    @staticmethod
+    def _iter_score_rows(
+        queries: Sequence[str],
+        choices: Sequence[str],
+        scorer: ScorerProtocol,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType,
+        workers: int
+    ) -> Generator[tuple[int, Any, Any], None, None]:
+        """
+        Yields rows of the scores matrix between queries and choices.
+        The matrix is calculated by `cdist` in chunks of queries, so the memory usage is bounded.
+
+        Yield tuple with 3 elements:
+            The first element is the index of query.
+            The second element is the row of scores (`numpy.ndarray`) with the length of choices.
+            The third element is the boolean mask of choices which passed `score_cutoff`.
+        """
+
+        if numpy is None:
+            raise ImportError("Batch queries require `numpy`. Install it with `pip install numpy`.")
+
+        if not queries:
+            return
+
+        if not choices:
+            for index in range(len(queries)):
+                row = numpy.empty(0)
+                yield index, row, row.astype(bool)
+            return
+
+        dtype = numpy.float64 if scorer_type == ScorerType.SIMILARITY else None
+        chunk_size = max(1, CDIST_CHUNK_CELLS // len(choices))
+
+        for offset in range(0, len(queries), chunk_size):
+            matrix = RapidfuzzCollection._cdist(
+                queries[offset:offset + chunk_size],
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs,
+                dtype=dtype,
+                workers=workers
+            )
+
+            if scorer_type == ScorerType.SIMILARITY:
+                passed = matrix >= ( 0 if score_cutoff is None else score_cutoff )
+            elif score_cutoff is None:
+                passed = numpy.ones(matrix.shape, dtype=bool)
+            else:
+                passed = matrix <= score_cutoff
+
+            for index in range(matrix.shape[0]):
+                yield offset + index, matrix[index], passed[index]
+
+    def _iter_best_choices(
+        self,
+        queries: Sequence[str],
+        choices: Sequence[str],
+        scorer: ScorerProtocol,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType,
+        strategy: Strategy,
+        workers: int
+    ) -> Generator[tuple[int, int | None], None, None]:
+        """
+        Yields the index of the choice which is selected for each query by strategy.
+        The selection is the same as `extractOne` (FIRST_FROM_BEST), `extract` with `limit=2` (BEST_ONLY_ONE)
+        and `extract_iter` (FIRST) would do for a single query.
+
+        Yield tuple with 2 elements:
+            The first element is the index of query.
+            The second element is the index of choice or `None` if there is no similar choice.
+        """
+
+        lengths = None
+        if strategy == Strategy.FIRST and scorer_type == ScorerType.DISTANCE:
+            lengths = numpy.fromiter(map(len, choices), dtype=numpy.int64, count=len(choices))
+
+        for index, row, passed in self._iter_score_rows(
+            queries,
+            choices,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            scorer_type=scorer_type,
+            workers=workers
+        ):
+            if not row.size:
+                yield index, None
+                continue
+
+            if strategy == Strategy.FIRST_FROM_BEST:
+                best = int(row.argmax() if scorer_type == ScorerType.SIMILARITY else row.argmin())
+                yield index, ( best if passed[best] else None )
+
+            elif strategy == Strategy.BEST_ONLY_ONE:
+                indexes = numpy.flatnonzero(passed)
+                yield index, ( int(indexes[0]) if len(indexes) == 1 else None )
+
+            elif strategy == Strategy.FIRST:
+                if scorer_type == ScorerType.SIMILARITY:
+                    passed = passed & ( row > 0 )
+                else:
+                    passed = passed & ( row < ( len(queries[index]) + lengths ) )
+                indexes = numpy.flatnonzero(passed)
+                yield index, ( int(indexes[0]) if len(indexes) else None )
+
+            else:
+                raise NotImplementedError
+
+    def _iter_sorted_scores(
+        self,
+        queries: Sequence[str],
+        choices: Sequence[str],
+        scorer: ScorerProtocol,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType,
+        workers: int
+    ) -> Generator[tuple[int, list[tuple[int, int | float]]], None, None]:
+        """
+        Yields the scores of choices which passed `score_cutoff` for each query.
+        The scores are sorted the same way as `extract` with `limit=None` sorts them:
+        by similarity or distance, and by index of choice for equal scores.
+
+        Yield tuple with 2 elements:
+            The first element is the index of query.
+            The second element is the list of pairs of the index of choice and the score.
+        """
+
+        for index, row, passed in self._iter_score_rows(
+            queries,
+            choices,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            scorer_type=scorer_type,
+            workers=workers
+        ):
+            indexes = numpy.flatnonzero(passed)
+            scores = row[indexes]
+            order = numpy.argsort(-scores if scorer_type == ScorerType.SIMILARITY else scores, kind='stable')
+            yield index, list(zip(indexes[order].tolist(), scores[order].tolist()))
+
+    def _cached_result(self, func: Callable, *args) -> Any:
+        """
+        Return `func(*args)` using the result cache if it is enabled.
+        The cache is cleared when the collection was changed (generation is changed) since the last call.
+        Calls with unhashable arguments are not cached.
+        """
+
+        cache = self._result_cache
+        if cache is None or self._frozen:
+            return func(*args)
+
+        if self._result_cache_generation != self._generation:
+            cache.clear()
+            self._result_cache_generation = self._generation
+
+        key = ( func.__name__, *( tuple(i.items()) if isinstance(i, dict) else i for i in args ), )
+        try:
+            result = cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable arguments can not be cached
+            return func(*args)
+        else:
+            try:
+                cache.move_to_end(key)
+            except KeyError:
+                # the key was evicted by a concurrent call (see async methods)
+                pass
+            self._result_cache_hits += 1
+            return result
+
+        result = func(*args)
+        self._result_cache_misses += 1
+        cache[key] = result
+        while len(cache) > self._result_cache_size:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                break
+
+        return result
+
+    def _compile_normalizer(self) -> NormalizerProtocol:
+        """
+        Return the normalizer as one compiled function (see `Normalizer.compile`) for normalization of many values.
+        Other normalizers are returned as is.
+        """
+
+        if isinstance(self._normalizer, Normalizer):
+            return self._normalizer.compile()
+
+        return self._normalizer
+
+    def _derive(self, data: Any, choices: Any, normalizer: NormalizerProtocol | None = None) -> Self:
+        """
+        Return new collection of the same class and with the same settings.
+        `choices` must be `data` which is already normalized by the normalizer, so the normalizer is not called.
+
+        :param data:
+        Data of new collection.
+
+        :param choices:
+        Normalized data of new collection.
+
+        :param normalizer:
+        Normalizer of new collection. If `None`, then normalizer of this collection is used.
+        """
+
+        instance = self.__new__(self.__class__)
+        instance._data = data
+        instance._choices = choices
+        instance._normalizer = self._normalizer if normalizer is None else normalizer
+        instance._score_cutoff = self._score_cutoff
+        instance._score_hint = self._score_hint
+        instance._scorer = self._scorer
+        instance._scorer_kwargs = self._scorer_kwargs
+        instance._scorer_type = self._scorer_type
+        instance._strategy = self._strategy
+        instance._workers = self._workers
+        instance._executor = self._executor
+        instance._progress = self._progress
+        instance._query_cache_size = self._query_cache_size
+        instance._reset_query_cache()
+        instance._generation = 0
+        instance._result_cache_size = self._result_cache_size
+        instance._reset_result_cache()
+        instance._length_index = None
+        instance._length_index_generation = None
+        instance._unique_choices = None
+        instance._unique_choices_generation = None
+        instance._qgram_size = self._qgram_size
+        instance._qgram_strictness = self._qgram_strictness
+        instance._qgram_index = None
+        instance._index_type = self._index_type
+        instance._index = None
+        instance._symspell_distance = self._symspell_distance
+        instance._symspell_max_entries = self._symspell_max_entries
+        instance._frozen = False
+
+        return instance
+
+    @staticmethod
+    def _fingerprint(
+        normalizer: NormalizerProtocol,
+        scorer: ScorerProtocol,
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType
+    ) -> str:
+        """
+        Return the hash (hex) of the configuration (see `fingerprint`).
+        """
+
+        config = (
+            normalizer.fingerprint() if isinstance(normalizer, Normalizer) else stable_repr(normalizer),
+            stable_repr(scorer),
+            stable_repr(scorer_kwargs),
+            scorer_type.name,
+        )
+        return sha256(stable_repr(config).encode()).hexdigest()
+
+    def _build_length_index(self, choices: Iterable[str | None]) -> LengthIndex:
+        """
+        Build the length index of unique normalized values, which orders selections as `_get_unique_choices`:
+        sequences by the first position of values, dicts and sets by the order of adding.
+        """
+
+        if isinstance(self._choices, dict):
+            return LengthIndex(choices)
+
+        return LengthIndex(choices, key=lambda choice: self._choice_indexes[choice][0])
+
+    def _freeze(self):
+        """
+        Build the lazy state of searching: unique choices, the length index, the q-gram index and the index
+        of `index_type` for the default scorer. After that searches only read the collection, so they can run
+        in concurrent threads (see `SnapshotCollection`): indexes are not built by searches (searches which
+        can not use the built indexes scan choices), and the result cache and the cache of selections
+        of the length index are not used. The collection must not be changed after that.
+        """
+
+        choices = self._get_unique_choices()
+
+        if self._length_index is None:
+            self._length_index = self._build_length_index(choices)
+        elif self._length_index_generation != self._generation:
+            self._length_index.clear_selections()
+        self._length_index_generation = self._generation
+
+        if self._qgram_size is not None and isinstance(self._choices, dict) and self._qgram_index is None:
+            self._qgram_index = QGramIndex(self._qgram_size, self._choices)
+
+        if self._index_type is not None and self._index is None and not self._scorer_kwargs:
+            indexed = self._choices if isinstance(self._choices, dict) else self._choice_indexes
+            if self._index_type == IndexType.BK_TREE:
+                if is_metric_scorer(self._scorer):
+                    self._index = BKTree(self._scorer, indexed)
+            elif is_deletion_scorer(self._scorer):
+                self._index = SymSpellIndex(self._symspell_distance, self._symspell_max_entries, indexed)
+
+        self._frozen = True
+
+    @classmethod
+    def _from_pickle(
+        cls,
+        payload: bytes,
+        normalizer: NormalizerProtocol,
+        settings: dict[str, Any]
+    ) -> Self:
+        """
+        Return the collection which was pickled by `__reduce__`. The normalizer is not called.
+        """
+
+        settings['_scorer'] = cls._unpickle_scorer(settings['_scorer'])
+        prototype = cls.__new__(cls)
+        prototype.__dict__.update(settings)
+        data, choices = cls._unpickle_choices(pickle_loads, payload)
+
+        return prototype._derive(data, choices, normalizer)
+
+    @staticmethod
+    def _pickle_scorer(scorer: ScorerProtocol) -> ScorerProtocol | tuple[str, str]:
+        """
+        Return the scorer for `pickle`: scorers of `PICKLED_SCORERS` are replaced by the module and the name.
+        """
+
+        return PICKLED_SCORERS.get(scorer, scorer)
+
+    def _pickle_settings(self) -> dict[str, Any]:
+        """
+        Return the settings which are pickled by `__reduce__` (the attributes which are copied by `_derive`).
+        """
+
+        return {
+            '_score_cutoff': self._score_cutoff,
+            '_score_hint': self._score_hint,
+            '_scorer': self._pickle_scorer(self._scorer),
+            '_scorer_kwargs': self._scorer_kwargs,
+            '_scorer_type': self._scorer_type,
+            '_strategy': self._strategy,
+            '_workers': self._workers,
+            '_executor': None,
+            '_progress': None,
+            '_query_cache_size': self._query_cache_size,
+            '_result_cache_size': self._result_cache_size,
+            '_qgram_size': self._qgram_size,
+            '_qgram_strictness': self._qgram_strictness,
+            '_index_type': self._index_type,
+            '_symspell_distance': self._symspell_distance,
+            '_symspell_max_entries': self._symspell_max_entries,
+        }
+
+    def _get_unique_choices(self) -> Sequence[str | None]:
+        """
+        Return unique normalized values of choices in the order of choices.
+        Sequences (list, tuple) order them by the first position and build the list once after each change,
+        so equal normalized values are scored only once and the results are expanded by `_choice_indexes`.
+        """
+
+        if isinstance(self._choices, dict):
+            return self._choices.keys()
+
+        if self._unique_choices_generation != self._generation:
+            self._unique_choices = list(dict.fromkeys(self._choices))
+            self._unique_choices_generation = self._generation
+
+        return self._unique_choices
+
+    def _iter_sorted_positions(
+        self,
+        results: Iterable[tuple[str, int | float, Any]]
+    ) -> Generator[tuple[int, int | float], None, None]:
+        """
+        Expand sorted scores of unique normalized values (see `_get_unique_choices`), which are given
+        as results of `extract`, to positions of sequences.
+        Positions with equal scores are yielded in the ascending order, the same as sorting all positions does.
+
+        Yield tuple with 2 elements:
+            The first element is the position of element.
+            The second element is the score.
+        """
+
+        group = []
+        group_score = None
+        for choice, score, _ in chain(results, [ ( None, None, None, ) ]):
+            if group and ( choice is None or score != group_score ):
+                positions = group[0] if len(group) == 1 else merge(*group)
+                for index in positions:
+                    yield index, group_score
+                group = []
+            if choice is None:
+                return
+            group.append(self._choice_indexes[choice])
+            group_score = score
+
+    def _select_batch_choices(
+        self,
+        queries: Sequence[str],
+        scorer: ScorerProtocol,
+        score_cutoff: int | float | None,
+        scorer_kwargs: dict[str, Any] | None
+    ) -> list[str]:
+        """
+        Return unique normalized values of choices (without `None`) for scoring the queries together.
+        A single query uses the selection of `_select_choices`, so the indexes also work for single queries
+        with `workers`.
+        """
+
+        if len(queries) == 1:
+            choices = self._select_choices(queries[0], scorer, score_cutoff, scorer_kwargs)
+        else:
+            choices = self._get_unique_choices()
+
+        return [ choice for choice in choices if choice is not None ]
+
+    def _is_same_normalizer(self, normalizer: NormalizerProtocol) -> bool:
+        """
+        Check that the normalizer returns the same values as normalizer of this collection.
+        Only the same object or `Normalizer` with the same operations are considered the same.
+        """
+
+        if normalizer is self._normalizer:
+            return True
+
+        if isinstance(normalizer, Normalizer) and isinstance(self._normalizer, Normalizer):
+            return normalizer.operations == self._normalizer.operations
+
+        return False
+
+    def _link_choice(self, choice: str | None):
+        """
+        Add the new normalized value of choices to the indexes.
+        """
+
+        if self._length_index is not None:
+            self._length_index.add(choice)
+        if self._qgram_index is not None:
+            self._qgram_index.add(choice)
+        if self._index is not None:
+            self._index.add(choice)
+
+    def _normalize_query(self, value: Any) -> str | None:
+        """
+        Normalize the query for searching, using the query cache if it is enabled.
+        """
+
+        if self._query_normalizer is None:
+            return self._normalizer(value)
+
+        try:
+            return self._query_normalizer(value)
+        except TypeError:
+            # unhashable value can not be cached
+            return self._normalizer(value)
+
+    def _reset_indexes(self):
+        """
+        Drop the indexes of normalized values, so they are rebuilt from choices by the next search.
+        """
+
+        self._length_index = None
+        self._qgram_index = None
+        self._index = None
+
+    def _reset_query_cache(self):
+        """
+        Create a new empty query cache for the current normalizer (or disable it).
+        """
+
+        if self._query_cache_size is None:
+            self._query_normalizer = None
+        else:
+            self._query_normalizer = lru_cache(maxsize=self._query_cache_size, typed=True)(self._compile_normalizer())
+
+    def _reset_result_cache(self):
+        """
+        Create a new empty result cache (or disable it).
+        """
+
+        self._result_cache = None if self._result_cache_size is None else OrderedDict()
+        self._result_cache_generation = self._generation
+        self._result_cache_hits = 0
+        self._result_cache_misses = 0
+
+    def _unlink_choice(self, choice: str | None):
+        """
+        Remove the normalized value, which is removed from choices, from the indexes.
+        """
+
+        if self._length_index is not None:
+            self._length_index.remove(choice)
+        if self._qgram_index is not None:
+            self._qgram_index.remove(choice)
+        if self._index is not None:
+            self._index.remove(choice)
+
+    @staticmethod
+    def _unpickle_scorer(value: ScorerProtocol | tuple[str, str]) -> ScorerProtocol:
+        """
+        Return the scorer which was pickled by `_pickle_scorer`.
+        """
+
+        if isinstance(value, tuple):
+            module, name = value
+            return getattr(import_module(module), name)
+
+        return value
+
+    @staticmethod
+    def _unpickle_choices(func: Callable, source: Any) -> tuple[Any, Any]:
+        """
+        Return the data and normalized values which are unpickled by `func` (`pickle.load` or `pickle.loads`).
+        The cyclic garbage collector is paused: it is triggered many times by millions of new groups of choices,
+        but they can not have reference cycles.
+        """
+
+        gc_enabled = gc_isenabled()
+        gc_disable()
+        try:
+            return func(source)
+        finally:
+            if gc_enabled:
+                gc_enable()
+
+    def _search_index(
+        self,
+        q: str | None,
+        scorer: ScorerProtocol,
+        score_cutoff: int | float | None,
+        scorer_kwargs: dict[str, Any] | None
+    ) -> list[str] | None:
+        """
+        Return unique normalized values of choices found by the index (see `IndexType`) in the order of choices.
+        `None` if the index is disabled or can not be used for the search, so all choices must be scanned.
+        """
+
+        if self._index_type is None or q is None or score_cutoff is None or scorer_kwargs:
+            return None
+
+        choices = self._choices if isinstance(self._choices, dict) else self._choice_indexes
+        # rapidfuzz truncates `score_cutoff` of scorers with integer scores
+        radius = int(score_cutoff)
+
+        if self._index_type == IndexType.BK_TREE:
+            if not is_metric_scorer(scorer):
+                return None
+            if self._index is None or self._index.scorer is not scorer:
+                if self._frozen:
+                    return None
+                self._index = BKTree(scorer, choices)
+            return self._index.select(q, radius)
+
+        if not is_deletion_scorer(scorer) or radius > self._symspell_distance:
+            return None
+        if self._index is None:
+            if self._frozen:
+                return None
+            self._index = SymSpellIndex(self._symspell_distance, self._symspell_max_entries, choices)
+        return self._index.select(q, scorer, radius)
+
+    def _select_choices(
+        self,
+        q: str | None,
+        scorer: ScorerProtocol,
+        score_cutoff: int | float | None,
+        scorer_kwargs: dict[str, Any] | None
+    ) -> Sequence[str | None]:
+        """
+        Return unique normalized values of choices for scanning by the scorer in the order of choices
+        (see `_get_unique_choices`). The first applicable way of selection is used:
+            - the index of choices (see `_search_index`): only found choices;
+            - the q-gram index: only choices which share enough q-grams with the query;
+            - the length bound of the scorer (see `indexes.LENGTH_BOUNDS`): only choices with lengths
+              which can pass `score_cutoff`;
+            - all choices.
+
+        The indexes are built on the first scan and then kept in sync with choices.
+        """
+
+        choices = self._get_unique_choices()
+        if q is None or score_cutoff is None or scorer_kwargs:
+            return choices
+
+        found = self._search_index(q, scorer, score_cutoff, scorer_kwargs)
+        if found is not None:
+            if not isinstance(self._choices, dict):
+                found.sort(key=lambda choice: self._choice_indexes[choice][0])
+            return found
+
+        if self._qgram_size is not None and isinstance(self._choices, dict):
+            if self._qgram_index is None and not self._frozen:
+                self._qgram_index = QGramIndex(self._qgram_size, self._choices)
+            if self._qgram_index is not None:
+                selected = self._qgram_index.select(q, scorer, score_cutoff, self._qgram_strictness)
+                if selected is not None:
+                    return selected
+
+        if not has_length_bound(scorer):
+            return choices
+
+        if self._length_index is None:
+            if self._frozen:
+                return choices
+            self._length_index = self._build_length_index(choices)
+            self._length_index_generation = self._generation
+        elif self._length_index_generation != self._generation:
+            # choices may be reordered without changes of the index (e.g. `sort`)
+            self._length_index.clear_selections()
+            self._length_index_generation = self._generation
+
+        selected = self._length_index.select(q, scorer, score_cutoff, cache=not self._frozen)
+        if selected is None:
+            return choices
+
+        return selected
+
     def fuzzy_contains(self, value: Any, **kwargs) -> bool:
         """
         Check for a similar value in the collection.
@@ -198,6 +1328,19 @@ class RapidfuzzCollection:
         """
         ...
 
+    def fuzzy_top_k(self, value: Any, k: int, **kwargs) -> list[Any]:
+        """
+        Return `k` elements of the collection which are most similar to value.
+        Only `k` best scores are kept while scoring instead of sorting all of them.
+
+        :param value:
+        Value to search for in collection.
+
+        :param k:
+        Maximum number of returned elements.
+        """
+        ...
+
     def get_fuzzy_scores(self, value: Any, **kwargs) -> list[ScorerResultListType]:
         """
         Score all elements of the collection.
@@ -212,6 +1355,7 @@ class RapidfuzzCollection:
             scorer
             scorer_kwargs
             scorer_type
+            unscored
         If an argument is passed, then it is used for the search,
         otherwise the default value specified when the class was initialized is used.
         """
@@ -237,9 +1381,329 @@ class RapidfuzzCollection:
         """
         ...
 
+    def fuzzy_get_many(self, values: Iterable, **kwargs) -> list[Any]:
+        """
+        Batch version of `fuzzy_get`.
+        All queries are normalized at first and then scored together by `rapidfuzz.process.cdist`.
+
+        :param values:
+        Values to search for in collection.
+
+        :return:
+        List of results of `fuzzy_get` in the order of values.
+        """
+        ...
+
+    def get_fuzzy_scores_many(self, values: Iterable, **kwargs) -> list[list[Any]]:
+        """
+        Batch version of `get_fuzzy_scores`.
+        All queries are normalized at first and then scored together by `rapidfuzz.process.cdist`.
+
+        :param values:
+        Values to search for in collection.
+
+        :return:
+        List of results of `get_fuzzy_scores` in the order of values.
+        """
+        ...
+
+    async def _run_in_executor(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run `func(*args, **kwargs)` in the executor (see `default_executor`) without blocking the event loop.
+        """
+
+        executor = self._check_executor(kwargs.get('executor', self.default_executor))
+        return await get_running_loop().run_in_executor(executor, partial(func, *args, **kwargs))
+
+    async def afuzzy_contains(self, value: Any, **kwargs) -> bool:
+        """
+        Async version of `fuzzy_contains`. Scoring runs in the executor (default is `default_executor`).
+        """
+
+        return await self._run_in_executor(self.fuzzy_contains, value, **kwargs)
+
+    async def afuzzy_get(self, value: Any, **kwargs) -> Any:
+        """
+        Async version of `fuzzy_get`. Scoring runs in the executor (default is `default_executor`).
+        The query is scored as a batch of one query by `cdist` (requires `numpy`), which releases the GIL
+        unlike `extractOne`, so the event loop is not blocked by scoring. The result cache is not used.
+        """
+
+        if numpy is None:
+            return await self._run_in_executor(self.fuzzy_get, value, **kwargs)
+
+        return ( await self._run_in_executor(self.fuzzy_get_many, [ value ], **kwargs) )[0]
+
+    async def afuzzy_top_k(self, value: Any, k: int, **kwargs) -> list[Any]:
+        """
+        Async version of `fuzzy_top_k`. Scoring runs in the executor (default is `default_executor`).
+        The query is scored as a batch of one query by `cdist` (requires `numpy`), see `afuzzy_get`.
+        """
+
+        if numpy is None:
+            return await self._run_in_executor(self.fuzzy_top_k, value, k, **kwargs)
+
+        k = self._check_top_k(k)
+        kwargs = { **kwargs, 'unscored': False, }
+        return ( await self._run_in_executor(self.get_fuzzy_scores_many, [ value ], **kwargs) )[0][:k]
+
+    async def aget_fuzzy_scores(self, value: Any, **kwargs) -> list[ScorerResultListType]:
+        """
+        Async version of `get_fuzzy_scores`. Scoring runs in the executor (default is `default_executor`).
+        The query is scored as a batch of one query by `cdist` (requires `numpy`), see `afuzzy_get`.
+        """
+
+        if numpy is None:
+            return await self._run_in_executor(self.get_fuzzy_scores, value, **kwargs)
+
+        return ( await self._run_in_executor(self.get_fuzzy_scores_many, [ value ], **kwargs) )[0]
+
+    async def afuzzy_get_many(self, values: Iterable, **kwargs) -> list[Any]:
+        """
+        Async version of `fuzzy_get_many`. Scoring runs in the executor (default is `default_executor`).
+        """
+
+        return await self._run_in_executor(self.fuzzy_get_many, values, **kwargs)
+
+    async def aget_fuzzy_scores_many(self, values: Iterable, **kwargs) -> list[list[Any]]:
+        """
+        Async version of `get_fuzzy_scores_many`. Scoring runs in the executor (default is `default_executor`).
+        """
+
+        return await self._run_in_executor(self.get_fuzzy_scores_many, values, **kwargs)
+
+    async def aget_fuzzy_score_iter(self, value: Any, **kwargs) -> AsyncGenerator[list[Any], None]:
+        """
+        Async version of `get_fuzzy_score_iter`, which yields lists of results by chunks.
+        Each chunk is scored in the executor (default is `default_executor`) only when the previous one
+        was consumed, so a slow consumer holds back scoring. When the iteration is cancelled or closed,
+        no more results are taken from `get_fuzzy_score_iter`: a result which is being scored in the executor
+        is finished and dropped.
+
+        :param value:
+        Value to search for in collection.
+
+        :param kwargs:
+        Optional named arguments of `get_fuzzy_score_iter` and:
+            chunk_size
+            executor
+        `chunk_size` is the maximum number of results in one chunk (default is `ASYNC_CHUNK_SIZE`).
+        """
+
+        chunk_size = self._check_chunk_size(kwargs.get('chunk_size', ASYNC_CHUNK_SIZE))
+        executor = self._check_executor(kwargs.get('executor', self.default_executor))
+        iterator = self.get_fuzzy_score_iter(value, **kwargs)
+        stopped = Event()
+
+        def next_chunk() -> list[Any]:
+            chunk = []
+            for result in iterator:
+                chunk.append(result)
+                if len(chunk) == chunk_size or stopped.is_set():
+                    break
+            return chunk
+
+        loop = get_running_loop()
+        running = False
+        try:
+            while True:
+                running = True
+                chunk = await loop.run_in_executor(executor, next_chunk)
+                running = False
+                if not chunk:
+                    return
+                yield chunk
+        finally:
+            stopped.set()
+            # a running chunk can not be closed from here, it is dropped after the stop
+            if not running:
+                iterator.close()
+
+    def fingerprint(self) -> str:
+        """
+        Return the hash (hex) of the configuration which defines normalized values and their scoring:
+        the normalizer (see `Normalizer.fingerprint`), the scorer, `scorer_kwargs` and `scorer_type`.
+        Other callables are identified by the module, the qualified name and the code of Python functions
+        (see `normatlization.stable_repr`). `TypeError` is raised for objects without `repr` which is the same
+        in every process, so such collections can not be saved.
+        """
+
+        return self._fingerprint(self._normalizer, self._scorer, self._scorer_kwargs, self._scorer_type)
+
+    def save(self, path: str | PathLike):
+        """
+        Save the data and normalized values of the collection to the file with the fingerprint of the configuration
+        (see `fingerprint`), so `load` restores the collection without calling the normalizer.
+        The file is written by `pickle` into a temporary file and then replaces the file atomically.
+
+        :param path:
+        Path of the file.
+        """
+
+        path = fspath(path)
+        header = { 'version': FILE_VERSION, 'class': self.__class__.__name__, 'fingerprint': self.fingerprint(), }
+        with open(f'{path}.tmp', 'wb') as file:
+            file.write(FILE_MAGIC)
+            pickle_dump(header, file, protocol=HIGHEST_PROTOCOL)
+            pickle_dump(( self._data, self._choices, ), file, protocol=HIGHEST_PROTOCOL)
+        os_replace(f'{path}.tmp', path)
+
+    @classmethod
+    def load(cls, path: str | PathLike, **kwargs) -> Self:
+        """
+        Load the collection which was saved by `save`.
+        The file is read by `pickle`, so only trusted files must be loaded.
+
+        :param path:
+        Path of the file.
+
+        :param kwargs:
+        Named arguments of the constructor. The fingerprint of the configuration must be the same as in the file,
+        otherwise `ValueError` is raised and the collection must be built from the data again.
+        """
+
+        instance = cls(**kwargs)
+        with open(fspath(path), 'rb') as file:
+            if file.read(len(FILE_MAGIC)) != FILE_MAGIC:
+                raise ValueError(f"Need: file of `{cls.__name__}.save`. Got: `{str(path)}`")
+
+            header = pickle_load(file)
+            if header['version'] != FILE_VERSION:
+                raise ValueError(f"Need: file version `{FILE_VERSION}`. Got: `{header['version']}`")
+            if header['class'] != cls.__name__:
+                raise ValueError(f"Need: file of `{cls.__name__}`. Got: file of `{header['class']}`")
+            if header['fingerprint'] != instance.fingerprint():
+                raise ValueError(f"Need: fingerprint `{instance.fingerprint()}`. Got: `{header['fingerprint']}`")
+
+            data, choices = cls._unpickle_choices(pickle_load, file)
+
+        return instance._derive(data, choices)
+
+    def query_cache_clear(self):
+        """
+        Clear the query cache and its statistics.
+        """
+
+        if self._query_normalizer is not None:
+            self._query_normalizer.cache_clear()
+
+    def query_cache_info(self) -> Any:
+        """
+        Return statistics of the query cache: `CacheInfo(hits, misses, maxsize, currsize)`.
+        `None` if the query cache is disabled.
+        """
+
+        if self._query_normalizer is None:
+            return None
+
+        return self._query_normalizer.cache_info()
+
+    def result_cache_clear(self):
+        """
+        Clear the result cache and its statistics.
+        """
+
+        self._reset_result_cache()
+
+    def result_cache_info(self) -> ResultCacheInfo | None:
+        """
+        Return statistics of the result cache: `ResultCacheInfo(hits, misses, maxsize, currsize)`.
+        `None` if the result cache is disabled.
+        """
+
+        if self._result_cache is None:
+            return None
+
+        if self._result_cache_generation != self._generation:
+            currsize = 0
+        else:
+            currsize = len(self._result_cache)
+
+        return ResultCacheInfo(self._result_cache_hits, self._result_cache_misses, self._result_cache_size, currsize)
+
+    def index_info(self) -> IndexInfo | None:
+        """
+        Return statistics of the index (see `IndexType`):
+        `IndexInfo(index_type, size, entries, maxentries, memory, overflow)`, where `size` is the number of indexed
+        normalized values, `entries` is the number of stored entries (tree choices or deletions) and `memory` is
+        the estimated memory of the index structure in bytes. `None` if the index is disabled or not built yet.
+        """
+
+        if self._index is None:
+            return None
+
+        maxentries = self._index.max_entries if isinstance(self._index, SymSpellIndex) else None
+        overflow = self._index.overflow if isinstance(self._index, SymSpellIndex) else False
+        return IndexInfo(
+            self._index_type,
+            self._index.size,
+            self._index.entries,
+            maxentries,
+            self._index.memory(),
+            overflow
+        )
+
     def _normalize_choices(self):
         """
         Normalize all values of choices.
         """
 
         raise NotImplementedError
+
+    def _normalize_values(self, values: Collection) -> list[str | None]:
+        """
+        Return the normalized values in the same order: the bulk normalization of all values of choices.
+
+        Chunks of `NORMALIZE_CHUNK_SIZE` values are normalized by `default_workers` processes when there are
+        at least `PARALLEL_NORMALIZE_MIN_VALUES` values and the normalizer can be pickled,
+        or by threads on free-threaded builds. Otherwise (and for `workers=1`) they are normalized
+        in this thread, as well as the remaining chunks after a chunk which can not be pickled (see `_map_chunks`).
+        `progress` is called after each chunk.
+        """
+
+        total = len(values)
+        workers = ( cpu_count() or 1 ) if self._workers == -1 else self._workers
+        progress = self._progress
+
+        if workers == 1 or total < PARALLEL_NORMALIZE_MIN_VALUES:
+            if progress is None:
+                return list(map(self._compile_normalizer(), values))
+            executor = None
+        elif not _is_gil_enabled():
+            executor = ThreadPoolExecutor(max_workers=workers)
+            chunk_func = partial(_normalize_chunk, normalize=self._compile_normalizer())
+        else:
+            try:
+                pickle_dumps(self._normalizer, protocol=HIGHEST_PROTOCOL)
+            except ( AttributeError, PicklingError, TypeError, ):
+                executor = None
+            else:
+                executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_normalize_process,
+                    initargs=( self._normalizer, )
+                )
+                chunk_func = _normalize_chunk
+
+        iterator = iter(values)
+        chunks = iter(lambda: list(islice(iterator, NORMALIZE_CHUNK_SIZE)), [])
+        normalize_chunk = partial(_normalize_chunk, normalize=self._compile_normalizer())
+        if executor is None:
+            results = map(normalize_chunk, chunks)
+        else:
+            results = _map_chunks(executor, chunk_func, chunks, normalize_chunk, workers * NORMALIZE_CHUNKS_PER_WORKER)
+
+        result = [ None ] * total
+        done = 0
+        try:
+            # chunks are in the order of values, so groups of choices are the same as by serial normalization
+            for chunk in results:
+                result[done:done + len(chunk)] = chunk
+                done += len(chunk)
+                if progress is not None:
+                    progress(done, total)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        return result
@@ -0,0 +1,189 @@
+from asyncio import (
+    Future,
+    get_running_loop
+)
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any
+
+from .base import RapidfuzzCollection
+
+
+class QueryCoalescer:
+    """
+    Micro-batching of concurrent queries to a collection.
+
+    Queries which arrive within `max_delay` seconds (or until `max_batch` queries are collected) are scored
+    together by one call of `fuzzy_get_many` / `get_fuzzy_scores_many` (one `cdist` matrix) in the executor,
+    and each caller gets its own result (requires `numpy`). The collection must not be changed while queries
+    are pending.
+
+    Example:
+        coalescer = QueryCoalescer(rapidfuzz_dict, max_delay=0.002, max_batch=64, score_cutoff=90)
+        await coalescer.fuzzy_get('Ustralia')  # ( 'Australia', 'AUS', )
+    """
+
+    def __init__(
+        self,
+        collection: RapidfuzzCollection,
+        max_delay: int | float = 0.001,
+        max_batch: int = 64,
+        executor: Executor | None = None,
+        **kwargs
+    ):
+        """
+        :param collection:
+        Collection for searching.
+
+        :param max_delay:
+        Maximum time in seconds which the first query of a batch waits for other queries.
+
+        :param max_batch:
+        Maximum number of queries in a batch. A full batch is scored without waiting.
+
+        :param executor:
+        Executor for scoring of batches. If `None`, then `default_executor` of the collection is used.
+
+        :param kwargs:
+        Named arguments of `fuzzy_get_many` and `get_fuzzy_scores_many` (e.g. `score_cutoff`, `workers`),
+        which are used for all queries.
+        """
+
+        self._collection = self._check_collection(collection)
+        self._max_delay = self._check_max_delay(max_delay)
+        self._max_batch = self._check_max_batch(max_batch)
+        self._executor = RapidfuzzCollection._check_executor(executor)
+        self._kwargs = kwargs
+        self._pending = {}
+        self._timers = {}
+        self._tasks = set()
+
+    @property
+    def collection(self) -> RapidfuzzCollection:
+        return self._collection
+
+    @property
+    def max_batch(self) -> int:
+        return self._max_batch
+
+    @property
+    def max_delay(self) -> int | float:
+        return self._max_delay
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of queries which are waiting for a batch.
+        """
+
+        return sum(len(batch) for batch in self._pending.values())
+
+    @staticmethod
+    def _check_collection(value: RapidfuzzCollection) -> RapidfuzzCollection:
+        if not isinstance(value, RapidfuzzCollection):
+            raise TypeError(f"Need: `RapidfuzzCollection`. Got: `{str(value)}` type=`{type(value)}`")
+        return value
+
+    @staticmethod
+    def _check_max_batch(value: int) -> int:
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"Need: `int`. Got: `{str(value)}` type=`{type(value)}`")
+        if value < 1:
+            raise ValueError(f"Need: value greater than 0. Got: `{value}`")
+        return value
+
+    @staticmethod
+    def _check_max_delay(value: int | float) -> int | float:
+        if not isinstance(value, ( int, float, )) or isinstance(value, bool):
+            raise TypeError(f"Need: `int` or `float`. Got: `{str(value)}` type=`{type(value)}`")
+        if value < 0:
+            raise ValueError(f"Need: value not less than 0. Got: `{value}`")
+        return value
+
+    def _flush(self, method: str):
+        """
+        Start scoring of the pending batch of `method`.
+        """
+
+        timer = self._timers.pop(method, None)
+        if timer is not None:
+            timer.cancel()
+
+        batch = self._pending.pop(method, None)
+        if batch:
+            task = get_running_loop().create_task(self._score(method, batch))
+            # the loop keeps only weak references to tasks
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _score(self, method: str, batch: list[tuple[Any, Future]]):
+        """
+        Score the batch of queries by the batch `method` of the collection and resolve the futures of callers.
+        """
+
+        executor = self._executor if self._executor is not None else self._collection.default_executor
+        func = partial(getattr(self._collection, method), [ value for value, future in batch ], **self._kwargs)
+
+        try:
+            results = await get_running_loop().run_in_executor(executor, func)
+        except Exception as e:
+            if len(batch) == 1:
+                value, future = batch[0]
+                if not future.done():
+                    future.set_exception(e)
+                return
+
+            # an invalid query must not fail other queries of the batch, so they are scored one by one
+            for item in batch:
+                await self._score(method, [ item ])
+            return
+
+        for ( value, future, ), result in zip(batch, results):
+            # a caller could be cancelled while waiting
+            if not future.done():
+                future.set_result(result)
+
+    async def _submit(self, method: str, value: Any) -> Any:
+        """
+        Add the query to the pending batch of `method` and wait for its result.
+        """
+
+        loop = get_running_loop()
+        future = loop.create_future()
+
+        batch = self._pending.setdefault(method, [])
+        batch.append(( value, future, ))
+        if len(batch) >= self._max_batch:
+            self._flush(method)
+        elif method not in self._timers:
+            self._timers[method] = loop.call_later(self._max_delay, self._flush, method)
+
+        return await future
+
+    def flush(self):
+        """
+        Start scoring of all pending queries without waiting for `max_delay`.
+        """
+
+        for method in list(self._pending):
+            self._flush(method)
+
+    async def fuzzy_get(self, value: Any) -> Any:
+        """
+        Result of `fuzzy_get` of the collection, which is scored in a batch with other concurrent queries.
+
+        :param value:
+        Value to search for in collection.
+        """
+
+        return await self._submit('fuzzy_get_many', value)
+
+    async def get_fuzzy_scores(self, value: Any) -> list[Any]:
+        """
+        Result of `get_fuzzy_scores` of the collection, which is scored in a batch with other concurrent queries.
+
+        :param value:
+        Value to search for in collection.
+        """
+
+        return await self._submit('get_fuzzy_scores_many', value)
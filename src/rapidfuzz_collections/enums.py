@@ -23,3 +23,14 @@ class Strategy(Enum):
     FIRST_FROM_BEST = 1
     BEST_ONLY_ONE = 2
     FIRST = 3
+
+
+class IndexType(Enum):
+    """
+    Type of index of normalized values for searching:
+        BK_TREE: metric tree for edit distance scorers, which searches only choices within `score_cutoff` distance
+        SYMSPELL: deletion neighbourhood of choices for small edit distances, which finds choices within
+            `score_cutoff` distance by deletions from the query in near-constant time at the cost of memory
+    """
+    BK_TREE = 1
+    SYMSPELL = 2
@@ -0,0 +1,751 @@
+from collections import (
+    Counter,
+    OrderedDict
+)
+from itertools import chain
+from math import ceil
+from sys import getsizeof
+from rapidfuzz.distance import (
+    DamerauLevenshtein,
+    Indel,
+    LCSseq,
+    Levenshtein,
+    OSA
+)
+from rapidfuzz.fuzz import ratio
+from rapidfuzz.process import extract_iter
+from typing import (
+    Any,
+    Callable,
+    Iterable
+)
+
+from .types import ScorerProtocol
+
+
+# Maximum share of choices selected by the length index for scanning them instead of all choices.
+LENGTH_INDEX_MAX_SHARE = 0.5
+
+# Maximum total size of cached selections of the length index relative to the number of choices.
+LENGTH_INDEX_CACHE_SHARE = 4
+
+# Maximum number of choices in a bucket of `BKTree` before it becomes a node.
+BK_TREE_BUCKET_SIZE = 32
+
+# Tolerance of comparing the bound with `score_cutoff`, so the rounding never prunes a passing choice.
+LENGTH_BOUND_TOLERANCE = 1e-9
+
+
+def _indel_normalized_similarity(len1: int, len2: int) -> float:
+    total = len1 + len2
+    return 1.0 if not total else 1 - abs(len1 - len2) / total
+
+
+def _levenshtein_normalized_similarity(len1: int, len2: int) -> float:
+    longest = max(len1, len2)
+    return 1.0 if not longest else min(len1, len2) / longest
+
+
+# Scorer -> (is distance, is integer score, the best possible score of two strings by their lengths).
+# The bounds are valid for the default arguments of scorers only (without `weights`, `processor`, etc.).
+LENGTH_BOUNDS: dict[Callable, tuple[bool, bool, Callable[[int, int], int | float]]] = {
+    ratio: ( False, False, lambda len1, len2: 100 * _indel_normalized_similarity(len1, len2), ),
+    Indel.distance: ( True, True, lambda len1, len2: abs(len1 - len2), ),
+    Indel.normalized_distance: ( True, False, lambda len1, len2: 1 - _indel_normalized_similarity(len1, len2), ),
+    Indel.normalized_similarity: ( False, False, _indel_normalized_similarity, ),
+    Indel.similarity: ( False, True, lambda len1, len2: 2 * min(len1, len2), ),
+    LCSseq.distance: ( True, True, lambda len1, len2: abs(len1 - len2), ),
+    LCSseq.normalized_distance: ( True, False, lambda len1, len2: 1 - _levenshtein_normalized_similarity(len1, len2), ),
+    LCSseq.normalized_similarity: ( False, False, _levenshtein_normalized_similarity, ),
+    LCSseq.similarity: ( False, True, lambda len1, len2: min(len1, len2), ),
+    Levenshtein.distance: ( True, True, lambda len1, len2: abs(len1 - len2), ),
+    Levenshtein.normalized_distance: ( True, False, lambda len1, len2: 1 - _levenshtein_normalized_similarity(len1, len2), ),
+    Levenshtein.normalized_similarity: ( False, False, _levenshtein_normalized_similarity, ),
+    Levenshtein.similarity: ( False, True, lambda len1, len2: min(len1, len2), ),
+}
+
+
+# Scorer -> the maximum number of edits (insertions and deletions, and substitutions for `Levenshtein`) between
+# two strings by `score_cutoff` and their lengths, which keeps the score within `score_cutoff`. It is used
+# by the count filtering of `QGramIndex`. The bounds are valid for the default arguments of scorers only.
+# `LCSseq` distance `d` is at most `2 * d - abs(len1 - len2)` insertions and deletions.
+QGRAM_EDITS: dict[Callable, Callable[[int | float, int, int], int | float]] = {
+    ratio: lambda cutoff, len1, len2: ( 1 - cutoff / 100 ) * ( len1 + len2 ),
+    Indel.distance: lambda cutoff, len1, len2: cutoff,
+    Indel.normalized_distance: lambda cutoff, len1, len2: cutoff * ( len1 + len2 ),
+    Indel.normalized_similarity: lambda cutoff, len1, len2: ( 1 - cutoff ) * ( len1 + len2 ),
+    Indel.similarity: lambda cutoff, len1, len2: len1 + len2 - cutoff,
+    LCSseq.distance: lambda cutoff, len1, len2: 2 * cutoff - abs(len1 - len2),
+    LCSseq.normalized_distance: lambda cutoff, len1, len2: 2 * cutoff * max(len1, len2) - abs(len1 - len2),
+    LCSseq.normalized_similarity: lambda cutoff, len1, len2: (
+        2 * ( 1 - cutoff ) * max(len1, len2) - abs(len1 - len2)
+    ),
+    LCSseq.similarity: lambda cutoff, len1, len2: 2 * ( max(len1, len2) - cutoff ) - abs(len1 - len2),
+    Levenshtein.distance: lambda cutoff, len1, len2: cutoff,
+    Levenshtein.normalized_distance: lambda cutoff, len1, len2: cutoff * max(len1, len2),
+    Levenshtein.normalized_similarity: lambda cutoff, len1, len2: ( 1 - cutoff ) * max(len1, len2),
+    Levenshtein.similarity: lambda cutoff, len1, len2: max(len1, len2) - cutoff,
+}
+
+
+# Scorers which are metrics (the triangle inequality holds) with the default arguments.
+# `OSA.distance` is not a metric.
+METRIC_SCORERS = frozenset({
+    DamerauLevenshtein.distance,
+    Indel.distance,
+    Levenshtein.distance,
+})
+
+# Edit distance scorers with the default arguments, for which two strings within the distance `k` have
+# a common string obtained by at most `k` deletions from each of them, so they can be used by `SymSpellIndex`.
+DELETION_SCORERS = frozenset({
+    DamerauLevenshtein.distance,
+    Indel.distance,
+    LCSseq.distance,
+    Levenshtein.distance,
+    OSA.distance,
+})
+
+
+def _deletes(value: str, distance: int) -> set[str]:
+    """
+    Return all strings obtained by at most `distance` deletions of characters from the value (including itself).
+    """
+
+    result = { value }
+    layer = result
+    for _ in range(distance):
+        layer = { i[:j] + i[j + 1:] for i in layer for j in range(len(i)) }
+        if not layer:
+            break
+        result |= layer
+    return result
+
+
+def has_length_bound(scorer: ScorerProtocol) -> bool:
+    """
+    Check that the best possible score of the scorer is known by lengths of strings.
+    """
+
+    try:
+        return scorer in LENGTH_BOUNDS
+    except TypeError:
+        # unhashable scorer
+        return False
+
+
+def select_lengths(
+    lengths: Iterable[int],
+    q: str,
+    scorer: ScorerProtocol,
+    score_cutoff: int | float
+) -> list[int]:
+    """
+    Return lengths of choices which can pass `score_cutoff` of the scorer with the known length bound
+    (see `has_length_bound`) for the query `q`, in the order of lengths.
+    """
+
+    is_distance, is_integer, bound = LENGTH_BOUNDS[scorer]
+    length = len(q)
+
+    if is_integer:
+        # rapidfuzz truncates `score_cutoff` of scorers with integer scores
+        score_cutoff, tolerance = int(score_cutoff), 0
+    else:
+        tolerance = LENGTH_BOUND_TOLERANCE
+
+    if is_distance:
+        return [ i for i in lengths if bound(length, i) <= score_cutoff + tolerance ]
+
+    return [ i for i in lengths if bound(length, i) >= score_cutoff - tolerance ]
+
+
+class LengthIndex:
+    """
+    Index of normalized choices by their lengths.
+    It selects choices which can pass `score_cutoff` of the scorer with the known length bound,
+    so other choices are not scored at all.
+    The index is kept in sync with choices by `add` and `remove`.
+    Selections are cached by lengths, since queries of the same length select the same choices,
+    the cache is cleared by changes of the index and by `clear_selections`.
+    """
+
+    __slots__ = ( '_buckets', '_key', '_order', '_selections', '_selections_size', '_sequence', )
+
+    def __init__(self, choices: Iterable[str | None], key: Callable[[str], int] | None = None):
+        """
+        :param choices:
+        Normalized choices in their order. `None` choices are never selected.
+
+        :param key:
+        Function which returns the position of the choice for ordering selections
+        (e.g. the first position of the choice in a sequence).
+        By default choices are ordered by their addition to the index.
+        """
+
+        self._buckets: dict[int, dict[str, None]] = {}
+        self._order: dict[str, int] = {}
+        self._key = self._order.__getitem__ if key is None else key
+        self._sequence = 0
+        self._selections: OrderedDict[tuple[int, ...], list[str]] = OrderedDict()
+        self._selections_size = 0
+        for choice in choices:
+            self.add(choice)
+
+    def add(self, choice: str | None):
+        """
+        Add new choice to the end of the index.
+        """
+
+        if choice in self._order:
+            return
+
+        # `None` choice is counted in the share of selected choices, but it is never selected
+        self._order[choice] = self._sequence
+        self._sequence += 1
+        if choice is not None:
+            self._buckets.setdefault(len(choice), {})[choice] = None
+        self.clear_selections()
+
+    def clear_selections(self):
+        """
+        Clear the cache of selections, e.g. after choices were reordered.
+        """
+
+        if self._selections:
+            self._selections.clear()
+            self._selections_size = 0
+
+    def remove(self, choice: str | None):
+        """
+        Remove the choice from the index.
+        """
+
+        if choice not in self._order:
+            return
+
+        del self._order[choice]
+        if choice is not None:
+            bucket = self._buckets[len(choice)]
+            del bucket[choice]
+            if not bucket:
+                del self._buckets[len(choice)]
+        self.clear_selections()
+
+    def select(
+        self,
+        q: str,
+        scorer: ScorerProtocol,
+        score_cutoff: int | float,
+        cache: bool = True
+    ) -> list[str] | None:
+        """
+        Select choices which lengths can pass `score_cutoff` of the scorer for the query `q`.
+        With `cache=False` the cache of selections is not changed, so concurrent calls only read the index.
+
+        :return:
+        List of selected choices in the order of choices.
+        `None` if the selection is not worth it (too many choices are selected), so all choices must be scanned.
+        """
+
+        lengths = select_lengths(self._buckets, q, scorer, score_cutoff)
+
+        if sum(len(self._buckets[i]) for i in lengths) > len(self._order) * LENGTH_INDEX_MAX_SHARE:
+            return None
+
+        key = tuple(lengths)
+        selection = self._selections.get(key)
+        if selection is not None:
+            if cache:
+                self._selections.move_to_end(key)
+            return selection
+
+        selection = list(chain.from_iterable(self._buckets[i] for i in lengths))
+        selection.sort(key=self._key)
+        if not cache:
+            return selection
+
+        self._selections[key] = selection
+        self._selections_size += len(selection)
+        while self._selections_size > len(self._order) * LENGTH_INDEX_CACHE_SHARE:
+            self._selections_size -= len(self._selections.popitem(last=False)[1])
+
+        return selection
+
+
+class QGramIndex:
+    """
+    Inverted index of normalized choices by their q-grams (substrings of length `size`).
+
+    It selects candidates which share enough q-grams with the query (count filtering):
+    every edit changes at most `size` q-grams of a string, so two strings within `k` edits
+    share at least `max(len1, len2) - size + 1 - k * size` q-grams.
+    The number of edits `k` is bounded by `score_cutoff` and the lengths of the query and the choice
+    for scorers of `QGRAM_EDITS` only, other scorers (e.g. `WRatio`, `Damerau`/`OSA` transpositions)
+    are not filtered, so the filtering never loses matches.
+    `strictness` scales the required number of common q-grams: lower values select more candidates
+    and are slower.
+    """
+
+    __slots__ = ( '_lengths', '_order', '_postings', '_sequence', '_size', )
+
+    def __init__(self, size: int, choices: Iterable[str | None]):
+        """
+        :param size:
+        Length of q-grams.
+
+        :param choices:
+        Normalized choices in their order. `None` choices are never selected.
+        """
+
+        self._size = size
+        self._postings: dict[str, dict[str, int]] = {}
+        self._order: dict[str, int] = {}
+        self._lengths: Counter = Counter()
+        self._sequence = 0
+        for choice in choices:
+            self.add(choice)
+
+    def _grams(self, value: str) -> Counter:
+        """
+        Return q-grams of the value with their counts.
+        """
+
+        size = self._size
+        return Counter(value[i:i + size] for i in range(len(value) - size + 1))
+
+    def add(self, choice: str | None):
+        """
+        Add new choice to the end of the index.
+        """
+
+        if choice is None or choice in self._order:
+            return
+
+        self._order[choice] = self._sequence
+        self._sequence += 1
+        self._lengths[len(choice)] += 1
+        for gram, count in self._grams(choice).items():
+            self._postings.setdefault(gram, {})[choice] = count
+
+    def remove(self, choice: str | None):
+        """
+        Remove the choice from the index.
+        """
+
+        if choice is None or choice not in self._order:
+            return
+
+        del self._order[choice]
+        self._lengths[len(choice)] -= 1
+        if not self._lengths[len(choice)]:
+            del self._lengths[len(choice)]
+        for gram in self._grams(choice):
+            postings = self._postings[gram]
+            del postings[choice]
+            if not postings:
+                del self._postings[gram]
+
+    def select(
+        self,
+        q: str,
+        scorer: ScorerProtocol,
+        score_cutoff: int | float,
+        strictness: int | float
+    ) -> list[str] | None:
+        """
+        Select candidates which share enough q-grams with the query `q`.
+
+        :return:
+        List of candidates in the order of choices.
+        `None` if the scorer is not in `QGRAM_EDITS` or a choice which can pass `score_cutoff`
+        may have no common q-grams with the query (e.g. the query is too short), so all choices must be scanned.
+        """
+
+        try:
+            edits = QGRAM_EDITS.get(scorer)
+        except TypeError:
+            # unhashable scorer
+            return None
+        if edits is None:
+            return None
+
+        if LENGTH_BOUNDS[scorer][1]:
+            # rapidfuzz truncates `score_cutoff` of scorers with integer scores
+            score_cutoff = int(score_cutoff)
+
+        # the required number of common q-grams by lengths of choices which can pass `score_cutoff`
+        size = self._size
+        length = len(q)
+        min_common = {}
+        for i in select_lengths(self._lengths, q, scorer, score_cutoff):
+            common = max(length, i) - size + 1 - int(edits(score_cutoff, length, i) + LENGTH_BOUND_TOLERANCE) * size
+            if common < 1:
+                return None
+            min_common[i] = ceil(common * strictness)
+
+        counts = Counter()
+        for gram, count in self._grams(q).items():
+            postings = self._postings.get(gram)
+            if not postings:
+                continue
+            if count == 1:
+                counts.update(postings.keys())
+            else:
+                for choice, choice_count in postings.items():
+                    counts[choice] += min(count, choice_count)
+
+        candidates = [
+            choice for choice, common in counts.items()
+            if len(choice) in min_common and common >= min_common[len(choice)]
+        ]
+        candidates.sort(key=self._order.__getitem__)
+        return candidates
+
+
+def is_deletion_scorer(scorer: ScorerProtocol) -> bool:
+    """
+    Check that candidates of the scorer within a distance can be found by deletions (see `DELETION_SCORERS`).
+    """
+
+    try:
+        return scorer in DELETION_SCORERS
+    except TypeError:
+        # unhashable scorer
+        return False
+
+
+def is_metric_scorer(scorer: ScorerProtocol) -> bool:
+    """
+    Check that the scorer is a metric (the triangle inequality holds), so it can be used by `BKTree`.
+    """
+
+    try:
+        return scorer in METRIC_SCORERS
+    except TypeError:
+        # unhashable scorer
+        return False
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree of normalized choices for an edit distance metric.
+
+    Every node is a pivot choice with children by the distance to the pivot. Children are buckets
+    (lists of up to `BK_TREE_BUCKET_SIZE` choices), which become nodes when they overflow.
+    A radius query visits only children which can contain choices within the radius by the triangle inequality,
+    and choices of visited buckets are scored by one scan.
+    New choices are inserted into the tree at once. Removed choices are only marked as deleted,
+    and the tree is rebuilt when deleted choices outnumber the others.
+    """
+
+    __slots__ = ( 'scorer', '_deleted', '_order', '_root', '_sequence', )
+
+    def __init__(self, scorer: ScorerProtocol, choices: Iterable[str | None]):
+        """
+        :param scorer:
+        Edit distance metric (see `METRIC_SCORERS`).
+
+        :param choices:
+        Normalized choices in their order. `None` choices are never selected.
+        """
+
+        self.scorer = scorer
+        self._root: tuple[str, dict[int, Any]] | None = None
+        self._order: dict[str, int] = {}
+        self._sequence = 0
+        self._deleted: set[str] = set()
+        for choice in choices:
+            self.add(choice)
+
+    def _insert(self, node: tuple[str, dict[int, Any]], choice: str):
+        """
+        Insert the choice into the subtree of the node.
+        """
+
+        scorer = self.scorer
+        while True:
+            distance = scorer(choice, node[0])
+            child = node[1].get(distance)
+
+            if child is None:
+                node[1][distance] = [ choice ]
+                return
+
+            if child.__class__ is list:
+                if len(child) < BK_TREE_BUCKET_SIZE:
+                    child.append(choice)
+                    return
+                # the bucket overflows: its first choice becomes the pivot of new node
+                node[1][distance] = child_node = ( child[0], {}, )
+                for i in child[1:]:
+                    self._insert(child_node, i)
+                child = child_node
+
+            node = child
+
+    def _rebuild(self):
+        """
+        Rebuild the tree without deleted choices.
+        """
+
+        choices = sorted(self._order, key=self._order.__getitem__)
+        self._root = None
+        self._order = {}
+        self._sequence = 0
+        self._deleted = set()
+        for choice in choices:
+            self.add(choice)
+
+    def add(self, choice: str | None):
+        """
+        Add new choice to the end of the tree.
+        """
+
+        if choice is None or choice in self._order:
+            return
+
+        self._order[choice] = self._sequence
+        self._sequence += 1
+
+        if choice in self._deleted:
+            # it is still in the tree
+            self._deleted.discard(choice)
+        elif self._root is None:
+            self._root = ( choice, {}, )
+        else:
+            self._insert(self._root, choice)
+
+    def remove(self, choice: str | None):
+        """
+        Mark the choice as deleted.
+        """
+
+        if choice is None or choice not in self._order:
+            return
+
+        del self._order[choice]
+        self._deleted.add(choice)
+        if len(self._deleted) > len(self._order):
+            self._rebuild()
+
+    def select(self, q: str, radius: int) -> list[str]:
+        """
+        Select choices within the distance `radius` from the query `q`.
+
+        :return:
+        List of choices in the order of choices.
+        """
+
+        result = []
+        if self._root is None:
+            return result
+
+        scorer = self.scorer
+        candidates = []
+        stack = [ self._root ]
+        while stack:
+            pivot, children = stack.pop()
+            distance = scorer(q, pivot)
+            if distance <= radius:
+                result.append(pivot)
+            for i in range(max(distance - radius, 1), distance + radius + 1):
+                child = children.get(i)
+                if child is None:
+                    continue
+                if child.__class__ is list:
+                    candidates.extend(child)
+                else:
+                    stack.append(child)
+
+        # choices of buckets are scored together
+        result.extend(choice for choice, score, index in extract_iter(
+            q,
+            candidates,
+            scorer=scorer,
+            score_cutoff=radius
+        ))
+
+        if self._deleted:
+            result = [ i for i in result if i not in self._deleted ]
+        result.sort(key=self._order.__getitem__)
+        return result
+
+    def memory(self) -> int:
+        """
+        Return estimated memory of the tree structure in bytes (shared choices are not counted).
+        """
+
+        total = getsizeof(self._order) + getsizeof(self._deleted)
+        stack = [] if self._root is None else [ self._root ]
+        while stack:
+            node = stack.pop()
+            total += getsizeof(node) + getsizeof(node[1])
+            for child in node[1].values():
+                if child.__class__ is list:
+                    total += getsizeof(child)
+                else:
+                    stack.append(child)
+        return total
+
+    @property
+    def size(self) -> int:
+        """
+        Number of indexed choices.
+        """
+
+        return len(self._order)
+
+    @property
+    def entries(self) -> int:
+        """
+        Number of choices stored in the tree, including deleted ones.
+        """
+
+        return len(self._order) + len(self._deleted)
+
+
+class SymSpellIndex:
+    """
+    Deletion neighbourhood (SymSpell) index of normalized choices for small edit distances.
+
+    All strings obtained by at most `distance` deletions from each choice are mapped to the choices.
+    Two strings within the edit distance `k` have a common string obtained by at most `k` deletions from each
+    of them, so a radius query looks up deletions of the query only, and the found choices are scored by one scan.
+    The lookup does not depend on the number of choices, and the memory grows with the number of deletions,
+    so the index is dropped (overflows) when the number of entries exceeds `max_entries`.
+    """
+
+    __slots__ = ( 'distance', 'max_entries', 'overflow', '_order', '_sequence', '_variants', )
+
+    def __init__(self, distance: int, max_entries: int | None, choices: Iterable[str | None]):
+        """
+        :param distance:
+        Maximum number of deletions from choices, which is the maximum supported radius of queries.
+
+        :param max_entries:
+        Maximum number of deletions in the index. `None` means unlimited.
+
+        :param choices:
+        Normalized choices in their order. `None` choices are never selected.
+        """
+
+        self.distance = distance
+        self.max_entries = max_entries
+        self.overflow = False
+        self._order: dict[str, int] = {}
+        self._sequence = 0
+        # deletion -> the choice or the set of choices (most deletions belong to one choice)
+        self._variants: dict[str, str | set[str]] = {}
+        for choice in choices:
+            self.add(choice)
+            if self.overflow:
+                break
+
+    def add(self, choice: str | None):
+        """
+        Add new choice to the end of the index.
+        """
+
+        if self.overflow or choice is None or choice in self._order:
+            return
+
+        self._order[choice] = self._sequence
+        self._sequence += 1
+
+        variants = self._variants
+        for variant in _deletes(choice, self.distance):
+            postings = variants.get(variant)
+            if postings is None:
+                variants[variant] = choice
+            elif postings.__class__ is str:
+                variants[variant] = { postings, choice, }
+            else:
+                postings.add(choice)
+
+        if self.max_entries is not None and len(variants) > self.max_entries:
+            # release the memory, the index can not be used anymore
+            self.overflow = True
+            self._order = {}
+            self._variants = {}
+
+    def remove(self, choice: str | None):
+        """
+        Remove the choice from the index.
+        """
+
+        if self.overflow or choice is None or choice not in self._order:
+            return
+
+        del self._order[choice]
+
+        variants = self._variants
+        for variant in _deletes(choice, self.distance):
+            postings = variants[variant]
+            if postings.__class__ is str:
+                del variants[variant]
+            else:
+                postings.discard(choice)
+                if len(postings) == 1:
+                    variants[variant] = postings.pop()
+
+    def select(self, q: str, scorer: ScorerProtocol, radius: int) -> list[str] | None:
+        """
+        Select choices within the distance `radius` by the scorer (see `DELETION_SCORERS`) from the query `q`.
+
+        :return:
+        List of choices in the order of choices.
+        `None` if the index overflowed or the radius is greater than `distance`.
+        """
+
+        if self.overflow or radius > self.distance:
+            return None
+
+        variants = self._variants
+        candidates = set()
+        for variant in _deletes(q, max(radius, 0)):
+            postings = variants.get(variant)
+            if postings is None:
+                continue
+            if postings.__class__ is str:
+                candidates.add(postings)
+            else:
+                candidates.update(postings)
+
+        result = [ choice for choice, score, index in extract_iter(
+            q,
+            candidates,
+            scorer=scorer,
+            score_cutoff=radius
+        ) ]
+        result.sort(key=self._order.__getitem__)
+        return result
+
+    def memory(self) -> int:
+        """
+        Return estimated memory of the index in bytes (shared choices are not counted).
+        """
+
+        total = getsizeof(self._order) + getsizeof(self._variants)
+        for variant, postings in self._variants.items():
+            if variant not in self._order:
+                total += getsizeof(variant)
+            if postings.__class__ is not str:
+                total += getsizeof(postings)
+        return total
+
+    @property
+    def size(self) -> int:
+        """
+        Number of indexed choices.
+        """
+
+        return len(self._order)
+
+    @property
+    def entries(self) -> int:
+        """
+        Number of deletions in the index.
+        """
+
+        return len(self._variants)
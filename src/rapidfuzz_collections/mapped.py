@@ -0,0 +1,608 @@
+from gc import collect as gc_collect
+from mmap import (
+    ACCESS_READ,
+    mmap
+)
+from os import (
+    PathLike,
+    fspath,
+    replace as os_replace
+)
+from pickle import (
+    HIGHEST_PROTOCOL,
+    dumps as pickle_dumps,
+    loads as pickle_loads
+)
+from rapidfuzz.fuzz import WRatio
+from rapidfuzz.process import (
+    extract,
+    extractOne,
+    extract_iter
+)
+from typing import (
+    Any,
+    Callable,
+    Self
+)
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from .base import RapidfuzzCollection
+from .enums import (
+    ScorerType,
+    Strategy
+)
+from .indexes import (
+    has_length_bound,
+    select_lengths
+)
+from .normatlization import Normalizer
+from .types import (
+    NormalizerProtocol,
+    ScorerProtocol
+)
+
+
+# Signature and version of the format of mapped files.
+MAPPED_MAGIC = b'RFCMAP\x00\x00'
+MAPPED_VERSION = 1
+
+# Alignment of sections of mapped files.
+MAPPED_ALIGNMENT = 8
+
+_MISSING = object()
+
+
+class MappedCollection:
+    """
+    Read-only collection of a memory-mapped file, which is exported by `MappedCollection.export`
+    from `RapidFuzzDict`, `RapidFuzzSet` or `RapidFuzzFrozenSet`. Processes which map the same file share
+    its memory (the page cache) instead of holding their own Python objects of normalized values.
+
+    Normalized values are stored as UCS4 arrays by their lengths (`numpy` arrays on the mapped memory),
+    which are scored by rapidfuzz directly, so the length bound of the scorer (see `indexes.LENGTH_BOUNDS`)
+    selects whole arrays. Original keys (and values of dict) of each normalized value are stored by `pickle`
+    and only keys of results are loaded. Choices are ordered by length and then by normalized value.
+
+    Example:
+        MappedCollection.export(rapidfuzz_dict, 'countries.map')
+        mapped = MappedCollection('countries.map', normalizer=normalizer, score_cutoff=90)
+        mapped.fuzzy_get('Ustralia')  # ( 'Australia', 'AUS', )
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike,
+        normalizer: NormalizerProtocol = None,
+        score_cutoff: int | float | None = None,
+        score_hint: int | float | None = None,
+        scorer: ScorerProtocol = WRatio,
+        scorer_kwargs: dict[str, Any] | None = None,
+        scorer_type: ScorerType = ScorerType.SIMILARITY,
+        strategy: Strategy = Strategy.FIRST_FROM_BEST
+    ):
+        """
+        :param path:
+        Path of the file which is exported by `MappedCollection.export`.
+
+        :param normalizer:
+        Normalizer of queries. The fingerprint of the configuration (see `RapidfuzzCollection.fingerprint`)
+        must be the same as of the exported collection, otherwise `ValueError` is raised.
+
+        Other arguments are the same as of collections.
+        """
+
+        if numpy is None:
+            raise ImportError("Mapped collections require `numpy`. Install it with `pip install numpy`.")
+
+        self._normalizer = RapidfuzzCollection._check_normalizer(
+            Normalizer.default() if normalizer is None else normalizer
+        )
+        self._score_cutoff = RapidfuzzCollection._check_score_cutoff(score_cutoff)
+        self._score_hint = RapidfuzzCollection._check_score_hint(score_hint)
+        self._scorer = RapidfuzzCollection._check_scorer(scorer)
+        self._scorer_kwargs = RapidfuzzCollection._check_scorer_kwargs(scorer_kwargs)
+        self._scorer_type = RapidfuzzCollection._check_scorer_type(scorer_type)
+        self._strategy = RapidfuzzCollection._check_strategy(strategy)
+
+        self._path = fspath(path)
+        with open(self._path, 'rb') as file:
+            if file.read(len(MAPPED_MAGIC)) != MAPPED_MAGIC:
+                raise ValueError(f"Need: file of `MappedCollection.export`. Got: `{str(path)}`")
+            self._mmap = mmap(file.fileno(), 0, access=ACCESS_READ)
+
+        start = len(MAPPED_MAGIC) + 8
+        header_size = int.from_bytes(self._mmap[len(MAPPED_MAGIC):start], 'little')
+        header = pickle_loads(self._mmap[start:start + header_size])
+        if header['version'] != MAPPED_VERSION:
+            self.close()
+            raise ValueError(f"Need: file version `{MAPPED_VERSION}`. Got: `{header['version']}`")
+
+        fingerprint = RapidfuzzCollection._fingerprint(
+            self._normalizer,
+            self._scorer,
+            self._scorer_kwargs,
+            self._scorer_type
+        )
+        if header['fingerprint'] != fingerprint:
+            self.close()
+            raise ValueError(f"Need: fingerprint `{fingerprint}`. Got: `{header['fingerprint']}`")
+
+        data = self._align(start + header_size)
+        self._is_dict = header['kind'] == 'dict'
+        self._size = header['size']
+        self._has_none = header['none_group']
+
+        # ( length, index of the first group, array of normalized values, )
+        self._buckets = []
+        group = 0
+        for length, offset, count in header['buckets']:
+            array = numpy.frombuffer(self._mmap, dtype=f'<U{max(length, 1)}', count=count, offset=data + offset)
+            self._buckets.append(( length, group, array, ))
+            group += count
+        self._buckets_by_length = { bucket[0]: bucket for bucket in self._buckets }
+        self._lengths = [ bucket[0] for bucket in self._buckets ]
+
+        offset, count = header['groups']
+        self._group_offsets = numpy.frombuffer(self._mmap, dtype='<u8', count=count + 1, offset=data + offset)
+        self._blob = data + header['blob']
+
+    def __contains__(self, value: Any) -> bool:
+        """ Return bool(value in self). """
+
+        return self._get_item(value) is not _MISSING
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        """ Return len(self). """
+
+        return self._size
+
+    def __reduce__(self) -> tuple[Callable, tuple]:
+        """
+        Return the state for `pickle`: the path of the file and the settings, so the unpickled collection
+        maps the same file (it must not be replaced) instead of copying its data.
+        """
+
+        return self.__class__._from_pickle, (
+            self._path,
+            self._normalizer,
+            self._score_cutoff,
+            self._score_hint,
+            RapidfuzzCollection._pickle_scorer(self._scorer),
+            self._scorer_kwargs,
+            self._scorer_type,
+            self._strategy,
+        )
+
+    def __repr__(self) -> str:
+        """ Return repr(self). """
+
+        return f"{self.__class__.__name__}(size={self._size}, choices={int(self._group_offsets.size) - 1})"
+
+    @property
+    def normalizer(self) -> NormalizerProtocol:
+        return self._normalizer
+
+    @property
+    def default_score_cutoff(self) -> int | float | None:
+        return self._score_cutoff
+
+    @property
+    def default_score_hint(self) -> int | float | None:
+        return self._score_hint
+
+    @property
+    def default_scorer(self) -> ScorerProtocol:
+        return self._scorer
+
+    @property
+    def default_scorer_kwargs(self) -> dict[str, Any] | None:
+        return self._scorer_kwargs
+
+    @property
+    def default_scorer_type(self) -> ScorerType:
+        return self._scorer_type
+
+    @property
+    def default_strategy(self) -> Strategy:
+        return self._strategy
+
+    @staticmethod
+    def _align(offset: int) -> int:
+        return -( -offset // MAPPED_ALIGNMENT ) * MAPPED_ALIGNMENT
+
+    @classmethod
+    def _from_pickle(
+        cls,
+        path: str,
+        normalizer: NormalizerProtocol,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer: ScorerProtocol | tuple[str, str],
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType,
+        strategy: Strategy
+    ) -> Self:
+        """
+        Return the collection which was pickled by `__reduce__`.
+        """
+
+        return cls(
+            path,
+            normalizer=normalizer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer=RapidfuzzCollection._unpickle_scorer(scorer),
+            scorer_kwargs=scorer_kwargs,
+            scorer_type=scorer_type,
+            strategy=strategy
+        )
+
+    def _find(self, q: str | None) -> int | None:
+        """
+        Return the index of the group of the normalized value `q` or `None` if it is absent.
+        """
+
+        if q is None:
+            return len(self._group_offsets) - 2 if self._has_none else None
+
+        bucket = self._buckets_by_length.get(len(q))
+        if bucket is None:
+            return None
+
+        length, group, array = bucket
+        index = int(numpy.searchsorted(array, q))
+        if index < len(array) and array[index] == q:
+            return group + index
+
+        return None
+
+    def _get_group(self, group: int) -> list[Any]:
+        """
+        Return original keys (pairs of key and value for dict) of the group.
+        """
+
+        start, end = self._group_offsets[group:group + 2].tolist()
+        return pickle_loads(self._mmap[self._blob + start:self._blob + end])
+
+    def _get_item(self, value: Any) -> Any:
+        """
+        Return the element (pair of key and value for dict) which is equal to value or `_MISSING`.
+        """
+
+        try:
+            group = self._find(self._normalizer(value))
+        except (TypeError, ValueError):
+            return _MISSING
+
+        if group is not None:
+            for item in self._get_group(group):
+                k = item[0] if self._is_dict else item
+                try:
+                    if k == value:
+                        return item
+                except TypeError:
+                    continue
+
+        return _MISSING
+
+    def _iter_buckets(
+        self,
+        q: str | None,
+        scorer: ScorerProtocol,
+        score_cutoff: int | float | None,
+        scorer_kwargs: dict[str, Any] | None
+    ) -> list[tuple[int, int, Any]]:
+        """
+        Return buckets of normalized values which can pass `score_cutoff` (see `indexes.select_lengths`).
+        """
+
+        if q is None:
+            return []
+
+        if score_cutoff is None or scorer_kwargs or not has_length_bound(scorer):
+            return self._buckets
+
+        lengths = select_lengths(self._lengths, q, scorer, score_cutoff)
+        return [ self._buckets_by_length[i] for i in lengths ]
+
+    def _parse_kwargs(self, kwargs: dict[str, Any]) -> tuple:
+        return (
+            RapidfuzzCollection._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff)),
+            RapidfuzzCollection._check_score_hint(kwargs.get('score_hint', self.default_score_hint)),
+            RapidfuzzCollection._check_scorer(kwargs.get('scorer', self.default_scorer)),
+            RapidfuzzCollection._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs)),
+            RapidfuzzCollection._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type)),
+        )
+
+    def close(self):
+        """
+        Unmap the file. The collection can not be used after that.
+        """
+
+        self._buckets = []
+        self._buckets_by_length = {}
+        self._group_offsets = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # generators of `extract_iter` which were stopped early keep arrays in reference cycles
+            gc_collect()
+            self._mmap.close()
+
+    @classmethod
+    def export(cls, collection: RapidfuzzCollection, path: str | PathLike):
+        """
+        Export the collection with choices by normalized value (`RapidFuzzDict`, `RapidFuzzSet`,
+        `RapidFuzzFrozenSet`) to the file for `MappedCollection`. Keys and values must be picklable.
+        The file is written into a temporary file and then replaces the file atomically.
+
+        :param collection:
+        Collection for export.
+
+        :param path:
+        Path of the file.
+        """
+
+        if numpy is None:
+            raise ImportError("Mapped collections require `numpy`. Install it with `pip install numpy`.")
+
+        if not isinstance(collection, RapidfuzzCollection) or not isinstance(collection._choices, dict):
+            raise TypeError(
+                f"Need: `RapidFuzzDict`, `RapidFuzzSet` or `RapidFuzzFrozenSet`. "
+                f"Got: `{str(collection)}` type=`{type(collection)}`"
+            )
+
+        is_dict = isinstance(collection._data, dict)
+        by_length = {}
+        for nk in collection._choices:
+            if nk is None:
+                continue
+            # `numpy` strips trailing null characters of strings
+            if nk.endswith('\x00'):
+                raise ValueError(f"Need: normalized value without trailing null characters. Got: `{nk!r}`")
+            by_length.setdefault(len(nk), []).append(nk)
+
+        sections = []
+        buckets = []
+        offset = 0
+        nks = []
+        for length in sorted(by_length):
+            values = sorted(by_length[length])
+            array = numpy.array(values, dtype=f'<U{max(length, 1)}')
+            buckets.append(( length, offset, len(values), ))
+            sections.append(array.tobytes())
+            offset = cls._align(offset + len(sections[-1]))
+            nks.extend(values)
+
+        has_none = None in collection._choices
+        if has_none:
+            nks.append(None)
+
+        groups = []
+        group_offsets = [ 0, ]
+        for nk in nks:
+            ks = collection._choices[nk]
+            group = [ ( k, collection._data[k], ) for k in ks ] if is_dict else list(ks)
+            groups.append(pickle_dumps(group, protocol=HIGHEST_PROTOCOL))
+            group_offsets.append(group_offsets[-1] + len(groups[-1]))
+
+        groups_offset = offset
+        sections.append(numpy.array(group_offsets, dtype='<u8').tobytes())
+        blob_offset = cls._align(groups_offset + len(sections[-1]))
+        sections.append(b''.join(groups))
+
+        header = pickle_dumps({
+            'version': MAPPED_VERSION,
+            'kind': 'dict' if is_dict else 'set',
+            'fingerprint': collection.fingerprint(),
+            'size': len(collection),
+            'buckets': buckets,
+            'groups': ( groups_offset, len(nks), ),
+            'blob': blob_offset,
+            'none_group': has_none,
+        }, protocol=HIGHEST_PROTOCOL)
+
+        path = fspath(path)
+        with open(f'{path}.tmp', 'wb') as file:
+            file.write(MAPPED_MAGIC)
+            file.write(len(header).to_bytes(8, 'little'))
+            file.write(header)
+            data = cls._align(file.tell())
+            file.write(b'\x00' * ( data - file.tell() ))
+            for section in sections:
+                offset = file.tell() - data
+                file.write(b'\x00' * ( cls._align(offset) - offset ))
+                file.write(section)
+        os_replace(f'{path}.tmp', path)
+
+    def fuzzy_contains(self, value: Any, **kwargs) -> bool:
+        """
+        Check for a similar value in the collection (see `RapidFuzzSet.fuzzy_contains`).
+
+        :param value:
+        Value to search for in collection.
+        """
+
+        score_cutoff, score_hint, scorer, scorer_kwargs, scorer_type = self._parse_kwargs(kwargs)
+
+        if self.__contains__(value):
+            return True
+
+        q = self._normalizer(value)
+        if q is not None and self._find(q) is not None:
+            return True
+
+        for length, group, array in self._iter_buckets(q, scorer, score_cutoff, scorer_kwargs):
+            # all values of the bucket have the same length, so the best one decides
+            result = extractOne(
+                q,
+                array,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs
+            )
+            if result is not None and (
+                ( scorer_type == ScorerType.SIMILARITY and result[1] > 0 ) or
+                ( scorer_type == ScorerType.DISTANCE and result[1] < ( len(q) + length ) )
+            ):
+                return True
+
+        return False
+
+    def fuzzy_get(self, value: Any, **kwargs) -> Any:
+        """
+        Return the element of collection which most similar to value (see `RapidFuzzSet.fuzzy_get`),
+        pair of key and value for dict. `Strategy.FIRST` returns the first similar element in the order of choices
+        of the file.
+
+        :param value:
+        Value to search for in collection.
+        """
+
+        score_cutoff, score_hint, scorer, scorer_kwargs, scorer_type = self._parse_kwargs(kwargs)
+        strategy = RapidfuzzCollection._check_strategy(kwargs.get('strategy', self.default_strategy))
+
+        item = self._get_item(value)
+        if item is not _MISSING:
+            return item
+
+        q = self._normalizer(value)
+        group = None if q is None else self._find(q)
+        if group is not None:
+            items = self._get_group(group)
+            if strategy != Strategy.BEST_ONLY_ONE or len(items) == 1:
+                return items[0]
+
+        buckets = self._iter_buckets(q, scorer, score_cutoff, scorer_kwargs)
+
+        if strategy == Strategy.FIRST_FROM_BEST:
+            best = None
+            for length, group, array in buckets:
+                result = extractOne(
+                    q,
+                    array,
+                    scorer=scorer,
+                    score_cutoff=score_cutoff if best is None else best[0],
+                    score_hint=score_hint,
+                    scorer_kwargs=scorer_kwargs
+                )
+                if result is None:
+                    continue
+                nk, score, index = result
+                # equal scores of later buckets do not replace the first best choice
+                if best is None or ( score > best[0] if scorer_type == ScorerType.SIMILARITY else score < best[0] ):
+                    best = score, group + index
+            if best is None:
+                return None
+            return self._get_group(best[1])[0]
+
+        elif strategy == Strategy.BEST_ONLY_ONE:
+            found = []
+            for length, group, array in buckets:
+                for nk, score, index in extract(
+                    q,
+                    array,
+                    scorer=scorer,
+                    score_cutoff=score_cutoff,
+                    score_hint=score_hint,
+                    scorer_kwargs=scorer_kwargs,
+                    limit=2
+                ):
+                    found.append(group + index)
+                if len(found) > 1:
+                    return None
+            if len(found) == 1:
+                items = self._get_group(found[0])
+                if len(items) == 1:
+                    return items[0]
+            return None
+
+        elif strategy == Strategy.FIRST:
+            for length, group, array in buckets:
+                for nk, score, index in extract_iter(
+                    q,
+                    array,
+                    scorer=scorer,
+                    score_cutoff=score_cutoff,
+                    score_hint=score_hint,
+                    scorer_kwargs=scorer_kwargs
+                ):
+                    if (
+                        ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
+                        ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + length ) )
+                    ):
+                        return self._get_group(group + index)[0]
+            return None
+
+        raise NotImplementedError
+
+    def fuzzy_top_k(self, value: Any, k: int, **kwargs) -> list[Any]:
+        """
+        Return `k` elements of the collection which are most similar to value (see `get_fuzzy_scores`).
+
+        :param value:
+        Value to search for in collection.
+
+        :param k:
+        Maximum number of returned elements.
+        """
+
+        k = RapidfuzzCollection._check_top_k(k)
+        return self._get_fuzzy_scores(value, k, kwargs)
+
+    def get_fuzzy_scores(self, value: Any, **kwargs) -> list[Any]:
+        """
+        Score elements of the collection and return scored ones by the best score:
+        pairs of key and score, triples of value, score and key for dict. Elements which are not scored
+        (see `unscored` of collections) are not returned.
+
+        :param value:
+        Value to search for in collection.
+        """
+
+        return self._get_fuzzy_scores(value, None, kwargs)
+
+    def _get_fuzzy_scores(self, value: Any, limit: int | None, kwargs: dict[str, Any]) -> list[Any]:
+        """
+        Implementation of `get_fuzzy_scores` and `fuzzy_top_k`: only `limit` best elements if it is not `None`.
+        """
+
+        score_cutoff, score_hint, scorer, scorer_kwargs, scorer_type = self._parse_kwargs(kwargs)
+
+        q = self._normalizer(value)
+
+        scores = []
+        for length, group, array in self._iter_buckets(q, scorer, score_cutoff, scorer_kwargs):
+            for nk, score, index in extract(
+                q,
+                array,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs,
+                limit=limit
+            ):
+                scores.append(( score, group + index, ))
+
+        # the sort is stable, so equal scores keep the order of choices
+        scores.sort(key=lambda i: -i[0] if scorer_type == ScorerType.SIMILARITY else i[0])
+
+        result = []
+        for score, group in scores:
+            for item in self._get_group(group):
+                result.append(( item[1], score, item[0], ) if self._is_dict else ( item, score, ))
+                if limit is not None and len(result) == limit:
+                    return result
+
+        return result
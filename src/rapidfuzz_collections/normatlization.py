@@ -3,9 +3,16 @@ from copy import (
     copy,
     deepcopy
 )
+from functools import partial
+from hashlib import sha256
 from re import (
+    Pattern as RePattern,
     RegexFlag,
-    sub
+    compile as re_compile
+)
+from types import (
+    CodeType,
+    FunctionType
 )
 from typing import (
     Any,
@@ -16,7 +23,66 @@ from typing import (
     Self
 )
 
-from .types import NormalizerOperationType
+from .types import (
+    NormalizerOperationType,
+    NormalizerSpecType
+)
+
+
+# Version of the format of specifications of `Normalizer.to_spec`.
+SPEC_VERSION = 1
+
+
+# Types of closure variables which are represented by their values in `stable_repr`.
+STABLE_CLOSURE_TYPES = ( type(None), bool, int, float, complex, str, bytes, tuple, frozenset, RePattern, )
+
+
+def stable_repr(value: Any, _functions: tuple[FunctionType, ...] = ()) -> str:
+    """
+    Return `repr` of the value which does not depend on the process: functions and classes are represented
+    by the module and qualified name, compiled patterns by the pattern and flags. It is used for fingerprints.
+    Python functions are also represented by their code (bytecode, constants and names), default arguments
+    and closure variables, so different lambdas and closures of the same name are different.
+    Mutable closure variables (e.g. caches) are represented by their types only, since they change over time.
+    `functools.partial` is represented by its function and arguments.
+    Objects with the default `repr` of `object` contain the address in memory, `TypeError` is raised for them.
+    """
+
+    if isinstance(value, RePattern):
+        return f're.compile({value.pattern!r}, {int(value.flags)})'
+    if isinstance(value, ( tuple, list, )):
+        return f'{type(value).__name__}({", ".join(stable_repr(i, _functions) for i in value)})'
+    if isinstance(value, ( set, frozenset, )):
+        return f'{type(value).__name__}({", ".join(sorted(stable_repr(i, _functions) for i in value))})'
+    if isinstance(value, dict):
+        items = sorted(( stable_repr(k, _functions), stable_repr(v, _functions), ) for k, v in value.items())
+        return f'dict({", ".join(f"{k}: {v}" for k, v in items)})'
+    if isinstance(value, partial):
+        items = ( value.func, value.args, value.keywords, )
+        return f'functools.partial({", ".join(stable_repr(i, _functions) for i in items)})'
+    if isinstance(value, CodeType):
+        consts = stable_repr(value.co_consts, _functions)
+        return f'code({value.co_code.hex()}, {consts}, {stable_repr(value.co_names)})'
+    if isinstance(value, FunctionType) and value not in _functions:
+        # recursive functions refer to themselves by the name only
+        _functions += ( value, )
+        closure = []
+        for cell in value.__closure__ or ():
+            try:
+                variable = cell.cell_contents
+            except ValueError:
+                # the variable is not assigned yet
+                variable = None
+            if not isinstance(variable, STABLE_CLOSURE_TYPES) and not hasattr(variable, '__qualname__'):
+                variable = type(variable)
+            closure.append(variable)
+        code = ( value.__code__, value.__defaults__, value.__kwdefaults__, closure, )
+        return f'{value.__module__}.{value.__qualname__}({", ".join(stable_repr(i, _functions) for i in code)})'
+    if callable(value) and hasattr(value, '__qualname__'):
+        return f'{getattr(value, "__module__", None)}.{value.__qualname__}'
+    if type(value).__repr__ is object.__repr__:
+        raise TypeError(f"Need: value with `repr` which does not depend on the process. Got: type=`{type(value)}`")
+    return repr(value)
 
 
 # noinspection DuplicatedCode
@@ -48,7 +114,9 @@ class Normalizer:
         'max_length': lambda v, args, kwargs: ( v if len(v) <= args[0] else None ) if isinstance(v, str) else None,
         'min_length': lambda v, args, kwargs: ( v if len(v) >= args[0] else None ) if isinstance(v, str) else None,
         'not_empty_str': lambda v, args, kwargs: v if len(v) else None,
-        're_sub': lambda v, args, kwargs: sub(args[0], args[1], v),
+        're_fullmatch': lambda v, args, kwargs: ( v if args[0].fullmatch(v) else None ) if isinstance(v, str) else None,
+        're_search': lambda v, args, kwargs: ( v if args[0].search(v) else None ) if isinstance(v, str) else None,
+        're_sub': lambda v, args, kwargs: args[0].sub(args[1], v, args[2]) if isinstance(v, str) else None,
         'removeprefix': lambda v, args, kwargs: v.removeprefix(args[0]) if isinstance(v, str) else None,
         'removesuffix': lambda v, args, kwargs: v.removesuffix(args[0]) if isinstance(v, str) else None,
         'replace': lambda v, args, kwargs: v.replace(*args) if isinstance(v, str) else None,
@@ -58,26 +126,69 @@ class Normalizer:
         'upper': lambda v, args, kwargs: v.upper() if isinstance(v, str) else None,
     }
 
+    # Operations which are inlined by `compile`: only for `str`, for other types the result is `None`.
+    # Transformations: expression of the new value.
+    _COMPILE_TRANSFORMATIONS = {
+        'capitalize': '{value}.capitalize()',
+        'casefold': '{value}.casefold()',
+        'lower': '{value}.lower()',
+        'lstrip': '{value}.lstrip({args})',
+        're_sub': '{0}({1}, {value}, {2})',
+        'removeprefix': '{value}.removeprefix({args})',
+        'removesuffix': '{value}.removesuffix({args})',
+        'replace': '{value}.replace({args})',
+        'rstrip': '{value}.rstrip({args})',
+        'strip': '{value}.strip({args})',
+        'upper': '{value}.upper()',
+    }
+    # Checks: condition to keep the value (`None` - always keep).
+    _COMPILE_CHECKS = {
+        'endswith': '{value}.endswith({args})',
+        'exact_length': 'len({value}) == {args}',
+        'isalnum': '{value}.isalnum()',
+        'isalpha': '{value}.isalpha()',
+        'isascii': '{value}.isascii()',
+        'isdecimal': '{value}.isdecimal()',
+        'isdigit': '{value}.isdigit()',
+        'isidentifier': '{value}.isidentifier()',
+        'isinstance_str': None,
+        'islower': '{value}.islower()',
+        'isnumeric': '{value}.isnumeric()',
+        'isprintable': '{value}.isprintable()',
+        'isspace': '{value}.isspace()',
+        'istitle': '{value}.istitle()',
+        'isupper': '{value}.isupper()',
+        'max_length': 'len({value}) <= {args}',
+        'min_length': 'len({value}) >= {args}',
+        're_fullmatch': '{0}({value}) is not None',
+        're_search': '{0}({value}) is not None',
+        'startswith': '{value}.startswith({args})',
+    }
+    # Regex operations: the compiled pattern (first argument) is bound to this method.
+    _COMPILE_METHODS = {
+        're_fullmatch': 'fullmatch',
+        're_search': 'search',
+        're_sub': 'sub',
+    }
+
     def __call__(self, value: Any) -> Optional[str]:
         """
         :param value: Value for normalization.
         :return: Normalized value.
         """
-        _value = value
-
-        for name, func, args, kwargs in self.operations:
-            _value = func(_value, args, kwargs)
 
-        if _value is not None and not isinstance(_value, str):
-            raise ValueError(f"Need: `None` or `str`. Got: value=`{str(_value)}` type=`{type(_value)}`")
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self.compile()
 
-        return _value
+        return compiled(value)
 
     def __copy__(self) -> 'Normalizer':
         """ Return shallow copy. """
 
         instance = self.__new__(self.__class__)
         instance.__dict__['_operations'] = copy(self._operations)
+        instance.__dict__['_compiled'] = None
         return instance
 
     def __deepcopy__(self, memodict) -> 'Normalizer':
@@ -85,15 +196,68 @@ class Normalizer:
 
         instance = self.__new__(self.__class__)
         instance.__dict__['_operations'] = deepcopy(self._operations)
+        instance.__dict__['_compiled'] = None
         return instance
 
+    def __reduce__(self) -> tuple[Callable, tuple]:
+        """
+        Return the state for `pickle`: the chain of operations without functions of built-in operations
+        (they are found by names on unpickling). Functions of `custom` operations must be picklable.
+        """
+
+        operations = [
+            ( name, func if name == 'custom' else None, args, kwargs, )
+            for name, func, args, kwargs in self._operations
+        ]
+        return self.__class__._from_operations, ( operations, )
+
     def __init__(self):
         self._operations: list[NormalizerOperationType] = []
+        self._compiled: Callable[[Any], Optional[str]] | None = None
 
     @property
     def operations(self) -> tuple[NormalizerOperationType, ...]:
         return tuple(self._operations)
 
+    def _add_operation(self, operation: NormalizerOperationType):
+        """
+        Add operation to the chain and reset the compiled function.
+        """
+
+        self._operations.append(operation)
+        self._compiled = None
+
+    @classmethod
+    def _from_operations(cls, operations: list[NormalizerOperationType]) -> 'Normalizer':
+        """
+        Return the normalizer which was pickled by `__reduce__`.
+        """
+
+        instance = cls()
+        for name, func, args, kwargs in operations:
+            instance._add_operation(( name, cls._MAPPING[name] if func is None else func, args, kwargs, ))
+
+        return instance
+
+    @staticmethod
+    def _compile_pattern(pattern: str | Pattern[str], flags: int | RegexFlag) -> Pattern[str]:
+        """
+        Compile the pattern of regex operation.
+        """
+
+        if not isinstance(pattern, ( str, RePattern, )):
+            raise TypeError(f"Need: `str` or `Pattern`. Got: `{str(pattern)}` type=`{type(pattern)}`")
+
+        if not isinstance(flags, int):
+            raise TypeError(f"Need: `int` or `RegexFlag`. Got: `{str(flags)}` type=`{type(flags)}`")
+
+        if isinstance(pattern, RePattern):
+            if flags:
+                raise ValueError(f"Need: `flags=0` for compiled pattern. Got: `{flags}`")
+            return pattern
+
+        return re_compile(pattern, flags)
+
     @classmethod
     def default(cls) -> 'Normalizer':
         return cls().isinstance_str().strip().min_length(3)
@@ -109,7 +273,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -124,20 +288,175 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
+    def compile(self) -> Callable[[Any], Optional[str]]:
+        """
+        Return one function which is equivalent to the chain of operations.
+
+        Consecutive operations over `str` are fused: the type is checked once, methods of `str` are called directly
+        and a rejected value becomes `None` without running the remaining fused operations.
+        Consecutive transformations are chained in one expression, but each of them is still a separate call:
+        e.g. replaces are not merged into one `str.translate`, which is slower for short chains.
+        Methods of compiled patterns of regex operations are bound once. `custom` and `not_empty_str` are called as is.
+        The result is cached until the next operation is added.
+        """
+
+        if self._compiled is not None:
+            return self._compiled
+
+        namespace = {}
+        operations = self._operations
+        lines = [ 'def normalize(value):', ]
+        depth = 1
+
+        def bind(index: int, name: str, args: tuple) -> list[str]:
+            names = []
+            for i, arg in enumerate(args):
+                if i == 0 and name in self._COMPILE_METHODS:
+                    arg = getattr(arg, self._COMPILE_METHODS[name])
+                names.append(f'a{index}_{i}')
+                namespace[names[-1]] = arg
+            return names
+
+        def emit(line: str):
+            lines.append('    ' * depth + line)
+
+        index = 0
+        while index < len(operations):
+            name, func, args, kwargs = operations[index]
+
+            if name not in self._COMPILE_TRANSFORMATIONS and name not in self._COMPILE_CHECKS:
+                namespace[f'f{index}'], namespace[f'a{index}'], namespace[f'k{index}'] = func, args, kwargs
+                emit(f'value = f{index}(value, a{index}, k{index})')
+                index += 1
+                continue
+
+            end = index
+            while end < len(operations) and (
+                operations[end][0] in self._COMPILE_TRANSFORMATIONS or operations[end][0] in self._COMPILE_CHECKS
+            ):
+                end += 1
+            last = end == len(operations)
+
+            # The value is always `str` or `None` after the block, so the last block returns directly.
+            if last:
+                emit('if not isinstance(value, str):')
+                emit('    return None')
+            else:
+                emit('if not isinstance(value, str):')
+                emit('    value = None')
+                emit('else:')
+                depth += 1
+            block_depth = depth
+
+            expression = 'value'
+            for i in range(index, end):
+                name, func, args, kwargs = operations[i]
+                if name in self._COMPILE_TRANSFORMATIONS:
+                    names = bind(i, name, args)
+                    expression = self._COMPILE_TRANSFORMATIONS[name].format(*names, value=expression, args=', '.join(names))
+                    continue
+
+                condition = self._COMPILE_CHECKS[name]
+                if condition is None:
+                    continue
+
+                if expression != 'value':
+                    emit(f'value = {expression}')
+                    expression = 'value'
+
+                names = bind(i, name, args)
+                emit(f'if not ({condition.format(*names, value="value", args=", ".join(names))}):')
+                if last:
+                    emit('    return None')
+                else:
+                    emit('    value = None')
+                    emit('else:')
+                    depth += 1
+
+            if last:
+                emit(f'return {expression}')
+            elif expression != 'value':
+                emit(f'value = {expression}')
+            elif lines[-1].endswith('else:'):
+                lines.pop()
+
+            depth = block_depth - 1
+            index = end
+
+        if not operations or (
+            operations[-1][0] not in self._COMPILE_TRANSFORMATIONS and operations[-1][0] not in self._COMPILE_CHECKS
+        ):
+            emit('if value is not None and not isinstance(value, str):')
+            emit('    raise ValueError(f"Need: `None` or `str`. Got: value=`{str(value)}` type=`{type(value)}`")')
+            emit('return value')
+
+        exec(compile('\n'.join(lines), '<normalizer>', 'exec'), namespace)
+        self._compiled = namespace['normalize']
+
+        return self._compiled
+
     def custom(self, func: Callable, *args, **kwargs) -> Self:
 
         if not callable(func):
             raise TypeError(f"Need: `Callable`. Got: `{str(func)}` type=`{type(func)}`")
 
         operation = ( 'custom', func, args, kwargs, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
+    def fingerprint(self) -> str:
+        """
+        Return the hash (hex) of the chain of operations and their arguments, which is the same in every process.
+        Functions of `custom` operations are identified by the module, the qualified name and their code
+        (see `stable_repr`). `TypeError` is raised for arguments without `repr` which is the same in every process.
+        """
+
+        operations = [
+            ( name, args, kwargs, func if name == 'custom' else None, )
+            for name, func, args, kwargs in self._operations
+        ]
+        return sha256(stable_repr(operations).encode()).hexdigest()
+
+    @classmethod
+    def from_spec(cls, spec: NormalizerSpecType) -> 'Normalizer':
+        """
+        Return the normalizer of the specification which is returned by `to_spec` (e.g. after `json.loads`).
+        Operations are added by their methods, so their arguments are validated in the same way.
+        """
+
+        if not isinstance(spec, dict):
+            raise TypeError(f"Need: `dict`. Got: `{str(spec)}` type=`{type(spec)}`")
+
+        if spec.get('version') != SPEC_VERSION:
+            raise ValueError(f"Need: specification version `{SPEC_VERSION}`. Got: `{spec.get('version')}`")
+
+        operations = spec.get('operations')
+        if not isinstance(operations, list):
+            raise TypeError(f"Need: `list`. Got: `{str(operations)}` type=`{type(operations)}`")
+
+        instance = cls()
+        for operation in operations:
+            if not isinstance(operation, dict):
+                raise TypeError(f"Need: `dict`. Got: `{str(operation)}` type=`{type(operation)}`")
+
+            name = operation.get('name')
+            if not isinstance(name, str) or name not in cls._MAPPING:
+                raise ValueError(f"Need: name of operation. Got: `{name}`")
+
+            args = operation.get('args', [])
+            if not isinstance(args, list):
+                raise TypeError(f"Need: `list`. Got: `{str(args)}` type=`{type(args)}`")
+
+            # tuples (e.g. suffixes of `endswith`) are lists in JSON
+            getattr(instance, name)(*( tuple(i) if isinstance(i, list) else i for i in args ))
+
+        return instance
+
     def endswith(self, *args) -> Self:
         """
         https://docs.python.org/3/library/stdtypes.html#str.endswith
@@ -173,7 +492,7 @@ class Normalizer:
         args = tuple( i for i in ( suffix, start, end, ) if i is not None )
 
         operation = ( name, func, args, {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -194,7 +513,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, ( length, ), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -209,7 +528,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -224,7 +543,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -239,7 +558,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -254,7 +573,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -269,7 +588,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -284,7 +603,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -297,7 +616,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -312,7 +631,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -327,7 +646,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -342,7 +661,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -357,7 +676,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -372,7 +691,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -387,7 +706,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -402,7 +721,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -426,7 +745,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, args, {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -447,7 +766,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, ( length, ), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -468,7 +787,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, ( length, ), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -481,7 +800,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -499,7 +818,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, ( prefix, ), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -517,7 +836,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, ( prefix, ), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -550,7 +869,41 @@ class Normalizer:
         args = ( old, new, ) if counter is None else ( old, new, counter, )
 
         operation = ( name, func, args, {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
+
+        return self
+
+    def re_fullmatch(self, pattern: str | Pattern[str], flags: int | RegexFlag = 0) -> Self:
+        """
+        https://docs.python.org/3/library/re.html#re.fullmatch
+
+        If type of value is `str` and the whole string matches the pattern. Else - `None`.
+        The pattern is compiled once.
+        """
+
+        name = 're_fullmatch'
+        func = self._MAPPING[name]
+        args = ( self._compile_pattern(pattern, flags), )
+
+        operation = ( name, func, args, {}, )
+        self._add_operation(operation)
+
+        return self
+
+    def re_search(self, pattern: str | Pattern[str], flags: int | RegexFlag = 0) -> Self:
+        """
+        https://docs.python.org/3/library/re.html#re.search
+
+        If type of value is `str` and the pattern is found in the string. Else - `None`.
+        The pattern is compiled once.
+        """
+
+        name = 're_search'
+        func = self._MAPPING[name]
+        args = ( self._compile_pattern(pattern, flags), )
+
+        operation = ( name, func, args, {}, )
+        self._add_operation(operation)
 
         return self
 
@@ -558,7 +911,6 @@ class Normalizer:
         self,
         pattern: str | Pattern[str],
         repl: str | Callable[[Match[str]], str],
-        string: str,
         count: int = 0,
         flags: int | RegexFlag = 0
     ) -> Self:
@@ -566,15 +918,24 @@ class Normalizer:
         https://docs.python.org/3/library/re.html#re.sub
 
         If type of value is `str` - modify and return. Else - `None`.
+        The pattern is compiled once.
         """
 
+        if not isinstance(repl, str) and not callable(repl):
+            raise TypeError(f"Need: `str` or `Callable`. Got: `{str(repl)}` type=`{type(repl)}`")
+
+        if not isinstance(count, int) or isinstance(count, bool):
+            raise TypeError(f"Need: `int`. Got: `{str(count)}` type=`{type(count)}`")
+
+        if count < 0:
+            raise ValueError(f"Need: value greater than or equal to 0. Got: `{count}`")
+
         name = 're_sub'
         func = self._MAPPING[name]
-        args = ( pattern, repl, string, )
-        kwargs = { 'count': count, 'flags': flags, }
+        args = ( self._compile_pattern(pattern, flags), repl, count, )
 
-        operation = ( name, func, args, kwargs, )
-        self._operations.append(operation)
+        operation = ( name, func, args, {}, )
+        self._add_operation(operation)
 
         return self
 
@@ -598,7 +959,7 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, args, {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -637,7 +998,7 @@ class Normalizer:
         args = tuple( i for i in ( prefix, start, end, ) if i is not None )
 
         operation = ( name, func, args, {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
@@ -661,10 +1022,37 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, args, {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
 
+    def to_spec(self) -> NormalizerSpecType:
+        """
+        Return the declarative specification of the chain of operations, which contains only JSON-compatible values:
+        names of operations with the arguments of their methods (regex patterns by the pattern and flags).
+        `Normalizer.from_spec` returns the same normalizer with the same fingerprint.
+        `custom` operations and functions of `re_sub` can not be specified, `ValueError` is raised.
+        """
+
+        operations = []
+        for name, func, args, kwargs in self._operations:
+            if name == 'custom':
+                raise ValueError(f"Need: operations without `custom`. Got: `custom({func!r})`")
+
+            if name in self._COMPILE_METHODS:
+                pattern, *args = args
+                if not isinstance(pattern.pattern, str):
+                    raise ValueError(f"Need: `str` pattern. Got: `{pattern.pattern!r}`")
+                # `re.UNICODE` is the default of `str` patterns
+                args = [ pattern.pattern, *args, int(pattern.flags & ~RegexFlag.UNICODE), ]
+
+            if name == 're_sub' and not isinstance(args[1], str):
+                raise ValueError(f"Need: `str` replacement of `re_sub`. Got: `{args[1]!r}`")
+
+            operations.append({ 'name': name, 'args': [ list(i) if isinstance(i, tuple) else i for i in args ], })
+
+        return { 'version': SPEC_VERSION, 'operations': operations, }
+
     def upper(self) -> Self:
         """
         https://docs.python.org/3/library/stdtypes.html#str.upper
@@ -676,6 +1064,6 @@ class Normalizer:
         func = self._MAPPING[name]
 
         operation = ( name, func, tuple(), {}, )
-        self._operations.append(operation)
+        self._add_operation(operation)
 
         return self
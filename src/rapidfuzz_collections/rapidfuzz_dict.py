@@ -1,4 +1,5 @@
 
+from concurrent.futures import Executor
 from copy import (
     copy,
     deepcopy
@@ -11,13 +12,16 @@ from rapidfuzz.process import (
 )
 from typing import (
     Any,
+    Callable,
     Generator,
+    Iterable,
     Iterator,
     Self,
     Union
 )
 
 from .enums import (
+    IndexType,
     ScorerType,
     Strategy
 )
@@ -27,6 +31,7 @@ from .types import (
     ScorerResultDictType
 )
 from .base import RapidfuzzCollection
+from .views import ChoicesView
 
 
 # noinspection DuplicatedCode
@@ -46,43 +51,28 @@ class RapidFuzzDict(RapidfuzzCollection):
         seq = copy(self._data)
         normalizer = copy(self.normalizer)
 
-        return self.__class__(
-            seq,
-            normalizer=normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._copy_choices(), normalizer)
 
     def __deepcopy__(self, memodict) -> 'RapidFuzzDict':
         """ Return deep copy. """
 
         seq = deepcopy(self._data, memo=memodict)
+        choices = deepcopy(self._choices, memo=memodict)
         normalizer = deepcopy(self.normalizer)
 
-        return self.__class__(
-            seq,
-            normalizer=normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, choices, normalizer)
 
     def __delitem__(self, key: Any):
         """ Delete self[key]. """
 
         del self._data[key]
+        self._generation += 1
 
         nk = self.normalizer(key)
         self._choices[nk].discard(key)
         if not self._choices[nk]:
             del self._choices[nk]
+            self._unlink_choice(nk)
 
     def __eq__(self, value: Any) -> bool:
         """ Return self==value. """
@@ -92,7 +82,7 @@ class RapidFuzzDict(RapidfuzzCollection):
 
         return (
             self._data == value._data and
-            self.choices == value.choices and
+            self._choices == value._choices and
             self.default_score_cutoff == value.default_score_cutoff and
             self.default_score_hint == value.default_score_hint and
             self.default_scorer_type == value.default_scorer_type and
@@ -113,7 +103,17 @@ class RapidFuzzDict(RapidfuzzCollection):
         scorer: ScorerProtocol = WRatio,
         scorer_kwargs: dict[str, Any] | None = None,
         scorer_type: ScorerType = ScorerType.SIMILARITY,
-        strategy: Strategy = Strategy.FIRST_FROM_BEST
+        strategy: Strategy = Strategy.FIRST_FROM_BEST,
+        query_cache_size: int | None = None,
+        result_cache_size: int | None = None,
+        qgram_size: int | None = None,
+        qgram_strictness: int | float = 1,
+        index_type: IndexType | None = None,
+        symspell_distance: int = 2,
+        symspell_max_entries: int | None = None,
+        workers: int = 1,
+        executor: Executor | None = None,
+        progress: Callable[[int, int], Any] | None = None
     ):
         """
         RapidFuzzDict() -> new empty RapidFuzzDict
@@ -140,20 +140,35 @@ class RapidFuzzDict(RapidfuzzCollection):
             scorer=scorer,
             scorer_kwargs=scorer_kwargs,
             scorer_type=scorer_type,
-            strategy=strategy
+            strategy=strategy,
+            query_cache_size=query_cache_size,
+            result_cache_size=result_cache_size,
+            qgram_size=qgram_size,
+            qgram_strictness=qgram_strictness,
+            index_type=index_type,
+            symspell_distance=symspell_distance,
+            symspell_max_entries=symspell_max_entries,
+            workers=workers,
+            executor=executor,
+            progress=progress
         )
 
     def __ior__(self, value: Union['RapidFuzzDict', dict]) -> Self:
         """ Return self|=value. """
 
         if isinstance(value, self.__class__):
-            self._data |= value._data
+            seq = value._data
         elif isinstance(value, dict):
-            self._data |= value
+            seq = value
         else:
             raise TypeError(f"'|=' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        self._normalize_choices()
+        if not seq:
+            return self
+
+        self._generation += 1
+        self._add_choices([ k for k in seq if k not in self._data ])
+        self._data |= seq
 
         return self
 
@@ -175,7 +190,7 @@ class RapidFuzzDict(RapidfuzzCollection):
 
         return not (
             self._data == value._data and
-            self.choices == value.choices and
+            self._choices == value._choices and
             self.default_score_cutoff == value.default_score_cutoff and
             self.default_score_hint == value.default_score_hint and
             self.default_scorer_type == value.default_scorer_type and
@@ -192,16 +207,7 @@ class RapidFuzzDict(RapidfuzzCollection):
         else:
             raise TypeError(f"'|' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._or_choices(value))
 
     def __repr__(self) -> str:
         """ Return repr(self). """
@@ -223,30 +229,160 @@ class RapidFuzzDict(RapidfuzzCollection):
         else:
             raise TypeError(f"'|' not supported between instances of '{type(value)}' and '{self.__class__.__qualname__}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._or_choices(value))
 
     def __setitem__(self, key: Any, value: Any):
         """ Set self[key] to value. """
 
         self._data[key] = value
+        self._generation += 1
 
         nk = self.normalizer(key)
         if nk not in self._choices:
             self._choices[nk] = set()
+            self._link_choice(nk)
         self._choices[nk].add(key)
 
     @property
-    def choices(self) -> dict[str | None, set[Any]]:
-        return deepcopy(self._choices)
+    def choices(self) -> ChoicesView:
+        return ChoicesView(self._choices)
+
+    def _add_choices(self, keys: Iterable):
+        """
+        Normalize only the passed keys and add them to choices.
+        """
+
+        normalize = self._compile_normalizer()
+        for k in keys:
+            nk = normalize(k)
+            if nk not in self._choices:
+                self._choices[nk] = set()
+                self._link_choice(nk)
+            self._choices[nk].add(k)
+
+    def _copy_choices(self) -> dict[str | None, set[Any]]:
+        """
+        Return copy of choices with copies of groups.
+        """
+
+        return { nk: set(ks) for nk, ks in self._choices.items() }
+
+    def _fuzzy_contains_choices(
+        self,
+        q: str | None,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer: ScorerProtocol,
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType
+    ) -> bool:
+        """
+        Search the normalized value `q` in choices: the cached part of `fuzzy_contains`.
+        """
+
+        if q is not None and q in self._choices:
+            return True
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        for nk, score, index in extract_iter(
+            q,
+            choices,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs
+        ):
+            if (
+                ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
+                ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(nk) ) )  # noqa
+            ):
+                return True
+        return False
+
+    def _fuzzy_get_choices(
+        self,
+        q: str | None,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer: ScorerProtocol,
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType,
+        strategy: Strategy
+    ) -> tuple | None:
+        """
+        Search the normalized value `q` in choices: the cached part of `fuzzy_get`.
+        """
+
+        if q is not None and q in self._choices:
+            ks = self._choices[q]
+            if strategy == Strategy.BEST_ONLY_ONE:
+                if len(ks) == 1:
+                    k = next(iter(ks))
+                    return k, self.__getitem__(k)
+            else:
+                k = next(iter(ks))
+                return k, self.__getitem__(k)
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        if strategy == Strategy.FIRST_FROM_BEST:
+
+            result = extractOne(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs
+            )
+            if result is None:
+                return None
+            nk, score, index = result
+            ks = self._choices[nk]
+            k = next(iter(ks))
+            return k, self.__getitem__(k)
+
+        elif strategy == Strategy.BEST_ONLY_ONE:
+
+            result = extract(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs,
+                limit=2
+            )
+            if not result:
+                return None
+            if len(result) == 1:
+                nk, score, index = result[0]
+                ks = self._choices[nk]
+                if len(ks) == 1:
+                    k = next(iter(ks))
+                    return k, self.__getitem__(k)
+            return None
+
+        elif strategy == Strategy.FIRST:
+            for nk, score, index in extract_iter(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs
+            ):
+                if (
+                    ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
+                    ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(nk) ) )
+                ):
+                    ks = self._choices[nk]
+                    k = next(iter(ks))
+                    return k, self.__getitem__(k)
+            return None
+
+        raise NotImplementedError
 
     def _normalize_choices(self):
         """
@@ -254,17 +390,47 @@ class RapidFuzzDict(RapidfuzzCollection):
         """
 
         self._choices = {}
-        for k in self._data.keys():
-            nk = self.normalizer(k)
+        for k, nk in zip(self._data, self._normalize_values(self._data.keys())):
             if nk not in self._choices:
                 self._choices[nk] = set()
             self._choices[nk].add(k)
 
+    def _or_choices(self, value: Union['RapidFuzzDict', dict]) -> dict[str | None, set[Any]]:
+        """
+        Return choices of the union of collection and value.
+        Only keys of value, which are not in collection, are normalized (if normalizers are different).
+        """
+
+        result = self._copy_choices()
+
+        if isinstance(value, self.__class__) and self._is_same_normalizer(value.normalizer):
+            for nk, ks in value._choices.items():
+                if nk in result:
+                    result[nk] |= ks
+                else:
+                    result[nk] = set(ks)
+            return result
+
+        seq = value._data if isinstance(value, self.__class__) else value
+        normalize = self._compile_normalizer()
+        for k in seq:
+            if k not in self._data:
+                nk = normalize(k)
+                if nk not in result:
+                    result[nk] = set()
+                result[nk].add(k)
+        return result
+
     def clear(self):
         """ Remove all items from collection. """
 
+        if not self._data:
+            return
+
+        self._generation += 1
         self._data.clear()
         self._choices.clear()
+        self._reset_indexes()
 
     def copy(self) -> 'RapidFuzzDict':
         """ Return shallow copy. """
@@ -272,16 +438,7 @@ class RapidFuzzDict(RapidfuzzCollection):
         seq = copy(self._data)
         normalizer = copy(self.normalizer)
 
-        return self.__class__(
-            seq,
-            normalizer=normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._copy_choices(), normalizer)
 
     @staticmethod
     def fromkeys(*args, **kwargs) -> 'RapidFuzzDict':
@@ -322,11 +479,13 @@ class RapidFuzzDict(RapidfuzzCollection):
         is_exist = self.__contains__(key)
         value = self._data.pop(key, *args)
         if is_exist:
+            self._generation += 1
             nk = self.normalizer(key)
             if nk in self._choices:
                 self._choices[nk].discard(key)
                 if not self._choices[nk]:
                     del self._choices[nk]
+                    self._unlink_choice(nk)
         return value
 
     def popitem(self) -> tuple[str | None, Any]:
@@ -338,11 +497,13 @@ class RapidFuzzDict(RapidfuzzCollection):
         """
 
         k, v = self._data.popitem()
+        self._generation += 1
         nk = self.normalizer(k)
         if nk in self._choices:
             self._choices[nk].discard(k)
             if not self._choices[nk]:
                 del self._choices[nk]
+                self._unlink_choice(nk)
         return k, v
 
     def setdefault(self, key: Any, value: Any = None) -> Any:
@@ -356,9 +517,11 @@ class RapidFuzzDict(RapidfuzzCollection):
             return self._data[key]
 
         self._data[key] = value
+        self._generation += 1
         nk = self.normalizer(key)
         if nk not in self._choices:
             self._choices[nk] = set()
+            self._link_choice(nk)
         self._choices[nk].add(key)
 
         return value
@@ -371,8 +534,13 @@ class RapidFuzzDict(RapidfuzzCollection):
         In either case, this is followed by: for k in F:  D[k] = F[k]
         """
 
-        self._data.update(*args, **kwargs)
-        self._normalize_choices()
+        seq = dict(*args, **kwargs)
+        if not seq:
+            return
+
+        self._generation += 1
+        self._add_choices([ k for k in seq if k not in self._data ])
+        self._data.update(seq)
 
     # noinspection PyUnresolvedReferences
     def values(self) -> 'dict_values':
@@ -410,25 +578,17 @@ class RapidFuzzDict(RapidfuzzCollection):
         if self.__contains__(key):
             return True
 
-        q = self.normalizer(key)
-
-        if q is not None and q in self._choices:
-            return True
+        q = self._normalize_query(key)
 
-        for nk, score, index in extract_iter(
+        return self._cached_result(
+            self._fuzzy_contains_choices,
             q,
-            self._choices.keys(),
-            scorer=scorer,
-            score_cutoff=score_cutoff,
-            score_hint=score_hint,
-            scorer_kwargs=scorer_kwargs
-        ):
-            if (
-                ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
-                ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(nk) ) )  # noqa
-            ):
-                return True
-        return False
+            score_cutoff,
+            score_hint,
+            scorer,
+            scorer_kwargs,
+            scorer_type
+        )
 
     def fuzzy_get(self, key: Any, **kwargs) -> tuple | None:
         """
@@ -445,8 +605,11 @@ class RapidFuzzDict(RapidfuzzCollection):
             scorer_kwargs
             scorer_type
             strategy
+            workers
         If an argument is passed, then it is used for the search,
         otherwise the default value specified when the class was initialized is used.
+        `workers` is the number of threads, `-1` means all available cores (default is `default_workers`).
+        More than one thread scores chunks of choices by `cdist` in parallel, the same as `fuzzy_get_many` does.
 
         :return:
         Tuple of key and value from collection if key exists, `None` otherwise.
@@ -458,79 +621,160 @@ class RapidFuzzDict(RapidfuzzCollection):
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
         scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
         strategy = self._check_strategy(kwargs.get('strategy', self.default_strategy))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+
+        if workers != 1:
+            return self.fuzzy_get_many([ key ], **kwargs)[0]
 
         if self.__contains__(key):
             return key, self.__getitem__(key)
 
-        q = self.normalizer(key)
+        q = self._normalize_query(key)
 
-        if q is not None and q in self._choices:
-            ks = self._choices[q]
-            if strategy == Strategy.BEST_ONLY_ONE:
-                if len(ks) == 1:
+        return self._cached_result(
+            self._fuzzy_get_choices,
+            q,
+            score_cutoff,
+            score_hint,
+            scorer,
+            scorer_kwargs,
+            scorer_type,
+            strategy
+        )
+
+    def fuzzy_get_many(self, keys: Iterable, **kwargs) -> list[tuple | None]:
+        """
+        Batch version of `fuzzy_get`.
+        All keys are normalized at first and then scored together by `rapidfuzz.process.cdist`.
+
+        :param keys:
+        Keys to search for in collection's keys.
+
+        :param kwargs:
+        Optional named arguments:
+            score_cutoff
+            score_hint
+            scorer
+            scorer_kwargs
+            scorer_type
+            strategy
+            workers
+        If an argument is passed, then it is used for the search,
+        otherwise the default value specified when the class was initialized is used.
+        `workers` is the number of threads for `cdist`, `-1` means all available cores (default is `default_workers`).
+
+        :return:
+        List of results of `fuzzy_get` in the order of keys.
+        """
+
+        score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
+        score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
+        scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
+        scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+        scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
+        strategy = self._check_strategy(kwargs.get('strategy', self.default_strategy))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+
+        result = []
+        queries = {}
+
+        for key in keys:
+            if self.__contains__(key):
+                result.append(( key, self.__getitem__(key), ))
+                continue
+
+            q = self._normalize_query(key)
+
+            if q is not None and q in self._choices:
+                ks = self._choices[q]
+                if strategy != Strategy.BEST_ONLY_ONE or len(ks) == 1:
                     k = next(iter(ks))
-                    return k, self.__getitem__(k)
-            else:
-                k = next(iter(ks))
-                return k, self.__getitem__(k)
+                    result.append(( k, self.__getitem__(k), ))
+                    continue
 
-        if strategy == Strategy.FIRST_FROM_BEST:
+            if q is not None:
+                queries.setdefault(q, []).append(len(result))
+            result.append(None)
 
-            result = extractOne(
-                q,
-                self._choices.keys(),
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs
-            )
-            if result is None:
-                return None
-            nk, score, index = result
-            ks = self._choices[nk]
+        qs = list(queries)
+        nks = self._select_batch_choices(qs, scorer, score_cutoff, scorer_kwargs)
+
+        for index, choice_index in self._iter_best_choices(
+            qs,
+            nks,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            scorer_type=scorer_type,
+            strategy=strategy,
+            workers=workers
+        ):
+            if choice_index is None:
+                continue
+            ks = self._choices[nks[choice_index]]
+            if strategy == Strategy.BEST_ONLY_ONE and len(ks) != 1:
+                continue
             k = next(iter(ks))
-            return k, self.__getitem__(k)
+            for position in queries[qs[index]]:
+                result[position] = k, self.__getitem__(k)
 
-        elif strategy == Strategy.BEST_ONLY_ONE:
+        return result
 
-            result = extract(
-                q,
-                self._choices.keys(),
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs,
-                limit=2
-            )
-            if not result:
-                return None
-            if len(result) == 1:
-                nk, score, index = result[0]
-                ks = self._choices[nk]
-                if len(ks) == 1:
-                    k = next(iter(ks))
-                    return k, self.__getitem__(k)
-            return None
+    def fuzzy_top_k(self, key: Any, k: int, **kwargs) -> list[ScorerResultDictType]:
+        """
+        Return `k` elements of the collection which are most similar to key.
+        Only `k` best scores are kept while scoring instead of sorting all of them.
 
-        elif strategy == Strategy.FIRST:
-            for nk, score, index in extract_iter(
-                q,
-                self._choices.keys(),
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs
-            ):
-                if (
-                    ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
-                    ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(nk) ) )
-                ):
-                    ks = self._choices[nk]
-                    k = next(iter(ks))
-                    return k, self.__getitem__(k)
-            return None
+        :param key:
+        Key to search for in collection's keys.
 
-        raise NotImplementedError
+        :param k:
+        Maximum number of returned elements.
+
+        :param kwargs:
+        Optional named arguments:
+            score_cutoff
+            score_hint
+            scorer
+            scorer_kwargs
+        If an argument is passed, then it is used for the search,
+        otherwise the default value specified when the class was initialized is used.
+
+        :return:
+        List of up to `k` Tuples with 3 elements like `get_fuzzy_scores` returns, but only with elements
+        which passed `score_cutoff`. The first element in the list has the highest similarity / the smallest distance.
+        """
+
+        k = self._check_top_k(k)
+        score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
+        score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
+        scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
+        scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+
+        q = self._normalize_query(key)
+
+        result = []
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        for nk, score, index in extract(
+            q,
+            choices,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            limit=k
+        ):
+            # groups of equal normalized keys are expanded only until `k` elements are collected
+            for choice_key in self._choices[nk]:
+                item = self.__getitem__(choice_key), score, choice_key
+                result.append(item)
+                if len(result) == k:
+                    return result
+
+        return result
 
     def get_fuzzy_scores(self, key: Any, **kwargs) -> list[ScorerResultDictType]:
         """
@@ -545,8 +789,14 @@ class RapidFuzzDict(RapidfuzzCollection):
             score_hint
             scorer
             scorer_kwargs
+            unscored
+            workers
         If an argument is passed, then it is used for the search,
         otherwise the default value specified when the class was initialized is used.
+        `unscored` adds elements, which are not scored or did not pass `score_cutoff`, with `None` score
+        to the end of the list (default is `True`).
+        `workers` is the number of threads, `-1` means all available cores (default is `default_workers`).
+        More than one thread scores chunks of choices by `cdist` in parallel, the same as `get_fuzzy_scores_many` does.
 
         :return:
         List of Tuples with 3 elements:
@@ -566,15 +816,22 @@ class RapidFuzzDict(RapidfuzzCollection):
         score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
         scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+        unscored = self._check_unscored(kwargs.get('unscored', True))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
 
-        q = self.normalizer(key)
+        if workers != 1:
+            return self.get_fuzzy_scores_many([ key ], **kwargs)[0]
+
+        q = self._normalize_query(key)
 
         result = []
         indexes = set()
 
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
         for nk, score, index in extract(
             q,
-            self._choices.keys(),
+            choices,
             scorer=scorer,
             score_cutoff=score_cutoff,
             score_hint=score_hint,
@@ -587,10 +844,90 @@ class RapidFuzzDict(RapidfuzzCollection):
                 indexes.add(k)
                 result.append(item)
 
-        for k, v in self.items():
-            if k not in indexes:
-                item = v, None, k
-                result.append(item)
+        if unscored:
+            for k, v in self.items():
+                if k not in indexes:
+                    item = v, None, k
+                    result.append(item)
+
+        return result
+
+    def get_fuzzy_scores_many(self, keys: Iterable, **kwargs) -> list[list[ScorerResultDictType]]:
+        """
+        Batch version of `get_fuzzy_scores`.
+        All keys are normalized at first and then scored together by `rapidfuzz.process.cdist`.
+
+        :param keys:
+        Keys to search for in collection's keys.
+
+        :param kwargs:
+        Optional named arguments:
+            score_cutoff
+            score_hint
+            scorer
+            scorer_kwargs
+            scorer_type
+            workers
+            unscored
+        If an argument is passed, then it is used for the search,
+        otherwise the default value specified when the class was initialized is used.
+        `workers` is the number of threads for `cdist`, `-1` means all available cores (default is `default_workers`).
+        `unscored` adds elements, which are not scored or did not pass `score_cutoff`, with `None` score
+        to the end of the list (default is `True`).
+
+        :return:
+        List of results of `get_fuzzy_scores` in the order of keys.
+        """
+
+        score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
+        score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
+        scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
+        scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+        scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+        unscored = self._check_unscored(kwargs.get('unscored', True))
+
+        queries = {}
+        for position, key in enumerate(keys):
+            queries.setdefault(self._normalize_query(key), []).append(position)
+
+        qs = [ q for q in queries if q is not None ]
+        nks = self._select_batch_choices(qs, scorer, score_cutoff, scorer_kwargs)
+        scores = dict.fromkeys(queries, [])
+
+        for index, pairs in self._iter_sorted_scores(
+            qs,
+            nks,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            scorer_type=scorer_type,
+            workers=workers
+        ):
+            scores[qs[index]] = pairs
+
+        result = [ None ] * sum(map(len, queries.values()))
+
+        for q, positions in queries.items():
+            items = []
+            indexes = set()
+
+            for choice_index, score in scores[q]:
+                ks = self._choices[nks[choice_index]]
+                for k in ks:
+                    item = self.__getitem__(k), score, k
+                    indexes.add(k)
+                    items.append(item)
+
+            if unscored:
+                for k, v in self.items():
+                    if k not in indexes:
+                        item = v, None, k
+                        items.append(item)
+
+            for position in positions:
+                result[position] = list(items)
 
         return result
 
@@ -626,11 +963,13 @@ class RapidFuzzDict(RapidfuzzCollection):
         scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
 
-        q = self.normalizer(key)
+        q = self._normalize_query(key)
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
 
         for nk, score, index in extract_iter(
             q,
-            self._choices.keys(),
+            choices,
             scorer=scorer,
             score_cutoff=score_cutoff,
             score_hint=score_hint,
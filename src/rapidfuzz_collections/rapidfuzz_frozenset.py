@@ -1,4 +1,5 @@
 
+from concurrent.futures import Executor
 from copy import copy
 from rapidfuzz.fuzz import WRatio
 from rapidfuzz.process import (
@@ -8,13 +9,16 @@ from rapidfuzz.process import (
 )
 from typing import (
     Any,
+    Callable,
     Generator,
     Hashable,
+    Iterable,
     Iterator,
     Union
 )
 
 from .enums import (
+    IndexType,
     ScorerType,
     Strategy
 )
@@ -24,6 +28,7 @@ from .types import (
     ScorerResultSetType
 )
 from .base import RapidfuzzCollection
+from .views import ChoicesView
 
 
 # noinspection DuplicatedCode
@@ -42,16 +47,7 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         else:
             raise TypeError(f"'&' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._and_choices(value))
 
     def __contains__(self, item: Any) -> bool:
         """ Return bool(key in self). """
@@ -64,16 +60,7 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         seq = copy(self._data)
         normalizer = copy(self.normalizer)
 
-        return self.__class__(
-            seq,
-            normalizer=normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._choices, normalizer)
 
     def __eq__(self, value: Any) -> bool:
         """ Return self==value. """
@@ -83,7 +70,7 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
 
         return (
             self._data == value._data and
-            self.choices == value.choices and
+            self._choices == value._choices and
             self.default_score_cutoff == value.default_score_cutoff and
             self.default_score_hint == value.default_score_hint and
             self.default_scorer_type == value.default_scorer_type and
@@ -99,7 +86,17 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         scorer: ScorerProtocol = WRatio,
         scorer_kwargs: dict[str, Any] | None = None,
         scorer_type: ScorerType = ScorerType.SIMILARITY,
-        strategy: Strategy = Strategy.FIRST_FROM_BEST
+        strategy: Strategy = Strategy.FIRST_FROM_BEST,
+        query_cache_size: int | None = None,
+        result_cache_size: int | None = None,
+        qgram_size: int | None = None,
+        qgram_strictness: int | float = 1,
+        index_type: IndexType | None = None,
+        symspell_distance: int = 2,
+        symspell_max_entries: int | None = None,
+        workers: int = 1,
+        executor: Executor | None = None,
+        progress: Callable[[int, int], Any] | None = None
     ):
         """
         RapidFuzzFrozenSet() -> new empty RapidFuzzFrozenSet object
@@ -125,7 +122,17 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
             scorer=scorer,
             scorer_kwargs=scorer_kwargs,
             scorer_type=scorer_type,
-            strategy=strategy
+            strategy=strategy,
+            query_cache_size=query_cache_size,
+            result_cache_size=result_cache_size,
+            qgram_size=qgram_size,
+            qgram_strictness=qgram_strictness,
+            index_type=index_type,
+            symspell_distance=symspell_distance,
+            symspell_max_entries=symspell_max_entries,
+            workers=workers,
+            executor=executor,
+            progress=progress
         )
 
     def __iter__(self) -> Iterator:
@@ -146,7 +153,7 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
 
         return not (
             self._data == value._data and
-            self.choices == value.choices and
+            self._choices == value._choices and
             self.default_score_cutoff == value.default_score_cutoff and
             self.default_score_hint == value.default_score_hint and
             self.default_scorer_type == value.default_scorer_type and
@@ -163,16 +170,7 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         else:
             raise TypeError(f"'|' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._or_choices(value))
 
     def __rand__(self, value: Union['RapidFuzzFrozenSet', set, frozenset]) -> 'RapidFuzzFrozenSet':
         """ Return value&self. """
@@ -184,16 +182,7 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         else:
             raise TypeError(f"'&' not supported between instances of '{type(value)}' and '{self.__class__.__qualname__}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._and_choices(value))
 
     def __repr__(self) -> str:
         """ Return repr(self). """
@@ -210,37 +199,21 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         else:
             raise TypeError(f"'|' not supported between instances of '{type(value)}' and '{self.__class__.__qualname__}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._or_choices(value))
 
     def __rsub__(self, value: Union['RapidFuzzFrozenSet', set, frozenset]) -> 'RapidFuzzFrozenSet':
         """ Return value-self. """
 
         if isinstance(value, self.__class__):
             seq = value._data - self._data
+            if self._is_same_normalizer(value.normalizer):
+                return self._derive(seq, value._sub_choices(self))
         elif isinstance(value, ( set, frozenset, )):
             seq = value - self._data
         else:
             raise TypeError(f"'-' not supported between instances of '{type(value)}' and '{self.__class__.__qualname__}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._make_choices(seq))
 
     def __rxor__(self, value: Union['RapidFuzzFrozenSet', set, frozenset]) -> 'RapidFuzzFrozenSet':
         """ Return value^self. """
@@ -252,16 +225,7 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         else:
             raise TypeError(f"'^' not supported between instances of '{type(value)}' and '{self.__class__.__qualname__}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._xor_choices(value))
 
     def __sub__(self, value: Union['RapidFuzzFrozenSet', set, frozenset]) -> 'RapidFuzzFrozenSet':
         """ Return self-value. """
@@ -273,16 +237,7 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         else:
             raise TypeError(f"'-' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._sub_choices(value))
 
     def __xor__(self, value: Union['RapidFuzzFrozenSet', set, frozenset]) -> 'RapidFuzzFrozenSet':
         """ Return self^value. """
@@ -294,20 +249,176 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         else:
             raise TypeError(f"'^' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._xor_choices(value))
 
     @property
-    def choices(self) -> dict[str | None, set[Union[Hashable, None]]]:
-        return self._choices
+    def choices(self) -> ChoicesView:
+        return ChoicesView(self._choices)
+
+    def _and_choices(
+        self,
+        value: Union['RapidFuzzFrozenSet', set, frozenset]
+    ) -> dict[str | None, set[Union[Hashable, None]]]:
+        """
+        Return choices of the intersection of collection and value.
+        The normalizer is not called.
+        """
+
+        result = {}
+
+        if isinstance(value, self.__class__) and self._is_same_normalizer(value.normalizer):
+            choices, other = self._choices, value._choices
+            if len(other) < len(choices):
+                choices, other = other, choices
+            for choice, vs in choices.items():
+                if choice in other:
+                    common = vs & other[choice]
+                    if common:
+                        result[choice] = common
+            return result
+
+        seq = value._data if isinstance(value, self.__class__) else value
+        for choice, vs in self._choices.items():
+            common = vs & seq
+            if common:
+                result[choice] = common
+        return result
+
+    def _copy_choices(self) -> dict[str | None, set[Union[Hashable, None]]]:
+        """
+        Return copy of choices with copies of groups.
+        """
+
+        return { choice: set(vs) for choice, vs in self._choices.items() }
+
+    def _fuzzy_contains_choices(
+        self,
+        q: str | None,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer: ScorerProtocol,
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType
+    ) -> bool:
+        """
+        Search the normalized value `q` in choices: the cached part of `fuzzy_contains`.
+        """
+
+        if q is not None and q in self._choices:
+            return True
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        for nk, score, index in extract_iter(
+            q,
+            choices,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs
+        ):
+            if (
+                ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
+                ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(nk) ) )  # noqa
+            ):
+                return True
+        return False
+
+    def _fuzzy_get_choices(
+        self,
+        q: str | None,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer: ScorerProtocol,
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType,
+        strategy: Strategy
+    ) -> tuple | None:
+        """
+        Search the normalized value `q` in choices: the cached part of `fuzzy_get`.
+        """
+
+        if q is not None and q in self._choices:
+            ks = self._choices[q]
+            if strategy == Strategy.BEST_ONLY_ONE:
+                if len(ks) == 1:
+                    k = next(iter(ks))
+                    return k
+            else:
+                k = next(iter(ks))
+                return k
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        if strategy == Strategy.FIRST_FROM_BEST:
+            result = extractOne(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs
+            )
+            if result is None:
+                return None
+            nk, score, index = result
+            ks = self._choices[nk]
+            k = next(iter(ks))
+            return k
+
+        elif strategy == Strategy.BEST_ONLY_ONE:
+            result = extract(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs,
+                limit=2
+            )
+            if not result:
+                return None
+            if len(result) == 1:
+                nk, score, index = result[0]
+                ks = self._choices[nk]
+                if len(ks) == 1:
+                    k = next(iter(ks))
+                    return k
+            return None
+
+        elif strategy == Strategy.FIRST:
+            for nk, score, index in extract_iter(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs
+            ):
+                if (
+                    ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
+                    ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(nk) ) )
+                ):
+                    ks = self._choices[nk]
+                    k = next(iter(ks))
+                    return k
+            return None
+
+        raise NotImplementedError
+
+    def _make_choices(self, values: Iterable) -> dict[str | None, set[Union[Hashable, None]]]:
+        """
+        Normalize values and return them as choices.
+        """
+
+        choices = {}
+        normalize = self._compile_normalizer()
+        for value in values:
+            choice = normalize(value)
+            if choice not in choices:
+                choices[choice] = set()
+            choices[choice].add(value)
+        return choices
 
     def _normalize_choices(self):
         """
@@ -315,28 +426,101 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         """
 
         self._choices = {}
-        for value in self:
-            choice = self.normalizer(value)
+        for value, choice in zip(self._data, self._normalize_values(self._data)):
             if choice not in self._choices:
                 self._choices[choice] = set()
             self._choices[choice].add(value)
 
+    def _or_choices(
+        self,
+        value: Union['RapidFuzzFrozenSet', set, frozenset]
+    ) -> dict[str | None, set[Union[Hashable, None]]]:
+        """
+        Return choices of the union of collection and value.
+        Only elements of value, which are not in collection, are normalized (if normalizers are different).
+        """
+
+        result = self._copy_choices()
+
+        if isinstance(value, self.__class__) and self._is_same_normalizer(value.normalizer):
+            for choice, vs in value._choices.items():
+                if choice in result:
+                    result[choice] |= vs
+                else:
+                    result[choice] = set(vs)
+            return result
+
+        seq = value._data if isinstance(value, self.__class__) else value
+        for choice, vs in self._make_choices(seq - self._data).items():
+            if choice in result:
+                result[choice] |= vs
+            else:
+                result[choice] = vs
+        return result
+
+    def _sub_choices(
+        self,
+        value: Union['RapidFuzzFrozenSet', set, frozenset]
+    ) -> dict[str | None, set[Union[Hashable, None]]]:
+        """
+        Return choices of the difference of collection and value.
+        The normalizer is not called.
+        """
+
+        result = {}
+
+        if isinstance(value, self.__class__) and self._is_same_normalizer(value.normalizer):
+            other = value._choices
+            for choice, vs in self._choices.items():
+                rest = vs - other[choice] if choice in other else set(vs)
+                if rest:
+                    result[choice] = rest
+            return result
+
+        seq = value._data if isinstance(value, self.__class__) else value
+        for choice, vs in self._choices.items():
+            rest = vs - seq
+            if rest:
+                result[choice] = rest
+        return result
+
+    def _xor_choices(
+        self,
+        value: Union['RapidFuzzFrozenSet', set, frozenset]
+    ) -> dict[str | None, set[Union[Hashable, None]]]:
+        """
+        Return choices of the symmetric difference of collection and value.
+        Only elements of value, which are not in collection, are normalized (if normalizers are different).
+        """
+
+        if isinstance(value, self.__class__) and self._is_same_normalizer(value.normalizer):
+            result = {}
+            other = value._choices
+            for choice, vs in self._choices.items():
+                rest = vs ^ other[choice] if choice in other else set(vs)
+                if rest:
+                    result[choice] = rest
+            for choice, vs in other.items():
+                if choice not in self._choices:
+                    result[choice] = set(vs)
+            return result
+
+        seq = value._data if isinstance(value, self.__class__) else value
+        result = self._sub_choices(seq)
+        for choice, vs in self._make_choices(seq - self._data).items():
+            if choice in result:
+                result[choice] |= vs
+            else:
+                result[choice] = vs
+        return result
+
     def copy(self) -> 'RapidFuzzFrozenSet':
         """ Return a shallow copy. """
 
         seq = self._data.copy()
         normalizer = copy(self.normalizer)
 
-        return self.__class__(
-            seq,
-            normalizer=normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._choices, normalizer)
 
     def difference(self, *args) -> 'RapidFuzzFrozenSet':
         """
@@ -346,28 +530,15 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         (i.e. all elements that are in this 'RapidFuzzFrozenSet' but not the others.)
         """
 
-        sets = []
-
         for i in args:
-            if isinstance(i, ( set, frozenset, )):
-                sets.append(i)
-            elif isinstance(i, self.__class__):
-                sets.append(i._data)
-            else:
+            if not isinstance(i, ( set, frozenset, self.__class__, )):
                 raise TypeError(f"'difference' not supported between instances of '{self.__class__.__qualname__}' and '{type(i)}'")  # noqa: E501
 
-        seq = self._data.difference(*sets)
-
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        result = self._derive(self._data.copy(), self._copy_choices())
+        for i in args:
+            result = result.__sub__(i)
+
+        return result
 
     def intersection(self, *args) -> 'RapidFuzzFrozenSet':
         """
@@ -377,28 +548,15 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         (i.e. all elements that are in both collections.)
         """
 
-        sets = []
-
         for i in args:
-            if isinstance(i, ( set, frozenset, )):
-                sets.append(i)
-            elif isinstance(i, self.__class__):
-                sets.append(i._data)
-            else:
+            if not isinstance(i, ( set, frozenset, self.__class__, )):
                 raise TypeError(f"'intersection' not supported between instances of '{self.__class__.__qualname__}' and '{type(i)}'")  # noqa: E501
 
-        seq = self._data.intersection(*sets)
-
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        result = self._derive(self._data.copy(), self._copy_choices())
+        for i in args:
+            result = result.__and__(i)
+
+        return result
 
     def isdisjoint(self, other: Union['RapidFuzzFrozenSet', set, frozenset]) -> bool:
         """ Return True if two sets have a null intersection. """
@@ -448,16 +606,7 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         else:
             raise TypeError(f"'symmetric_difference' not supported between instances of '{self.__class__.__qualname__}' and '{type(other)}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._xor_choices(other))
 
     def union(self, *args) -> 'RapidFuzzFrozenSet':
         """
@@ -466,28 +615,15 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         (i.e. all elements that are in either set.)
         """
 
-        sets = []
-
         for i in args:
-            if isinstance(i, ( set, frozenset, )):
-                sets.append(i)
-            elif isinstance(i, self.__class__):
-                sets.append(i._data)
-            else:
+            if not isinstance(i, ( set, frozenset, self.__class__, )):
                 raise TypeError(f"'union' not supported between instances of '{self.__class__.__qualname__}' and '{type(i)}'")  # noqa: E501
 
-        seq = self._data.union(*sets)
-
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        result = self._derive(self._data.copy(), self._copy_choices())
+        for i in args:
+            result = result.__or__(i)
+
+        return result
 
     def fuzzy_contains(self, value: Any, **kwargs) -> bool:
         """
@@ -519,25 +655,17 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         if self.__contains__(value):
             return True
 
-        q = self.normalizer(value)
-
-        if q is not None and q in self._choices:
-            return True
+        q = self._normalize_query(value)
 
-        for nk, score, index in extract_iter(
+        return self._cached_result(
+            self._fuzzy_contains_choices,
             q,
-            self._choices.keys(),
-            scorer=scorer,
-            score_cutoff=score_cutoff,
-            score_hint=score_hint,
-            scorer_kwargs=scorer_kwargs
-        ):
-            if (
-                ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
-                ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(nk) ) )  # noqa
-            ):
-                return True
-        return False
+            score_cutoff,
+            score_hint,
+            scorer,
+            scorer_kwargs,
+            scorer_type
+        )
 
     def fuzzy_get(self, value: Any, **kwargs) -> tuple | None:
         """
@@ -554,8 +682,11 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
             scorer_kwargs
             scorer_type
             strategy
+            workers
         If an argument is passed, then it is used for the search,
         otherwise the default value specified when the class was initialized is used.
+        `workers` is the number of threads, `-1` means all available cores (default is `default_workers`).
+        More than one thread scores chunks of choices by `cdist` in parallel, the same as `fuzzy_get_many` does.
 
         :return:
         The value from collection if exists a similar value, `None` otherwise.
@@ -567,77 +698,159 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
         scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
         strategy = self._check_strategy(kwargs.get('strategy', self.default_strategy))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+
+        if workers != 1:
+            return self.fuzzy_get_many([ value ], **kwargs)[0]
 
         if self.__contains__(value):
             return value
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
 
-        if q is not None and q in self._choices:
-            ks = self._choices[q]
-            if strategy == Strategy.BEST_ONLY_ONE:
-                if len(ks) == 1:
-                    k = next(iter(ks))
-                    return k
-            else:
-                k = next(iter(ks))
-                return k
+        return self._cached_result(
+            self._fuzzy_get_choices,
+            q,
+            score_cutoff,
+            score_hint,
+            scorer,
+            scorer_kwargs,
+            scorer_type,
+            strategy
+        )
 
-        if strategy == Strategy.FIRST_FROM_BEST:
-            result = extractOne(
-                q,
-                self._choices.keys(),
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs
-            )
-            if result is None:
-                return None
-            nk, score, index = result
-            ks = self._choices[nk]
+    def fuzzy_get_many(self, values: Iterable, **kwargs) -> list[Any]:
+        """
+        Batch version of `fuzzy_get`.
+        All values are normalized at first and then scored together by `rapidfuzz.process.cdist`.
+
+        :param values:
+        Values to search for in collection.
+
+        :param kwargs:
+        Optional named arguments:
+            score_cutoff
+            score_hint
+            scorer
+            scorer_kwargs
+            scorer_type
+            strategy
+            workers
+        If an argument is passed, then it is used for the search,
+        otherwise the default value specified when the class was initialized is used.
+        `workers` is the number of threads for `cdist`, `-1` means all available cores (default is `default_workers`).
+
+        :return:
+        List of results of `fuzzy_get` in the order of values.
+        """
+
+        score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
+        score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
+        scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
+        scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+        scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
+        strategy = self._check_strategy(kwargs.get('strategy', self.default_strategy))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+
+        result = []
+        queries = {}
+
+        for value in values:
+            if self.__contains__(value):
+                result.append(value)
+                continue
+
+            q = self._normalize_query(value)
+
+            if q is not None and q in self._choices:
+                ks = self._choices[q]
+                if strategy != Strategy.BEST_ONLY_ONE or len(ks) == 1:
+                    result.append(next(iter(ks)))
+                    continue
+
+            if q is not None:
+                queries.setdefault(q, []).append(len(result))
+            result.append(None)
+
+        qs = list(queries)
+        nks = self._select_batch_choices(qs, scorer, score_cutoff, scorer_kwargs)
+
+        for index, choice_index in self._iter_best_choices(
+            qs,
+            nks,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            scorer_type=scorer_type,
+            strategy=strategy,
+            workers=workers
+        ):
+            if choice_index is None:
+                continue
+            ks = self._choices[nks[choice_index]]
+            if strategy == Strategy.BEST_ONLY_ONE and len(ks) != 1:
+                continue
             k = next(iter(ks))
-            return k
+            for position in queries[qs[index]]:
+                result[position] = k
 
-        elif strategy == Strategy.BEST_ONLY_ONE:
-            result = extract(
-                q,
-                self._choices.keys(),
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs,
-                limit=2
-            )
-            if not result:
-                return None
-            if len(result) == 1:
-                nk, score, index = result[0]
-                ks = self._choices[nk]
-                if len(ks) == 1:
-                    k = next(iter(ks))
-                    return k
-            return None
+        return result
 
-        elif strategy == Strategy.FIRST:
-            for nk, score, index in extract_iter(
-                q,
-                self._choices.keys(),
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs
-            ):
-                if (
-                    ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
-                    ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(nk) ) )
-                ):
-                    ks = self._choices[nk]
-                    k = next(iter(ks))
-                    return k
-            return None
+    def fuzzy_top_k(self, value: Any, k: int, **kwargs) -> list[ScorerResultSetType]:
+        """
+        Return `k` elements of the collection which are most similar to value.
+        Only `k` best scores are kept while scoring instead of sorting all of them.
 
-        raise NotImplementedError
+        :param value:
+        Value to search for in collection.
+
+        :param k:
+        Maximum number of returned elements.
+
+        :param kwargs:
+        Optional named arguments:
+            score_cutoff
+            score_hint
+            scorer
+            scorer_kwargs
+        If an argument is passed, then it is used for the search,
+        otherwise the default value specified when the class was initialized is used.
+
+        :return:
+        List of up to `k` Tuples with 2 elements like `get_fuzzy_scores` returns, but only with elements
+        which passed `score_cutoff`. The first element in the list has the highest similarity / the smallest distance.
+        """
+
+        k = self._check_top_k(k)
+        score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
+        score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
+        scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
+        scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+
+        q = self._normalize_query(value)
+
+        result = []
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        for nk, score, index in extract(
+            q,
+            choices,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            limit=k
+        ):
+            # groups of equal normalized values are expanded only until `k` elements are collected
+            for choice in self._choices[nk]:
+                item = choice, score
+                result.append(item)
+                if len(result) == k:
+                    return result
+
+        return result
 
     def get_fuzzy_scores(self, value: Any, **kwargs) -> list[ScorerResultSetType]:
         """
@@ -652,8 +865,14 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
             score_hint
             scorer
             scorer_kwargs
+            unscored
+            workers
         If an argument is passed, then it is used for the search,
         otherwise the default value specified when the class was initialized is used.
+        `unscored` adds elements, which are not scored or did not pass `score_cutoff`, with `None` score
+        to the end of the list (default is `True`).
+        `workers` is the number of threads, `-1` means all available cores (default is `default_workers`).
+        More than one thread scores chunks of choices by `cdist` in parallel, the same as `get_fuzzy_scores_many` does.
 
         :return:
         List of Tuples with 2 elements:
@@ -672,15 +891,22 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
         scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+        unscored = self._check_unscored(kwargs.get('unscored', True))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+
+        if workers != 1:
+            return self.get_fuzzy_scores_many([ value ], **kwargs)[0]
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
 
         result = []
         indexes = set()
 
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
         for nk, score, index in extract(
             q,
-            self._choices.keys(),
+            choices,
             scorer=scorer,
             score_cutoff=score_cutoff,
             score_hint=score_hint,
@@ -693,10 +919,90 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
                 indexes.add(k)
                 result.append(item)
 
-        for k in self:
-            if k not in indexes:
-                item = k, None
-                result.append(item)
+        if unscored:
+            for k in self:
+                if k not in indexes:
+                    item = k, None
+                    result.append(item)
+
+        return result
+
+    def get_fuzzy_scores_many(self, values: Iterable, **kwargs) -> list[list[ScorerResultSetType]]:
+        """
+        Batch version of `get_fuzzy_scores`.
+        All values are normalized at first and then scored together by `rapidfuzz.process.cdist`.
+
+        :param values:
+        Values to search for in collection.
+
+        :param kwargs:
+        Optional named arguments:
+            score_cutoff
+            score_hint
+            scorer
+            scorer_kwargs
+            scorer_type
+            workers
+            unscored
+        If an argument is passed, then it is used for the search,
+        otherwise the default value specified when the class was initialized is used.
+        `workers` is the number of threads for `cdist`, `-1` means all available cores (default is `default_workers`).
+        `unscored` adds elements, which are not scored or did not pass `score_cutoff`, with `None` score
+        to the end of the list (default is `True`).
+
+        :return:
+        List of results of `get_fuzzy_scores` in the order of values.
+        """
+
+        score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
+        score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
+        scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
+        scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+        scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+        unscored = self._check_unscored(kwargs.get('unscored', True))
+
+        queries = {}
+        for position, value in enumerate(values):
+            queries.setdefault(self._normalize_query(value), []).append(position)
+
+        qs = [ q for q in queries if q is not None ]
+        nks = self._select_batch_choices(qs, scorer, score_cutoff, scorer_kwargs)
+        scores = dict.fromkeys(queries, [])
+
+        for index, pairs in self._iter_sorted_scores(
+            qs,
+            nks,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            scorer_type=scorer_type,
+            workers=workers
+        ):
+            scores[qs[index]] = pairs
+
+        result = [ None ] * sum(map(len, queries.values()))
+
+        for q, positions in queries.items():
+            items = []
+            indexes = set()
+
+            for choice_index, score in scores[q]:
+                ks = self._choices[nks[choice_index]]
+                for k in ks:
+                    item = k, score
+                    indexes.add(k)
+                    items.append(item)
+
+            if unscored:
+                for k in self:
+                    if k not in indexes:
+                        item = k, None
+                        items.append(item)
+
+            for position in positions:
+                result[position] = list(items)
 
         return result
 
@@ -731,11 +1037,13 @@ class RapidFuzzFrozenSet(RapidfuzzCollection):
         scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
 
         for nk, score, index in extract_iter(
             q,
-            self._choices.keys(),
+            choices,
             scorer=scorer,
             score_cutoff=score_cutoff,
             score_hint=score_hint,
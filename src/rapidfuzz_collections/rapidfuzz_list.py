@@ -1,8 +1,14 @@
 
+from bisect import (
+    bisect_left,
+    insort
+)
+from concurrent.futures import Executor
 from copy import (
     copy,
     deepcopy
 )
+from itertools import islice
 from rapidfuzz.fuzz import WRatio
 from rapidfuzz.process import (
     extract,
@@ -20,6 +26,7 @@ from typing import (
 )
 
 from .enums import (
+    IndexType,
     ScorerType,
     Strategy
 )
@@ -42,26 +49,31 @@ class RapidFuzzList(RapidfuzzCollection):
 
         if isinstance(value, self.__class__):
             seq = self._data + value._data
+            if self._is_same_normalizer(value.normalizer):
+                choices = self._choices + value._choices
+            else:
+                choices = self._choices + list(map(self._compile_normalizer(), value._data))
         elif isinstance(value, list):
             seq = self._data + value
+            choices = self._choices + list(map(self._compile_normalizer(), value))
         else:
             raise TypeError(f"'+' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, choices)
 
     def __contains__(self, item: Any) -> bool:
         """ Return bool(key in self). """
 
-        return item in self._data
+        if self._value_indexes is None:
+            return item in self._data
+
+        try:
+            if item in self._value_indexes:
+                return True
+        except TypeError:
+            return item in self._data
+
+        return self._unhashable_count > 0 and item in self._data
 
     def __copy__(self) -> 'RapidFuzzList':
         """ Return shallow copy. """
@@ -69,16 +81,7 @@ class RapidFuzzList(RapidfuzzCollection):
         seq = copy(self._data)
         normalizer = copy(self.normalizer)
 
-        return self.__class__(
-            seq,
-            normalizer=normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, copy(self._choices), normalizer)
 
     def __deepcopy__(self, memodict) -> 'RapidFuzzList':
         """ Return deep copy. """
@@ -86,22 +89,22 @@ class RapidFuzzList(RapidfuzzCollection):
         seq = deepcopy(self._data, memo=memodict)
         normalizer = deepcopy(self.normalizer)
 
-        return self.__class__(
-            seq,
-            normalizer=normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, copy(self._choices), normalizer)
 
-    def __delitem__(self, index: int):
+    def __delitem__(self, index: int | slice):
         """ Delete self[index]. """
 
-        del self._data[index]
-        del self._choices[index]
+        length = len(self._data)
+        if isinstance(index, int) and length and index in { -1, length - 1, }:
+            self._unlink(length - 1)
+            del self._data[index]
+            del self._choices[index]
+        else:
+            del self._data[index]
+            del self._choices[index]
+            self._index_choices()
+
+        self._generation += 1
 
     def __eq__(self, value: Any) -> bool:
         """ Return self==value. """
@@ -111,7 +114,7 @@ class RapidFuzzList(RapidfuzzCollection):
 
         return (
             self._data == value._data and
-            self.choices == value.choices and
+            self._choices == value._choices and
             self.default_score_cutoff == value.default_score_cutoff and
             self.default_score_hint == value.default_score_hint and
             self.default_scorer_type == value.default_scorer_type and
@@ -127,13 +130,22 @@ class RapidFuzzList(RapidfuzzCollection):
         """ Implement self+=value. """
 
         if isinstance(value, self.__class__):
-            self._data += value._data
+            seq = value._data
         elif isinstance(value, list):
-            self._data += value
+            seq = value
         else:
             raise TypeError(f"'+=' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        self._normalize_choices()
+        if not seq:
+            return self
+
+        self._generation += 1
+        start = len(self._data)
+        choices = list(map(self._compile_normalizer(), seq))
+        self._data += seq
+        self._choices += choices
+        for index in range(start, len(self._data)):
+            self._link(index)
 
         return self
 
@@ -143,8 +155,13 @@ class RapidFuzzList(RapidfuzzCollection):
         if not isinstance(value, int):
             raise TypeError(f"'*=' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
+        if value == 1 or not self._data:
+            return self
+
+        self._generation += 1
         self._data *= value
-        self._normalize_choices()
+        self._choices *= value
+        self._index_choices()
 
         return self
 
@@ -157,7 +174,16 @@ class RapidFuzzList(RapidfuzzCollection):
         scorer: ScorerProtocol = WRatio,
         scorer_kwargs: dict[str, Any] | None = None,
         scorer_type: ScorerType = ScorerType.SIMILARITY,
-        strategy: Strategy = Strategy.FIRST_FROM_BEST
+        strategy: Strategy = Strategy.FIRST_FROM_BEST,
+        query_cache_size: int | None = None,
+        result_cache_size: int | None = None,
+        index_type: IndexType | None = None,
+        symspell_distance: int = 2,
+        symspell_max_entries: int | None = None,
+        workers: int = 1,
+        executor: Executor | None = None,
+        progress: Callable[[int, int], Any] | None = None,
+        index_values: bool = False
     ):
         """
         Mutable sequence. Basis is list.
@@ -195,6 +221,48 @@ class RapidFuzzList(RapidfuzzCollection):
 
         :param strategy:
         Strategy for searching and returning values.
+
+        :param query_cache_size:
+        Maximum size of the LRU cache of normalized queries (value -> normalized value) for searching.
+        Repeated queries skip the normalizer. Unhashable queries are not cached. `None` deactivates this behaviour.
+
+        :param result_cache_size:
+        Maximum size of the LRU cache of results of `fuzzy_contains`, `fuzzy_get` and `fuzzy_index`
+        by normalized query and search arguments. The cache is invalidated by any change of the collection.
+        `None` deactivates this behaviour.
+
+        :param index_type:
+        Type of index of normalized values for searching with `score_cutoff`.
+        `IndexType.BK_TREE` is used by edit distance scorers (see `indexes.METRIC_SCORERS`) without `scorer_kwargs`.
+        `IndexType.SYMSPELL` is used by edit distance scorers (see `indexes.DELETION_SCORERS`) without `scorer_kwargs`
+        when `score_cutoff` is not greater than `symspell_distance`. `None` deactivates this behaviour.
+
+        :param symspell_distance:
+        Maximum edit distance of `IndexType.SYMSPELL` index. Memory of the index grows fast with the distance
+        and the length of normalized values, so it is intended for distances 1-2 and short values.
+
+        :param symspell_max_entries:
+        Memory cap of `IndexType.SYMSPELL` index: the maximum number of deletions in it (see `index_info`).
+        The index is dropped and all choices are scanned when it overflows. `None` deactivates this behaviour.
+
+        :param workers:
+        Default number of threads for scoring, `-1` means all available cores. Batch queries pass it to `cdist`.
+        Single queries of `fuzzy_get` and `get_fuzzy_scores` with more than one thread are scored by `cdist`
+        in chunks of choices in parallel (requires `numpy`).
+        Normalization of all values (by the constructor and the `normalizer` setter) uses the same number
+        of processes, or threads on free-threaded builds (see `PARALLEL_NORMALIZE_MIN_VALUES`).
+
+        :param executor:
+        Default `concurrent.futures.Executor` of async methods (`afuzzy_get` etc.).
+        `None` means the default executor of the running event loop.
+
+        :param progress:
+        Callable `progress(done, total)` which is called after each chunk of normalization of all values
+        (see `NORMALIZE_CHUNK_SIZE`). `None` deactivates this behaviour.
+
+        :param index_values:
+        Keep the index of positions by the values of collection (only hashable values are indexed).
+        It is used for fast `in`, `count` and `index` operations.
         """
 
         length = len(args)
@@ -206,6 +274,9 @@ class RapidFuzzList(RapidfuzzCollection):
             raise TypeError(f"Need: 0 or 1 positional argument. Got: {length} positional arguments")
 
         self._choices = []
+        self._choice_indexes = {}
+        self._value_indexes = {} if index_values else None
+        self._unhashable_count = 0
 
         super().__init__(
             normalizer=normalizer,
@@ -214,7 +285,15 @@ class RapidFuzzList(RapidfuzzCollection):
             scorer=scorer,
             scorer_kwargs=scorer_kwargs,
             scorer_type=scorer_type,
-            strategy=strategy
+            strategy=strategy,
+            query_cache_size=query_cache_size,
+            result_cache_size=result_cache_size,
+            index_type=index_type,
+            symspell_distance=symspell_distance,
+            symspell_max_entries=symspell_max_entries,
+            workers=workers,
+            executor=executor,
+            progress=progress
         )
 
     def __iter__(self) -> Iterator:
@@ -235,16 +314,7 @@ class RapidFuzzList(RapidfuzzCollection):
 
         seq = self._data * value
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._choices * value)
 
     def __ne__(self, value: Any) -> bool:
         """ Return self!=value. """
@@ -254,7 +324,7 @@ class RapidFuzzList(RapidfuzzCollection):
 
         return not (
             self._data == value._data and
-            self.choices == value.choices and
+            self._choices == value._choices and
             self.default_score_cutoff == value.default_score_cutoff and
             self.default_score_hint == value.default_score_hint and
             self.default_scorer_type == value.default_scorer_type and
@@ -279,47 +349,335 @@ class RapidFuzzList(RapidfuzzCollection):
 
         seq = value * self._data
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._choices * value)
 
-    def __setitem__(self, index: int, value: Any):
+    def __setitem__(self, index: int | slice, value: Any):
         """ Set self[key] to value. """
 
-        self._data[index] = value
+        if isinstance(index, slice):
+            values = list(value)
+            choices = list(map(self._compile_normalizer(), values))
+            self._data[index] = values
+            self._generation += 1
+            self._choices[index] = choices
+            self._index_choices()
+            return
+
+        length = len(self._data)
+        if not -length <= index < length:
+            raise IndexError("list assignment index out of range")
+        index %= length
+
         choice = self.normalizer(value)
+        self._unlink(index)
+        self._data[index] = value
+        self._generation += 1
         self._choices[index] = choice
+        self._link(index)
 
     @property
     def choices(self) -> tuple:
-        return tuple(deepcopy(self._choices))
+        return tuple(self._choices)
+
+    @property
+    def index_values(self) -> bool:
+        return self._value_indexes is not None
+
+    def _derive(self, data: Any, choices: Any, normalizer: NormalizerProtocol | None = None) -> Self:
+        """
+        Return new collection of the same class and with the same settings.
+        `choices` must be `data` which is already normalized by the normalizer, so the normalizer is not called.
+        The indexes of positions are rebuilt.
+        """
+
+        instance = super()._derive(data, choices, normalizer)
+        instance._choice_indexes = {}
+        instance._value_indexes = {} if self.index_values else None
+        instance._unhashable_count = 0
+        instance._index_choices()
+
+        return instance
+
+    def _pickle_settings(self) -> dict[str, Any]:
+        """
+        Return the settings which are pickled by `__reduce__`, including `index_values`.
+        """
+
+        settings = super()._pickle_settings()
+        settings['_value_indexes'] = {} if self.index_values else None
+
+        return settings
+
+    def _fuzzy_contains_choices(
+        self,
+        q: str | None,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer: ScorerProtocol,
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType
+    ) -> bool:
+        """
+        Search the normalized value `q` in choices: the cached part of `fuzzy_contains`.
+        """
+
+        if q is not None and q in self._choice_indexes:
+            return True
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        for choice, score, index in extract_iter(
+            q,
+            choices,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs
+        ):
+            if (
+                ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
+                ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(choice) ) )  # noqa
+            ):
+                return True
+        return False
+
+    def _fuzzy_get_choices(
+        self,
+        q: str | None,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer: ScorerProtocol,
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType,
+        strategy: Strategy
+    ) -> Any:
+        """
+        Search the normalized value `q` in choices: the cached part of `fuzzy_get`.
+        """
+
+        if q is not None and q in self._choice_indexes:
+            index = self._choice_indexes[q][0]
+            return self.__getitem__(index)
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        if strategy == Strategy.FIRST_FROM_BEST:
+            result = extractOne(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs
+            )
+            if result is None:
+                return None
+            choice, score, index = result
+            return self.__getitem__(self._choice_indexes[choice][0])
+
+        elif strategy == Strategy.BEST_ONLY_ONE:
+            result = extract(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs,
+                limit=2
+            )
+            if not result:
+                return None
+            if len(result) == 1:
+                choice, score, index = result[0]
+                indexes = self._choice_indexes[choice]
+                if len(indexes) == 1:
+                    return self.__getitem__(indexes[0])
+            return None
+
+        elif strategy == Strategy.FIRST:
+            for choice, score, index in extract_iter(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs
+            ):
+                if (
+                    ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
+                    ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(choice) ) )  # noqa
+                ):
+                    return self.__getitem__(self._choice_indexes[choice][0])
+            return None
+
+        raise NotImplementedError
+
+    def _fuzzy_index_choices(
+        self,
+        q: str | None,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer: ScorerProtocol,
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType,
+        strategy: Strategy
+    ) -> int | None:
+        """
+        Search the normalized value `q` in choices: the cached part of `fuzzy_index`.
+        """
+
+        if q is not None and q in self._choice_indexes:
+            return self._choice_indexes[q][0]
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        if strategy == Strategy.FIRST_FROM_BEST:
+            result = extractOne(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs
+            )
+            if result is None:
+                return None
+            choice, score, index = result
+            return self._choice_indexes[choice][0]
+
+        elif strategy == Strategy.BEST_ONLY_ONE:
+            result = extract(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs,
+                limit=2
+            )
+            if not result:
+                return None
+            if len(result) == 1:
+                choice, score, index = result[0]
+                indexes = self._choice_indexes[choice]
+                if len(indexes) == 1:
+                    return indexes[0]
+            return None
+
+        elif strategy == Strategy.FIRST:
+            for choice, score, index in extract_iter(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs
+            ):
+                if (
+                    ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
+                    ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(choice) ) )  # noqa
+                ):
+                    return self._choice_indexes[choice][0]
+            return None
+
+        raise NotImplementedError
+
+    def _index_choices(self):
+        """
+        Rebuild the indexes of positions by normalized values and by values.
+        The normalizer is not called.
+        """
+
+        choice_indexes = self._choice_indexes
+        self._choice_indexes = {}
+        for index, choice in enumerate(self._choices):
+            self._choice_indexes.setdefault(choice, []).append(index)
+
+        for choice in choice_indexes.keys() - self._choice_indexes.keys():
+            self._unlink_choice(choice)
+        for choice in self._choice_indexes.keys() - choice_indexes.keys():
+            self._link_choice(choice)
+
+        if self._value_indexes is not None:
+            self._value_indexes = {}
+            self._unhashable_count = 0
+            for index, value in enumerate(self._data):
+                try:
+                    self._value_indexes.setdefault(value, []).append(index)
+                except TypeError:
+                    self._unhashable_count += 1
+
+    def _link(self, index: int):
+        """
+        Add the position of element to the indexes.
+        """
+
+        choice = self._choices[index]
+        if choice not in self._choice_indexes:
+            self._choice_indexes[choice] = []
+            self._link_choice(choice)
+        insort(self._choice_indexes[choice], index)
+
+        if self._value_indexes is not None:
+            try:
+                insort(self._value_indexes.setdefault(self._data[index], []), index)
+            except TypeError:
+                self._unhashable_count += 1
+
+    def _unlink(self, index: int):
+        """
+        Remove the position of element from the indexes.
+        """
+
+        choice = self._choices[index]
+        indexes = self._choice_indexes[choice]
+        del indexes[bisect_left(indexes, index)]
+        if not indexes:
+            del self._choice_indexes[choice]
+            self._unlink_choice(choice)
+
+        if self._value_indexes is not None:
+            value = self._data[index]
+            try:
+                indexes = self._value_indexes[value]
+            except TypeError:
+                self._unhashable_count -= 1
+            else:
+                del indexes[bisect_left(indexes, index)]
+                if not indexes:
+                    del self._value_indexes[value]
 
     def _normalize_choices(self):
         """
         Normalize all values of choices.
         """
 
-        self._choices = [ self.normalizer(i) for i in self._data ]
+        self._choices = self._normalize_values(self._data)
+        self._index_choices()
 
     def append(self, value: Any):
         """ Append object to the end of the collection. """
 
-        self._data.append(value)
         choice = self.normalizer(value)
+        self._data.append(value)
+        self._generation += 1
         self._choices.append(choice)
+        self._link(len(self._data) - 1)
 
     def clear(self):
         """ Remove all items from collection. """
 
+        if not self._data:
+            return
+
+        self._generation += 1
         self._data.clear()
         self._choices.clear()
+        self._choice_indexes.clear()
+        self._reset_indexes()
+        if self._value_indexes is not None:
+            self._value_indexes.clear()
+        self._unhashable_count = 0
 
     def copy(self) -> 'RapidFuzzList':
         """ Return a shallow copy. """
@@ -327,25 +685,23 @@ class RapidFuzzList(RapidfuzzCollection):
         seq = self._data.copy()
         normalizer = copy(self.normalizer)
 
-        return self.__class__(
-            seq,
-            normalizer=normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, copy(self._choices), normalizer)
 
     def count(self, value: Any) -> int:
         """ Return number of occurrences of value. """
 
+        if self._value_indexes is not None and not self._unhashable_count:
+            try:
+                return len(self._value_indexes.get(value, ()))
+            except TypeError:
+                pass
+
         return self._data.count(value)
 
     def extend(self, seq: Iterable):
         """ Extend list by appending elements from the iterable. """
 
+        # the generation is changed by each appended element
         for item in seq:
             self.append(item)
 
@@ -356,14 +712,29 @@ class RapidFuzzList(RapidfuzzCollection):
         Raises ValueError if the value is not present.
         """
 
+        if self._value_indexes is not None and not args:
+            try:
+                indexes = self._value_indexes.get(value)
+            except TypeError:
+                indexes = None
+            if indexes:
+                return indexes[0]
+            if not self._unhashable_count:
+                raise ValueError(f"{repr(value)} is not in list")
+
         return self._data.index(value, *args)
 
     def insert(self, index: int, value: Any) -> None:
         """ Insert object before index. """
 
-        self._data.insert(index, value)
         choice = self.normalizer(value)
+        self._data.insert(index, value)
+        self._generation += 1
         self._choices.insert(index, choice)
+        if index >= len(self._data) - 1:
+            self._link(len(self._data) - 1)
+        else:
+            self._index_choices()
 
     def pop(self, index: int = -1) -> Any:
         """
@@ -372,8 +743,17 @@ class RapidFuzzList(RapidfuzzCollection):
         Raises IndexError if list is empty or index is out of range.
         """
 
+        length = len(self._data)
+        if length and index in { -1, length - 1, }:
+            self._unlink(length - 1)
+            self._choices.pop()
+            self._generation += 1
+            return self._data.pop()
+
         result = self._data.pop(index)
+        self._generation += 1
         self._choices.pop(index)
+        self._index_choices()
         return result
 
     def remove(self, value: Any):
@@ -385,17 +765,32 @@ class RapidFuzzList(RapidfuzzCollection):
 
         try:
             index = self.index(value)
-            del self._data[index]
-            del self._choices[index]
         except ValueError:
-            self._data.remove(value)
+            # an element which is equal to the value, but has another hash, is not in the index of values
+            index = self._data.index(value)
+        self.__delitem__(index)
 
     def reverse(self):
         """ Reverse *IN PLACE*. """
 
+        if len(self._data) < 2:
+            return
+
         self._data.reverse()
+        self._generation += 1
         self._choices.reverse()
 
+        last = len(self._data) - 1
+        self._choice_indexes = {
+            choice: [ last - i for i in reversed(indexes) ]
+            for choice, indexes in self._choice_indexes.items()
+        }
+        if self._value_indexes is not None:
+            self._value_indexes = {
+                value: [ last - i for i in reversed(indexes) ]
+                for value, indexes in self._value_indexes.items()
+            }
+
     def sort(self, key: Union[Callable, None] = None, reverse: bool = False):
         """
         Sort the list in ascending order and return None.
@@ -409,8 +804,17 @@ class RapidFuzzList(RapidfuzzCollection):
         The reverse flag can be set to sort in descending order.
         """
 
-        self._data.sort(key=key, reverse=reverse)
-        self._normalize_choices()
+        data = self._data
+        order = sorted(
+            range(len(data)),
+            key=data.__getitem__ if key is None else lambda i: key(data[i]),
+            reverse=reverse
+        )
+
+        self._data[:] = [ data[i] for i in order ]
+        self._generation += 1
+        self._choices = [ self._choices[i] for i in order ]
+        self._index_choices()
 
     def fuzzy_contains(self, value: Any, **kwargs) -> bool:
         """
@@ -442,25 +846,17 @@ class RapidFuzzList(RapidfuzzCollection):
         if self.__contains__(value):
             return True
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
 
-        if q is not None and q in self._choices:
-            return True
-
-        for choice, score, index in extract_iter(
+        return self._cached_result(
+            self._fuzzy_contains_choices,
             q,
-            self._choices,
-            scorer=scorer,
-            score_cutoff=score_cutoff,
-            score_hint=score_hint,
-            scorer_kwargs=scorer_kwargs
-        ):
-            if (
-                ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
-                ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(choice) ) )  # noqa
-            ):
-                return True
-        return False
+            score_cutoff,
+            score_hint,
+            scorer,
+            scorer_kwargs,
+            scorer_type
+        )
 
     def fuzzy_count(self, value: Any, **kwargs) -> int:
         """
@@ -489,12 +885,14 @@ class RapidFuzzList(RapidfuzzCollection):
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
         scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
 
         counter = 0
         for choice, score, index in extract_iter(
             q,
-            self._choices,
+            choices,
             scorer=scorer,
             score_cutoff=score_cutoff,
             score_hint=score_hint,
@@ -504,7 +902,7 @@ class RapidFuzzList(RapidfuzzCollection):
                 ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
                 ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(choice) ) )
             ):
-                counter += 1
+                counter += len(self._choice_indexes[choice])
 
         return counter
 
@@ -523,8 +921,11 @@ class RapidFuzzList(RapidfuzzCollection):
             scorer_kwargs
             scorer_type
             strategy
+            workers
         If an argument is passed, then it is used for the search,
         otherwise the default value specified when the class was initialized is used.
+        `workers` is the number of threads, `-1` means all available cores (default is `default_workers`).
+        More than one thread scores chunks of choices by `cdist` in parallel, the same as `fuzzy_get_many` does.
 
         :return:
         The value from collection if exists a similar value, `None` otherwise.
@@ -536,64 +937,103 @@ class RapidFuzzList(RapidfuzzCollection):
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
         scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
         strategy = self._check_strategy(kwargs.get('strategy', self.default_strategy))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+
+        if workers != 1:
+            return self.fuzzy_get_many([ value ], **kwargs)[0]
 
         if self.__contains__(value):
             return value
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
 
-        if q is not None and q in self._choices:
-            index = self._choices.index(q)
-            return self.__getitem__(index)
+        return self._cached_result(
+            self._fuzzy_get_choices,
+            q,
+            score_cutoff,
+            score_hint,
+            scorer,
+            scorer_kwargs,
+            scorer_type,
+            strategy
+        )
 
-        if strategy == Strategy.FIRST_FROM_BEST:
-            result = extractOne(
-                q,
-                self._choices,
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs
-            )
-            if result is None:
-                return None
-            choice, score, index = result
-            return self.__getitem__(index)
+    def fuzzy_get_many(self, values: Iterable, **kwargs) -> list[Any]:
+        """
+        Batch version of `fuzzy_get`.
+        All values are normalized at first and then scored together by `rapidfuzz.process.cdist`.
 
-        elif strategy == Strategy.BEST_ONLY_ONE:
-            result = extract(
-                q,
-                self._choices,
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs,
-                limit=2
-            )
-            if not result:
-                return None
-            if len(result) == 1:
-                choice, score, index = result[0]
-                return self.__getitem__(index)
-            return None
+        :param values:
+        Values to search for in collection.
 
-        elif strategy == Strategy.FIRST:
-            for choice, score, index in extract_iter(
-                q,
-                self._choices,
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs
-            ):
-                if (
-                    ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
-                    ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(choice) ) )  # noqa
-                ):
-                    return self.__getitem__(index)
-            return None
+        :param kwargs:
+        Optional named arguments:
+            score_cutoff
+            score_hint
+            scorer
+            scorer_kwargs
+            scorer_type
+            strategy
+            workers
+        If an argument is passed, then it is used for the search,
+        otherwise the default value specified when the class was initialized is used.
+        `workers` is the number of threads for `cdist`, `-1` means all available cores (default is `default_workers`).
 
-        raise NotImplementedError
+        :return:
+        List of results of `fuzzy_get` in the order of values.
+        """
+
+        score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
+        score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
+        scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
+        scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+        scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
+        strategy = self._check_strategy(kwargs.get('strategy', self.default_strategy))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+
+        result = []
+        queries = {}
+
+        for value in values:
+            if self.__contains__(value):
+                result.append(value)
+                continue
+
+            q = self._normalize_query(value)
+
+            if q is not None and q in self._choice_indexes:
+                index = self._choice_indexes[q][0]
+                result.append(self.__getitem__(index))
+                continue
+
+            if q is not None:
+                queries.setdefault(q, []).append(len(result))
+            result.append(None)
+
+        qs = list(queries)
+        choices = self._select_batch_choices(qs, scorer, score_cutoff, scorer_kwargs)
+
+        for index, choice_index in self._iter_best_choices(
+            qs,
+            choices,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            scorer_type=scorer_type,
+            strategy=strategy,
+            workers=workers
+        ):
+            if choice_index is None:
+                continue
+            indexes = self._choice_indexes[choices[choice_index]]
+            if strategy == Strategy.BEST_ONLY_ONE and len(indexes) != 1:
+                continue
+            item = self.__getitem__(indexes[0])
+            for position in queries[qs[index]]:
+                result[position] = item
+
+        return result
 
     def fuzzy_index(self, value: Any, **kwargs) -> int | None:
         """
@@ -628,59 +1068,85 @@ class RapidFuzzList(RapidfuzzCollection):
         if self.__contains__(value):
             return self.index(value)
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
 
-        if q is not None and q in self._choices:
-            return self._choices.index(q)
+        return self._cached_result(
+            self._fuzzy_index_choices,
+            q,
+            score_cutoff,
+            score_hint,
+            scorer,
+            scorer_kwargs,
+            scorer_type,
+            strategy
+        )
 
-        if strategy == Strategy.FIRST_FROM_BEST:
-            result = extractOne(
-                q,
-                self._choices,
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs
-            )
-            if result is None:
-                return None
-            choice, score, index = result
-            return index
+    async def afuzzy_count(self, value: Any, **kwargs) -> int:
+        """
+        Async version of `fuzzy_count`. Scoring runs in the executor (default is `default_executor`).
+        """
 
-        elif strategy == Strategy.BEST_ONLY_ONE:
-            result = extract(
-                q,
-                self._choices,
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs,
-                limit=2
-            )
-            if not result:
-                return None
-            if len(result) == 1:
-                choice, score, index = result[0]
-                return index
-            return None
+        return await self._run_in_executor(self.fuzzy_count, value, **kwargs)
 
-        elif strategy == Strategy.FIRST:
-            for choice, score, index in extract_iter(
-                q,
-                self._choices,
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs
-            ):
-                if (
-                    ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
-                    ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(choice) ) )  # noqa
-                ):
-                    return index
-            return None
+    async def afuzzy_index(self, value: Any, **kwargs) -> int | None:
+        """
+        Async version of `fuzzy_index`. Scoring runs in the executor (default is `default_executor`).
+        """
 
-        raise NotImplementedError
+        return await self._run_in_executor(self.fuzzy_index, value, **kwargs)
+
+    def fuzzy_top_k(self, value: Any, k: int, **kwargs) -> list[ScorerResultListType]:
+        """
+        Return `k` elements of the collection which are most similar to value.
+        Only `k` best scores are kept while scoring instead of sorting all of them.
+
+        :param value:
+        Value to search for in collection.
+
+        :param k:
+        Maximum number of returned elements.
+
+        :param kwargs:
+        Optional named arguments:
+            score_cutoff
+            score_hint
+            scorer
+            scorer_kwargs
+        If an argument is passed, then it is used for the search,
+        otherwise the default value specified when the class was initialized is used.
+
+        :return:
+        List of up to `k` Tuples with 3 elements like `get_fuzzy_scores` returns, but only with elements
+        which passed `score_cutoff`. The first element in the list has the highest similarity / the smallest distance.
+        """
+
+        k = self._check_top_k(k)
+        score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
+        score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
+        scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
+        scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+
+        q = self._normalize_query(value)
+
+        result = []
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        # `k` best unique values always have `k` best positions: other values with the same score as the last one
+        # appear after the first positions of selected values with this score
+        for index, score in islice(self._iter_sorted_positions(extract(
+            q,
+            choices,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            limit=k
+        )), k):
+            item = self.__getitem__(index), score, index
+            result.append(item)
+
+        return result
 
     def get_fuzzy_scores(self, value: Any, **kwargs) -> list[ScorerResultListType]:
         """
@@ -695,8 +1161,14 @@ class RapidFuzzList(RapidfuzzCollection):
             score_hint
             scorer
             scorer_kwargs
+            unscored
+            workers
         If an argument is passed, then it is used for the search,
         otherwise the default value specified when the class was initialized is used.
+        `unscored` adds elements, which are not scored or did not pass `score_cutoff`, with `None` score
+        to the end of the list (default is `True`).
+        `workers` is the number of threads, `-1` means all available cores (default is `default_workers`).
+        More than one thread scores chunks of choices by `cdist` in parallel, the same as `get_fuzzy_scores_many` does.
 
         :return:
         List of Tuples with 3 elements:
@@ -716,29 +1188,116 @@ class RapidFuzzList(RapidfuzzCollection):
         score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
         scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+        unscored = self._check_unscored(kwargs.get('unscored', True))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+
+        if workers != 1:
+            return self.get_fuzzy_scores_many([ value ], **kwargs)[0]
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
 
         result = []
         indexes = set()
 
-        for choice, score, index in extract(
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        for index, score in self._iter_sorted_positions(extract(
             q,
-            self._choices,
+            choices,
             scorer=scorer,
             score_cutoff=score_cutoff,
             score_hint=score_hint,
             scorer_kwargs=scorer_kwargs,
             limit=None
-        ):
+        )):
             item = self.__getitem__(index), score, index
             indexes.add(index)
             result.append(item)
 
-        for index, value in enumerate(self):
-            if index not in indexes:
-                item = value, None, index
-                result.append(item)
+        if unscored:
+            for index, value in enumerate(self):
+                if index not in indexes:
+                    item = value, None, index
+                    result.append(item)
+
+        return result
+
+    def get_fuzzy_scores_many(self, values: Iterable, **kwargs) -> list[list[ScorerResultListType]]:
+        """
+        Batch version of `get_fuzzy_scores`.
+        All values are normalized at first and then scored together by `rapidfuzz.process.cdist`.
+
+        :param values:
+        Values to search for in collection.
+
+        :param kwargs:
+        Optional named arguments:
+            score_cutoff
+            score_hint
+            scorer
+            scorer_kwargs
+            scorer_type
+            workers
+            unscored
+        If an argument is passed, then it is used for the search,
+        otherwise the default value specified when the class was initialized is used.
+        `workers` is the number of threads for `cdist`, `-1` means all available cores (default is `default_workers`).
+        `unscored` adds elements, which are not scored or did not pass `score_cutoff`, with `None` score
+        to the end of the list (default is `True`).
+
+        :return:
+        List of results of `get_fuzzy_scores` in the order of values.
+        """
+
+        score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
+        score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
+        scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
+        scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+        scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+        unscored = self._check_unscored(kwargs.get('unscored', True))
+
+        queries = {}
+        for position, value in enumerate(values):
+            queries.setdefault(self._normalize_query(value), []).append(position)
+
+        qs = [ q for q in queries if q is not None ]
+        choices = self._select_batch_choices(qs, scorer, score_cutoff, scorer_kwargs)
+        scores = dict.fromkeys(queries, [])
+
+        for index, pairs in self._iter_sorted_scores(
+            qs,
+            choices,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            scorer_type=scorer_type,
+            workers=workers
+        ):
+            scores[qs[index]] = pairs
+
+        result = [ None ] * sum(map(len, queries.values()))
+
+        for q, positions in queries.items():
+            items = []
+            scored = set()
+
+            for index, score in self._iter_sorted_positions(
+                ( choices[choice_index], score, choice_index, ) for choice_index, score in scores[q]
+            ):
+                item = self.__getitem__(index), score, index
+                scored.add(index)
+                items.append(item)
+
+            if unscored:
+                for index, value in enumerate(self):
+                    if index not in scored:
+                        item = value, None, index
+                        items.append(item)
+
+            for position in positions:
+                result[position] = list(items)
 
         return result
 
@@ -767,6 +1326,10 @@ class RapidFuzzList(RapidfuzzCollection):
                 - A normalized edit distance (similarity is a score between 0 and 100, with 100 being a perfect match).
                   In this case only choices which have a similarity >= score_cutoff are returned.
             The third parameter is the index of element.
+
+        Elements are yielded while they are scored: elements with equal normalized values are yielded together
+        in the order of their indexes, groups are in the order of their first elements.
+        Sort the results by index if the order of elements is needed (all elements are materialized for that).
         """
 
         score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
@@ -774,14 +1337,18 @@ class RapidFuzzList(RapidfuzzCollection):
         scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
 
-        for choice, score, index in extract_iter(
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        # matches are expanded to positions as they are found, so elements are not materialized
+        for choice, score, _ in extract_iter(
             q,
-            self._choices,
+            choices,
             scorer=scorer,
             score_cutoff=score_cutoff,
             score_hint=score_hint,
             scorer_kwargs=scorer_kwargs
         ):
-            yield self.__getitem__(index), score, index
+            for index in self._choice_indexes[choice]:
+                yield self.__getitem__(index), score, index
@@ -1,8 +1,6 @@
 
-from copy import (
-    copy,
-    deepcopy
-)
+from concurrent.futures import Executor
+from copy import copy
 from rapidfuzz.fuzz import WRatio
 from rapidfuzz.process import (
     extract,
@@ -11,14 +9,17 @@ from rapidfuzz.process import (
 )
 from typing import (
     Any,
+    Callable,
     Generator,
     Hashable,
+    Iterable,
     Iterator,
     Self,
     Union
 )
 
 from .enums import (
+    IndexType,
     ScorerType,
     Strategy
 )
@@ -28,6 +29,7 @@ from .types import (
     ScorerResultSetType
 )
 from .base import RapidfuzzCollection
+from .views import ChoicesView
 
 
 # noinspection DuplicatedCode
@@ -46,16 +48,7 @@ class RapidFuzzSet(RapidfuzzCollection):
         else:
             raise TypeError(f"'&' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._and_choices(value))
 
     def __contains__(self, item: Any) -> bool:
         """ Return bool(key in self). """
@@ -68,16 +61,7 @@ class RapidFuzzSet(RapidfuzzCollection):
         seq = copy(self._data)
         normalizer = copy(self.normalizer)
 
-        return self.__class__(
-            seq,
-            normalizer=normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._copy_choices(), normalizer)
 
     def __eq__(self, value: Any) -> bool:
         """ Return self==value. """
@@ -87,7 +71,7 @@ class RapidFuzzSet(RapidfuzzCollection):
 
         return (
             self._data == value._data and
-            self.choices == value.choices and
+            self._choices == value._choices and
             self.default_score_cutoff == value.default_score_cutoff and
             self.default_score_hint == value.default_score_hint and
             self.default_scorer_type == value.default_scorer_type and
@@ -98,13 +82,17 @@ class RapidFuzzSet(RapidfuzzCollection):
         """ Return self&=value. """
 
         if isinstance(value, self.__class__):
-            self._data &= value._data
+            seq = value._data
         elif isinstance(value, ( set, frozenset, )):
-            self._data &= value
+            seq = value
         else:
             raise TypeError(f"'&=' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        self._normalize_choices()
+        removed = self._data - seq
+        if removed:
+            self._generation += 1
+            self._discard_choices(removed)
+            self._data -= removed
 
         return self
 
@@ -117,7 +105,17 @@ class RapidFuzzSet(RapidfuzzCollection):
         scorer: ScorerProtocol = WRatio,
         scorer_kwargs: dict[str, Any] | None = None,
         scorer_type: ScorerType = ScorerType.SIMILARITY,
-        strategy: Strategy = Strategy.FIRST_FROM_BEST
+        strategy: Strategy = Strategy.FIRST_FROM_BEST,
+        query_cache_size: int | None = None,
+        result_cache_size: int | None = None,
+        qgram_size: int | None = None,
+        qgram_strictness: int | float = 1,
+        index_type: IndexType | None = None,
+        symspell_distance: int = 2,
+        symspell_max_entries: int | None = None,
+        workers: int = 1,
+        executor: Executor | None = None,
+        progress: Callable[[int, int], Any] | None = None
     ):
         """
         RapidFuzzSet() -> new empty RapidFuzzSet object
@@ -143,20 +141,34 @@ class RapidFuzzSet(RapidfuzzCollection):
             scorer=scorer,
             scorer_kwargs=scorer_kwargs,
             scorer_type=scorer_type,
-            strategy=strategy
+            strategy=strategy,
+            query_cache_size=query_cache_size,
+            result_cache_size=result_cache_size,
+            qgram_size=qgram_size,
+            qgram_strictness=qgram_strictness,
+            index_type=index_type,
+            symspell_distance=symspell_distance,
+            symspell_max_entries=symspell_max_entries,
+            workers=workers,
+            executor=executor,
+            progress=progress
         )
 
     def __ior__(self, value: Union['RapidFuzzSet', set, frozenset]) -> Self:
         """ Return self|=value. """
 
         if isinstance(value, self.__class__):
-            self._data |= value._data
+            seq = value._data
         elif isinstance(value, ( set, frozenset, )):
-            self._data |= value
+            seq = value
         else:
             raise TypeError(f"'|=' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        self._normalize_choices()
+        added = seq - self._data
+        if added:
+            self._generation += 1
+            self._add_choices(added)
+            self._data |= added
 
         return self
 
@@ -164,13 +176,17 @@ class RapidFuzzSet(RapidfuzzCollection):
         """ Return self-=value. """
 
         if isinstance(value, self.__class__):
-            self._data -= value._data
+            seq = value._data
         elif isinstance(value, ( set, frozenset, )):
-            self._data -= value
+            seq = value
         else:
             raise TypeError(f"'-=' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        self._normalize_choices()
+        removed = self._data & seq
+        if removed:
+            self._generation += 1
+            self._discard_choices(removed)
+            self._data -= removed
 
         return self
 
@@ -183,13 +199,17 @@ class RapidFuzzSet(RapidfuzzCollection):
         """ Return self^=value. """
 
         if isinstance(value, self.__class__):
-            self._data ^= value._data
+            seq = value._data
         elif isinstance(value, ( set, frozenset, )):
-            self._data ^= value
+            seq = value
         else:
             raise TypeError(f"'^=' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        self._normalize_choices()
+        if seq:
+            self._generation += 1
+            self._discard_choices(self._data & seq)
+            self._add_choices(seq - self._data)
+            self._data ^= seq
 
         return self
 
@@ -206,7 +226,7 @@ class RapidFuzzSet(RapidfuzzCollection):
 
         return not (
             self._data == value._data and
-            self.choices == value.choices and
+            self._choices == value._choices and
             self.default_score_cutoff == value.default_score_cutoff and
             self.default_score_hint == value.default_score_hint and
             self.default_scorer_type == value.default_scorer_type and
@@ -223,16 +243,7 @@ class RapidFuzzSet(RapidfuzzCollection):
         else:
             raise TypeError(f"'|' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._or_choices(value))
 
     def __rand__(self, value: Union['RapidFuzzSet', set, frozenset]) -> 'RapidFuzzSet':
         """ Return value&self. """
@@ -244,16 +255,7 @@ class RapidFuzzSet(RapidfuzzCollection):
         else:
             raise TypeError(f"'&' not supported between instances of '{type(value)}' and '{self.__class__.__qualname__}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._and_choices(value))
 
     def __repr__(self) -> str:
         """ Return repr(self). """
@@ -270,37 +272,21 @@ class RapidFuzzSet(RapidfuzzCollection):
         else:
             raise TypeError(f"'|' not supported between instances of '{type(value)}' and '{self.__class__.__qualname__}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._or_choices(value))
 
     def __rsub__(self, value: Union['RapidFuzzSet', set, frozenset]) -> 'RapidFuzzSet':
         """ Return value-self. """
 
         if isinstance(value, self.__class__):
             seq = value._data - self._data
+            if self._is_same_normalizer(value.normalizer):
+                return self._derive(seq, value._sub_choices(self))
         elif isinstance(value, ( set, frozenset, )):
             seq = value - self._data
         else:
             raise TypeError(f"'-' not supported between instances of '{type(value)}' and '{self.__class__.__qualname__}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._make_choices(seq))
 
     def __rxor__(self, value: Union['RapidFuzzSet', set, frozenset]) -> 'RapidFuzzSet':
         """ Return value^self. """
@@ -312,16 +298,7 @@ class RapidFuzzSet(RapidfuzzCollection):
         else:
             raise TypeError(f"'^' not supported between instances of '{type(value)}' and '{self.__class__.__qualname__}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._xor_choices(value))
 
     def __sub__(self, value: Union['RapidFuzzSet', set, frozenset]) -> 'RapidFuzzSet':
         """ Return self-value. """
@@ -333,16 +310,7 @@ class RapidFuzzSet(RapidfuzzCollection):
         else:
             raise TypeError(f"'-' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._sub_choices(value))
 
     def __xor__(self, value: Union['RapidFuzzSet', set, frozenset]) -> 'RapidFuzzSet':
         """ Return self^value. """
@@ -354,20 +322,204 @@ class RapidFuzzSet(RapidfuzzCollection):
         else:
             raise TypeError(f"'^' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._xor_choices(value))
 
     @property
-    def choices(self) -> dict[str | None, set[Union[Hashable, None]]]:
-        return deepcopy(self._choices)
+    def choices(self) -> ChoicesView:
+        return ChoicesView(self._choices)
+
+    def _add_choices(self, values: Iterable):
+        """
+        Normalize only the passed values and add them to choices.
+        """
+
+        normalize = self._compile_normalizer()
+        for value in values:
+            choice = normalize(value)
+            if choice not in self._choices:
+                self._choices[choice] = set()
+                self._link_choice(choice)
+            self._choices[choice].add(value)
+
+    def _and_choices(
+        self,
+        value: Union['RapidFuzzSet', set, frozenset]
+    ) -> dict[str | None, set[Union[Hashable, None]]]:
+        """
+        Return choices of the intersection of collection and value.
+        The normalizer is not called.
+        """
+
+        result = {}
+
+        if isinstance(value, self.__class__) and self._is_same_normalizer(value.normalizer):
+            choices, other = self._choices, value._choices
+            if len(other) < len(choices):
+                choices, other = other, choices
+            for choice, vs in choices.items():
+                if choice in other:
+                    common = vs & other[choice]
+                    if common:
+                        result[choice] = common
+            return result
+
+        seq = value._data if isinstance(value, self.__class__) else value
+        for choice, vs in self._choices.items():
+            common = vs & seq
+            if common:
+                result[choice] = common
+        return result
+
+    def _copy_choices(self) -> dict[str | None, set[Union[Hashable, None]]]:
+        """
+        Return copy of choices with copies of groups.
+        """
+
+        return { choice: set(vs) for choice, vs in self._choices.items() }
+
+    def _discard_choices(self, values: Iterable):
+        """
+        Normalize only the passed values and remove them from choices.
+        """
+
+        normalize = self._compile_normalizer()
+        for value in values:
+            choice = normalize(value)
+            if choice in self._choices:
+                vs = self._choices[choice]
+                vs.discard(value)
+                if not vs:
+                    del self._choices[choice]
+                    self._unlink_choice(choice)
+
+    def _fuzzy_contains_choices(
+        self,
+        q: str | None,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer: ScorerProtocol,
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType
+    ) -> bool:
+        """
+        Search the normalized value `q` in choices: the cached part of `fuzzy_contains`.
+        """
+
+        if q is not None and q in self._choices:
+            return True
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        for nk, score, index in extract_iter(
+            q,
+            choices,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs
+        ):
+            if (
+                ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
+                ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(nk) ) )  # noqa
+            ):
+                return True
+        return False
+
+    def _fuzzy_get_choices(
+        self,
+        q: str | None,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer: ScorerProtocol,
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType,
+        strategy: Strategy
+    ) -> tuple | None:
+        """
+        Search the normalized value `q` in choices: the cached part of `fuzzy_get`.
+        """
+
+        if q is not None and q in self._choices:
+            ks = self._choices[q]
+            if strategy == Strategy.BEST_ONLY_ONE:
+                if len(ks) == 1:
+                    k = next(iter(ks))
+                    return k
+            else:
+                k = next(iter(ks))
+                return k
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        if strategy == Strategy.FIRST_FROM_BEST:
+            result = extractOne(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs
+            )
+            if result is None:
+                return None
+            nk, score, index = result
+            ks = self._choices[nk]
+            k = next(iter(ks))
+            return k
+
+        elif strategy == Strategy.BEST_ONLY_ONE:
+            result = extract(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs,
+                limit=2
+            )
+            if not result:
+                return None
+            if len(result) == 1:
+                nk, score, index = result[0]
+                ks = self._choices[nk]
+                if len(ks) == 1:
+                    k = next(iter(ks))
+                    return k
+            return None
+
+        elif strategy == Strategy.FIRST:
+            for nk, score, index in extract_iter(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs
+            ):
+                if (
+                    ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
+                    ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(nk) ) )
+                ):
+                    ks = self._choices[nk]
+                    k = next(iter(ks))
+                    return k
+            return None
+
+        raise NotImplementedError
+
+    def _make_choices(self, values: Iterable) -> dict[str | None, set[Union[Hashable, None]]]:
+        """
+        Normalize values and return them as choices.
+        """
+
+        choices = {}
+        normalize = self._compile_normalizer()
+        for value in values:
+            choice = normalize(value)
+            if choice not in choices:
+                choices[choice] = set()
+            choices[choice].add(value)
+        return choices
 
     def _normalize_choices(self):
         """
@@ -375,12 +527,94 @@ class RapidFuzzSet(RapidfuzzCollection):
         """
 
         self._choices = {}
-        for value in self._data:
-            choice = self.normalizer(value)
+        for value, choice in zip(self._data, self._normalize_values(self._data)):
             if choice not in self._choices:
                 self._choices[choice] = set()
             self._choices[choice].add(value)
 
+    def _or_choices(
+        self,
+        value: Union['RapidFuzzSet', set, frozenset]
+    ) -> dict[str | None, set[Union[Hashable, None]]]:
+        """
+        Return choices of the union of collection and value.
+        Only elements of value, which are not in collection, are normalized (if normalizers are different).
+        """
+
+        result = self._copy_choices()
+
+        if isinstance(value, self.__class__) and self._is_same_normalizer(value.normalizer):
+            for choice, vs in value._choices.items():
+                if choice in result:
+                    result[choice] |= vs
+                else:
+                    result[choice] = set(vs)
+            return result
+
+        seq = value._data if isinstance(value, self.__class__) else value
+        for choice, vs in self._make_choices(seq - self._data).items():
+            if choice in result:
+                result[choice] |= vs
+            else:
+                result[choice] = vs
+        return result
+
+    def _sub_choices(
+        self,
+        value: Union['RapidFuzzSet', set, frozenset]
+    ) -> dict[str | None, set[Union[Hashable, None]]]:
+        """
+        Return choices of the difference of collection and value.
+        The normalizer is not called.
+        """
+
+        result = {}
+
+        if isinstance(value, self.__class__) and self._is_same_normalizer(value.normalizer):
+            other = value._choices
+            for choice, vs in self._choices.items():
+                rest = vs - other[choice] if choice in other else set(vs)
+                if rest:
+                    result[choice] = rest
+            return result
+
+        seq = value._data if isinstance(value, self.__class__) else value
+        for choice, vs in self._choices.items():
+            rest = vs - seq
+            if rest:
+                result[choice] = rest
+        return result
+
+    def _xor_choices(
+        self,
+        value: Union['RapidFuzzSet', set, frozenset]
+    ) -> dict[str | None, set[Union[Hashable, None]]]:
+        """
+        Return choices of the symmetric difference of collection and value.
+        Only elements of value, which are not in collection, are normalized (if normalizers are different).
+        """
+
+        if isinstance(value, self.__class__) and self._is_same_normalizer(value.normalizer):
+            result = {}
+            other = value._choices
+            for choice, vs in self._choices.items():
+                rest = vs ^ other[choice] if choice in other else set(vs)
+                if rest:
+                    result[choice] = rest
+            for choice, vs in other.items():
+                if choice not in self._choices:
+                    result[choice] = set(vs)
+            return result
+
+        seq = value._data if isinstance(value, self.__class__) else value
+        result = self._sub_choices(seq)
+        for choice, vs in self._make_choices(seq - self._data).items():
+            if choice in result:
+                result[choice] |= vs
+            else:
+                result[choice] = vs
+        return result
+
     def add(self, value: Union[Hashable, None]):
         """
         Add an element to the collection.
@@ -388,17 +622,27 @@ class RapidFuzzSet(RapidfuzzCollection):
         This has no effect if the element is already present.
         """
 
+        if value in self._data:
+            return
+
         self._data.add(value)
+        self._generation += 1
         choice = self.normalizer(value)
         if choice not in self._choices:
             self._choices[choice] = set()
+            self._link_choice(choice)
         self._choices[choice].add(value)
 
     def clear(self):
         """ Remove all elements from the collection. """
 
+        if not self._data:
+            return
+
+        self._generation += 1
         self._data.clear()
         self._choices.clear()
+        self._reset_indexes()
 
     def copy(self) -> 'RapidFuzzSet':
         """ Return a shallow copy. """
@@ -406,16 +650,7 @@ class RapidFuzzSet(RapidfuzzCollection):
         seq = self._data.copy()
         normalizer = copy(self.normalizer)
 
-        return self.__class__(
-            seq,
-            normalizer=normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._copy_choices(), normalizer)
 
     def difference(self, *args) -> 'RapidFuzzSet':
         """
@@ -424,28 +659,15 @@ class RapidFuzzSet(RapidfuzzCollection):
         (i.e. all elements that are in this 'RapidFuzzSet' but not the others.)
         """
 
-        sets = []
-
         for i in args:
-            if isinstance(i, ( set, frozenset, )):
-                sets.append(i)
-            elif isinstance(i, self.__class__):
-                sets.append(i._data)
-            else:
+            if not isinstance(i, ( set, frozenset, self.__class__, )):
                 raise TypeError(f"'difference' not supported between instances of '{self.__class__.__qualname__}' and '{type(i)}'")  # noqa: E501
 
-        seq = self._data.difference(*sets)
-
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        result = self._derive(self._data.copy(), self._copy_choices())
+        for i in args:
+            result = result.__sub__(i)
+
+        return result
 
     def difference_update(self, *args) -> Self:
         """ Remove all elements of another 'RapidFuzzSet' or set from this collection. """
@@ -460,8 +682,11 @@ class RapidFuzzSet(RapidfuzzCollection):
             else:
                 raise TypeError(f"'difference_update' not supported between instances of '{self.__class__.__qualname__}' and '{type(i)}'")  # noqa: E501
 
-        self._data.difference_update(*sets)
-        self._normalize_choices()
+        removed = set().union(*( self._data & i for i in sets ))
+        if removed:
+            self._generation += 1
+            self._discard_choices(removed)
+            self._data -= removed
 
         return self
 
@@ -472,13 +697,18 @@ class RapidFuzzSet(RapidfuzzCollection):
         Does not raise an exception when an element is missing from the collection.
         """
 
+        if value not in self._data:
+            return
+
         self._data.discard(value)
+        self._generation += 1
         choice = self.normalizer(value)
         if choice in self._choices:
             vs = self._choices[choice]
             vs.discard(value)
             if not vs:
                 del self._choices[choice]
+                self._unlink_choice(choice)
 
     def intersection(self, *args) -> 'RapidFuzzSet':
         """
@@ -487,28 +717,15 @@ class RapidFuzzSet(RapidfuzzCollection):
         (i.e. all elements that are in both collections.)
         """
 
-        sets = []
-
         for i in args:
-            if isinstance(i, ( set, frozenset, )):
-                sets.append(i)
-            elif isinstance(i, self.__class__):
-                sets.append(i._data)
-            else:
+            if not isinstance(i, ( set, frozenset, self.__class__, )):
                 raise TypeError(f"'intersection' not supported between instances of '{self.__class__.__qualname__}' and '{type(i)}'")  # noqa: E501
 
-        seq = self._data.intersection(*sets)
-
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        result = self._derive(self._data.copy(), self._copy_choices())
+        for i in args:
+            result = result.__and__(i)
+
+        return result
 
     def intersection_update(self, *args) -> Self:
         """ Update a collection with the intersection of itself and another. """
@@ -523,8 +740,11 @@ class RapidFuzzSet(RapidfuzzCollection):
             else:
                 raise TypeError(f"'intersection_update' not supported between instances of '{self.__class__.__qualname__}' and '{type(i)}'")  # noqa: E501
 
-        self._data.intersection_update(*sets)
-        self._normalize_choices()
+        removed = self._data.difference(self._data.intersection(*sets))
+        if removed:
+            self._generation += 1
+            self._discard_choices(removed)
+            self._data -= removed
 
         return self
 
@@ -568,12 +788,14 @@ class RapidFuzzSet(RapidfuzzCollection):
         """
 
         value = self._data.pop()
+        self._generation += 1
         choice = self.normalizer(value)
         if choice in self._choices:
             vs = self._choices[choice]
             vs.discard(value)
             if not vs:
                 del self._choices[choice]
+                self._unlink_choice(choice)
         return value
 
     def remove(self, value: Any):
@@ -584,12 +806,14 @@ class RapidFuzzSet(RapidfuzzCollection):
         """
 
         self._data.remove(value)
+        self._generation += 1
         choice = self.normalizer(value)
         if choice in self._choices:
             vs = self._choices[choice]
             vs.discard(value)
             if not vs:
                 del self._choices[choice]
+                self._unlink_choice(choice)
 
     def symmetric_difference(self, other: Union['RapidFuzzSet', set, frozenset]) -> 'RapidFuzzSet':
         """
@@ -605,28 +829,23 @@ class RapidFuzzSet(RapidfuzzCollection):
         else:
             raise TypeError(f"'symmetric_difference' not supported between instances of '{self.__class__.__qualname__}' and '{type(other)}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._xor_choices(other))
 
     def symmetric_difference_update(self, other: Union['RapidFuzzSet', set, frozenset]) -> Self:
         """ Update the collection with the symmetric difference of itself and another. """
 
         if isinstance(other, ( set, frozenset, )):
-            self._data.symmetric_difference_update(other)
+            seq = other
         elif isinstance(other, self.__class__):
-            self._data.symmetric_difference_update(other._data)
+            seq = other._data
         else:
             raise TypeError(f"'symmetric_difference' not supported between instances of '{self.__class__.__qualname__}' and '{type(other)}'")  # noqa: E501
 
-        self._normalize_choices()
+        if seq:
+            self._generation += 1
+            self._discard_choices(self._data & seq)
+            self._add_choices(seq - self._data)
+            self._data ^= seq
 
         return self
 
@@ -637,28 +856,15 @@ class RapidFuzzSet(RapidfuzzCollection):
         (i.e. all elements that are in either set.)
         """
 
-        sets = []
-
         for i in args:
-            if isinstance(i, ( set, frozenset, )):
-                sets.append(i)
-            elif isinstance(i, self.__class__):
-                sets.append(i._data)
-            else:
+            if not isinstance(i, ( set, frozenset, self.__class__, )):
                 raise TypeError(f"'union' not supported between instances of '{self.__class__.__qualname__}' and '{type(i)}'")  # noqa: E501
 
-        seq = self._data.union(*sets)
-
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        result = self._derive(self._data.copy(), self._copy_choices())
+        for i in args:
+            result = result.__or__(i)
+
+        return result
 
     def update(self, *args):
         """ Update the collection with the union of itself and others. """
@@ -673,8 +879,11 @@ class RapidFuzzSet(RapidfuzzCollection):
             else:
                 raise TypeError(f"'update' not supported between instances of '{self.__class__.__qualname__}' and '{type(i)}'")  # noqa: E501
 
-        self._data.update(*sets)
-        self._normalize_choices()
+        added = set().union(*sets) - self._data
+        if added:
+            self._generation += 1
+            self._add_choices(added)
+            self._data |= added
 
     def fuzzy_contains(self, value: Any, **kwargs) -> bool:
         """
@@ -706,25 +915,17 @@ class RapidFuzzSet(RapidfuzzCollection):
         if self.__contains__(value):
             return True
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
 
-        if q is not None and q in self._choices:
-            return True
-
-        for nk, score, index in extract_iter(
+        return self._cached_result(
+            self._fuzzy_contains_choices,
             q,
-            self._choices.keys(),
-            scorer=scorer,
-            score_cutoff=score_cutoff,
-            score_hint=score_hint,
-            scorer_kwargs=scorer_kwargs
-        ):
-            if (
-                ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
-                ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(nk) ) )  # noqa
-            ):
-                return True
-        return False
+            score_cutoff,
+            score_hint,
+            scorer,
+            scorer_kwargs,
+            scorer_type
+        )
 
     def fuzzy_get(self, value: Any, **kwargs) -> tuple | None:
         """
@@ -741,8 +942,11 @@ class RapidFuzzSet(RapidfuzzCollection):
             scorer_kwargs
             scorer_type
             strategy
+            workers
         If an argument is passed, then it is used for the search,
         otherwise the default value specified when the class was initialized is used.
+        `workers` is the number of threads, `-1` means all available cores (default is `default_workers`).
+        More than one thread scores chunks of choices by `cdist` in parallel, the same as `fuzzy_get_many` does.
 
         :return:
         The value from collection if exists a similar value, `None` otherwise.
@@ -754,77 +958,159 @@ class RapidFuzzSet(RapidfuzzCollection):
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
         scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
         strategy = self._check_strategy(kwargs.get('strategy', self.default_strategy))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+
+        if workers != 1:
+            return self.fuzzy_get_many([ value ], **kwargs)[0]
 
         if self.__contains__(value):
             return value
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
 
-        if q is not None and q in self._choices:
-            ks = self._choices[q]
-            if strategy == Strategy.BEST_ONLY_ONE:
-                if len(ks) == 1:
-                    k = next(iter(ks))
-                    return k
-            else:
-                k = next(iter(ks))
-                return k
+        return self._cached_result(
+            self._fuzzy_get_choices,
+            q,
+            score_cutoff,
+            score_hint,
+            scorer,
+            scorer_kwargs,
+            scorer_type,
+            strategy
+        )
 
-        if strategy == Strategy.FIRST_FROM_BEST:
-            result = extractOne(
-                q,
-                self._choices.keys(),
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs
-            )
-            if result is None:
-                return None
-            nk, score, index = result
-            ks = self._choices[nk]
+    def fuzzy_get_many(self, values: Iterable, **kwargs) -> list[Any]:
+        """
+        Batch version of `fuzzy_get`.
+        All values are normalized at first and then scored together by `rapidfuzz.process.cdist`.
+
+        :param values:
+        Values to search for in collection.
+
+        :param kwargs:
+        Optional named arguments:
+            score_cutoff
+            score_hint
+            scorer
+            scorer_kwargs
+            scorer_type
+            strategy
+            workers
+        If an argument is passed, then it is used for the search,
+        otherwise the default value specified when the class was initialized is used.
+        `workers` is the number of threads for `cdist`, `-1` means all available cores (default is `default_workers`).
+
+        :return:
+        List of results of `fuzzy_get` in the order of values.
+        """
+
+        score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
+        score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
+        scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
+        scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+        scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
+        strategy = self._check_strategy(kwargs.get('strategy', self.default_strategy))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+
+        result = []
+        queries = {}
+
+        for value in values:
+            if self.__contains__(value):
+                result.append(value)
+                continue
+
+            q = self._normalize_query(value)
+
+            if q is not None and q in self._choices:
+                ks = self._choices[q]
+                if strategy != Strategy.BEST_ONLY_ONE or len(ks) == 1:
+                    result.append(next(iter(ks)))
+                    continue
+
+            if q is not None:
+                queries.setdefault(q, []).append(len(result))
+            result.append(None)
+
+        qs = list(queries)
+        nks = self._select_batch_choices(qs, scorer, score_cutoff, scorer_kwargs)
+
+        for index, choice_index in self._iter_best_choices(
+            qs,
+            nks,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            scorer_type=scorer_type,
+            strategy=strategy,
+            workers=workers
+        ):
+            if choice_index is None:
+                continue
+            ks = self._choices[nks[choice_index]]
+            if strategy == Strategy.BEST_ONLY_ONE and len(ks) != 1:
+                continue
             k = next(iter(ks))
-            return k
+            for position in queries[qs[index]]:
+                result[position] = k
 
-        elif strategy == Strategy.BEST_ONLY_ONE:
-            result = extract(
-                q,
-                self._choices.keys(),
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs,
-                limit=2
-            )
-            if not result:
-                return None
-            if len(result) == 1:
-                nk, score, index = result[0]
-                ks = self._choices[nk]
-                if len(ks) == 1:
-                    k = next(iter(ks))
-                    return k
-            return None
+        return result
 
-        elif strategy == Strategy.FIRST:
-            for nk, score, index in extract_iter(
-                q,
-                self._choices.keys(),
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs
-            ):
-                if (
-                    ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
-                    ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(nk) ) )
-                ):
-                    ks = self._choices[nk]
-                    k = next(iter(ks))
-                    return k
-            return None
+    def fuzzy_top_k(self, value: Any, k: int, **kwargs) -> list[ScorerResultSetType]:
+        """
+        Return `k` elements of the collection which are most similar to value.
+        Only `k` best scores are kept while scoring instead of sorting all of them.
 
-        raise NotImplementedError
+        :param value:
+        Value to search for in collection.
+
+        :param k:
+        Maximum number of returned elements.
+
+        :param kwargs:
+        Optional named arguments:
+            score_cutoff
+            score_hint
+            scorer
+            scorer_kwargs
+        If an argument is passed, then it is used for the search,
+        otherwise the default value specified when the class was initialized is used.
+
+        :return:
+        List of up to `k` Tuples with 2 elements like `get_fuzzy_scores` returns, but only with elements
+        which passed `score_cutoff`. The first element in the list has the highest similarity / the smallest distance.
+        """
+
+        k = self._check_top_k(k)
+        score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
+        score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
+        scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
+        scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+
+        q = self._normalize_query(value)
+
+        result = []
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        for nk, score, index in extract(
+            q,
+            choices,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            limit=k
+        ):
+            # groups of equal normalized values are expanded only until `k` elements are collected
+            for choice in self._choices[nk]:
+                item = choice, score
+                result.append(item)
+                if len(result) == k:
+                    return result
+
+        return result
 
     def get_fuzzy_scores(self, value: Any, **kwargs) -> list[ScorerResultSetType]:
         """
@@ -839,8 +1125,14 @@ class RapidFuzzSet(RapidfuzzCollection):
             score_hint
             scorer
             scorer_kwargs
+            unscored
+            workers
         If an argument is passed, then it is used for the search,
         otherwise the default value specified when the class was initialized is used.
+        `unscored` adds elements, which are not scored or did not pass `score_cutoff`, with `None` score
+        to the end of the list (default is `True`).
+        `workers` is the number of threads, `-1` means all available cores (default is `default_workers`).
+        More than one thread scores chunks of choices by `cdist` in parallel, the same as `get_fuzzy_scores_many` does.
 
         :return:
         List of Tuples with 2 elements:
@@ -859,15 +1151,22 @@ class RapidFuzzSet(RapidfuzzCollection):
         score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
         scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+        unscored = self._check_unscored(kwargs.get('unscored', True))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+
+        if workers != 1:
+            return self.get_fuzzy_scores_many([ value ], **kwargs)[0]
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
 
         result = []
         indexes = set()
 
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
         for nk, score, index in extract(
             q,
-            self._choices.keys(),
+            choices,
             scorer=scorer,
             score_cutoff=score_cutoff,
             score_hint=score_hint,
@@ -880,10 +1179,90 @@ class RapidFuzzSet(RapidfuzzCollection):
                 indexes.add(k)
                 result.append(item)
 
-        for k in self:
-            if k not in indexes:
-                item = k, None
-                result.append(item)
+        if unscored:
+            for k in self:
+                if k not in indexes:
+                    item = k, None
+                    result.append(item)
+
+        return result
+
+    def get_fuzzy_scores_many(self, values: Iterable, **kwargs) -> list[list[ScorerResultSetType]]:
+        """
+        Batch version of `get_fuzzy_scores`.
+        All values are normalized at first and then scored together by `rapidfuzz.process.cdist`.
+
+        :param values:
+        Values to search for in collection.
+
+        :param kwargs:
+        Optional named arguments:
+            score_cutoff
+            score_hint
+            scorer
+            scorer_kwargs
+            scorer_type
+            workers
+            unscored
+        If an argument is passed, then it is used for the search,
+        otherwise the default value specified when the class was initialized is used.
+        `workers` is the number of threads for `cdist`, `-1` means all available cores (default is `default_workers`).
+        `unscored` adds elements, which are not scored or did not pass `score_cutoff`, with `None` score
+        to the end of the list (default is `True`).
+
+        :return:
+        List of results of `get_fuzzy_scores` in the order of values.
+        """
+
+        score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
+        score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
+        scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
+        scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+        scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+        unscored = self._check_unscored(kwargs.get('unscored', True))
+
+        queries = {}
+        for position, value in enumerate(values):
+            queries.setdefault(self._normalize_query(value), []).append(position)
+
+        qs = [ q for q in queries if q is not None ]
+        nks = self._select_batch_choices(qs, scorer, score_cutoff, scorer_kwargs)
+        scores = dict.fromkeys(queries, [])
+
+        for index, pairs in self._iter_sorted_scores(
+            qs,
+            nks,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            scorer_type=scorer_type,
+            workers=workers
+        ):
+            scores[qs[index]] = pairs
+
+        result = [ None ] * sum(map(len, queries.values()))
+
+        for q, positions in queries.items():
+            items = []
+            indexes = set()
+
+            for choice_index, score in scores[q]:
+                ks = self._choices[nks[choice_index]]
+                for k in ks:
+                    item = k, score
+                    indexes.add(k)
+                    items.append(item)
+
+            if unscored:
+                for k in self:
+                    if k not in indexes:
+                        item = k, None
+                        items.append(item)
+
+            for position in positions:
+                result[position] = list(items)
 
         return result
 
@@ -918,11 +1297,13 @@ class RapidFuzzSet(RapidfuzzCollection):
         scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
 
         for nk, score, index in extract_iter(
             q,
-            self._choices.keys(),
+            choices,
             scorer=scorer,
             score_cutoff=score_cutoff,
             score_hint=score_hint,
@@ -1,8 +1,10 @@
 
+from concurrent.futures import Executor
 from copy import (
     copy,
     deepcopy
 )
+from itertools import islice
 from rapidfuzz.fuzz import WRatio
 from rapidfuzz.process import (
     extract,
@@ -11,12 +13,16 @@ from rapidfuzz.process import (
 )
 from typing import (
     Any,
+    Callable,
     Generator,
+    Iterable,
     Iterator,
+    Self,
     Union
 )
 
 from .enums import (
+    IndexType,
     ScorerType,
     Strategy
 )
@@ -39,26 +45,31 @@ class RapidFuzzTuple(RapidfuzzCollection):
 
         if isinstance(value, self.__class__):
             seq = self._data + value._data
+            if self._is_same_normalizer(value.normalizer):
+                choices = self._choices + value._choices
+            else:
+                choices = self._choices + tuple(map(self._compile_normalizer(), value._data))
         elif isinstance(value, tuple):
             seq = self._data + value
+            choices = self._choices + tuple(map(self._compile_normalizer(), value))
         else:
             raise TypeError(f"'+' not supported between instances of '{self.__class__.__qualname__}' and '{type(value)}'")  # noqa: E501
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, choices)
 
     def __contains__(self, item: Any) -> bool:
         """ Return bool(key in self). """
 
-        return item in self._data
+        if self._value_indexes is None:
+            return item in self._data
+
+        try:
+            if item in self._value_indexes:
+                return True
+        except TypeError:
+            return item in self._data
+
+        return self._unhashable_count > 0 and item in self._data
 
     def __copy__(self) -> 'RapidFuzzTuple':
         """ Return shallow copy. """
@@ -66,16 +77,7 @@ class RapidFuzzTuple(RapidfuzzCollection):
         seq = copy(self._data)
         normalizer = copy(self.normalizer)
 
-        return self.__class__(
-            seq,
-            normalizer=normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._choices, normalizer)
 
     def __deepcopy__(self, memodict) -> 'RapidFuzzTuple':
         """ Return deep copy. """
@@ -83,16 +85,7 @@ class RapidFuzzTuple(RapidfuzzCollection):
         seq = deepcopy(self._data, memo=memodict)
         normalizer = deepcopy(self.normalizer)
 
-        return self.__class__(
-            seq,
-            normalizer=normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._choices, normalizer)
 
     def __eq__(self, value: Any) -> bool:
         """ Return self==value. """
@@ -102,7 +95,7 @@ class RapidFuzzTuple(RapidfuzzCollection):
 
         return (
             self._data == value._data and
-            self.choices == value.choices and
+            self._choices == value._choices and
             self.default_score_cutoff == value.default_score_cutoff and
             self.default_score_hint == value.default_score_hint and
             self.default_scorer_type == value.default_scorer_type and
@@ -123,7 +116,16 @@ class RapidFuzzTuple(RapidfuzzCollection):
         scorer: ScorerProtocol = WRatio,
         scorer_kwargs: dict[str, Any] | None = None,
         scorer_type: ScorerType = ScorerType.SIMILARITY,
-        strategy: Strategy = Strategy.FIRST_FROM_BEST
+        strategy: Strategy = Strategy.FIRST_FROM_BEST,
+        query_cache_size: int | None = None,
+        result_cache_size: int | None = None,
+        index_type: IndexType | None = None,
+        symspell_distance: int = 2,
+        symspell_max_entries: int | None = None,
+        workers: int = 1,
+        executor: Executor | None = None,
+        progress: Callable[[int, int], Any] | None = None,
+        index_values: bool = False
     ):
         """
         Immutable sequence. Basis is tuple.
@@ -160,6 +162,48 @@ class RapidFuzzTuple(RapidfuzzCollection):
 
         :param strategy:
         Strategy for searching and returning values.
+
+        :param query_cache_size:
+        Maximum size of the LRU cache of normalized queries (value -> normalized value) for searching.
+        Repeated queries skip the normalizer. Unhashable queries are not cached. `None` deactivates this behaviour.
+
+        :param result_cache_size:
+        Maximum size of the LRU cache of results of `fuzzy_contains`, `fuzzy_get` and `fuzzy_index`
+        by normalized query and search arguments. The cache is invalidated by any change of the collection.
+        `None` deactivates this behaviour.
+
+        :param index_type:
+        Type of index of normalized values for searching with `score_cutoff`.
+        `IndexType.BK_TREE` is used by edit distance scorers (see `indexes.METRIC_SCORERS`) without `scorer_kwargs`.
+        `IndexType.SYMSPELL` is used by edit distance scorers (see `indexes.DELETION_SCORERS`) without `scorer_kwargs`
+        when `score_cutoff` is not greater than `symspell_distance`. `None` deactivates this behaviour.
+
+        :param symspell_distance:
+        Maximum edit distance of `IndexType.SYMSPELL` index. Memory of the index grows fast with the distance
+        and the length of normalized values, so it is intended for distances 1-2 and short values.
+
+        :param symspell_max_entries:
+        Memory cap of `IndexType.SYMSPELL` index: the maximum number of deletions in it (see `index_info`).
+        The index is dropped and all choices are scanned when it overflows. `None` deactivates this behaviour.
+
+        :param workers:
+        Default number of threads for scoring, `-1` means all available cores. Batch queries pass it to `cdist`.
+        Single queries of `fuzzy_get` and `get_fuzzy_scores` with more than one thread are scored by `cdist`
+        in chunks of choices in parallel (requires `numpy`).
+        Normalization of all values (by the constructor and the `normalizer` setter) uses the same number
+        of processes, or threads on free-threaded builds (see `PARALLEL_NORMALIZE_MIN_VALUES`).
+
+        :param executor:
+        Default `concurrent.futures.Executor` of async methods (`afuzzy_get` etc.).
+        `None` means the default executor of the running event loop.
+
+        :param progress:
+        Callable `progress(done, total)` which is called after each chunk of normalization of all values
+        (see `NORMALIZE_CHUNK_SIZE`). `None` deactivates this behaviour.
+
+        :param index_values:
+        Keep the index of positions by the values of collection (only hashable values are indexed).
+        It is used for fast `in`, `count` and `index` operations.
         """
 
         length = len(args)
@@ -171,6 +215,9 @@ class RapidFuzzTuple(RapidfuzzCollection):
             raise TypeError(f"Need: 0 or 1 positional argument. Got: {length} positional arguments")
 
         self._choices = tuple()
+        self._choice_indexes = {}
+        self._value_indexes = {} if index_values else None
+        self._unhashable_count = 0
 
         super().__init__(
             normalizer=normalizer,
@@ -179,7 +226,15 @@ class RapidFuzzTuple(RapidfuzzCollection):
             scorer=scorer,
             scorer_kwargs=scorer_kwargs,
             scorer_type=scorer_type,
-            strategy=strategy
+            strategy=strategy,
+            query_cache_size=query_cache_size,
+            result_cache_size=result_cache_size,
+            index_type=index_type,
+            symspell_distance=symspell_distance,
+            symspell_max_entries=symspell_max_entries,
+            workers=workers,
+            executor=executor,
+            progress=progress
         )
 
     def __iter__(self) -> Iterator:
@@ -200,16 +255,7 @@ class RapidFuzzTuple(RapidfuzzCollection):
 
         seq = self._data * value
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._choices * value)
 
     def __ne__(self, value: Any) -> bool:
         """ Return self!=value. """
@@ -219,7 +265,7 @@ class RapidFuzzTuple(RapidfuzzCollection):
 
         return not (
             self._data == value._data and
-            self.choices == value.choices and
+            self._choices == value._choices and
             self.default_score_cutoff == value.default_score_cutoff and
             self.default_score_hint == value.default_score_hint and
             self.default_scorer_type == value.default_scorer_type and
@@ -239,31 +285,251 @@ class RapidFuzzTuple(RapidfuzzCollection):
 
         seq = value * self._data
 
-        return self.__class__(
-            seq,
-            normalizer=self.normalizer,
-            score_cutoff=self.default_score_cutoff,
-            score_hint=self.default_score_hint,
-            scorer=self.default_scorer,
-            scorer_kwargs=self.default_scorer_kwargs,
-            scorer_type=self.default_scorer_type,
-            strategy=self.default_strategy
-        )
+        return self._derive(seq, self._choices * value)
 
     @property
     def choices(self) -> tuple:
-        return deepcopy(self._choices)
+        return self._choices
+
+    @property
+    def index_values(self) -> bool:
+        return self._value_indexes is not None
+
+    def _derive(self, data: Any, choices: Any, normalizer: NormalizerProtocol | None = None) -> Self:
+        """
+        Return new collection of the same class and with the same settings.
+        `choices` must be `data` which is already normalized by the normalizer, so the normalizer is not called.
+        The indexes of positions are rebuilt.
+        """
+
+        instance = super()._derive(data, choices, normalizer)
+        instance._value_indexes = {} if self.index_values else None
+        instance._unhashable_count = 0
+        instance._index_choices()
+
+        return instance
+
+    def _pickle_settings(self) -> dict[str, Any]:
+        """
+        Return the settings which are pickled by `__reduce__`, including `index_values`.
+        """
+
+        settings = super()._pickle_settings()
+        settings['_value_indexes'] = {} if self.index_values else None
+
+        return settings
+
+    def _fuzzy_contains_choices(
+        self,
+        q: str | None,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer: ScorerProtocol,
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType
+    ) -> bool:
+        """
+        Search the normalized value `q` in choices: the cached part of `fuzzy_contains`.
+        """
+
+        if q is not None and q in self._choice_indexes:
+            return True
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        for choice, score, index in extract_iter(
+            q,
+            choices,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs
+        ):
+            if (
+                ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
+                ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(choice) ) )  # noqa
+            ):
+                return True
+        return False
+
+    def _fuzzy_get_choices(
+        self,
+        q: str | None,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer: ScorerProtocol,
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType,
+        strategy: Strategy
+    ) -> Any:
+        """
+        Search the normalized value `q` in choices: the cached part of `fuzzy_get`.
+        """
+
+        if q is not None and q in self._choice_indexes:
+            index = self._choice_indexes[q][0]
+            return self.__getitem__(index)
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        if strategy == Strategy.FIRST_FROM_BEST:
+            result = extractOne(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs
+            )
+            if result is None:
+                return None
+            choice, score, index = result
+            return self.__getitem__(self._choice_indexes[choice][0])
+
+        elif strategy == Strategy.BEST_ONLY_ONE:
+            result = extract(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs,
+                limit=2
+            )
+            if not result:
+                return None
+            if len(result) == 1:
+                choice, score, index = result[0]
+                indexes = self._choice_indexes[choice]
+                if len(indexes) == 1:
+                    return self.__getitem__(indexes[0])
+            return None
+
+        elif strategy == Strategy.FIRST:
+            for choice, score, index in extract_iter(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs
+            ):
+                if (
+                    ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
+                    ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(choice) ) )  # noqa
+                ):
+                    return self.__getitem__(self._choice_indexes[choice][0])
+            return None
+
+        raise NotImplementedError
+
+    def _fuzzy_index_choices(
+        self,
+        q: str | None,
+        score_cutoff: int | float | None,
+        score_hint: int | float | None,
+        scorer: ScorerProtocol,
+        scorer_kwargs: dict[str, Any] | None,
+        scorer_type: ScorerType,
+        strategy: Strategy
+    ) -> int | None:
+        """
+        Search the normalized value `q` in choices: the cached part of `fuzzy_index`.
+        """
+
+        if q is not None and q in self._choice_indexes:
+            return self._choice_indexes[q][0]
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        if strategy == Strategy.FIRST_FROM_BEST:
+            result = extractOne(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs
+            )
+            if result is None:
+                return None
+            choice, score, index = result
+            return self._choice_indexes[choice][0]
+
+        elif strategy == Strategy.BEST_ONLY_ONE:
+            result = extract(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs,
+                limit=2
+            )
+            if not result:
+                return None
+            if len(result) == 1:
+                choice, score, index = result[0]
+                indexes = self._choice_indexes[choice]
+                if len(indexes) == 1:
+                    return indexes[0]
+            return None
+
+        elif strategy == Strategy.FIRST:
+            for choice, score, index in extract_iter(
+                q,
+                choices,
+                scorer=scorer,
+                score_cutoff=score_cutoff,
+                score_hint=score_hint,
+                scorer_kwargs=scorer_kwargs
+            ):
+                if (
+                    ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
+                    ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(choice) ) )  # noqa
+                ):
+                    return self._choice_indexes[choice][0]
+            return None
+
+        raise NotImplementedError
+
+    def _index_choices(self):
+        """
+        Rebuild the indexes of positions by normalized values and by values.
+        The normalizer is not called.
+        """
+
+        self._choice_indexes = {}
+        for index, choice in enumerate(self._choices):
+            self._choice_indexes.setdefault(choice, []).append(index)
+        self._reset_indexes()
+
+        if self._value_indexes is not None:
+            self._value_indexes = {}
+            self._unhashable_count = 0
+            for index, value in enumerate(self._data):
+                try:
+                    self._value_indexes.setdefault(value, []).append(index)
+                except TypeError:
+                    self._unhashable_count += 1
 
     def _normalize_choices(self):
         """
         Normalize all values of choices.
         """
 
-        self._choices = tuple( self.normalizer(i) for i in self._data )
+        self._choices = tuple(self._normalize_values(self._data))
+        self._index_choices()
 
     def count(self, value: Any) -> int:
         """ Return number of occurrences of value. """
 
+        if self._value_indexes is not None and not self._unhashable_count:
+            try:
+                return len(self._value_indexes.get(value, ()))
+            except TypeError:
+                pass
+
         return self._data.count(value)
 
     def index(self, value: Any, *args):
@@ -273,6 +539,16 @@ class RapidFuzzTuple(RapidfuzzCollection):
         Raises ValueError if the value is not present.
         """
 
+        if self._value_indexes is not None and not args:
+            try:
+                indexes = self._value_indexes.get(value)
+            except TypeError:
+                indexes = None
+            if indexes:
+                return indexes[0]
+            if not self._unhashable_count:
+                raise ValueError("tuple.index(x): x not in tuple")
+
         return self._data.index(value, *args)
 
     def fuzzy_contains(self, value: Any, **kwargs) -> bool:
@@ -305,25 +581,17 @@ class RapidFuzzTuple(RapidfuzzCollection):
         if self.__contains__(value):
             return True
 
-        q = self.normalizer(value)
-
-        if q is not None and q in self._choices:
-            return True
+        q = self._normalize_query(value)
 
-        for choice, score, index in extract_iter(
+        return self._cached_result(
+            self._fuzzy_contains_choices,
             q,
-            self._choices,
-            scorer=scorer,
-            score_cutoff=score_cutoff,
-            score_hint=score_hint,
-            scorer_kwargs=scorer_kwargs
-        ):
-            if (
-                ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
-                ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(choice) ) )  # noqa
-            ):
-                return True
-        return False
+            score_cutoff,
+            score_hint,
+            scorer,
+            scorer_kwargs,
+            scorer_type
+        )
 
     def fuzzy_count(self, value: Any, **kwargs) -> int:
         """
@@ -352,12 +620,14 @@ class RapidFuzzTuple(RapidfuzzCollection):
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
         scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
 
         counter = 0
         for choice, score, index in extract_iter(
             q,
-            self._choices,
+            choices,
             scorer=scorer,
             score_cutoff=score_cutoff,
             score_hint=score_hint,
@@ -367,7 +637,7 @@ class RapidFuzzTuple(RapidfuzzCollection):
                 ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
                 ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(choice) ) )
             ):
-                counter += 1
+                counter += len(self._choice_indexes[choice])
 
         return counter
 
@@ -386,8 +656,11 @@ class RapidFuzzTuple(RapidfuzzCollection):
             scorer_kwargs
             scorer_type
             strategy
+            workers
         If an argument is passed, then it is used for the search,
         otherwise the default value specified when the class was initialized is used.
+        `workers` is the number of threads, `-1` means all available cores (default is `default_workers`).
+        More than one thread scores chunks of choices by `cdist` in parallel, the same as `fuzzy_get_many` does.
 
         :return:
         The value from collection if exists a similar value, `None` otherwise.
@@ -399,64 +672,103 @@ class RapidFuzzTuple(RapidfuzzCollection):
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
         scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
         strategy = self._check_strategy(kwargs.get('strategy', self.default_strategy))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+
+        if workers != 1:
+            return self.fuzzy_get_many([ value ], **kwargs)[0]
 
         if self.__contains__(value):
             return value
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
 
-        if q is not None and q in self._choices:
-            index = self._choices.index(q)
-            return self.__getitem__(index)
+        return self._cached_result(
+            self._fuzzy_get_choices,
+            q,
+            score_cutoff,
+            score_hint,
+            scorer,
+            scorer_kwargs,
+            scorer_type,
+            strategy
+        )
 
-        if strategy == Strategy.FIRST_FROM_BEST:
-            result = extractOne(
-                q,
-                self._choices,
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs
-            )
-            if result is None:
-                return None
-            choice, score, index = result
-            return self.__getitem__(index)
+    def fuzzy_get_many(self, values: Iterable, **kwargs) -> list[Any]:
+        """
+        Batch version of `fuzzy_get`.
+        All values are normalized at first and then scored together by `rapidfuzz.process.cdist`.
 
-        elif strategy == Strategy.BEST_ONLY_ONE:
-            result = extract(
-                q,
-                self._choices,
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs,
-                limit=2
-            )
-            if not result:
-                return None
-            if len(result) == 1:
-                choice, score, index = result[0]
-                return self.__getitem__(index)
-            return None
+        :param values:
+        Values to search for in collection.
 
-        elif strategy == Strategy.FIRST:
-            for choice, score, index in extract_iter(
-                q,
-                self._choices,
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs
-            ):
-                if (
-                    ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
-                    ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(choice) ) )  # noqa
-                ):
-                    return self.__getitem__(index)
-            return None
+        :param kwargs:
+        Optional named arguments:
+            score_cutoff
+            score_hint
+            scorer
+            scorer_kwargs
+            scorer_type
+            strategy
+            workers
+        If an argument is passed, then it is used for the search,
+        otherwise the default value specified when the class was initialized is used.
+        `workers` is the number of threads for `cdist`, `-1` means all available cores (default is `default_workers`).
 
-        raise NotImplementedError
+        :return:
+        List of results of `fuzzy_get` in the order of values.
+        """
+
+        score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
+        score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
+        scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
+        scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+        scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
+        strategy = self._check_strategy(kwargs.get('strategy', self.default_strategy))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+
+        result = []
+        queries = {}
+
+        for value in values:
+            if self.__contains__(value):
+                result.append(value)
+                continue
+
+            q = self._normalize_query(value)
+
+            if q is not None and q in self._choice_indexes:
+                index = self._choice_indexes[q][0]
+                result.append(self.__getitem__(index))
+                continue
+
+            if q is not None:
+                queries.setdefault(q, []).append(len(result))
+            result.append(None)
+
+        qs = list(queries)
+        choices = self._select_batch_choices(qs, scorer, score_cutoff, scorer_kwargs)
+
+        for index, choice_index in self._iter_best_choices(
+            qs,
+            choices,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            scorer_type=scorer_type,
+            strategy=strategy,
+            workers=workers
+        ):
+            if choice_index is None:
+                continue
+            indexes = self._choice_indexes[choices[choice_index]]
+            if strategy == Strategy.BEST_ONLY_ONE and len(indexes) != 1:
+                continue
+            item = self.__getitem__(indexes[0])
+            for position in queries[qs[index]]:
+                result[position] = item
+
+        return result
 
     def fuzzy_index(self, value: Any, **kwargs) -> int | None:
         """
@@ -491,59 +803,85 @@ class RapidFuzzTuple(RapidfuzzCollection):
         if self.__contains__(value):
             return self.index(value)
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
 
-        if q is not None and q in self._choices:
-            return self._choices.index(q)
+        return self._cached_result(
+            self._fuzzy_index_choices,
+            q,
+            score_cutoff,
+            score_hint,
+            scorer,
+            scorer_kwargs,
+            scorer_type,
+            strategy
+        )
 
-        if strategy == Strategy.FIRST_FROM_BEST:
-            result = extractOne(
-                q,
-                self._choices,
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs
-            )
-            if result is None:
-                return None
-            choice, score, index = result
-            return index
+    async def afuzzy_count(self, value: Any, **kwargs) -> int:
+        """
+        Async version of `fuzzy_count`. Scoring runs in the executor (default is `default_executor`).
+        """
 
-        elif strategy == Strategy.BEST_ONLY_ONE:
-            result = extract(
-                q,
-                self._choices,
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs,
-                limit=2
-            )
-            if not result:
-                return None
-            if len(result) == 1:
-                choice, score, index = result[0]
-                return index
-            return None
+        return await self._run_in_executor(self.fuzzy_count, value, **kwargs)
 
-        elif strategy == Strategy.FIRST:
-            for choice, score, index in extract_iter(
-                q,
-                self._choices,
-                scorer=scorer,
-                score_cutoff=score_cutoff,
-                score_hint=score_hint,
-                scorer_kwargs=scorer_kwargs
-            ):
-                if (
-                    ( scorer_type == ScorerType.SIMILARITY and score > 0 ) or
-                    ( scorer_type == ScorerType.DISTANCE and score < ( len(q) + len(choice) ) )  # noqa
-                ):
-                    return index
-            return None
+    async def afuzzy_index(self, value: Any, **kwargs) -> int | None:
+        """
+        Async version of `fuzzy_index`. Scoring runs in the executor (default is `default_executor`).
+        """
 
-        raise NotImplementedError
+        return await self._run_in_executor(self.fuzzy_index, value, **kwargs)
+
+    def fuzzy_top_k(self, value: Any, k: int, **kwargs) -> list[ScorerResultListType]:
+        """
+        Return `k` elements of the collection which are most similar to value.
+        Only `k` best scores are kept while scoring instead of sorting all of them.
+
+        :param value:
+        Value to search for in collection.
+
+        :param k:
+        Maximum number of returned elements.
+
+        :param kwargs:
+        Optional named arguments:
+            score_cutoff
+            score_hint
+            scorer
+            scorer_kwargs
+        If an argument is passed, then it is used for the search,
+        otherwise the default value specified when the class was initialized is used.
+
+        :return:
+        List of up to `k` Tuples with 3 elements like `get_fuzzy_scores` returns, but only with elements
+        which passed `score_cutoff`. The first element in the list has the highest similarity / the smallest distance.
+        """
+
+        k = self._check_top_k(k)
+        score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
+        score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
+        scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
+        scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+
+        q = self._normalize_query(value)
+
+        result = []
+
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        # `k` best unique values always have `k` best positions: other values with the same score as the last one
+        # appear after the first positions of selected values with this score
+        for index, score in islice(self._iter_sorted_positions(extract(
+            q,
+            choices,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            limit=k
+        )), k):
+            item = self.__getitem__(index), score, index
+            result.append(item)
+
+        return result
 
     def get_fuzzy_scores(self, value: Any, **kwargs) -> list[ScorerResultListType]:
         """
@@ -558,8 +896,14 @@ class RapidFuzzTuple(RapidfuzzCollection):
             score_hint
             scorer
             scorer_kwargs
+            unscored
+            workers
         If an argument is passed, then it is used for the search,
         otherwise the default value specified when the class was initialized is used.
+        `unscored` adds elements, which are not scored or did not pass `score_cutoff`, with `None` score
+        to the end of the list (default is `True`).
+        `workers` is the number of threads, `-1` means all available cores (default is `default_workers`).
+        More than one thread scores chunks of choices by `cdist` in parallel, the same as `get_fuzzy_scores_many` does.
 
         :return:
         List of Tuples with 3 elements:
@@ -579,29 +923,116 @@ class RapidFuzzTuple(RapidfuzzCollection):
         score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
         scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+        unscored = self._check_unscored(kwargs.get('unscored', True))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+
+        if workers != 1:
+            return self.get_fuzzy_scores_many([ value ], **kwargs)[0]
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
 
         result = []
         indexes = set()
 
-        for choice, score, index in extract(
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        for index, score in self._iter_sorted_positions(extract(
             q,
-            self._choices,
+            choices,
             scorer=scorer,
             score_cutoff=score_cutoff,
             score_hint=score_hint,
             scorer_kwargs=scorer_kwargs,
             limit=None
-        ):
+        )):
             item = self.__getitem__(index), score, index
             indexes.add(index)
             result.append(item)
 
-        for index, value in enumerate(self):
-            if index not in indexes:
-                item = value, None, index
-                result.append(item)
+        if unscored:
+            for index, value in enumerate(self):
+                if index not in indexes:
+                    item = value, None, index
+                    result.append(item)
+
+        return result
+
+    def get_fuzzy_scores_many(self, values: Iterable, **kwargs) -> list[list[ScorerResultListType]]:
+        """
+        Batch version of `get_fuzzy_scores`.
+        All values are normalized at first and then scored together by `rapidfuzz.process.cdist`.
+
+        :param values:
+        Values to search for in collection.
+
+        :param kwargs:
+        Optional named arguments:
+            score_cutoff
+            score_hint
+            scorer
+            scorer_kwargs
+            scorer_type
+            workers
+            unscored
+        If an argument is passed, then it is used for the search,
+        otherwise the default value specified when the class was initialized is used.
+        `workers` is the number of threads for `cdist`, `-1` means all available cores (default is `default_workers`).
+        `unscored` adds elements, which are not scored or did not pass `score_cutoff`, with `None` score
+        to the end of the list (default is `True`).
+
+        :return:
+        List of results of `get_fuzzy_scores` in the order of values.
+        """
+
+        score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
+        score_hint = self._check_score_hint(kwargs.get('score_hint', self.default_score_hint))
+        scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
+        scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
+        scorer_type = self._check_scorer_type(kwargs.get('scorer_type', self.default_scorer_type))
+        workers = self._check_workers(kwargs.get('workers', self.default_workers))
+        unscored = self._check_unscored(kwargs.get('unscored', True))
+
+        queries = {}
+        for position, value in enumerate(values):
+            queries.setdefault(self._normalize_query(value), []).append(position)
+
+        qs = [ q for q in queries if q is not None ]
+        choices = self._select_batch_choices(qs, scorer, score_cutoff, scorer_kwargs)
+        scores = dict.fromkeys(queries, [])
+
+        for index, pairs in self._iter_sorted_scores(
+            qs,
+            choices,
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            scorer_type=scorer_type,
+            workers=workers
+        ):
+            scores[qs[index]] = pairs
+
+        result = [ None ] * sum(map(len, queries.values()))
+
+        for q, positions in queries.items():
+            items = []
+            scored = set()
+
+            for index, score in self._iter_sorted_positions(
+                ( choices[choice_index], score, choice_index, ) for choice_index, score in scores[q]
+            ):
+                item = self.__getitem__(index), score, index
+                scored.add(index)
+                items.append(item)
+
+            if unscored:
+                for index, value in enumerate(self):
+                    if index not in scored:
+                        item = value, None, index
+                        items.append(item)
+
+            for position in positions:
+                result[position] = list(items)
 
         return result
 
@@ -630,6 +1061,10 @@ class RapidFuzzTuple(RapidfuzzCollection):
                 - A normalized edit distance (similarity is a score between 0 and 100, with 100 being a perfect match).
                   In this case only choices which have a similarity >= score_cutoff are returned.
             The third parameter is the index of element.
+
+        Elements are yielded while they are scored: elements with equal normalized values are yielded together
+        in the order of their indexes, groups are in the order of their first elements.
+        Sort the results by index if the order of elements is needed (all elements are materialized for that).
         """
 
         score_cutoff = self._check_score_cutoff(kwargs.get('score_cutoff', self.default_score_cutoff))
@@ -637,14 +1072,18 @@ class RapidFuzzTuple(RapidfuzzCollection):
         scorer = self._check_scorer(kwargs.get('scorer', self.default_scorer))
         scorer_kwargs = self._check_scorer_kwargs(kwargs.get('scorer_kwargs', self.default_scorer_kwargs))
 
-        q = self.normalizer(value)
+        q = self._normalize_query(value)
 
-        for choice, score, index in extract_iter(
+        choices = self._select_choices(q, scorer, score_cutoff, scorer_kwargs)
+
+        # matches are expanded to positions as they are found, so elements are not materialized
+        for choice, score, _ in extract_iter(
             q,
-            self._choices,
+            choices,
             scorer=scorer,
             score_cutoff=score_cutoff,
             score_hint=score_hint,
             scorer_kwargs=scorer_kwargs
         ):
-            yield self.__getitem__(index), score, index
+            for index in self._choice_indexes[choice]:
+                yield self.__getitem__(index), score, index
@@ -0,0 +1,112 @@
+from contextlib import contextmanager
+from copy import copy
+from threading import Lock
+from typing import (
+    Any,
+    Generator,
+    Iterator
+)
+
+from .base import RapidfuzzCollection
+
+
+class SnapshotCollection:
+    """
+    Thread-safe access to a collection which is being changed: readers query an immutable snapshot
+    and writers publish a new snapshot atomically (copy-on-write).
+
+    Readers never take a lock: each call is done on the snapshot which is current at the time of the call,
+    so iterators (e.g. `get_fuzzy_score_iter`) are not affected by writers. Fuzzy search methods
+    (`fuzzy_*`, `get_fuzzy_*` and their async versions) are delegated to the current snapshot,
+    other reads are done by `snapshot`. Writers are serialized: `write` copies the current snapshot
+    (without normalization of values), so many changes should be batched in one `write`.
+    Indexes of a new snapshot (and other lazy state of searching) are built before it is published,
+    so readers never change a snapshot (see `RapidfuzzCollection._freeze`): the result cache is not used
+    and searches which can not use the built indexes (e.g. with other scorers) scan choices.
+
+    Example:
+        collection = SnapshotCollection(RapidFuzzDict(data_dict))
+        collection.fuzzy_get('Ustralia')  # in reader threads
+        with collection.write() as draft:  # in writer threads
+            draft['Gondor'] = 'GND'
+            del draft['Aruba']
+    """
+
+    def __init__(self, collection: RapidfuzzCollection):
+        """
+        :param collection:
+        Initial snapshot. It must not be changed after that.
+        """
+
+        self._snapshot = self._check_collection(collection)
+        self._snapshot._freeze()
+        self._lock = Lock()
+
+    def __contains__(self, value: Any) -> bool:
+        """ Return bool(value in self). """
+
+        return self._snapshot.__contains__(value)
+
+    def __getattr__(self, name: str) -> Any:
+        """ Fuzzy search methods of the current snapshot. """
+
+        if name.startswith(( 'fuzzy_', 'get_fuzzy_', 'afuzzy_', 'aget_fuzzy_', )):
+            return getattr(self._snapshot, name)
+
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def __iter__(self) -> Iterator:
+        """ Implement iter(self). """
+
+        return self._snapshot.__iter__()
+
+    def __len__(self) -> int:
+        """ Return len(self). """
+
+        return self._snapshot.__len__()
+
+    def __repr__(self) -> str:
+        """ Return repr(self). """
+
+        return f"{self.__class__.__name__}({self._snapshot!r})"
+
+    @property
+    def snapshot(self) -> RapidfuzzCollection:
+        """
+        Current snapshot. It must not be changed.
+        """
+
+        return self._snapshot
+
+    @staticmethod
+    def _check_collection(value: RapidfuzzCollection) -> RapidfuzzCollection:
+        if not isinstance(value, RapidfuzzCollection):
+            raise TypeError(f"Need: `RapidfuzzCollection`. Got: `{str(value)}` type=`{type(value)}`")
+        return value
+
+    def publish(self, collection: RapidfuzzCollection):
+        """
+        Replace the snapshot by the collection (e.g. a result of operations with immutable collections).
+
+        :param collection:
+        New snapshot. It must not be changed after that.
+        """
+
+        collection = self._check_collection(collection)
+        collection._freeze()
+        with self._lock:
+            self._snapshot = collection
+
+    @contextmanager
+    def write(self) -> Generator[RapidfuzzCollection, None, None]:
+        """
+        Context manager of changes: yields a copy of the current snapshot for changing, which is published
+        as the new snapshot on exit. If an exception is raised, then the changes are discarded.
+        Writers wait for each other, readers are not blocked.
+        """
+
+        with self._lock:
+            draft = copy(self._snapshot)
+            yield draft
+            draft._freeze()
+            self._snapshot = draft
@@ -3,17 +3,34 @@ from typing import (
     Any,
     Callable,
     Hashable,
+    NamedTuple,
     Protocol,
     Sequence
 )
 
 
+class IndexInfo(NamedTuple):
+    index_type: Any
+    size: int
+    entries: int
+    maxentries: int | None
+    memory: int
+    overflow: bool
+
+
 class NormalizerProtocol(Protocol):
 
     def __call__(self, value: Any) -> str | None:
         ...
 
 
+class ResultCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
 class ScorerProtocol(Protocol):
 
     def __call__(self, s1: Sequence[Hashable] | None, s2: Sequence[Hashable] | None, **kwargs) -> float | int:
@@ -21,6 +38,7 @@ class ScorerProtocol(Protocol):
 
 
 NormalizerOperationType = tuple[str, Callable, tuple, dict]
+NormalizerSpecType = dict[str, Any]
 ScorerResultDictType = tuple[Any, float, Any]
 ScorerResultListType = tuple[Any, float, int]
 ScorerResultSetType = tuple[Any, float]
@@ -0,0 +1,85 @@
+from collections.abc import (
+    Mapping,
+    Set
+)
+from typing import (
+    Any,
+    Hashable,
+    Iterator
+)
+
+
+class ChoicesGroupView(Set):
+    """
+    Read-only view on the group of values with the same normalized value.
+    It reflects changes of the collection and does not copy values.
+    """
+
+    __slots__ = ( '_group', )
+
+    def __contains__(self, value: Any) -> bool:
+        """ Return bool(value in self). """
+
+        try:
+            return value in self._group
+        except TypeError:
+            return False
+
+    def __init__(self, group: set[Hashable | None]):
+        self._group = group
+
+    def __iter__(self) -> Iterator:
+        """ Implement iter(self). """
+
+        return iter(self._group)
+
+    def __len__(self) -> int:
+        """ Return len(self). """
+
+        return len(self._group)
+
+    def __repr__(self) -> str:
+        """ Return repr(self). """
+
+        return f"{self.__class__.__qualname__}({repr(self._group)})"
+
+    @classmethod
+    def _from_iterable(cls, it) -> frozenset:
+        return frozenset(it)
+
+
+class ChoicesView(Mapping):
+    """
+    Read-only view on choices of the collection: normalized value -> group of values.
+    It reflects changes of the collection and does not copy choices.
+    """
+
+    __slots__ = ( '_choices', )
+
+    def __contains__(self, key: Any) -> bool:
+        """ Return bool(key in self). """
+
+        return key in self._choices
+
+    def __getitem__(self, key: str | None) -> ChoicesGroupView:
+        """ Return self[key]. """
+
+        return ChoicesGroupView(self._choices[key])
+
+    def __init__(self, choices: dict[str | None, set[Hashable | None]]):
+        self._choices = choices
+
+    def __iter__(self) -> Iterator:
+        """ Implement iter(self). """
+
+        return iter(self._choices)
+
+    def __len__(self) -> int:
+        """ Return len(self). """
+
+        return len(self._choices)
+
+    def __repr__(self) -> str:
+        """ Return repr(self). """
+
+        return f"{self.__class__.__qualname__}({repr(self._choices)})"
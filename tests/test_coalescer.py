@@ -0,0 +1,99 @@
+from asyncio import (
+    gather,
+    run,
+    sleep
+)
+from unittest import TestCase
+from unittest.mock import patch
+
+from rapidfuzz_collections import (
+    Normalizer,
+    QueryCoalescer,
+    RapidFuzzDict,
+    RapidFuzzList
+)
+
+from data import (
+    data_dict,
+    data_tuple
+)
+
+
+class TestQueryCoalescer(TestCase):
+
+    def test_init(self):
+        rapidfuzz_dict = RapidFuzzDict(data_dict)
+
+        coalescer = QueryCoalescer(rapidfuzz_dict, max_delay=0.01, max_batch=8)
+        self.assertIs(coalescer.collection, rapidfuzz_dict)
+        self.assertEqual(coalescer.max_delay, 0.01)
+        self.assertEqual(coalescer.max_batch, 8)
+        self.assertEqual(coalescer.pending, 0)
+
+        with self.assertRaises(TypeError):
+            QueryCoalescer(dict(data_dict))
+
+        with self.assertRaises(TypeError):
+            QueryCoalescer(rapidfuzz_dict, max_delay='0.01')
+
+        with self.assertRaises(ValueError):
+            QueryCoalescer(rapidfuzz_dict, max_delay=-1)
+
+        with self.assertRaises(TypeError):
+            QueryCoalescer(rapidfuzz_dict, max_batch=1.0)
+
+        with self.assertRaises(ValueError):
+            QueryCoalescer(rapidfuzz_dict, max_batch=0)
+
+        with self.assertRaises(TypeError):
+            QueryCoalescer(rapidfuzz_dict, executor=2)
+
+    def test_fuzzy_get(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_dict = RapidFuzzDict(data_dict, normalizer=normalizer, score_cutoff=90)
+        values = [ 'Ustralia', 'Gondor', 'Austria', 'Austraia', 'Russia', ]
+
+        async def main():
+            coalescer = QueryCoalescer(rapidfuzz_dict, max_delay=0.01, max_batch=3, score_cutoff=60)
+            with patch.object(rapidfuzz_dict, 'fuzzy_get_many', wraps=rapidfuzz_dict.fuzzy_get_many) as fuzzy_get_many:  # noqa: E501
+                results = await gather(*( coalescer.fuzzy_get(value) for value in values ))
+                # a full batch of 3 queries and 2 queries after the delay
+                self.assertEqual(fuzzy_get_many.call_count, 2)
+            self.assertListEqual(results, [ rapidfuzz_dict.fuzzy_get(value, score_cutoff=60) for value in values ])
+            self.assertEqual(coalescer.pending, 0)
+
+        run(main())
+
+    def test_get_fuzzy_scores(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_list = RapidFuzzList(data_tuple, normalizer=normalizer, score_cutoff=90)
+        values = [ 'Ustralia', 'Gondor', 'Austraia', ]
+
+        async def main():
+            coalescer = QueryCoalescer(rapidfuzz_list, max_delay=10)
+            tasks = gather(*( coalescer.get_fuzzy_scores(value) for value in values ))
+            await sleep(0)
+            self.assertEqual(coalescer.pending, 3)
+            coalescer.flush()
+            results = await tasks
+            self.assertListEqual(results, [ rapidfuzz_list.get_fuzzy_scores(value) for value in values ])
+
+        run(main())
+
+    def test_errors(self):
+        rapidfuzz_dict = RapidFuzzDict(data_dict, normalizer=Normalizer())
+
+        async def main():
+            coalescer = QueryCoalescer(rapidfuzz_dict, max_delay=0.01)
+            # an invalid query fails only its caller
+            results = await gather(
+                coalescer.fuzzy_get('Ustralia'),
+                coalescer.fuzzy_get(1),
+                coalescer.fuzzy_get('Austria'),
+                return_exceptions=True
+            )
+            self.assertEqual(results[0], rapidfuzz_dict.fuzzy_get('Ustralia'))
+            self.assertIsInstance(results[1], ValueError)
+            self.assertEqual(results[2], rapidfuzz_dict.fuzzy_get('Austria'))
+
+        run(main())
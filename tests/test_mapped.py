@@ -0,0 +1,130 @@
+from pathlib import Path
+from pickle import (
+    dumps as pickle_dumps,
+    loads as pickle_loads
+)
+from rapidfuzz import fuzz
+from rapidfuzz.distance import Levenshtein
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from rapidfuzz_collections import (
+    MappedCollection,
+    Normalizer,
+    RapidFuzzDict,
+    RapidFuzzFrozenSet,
+    RapidFuzzList,
+    ScorerType,
+    Strategy
+)
+
+from data import (
+    data_dict,
+    data_tuple
+)
+
+
+class TestMappedCollection(TestCase):
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'collection.map'
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_dict(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_dict = RapidFuzzDict(data_dict, normalizer=normalizer, score_cutoff=90)
+        MappedCollection.export(rapidfuzz_dict, self.path)
+
+        with MappedCollection(self.path, normalizer=normalizer, score_cutoff=90) as mapped:
+            self.assertEqual(len(mapped), len(rapidfuzz_dict))
+            self.assertIn('Australia', mapped)
+            self.assertNotIn('australia', mapped)
+            self.assertNotIn([ 'Australia', ], mapped)
+
+            self.assertEqual(mapped.fuzzy_get('Australia'), ( 'Australia', 'AUS', ))
+            self.assertEqual(mapped.fuzzy_get('Ustralia'), ( 'Australia', 'AUS', ))
+            self.assertIsNone(mapped.fuzzy_get('Gondor'))
+            self.assertTrue(mapped.fuzzy_contains('Ustralia'))
+            self.assertFalse(mapped.fuzzy_contains('Gondor'))
+            self.assertListEqual(mapped.get_fuzzy_scores('Austraia'), rapidfuzz_dict.get_fuzzy_scores('Austraia', unscored=False))  # noqa: E501
+            # equal scores are ordered by choices of the file
+            self.assertListEqual([ score for value, score, key in mapped.fuzzy_top_k('Gondor', 3, score_cutoff=60) ], [ score for value, score, key in rapidfuzz_dict.fuzzy_top_k('Gondor', 3, score_cutoff=60) ])  # noqa: E501
+
+            for strategy in ( Strategy.FIRST_FROM_BEST, Strategy.BEST_ONLY_ONE, ):
+                for value in ( 'Ustralia', 'Gondor', 'Austria', 'Republic of Korea', ):
+                    self.assertEqual(mapped.fuzzy_get(value, strategy=strategy, score_cutoff=80), rapidfuzz_dict.fuzzy_get(value, strategy=strategy, score_cutoff=80))  # noqa: E501
+
+    def test_frozenset(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_frozenset = RapidFuzzFrozenSet(
+            data_tuple,
+            normalizer=normalizer,
+            scorer=Levenshtein.distance,
+            scorer_type=ScorerType.DISTANCE,
+            score_cutoff=2
+        )
+        MappedCollection.export(rapidfuzz_frozenset, self.path)
+
+        mapped = MappedCollection(
+            self.path,
+            normalizer=normalizer,
+            scorer=Levenshtein.distance,
+            scorer_type=ScorerType.DISTANCE,
+            score_cutoff=2
+        )
+        self.assertEqual(len(mapped), len(rapidfuzz_frozenset))
+        self.assertEqual(mapped.fuzzy_get('Austalia'), 'Australia')
+        self.assertTrue(mapped.fuzzy_contains('Austrlia'))
+        self.assertFalse(mapped.fuzzy_contains('Gondor'))
+        self.assertSetEqual(set(mapped.get_fuzzy_scores('Austria')), set(rapidfuzz_frozenset.get_fuzzy_scores('Austria', unscored=False)))  # noqa: E501
+        mapped.close()
+
+    def test_pickle(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_dict = RapidFuzzDict(
+            data_dict,
+            normalizer=normalizer,
+            scorer=Levenshtein.distance,
+            scorer_type=ScorerType.DISTANCE,
+            score_cutoff=2
+        )
+        MappedCollection.export(rapidfuzz_dict, self.path)
+
+        with MappedCollection(
+            self.path,
+            normalizer=normalizer,
+            scorer=Levenshtein.distance,
+            scorer_type=ScorerType.DISTANCE,
+            score_cutoff=2
+        ) as mapped:
+            # the file is mapped again
+            with pickle_loads(pickle_dumps(mapped)) as loaded:
+                self.assertLess(len(pickle_dumps(mapped)), self.path.stat().st_size)
+                self.assertEqual(len(loaded), len(mapped))
+                self.assertIs(loaded.default_scorer, Levenshtein.distance)
+                self.assertEqual(loaded.default_score_cutoff, 2)
+                self.assertEqual(loaded.fuzzy_get('Ustralia'), mapped.fuzzy_get('Ustralia'))
+
+    def test_errors(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_dict = RapidFuzzDict(data_dict, normalizer=normalizer)
+        MappedCollection.export(rapidfuzz_dict, self.path)
+
+        # the normalizer and the scorer must be the same
+        with self.assertRaises(ValueError):
+            MappedCollection(self.path, normalizer=Normalizer().isinstance_str().strip().min_length(3))
+        with self.assertRaises(ValueError):
+            MappedCollection(self.path, normalizer=normalizer, scorer=fuzz.ratio)
+
+        with self.assertRaises(TypeError):
+            MappedCollection.export(RapidFuzzList(data_tuple), self.path)
+
+        with self.assertRaises(ValueError):
+            MappedCollection.export(RapidFuzzFrozenSet([ 'test\x00', ], normalizer=Normalizer()), self.path)
+
+        self.path.write_bytes(b'test')
+        with self.assertRaises(ValueError):
+            MappedCollection(self.path, normalizer=normalizer)
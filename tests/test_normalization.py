@@ -1,9 +1,27 @@
 
+import json
+import re
+
+from functools import partial
+from os import environ
+from pathlib import Path
+from pickle import (
+    dumps as pickle_dumps,
+    loads as pickle_loads
+)
+from subprocess import run
+from sys import executable
 from unittest import TestCase
 
+import rapidfuzz_collections
+
 from rapidfuzz_collections import Normalizer
 
 
+def casefold(v, args, kwargs):
+    return v.casefold() if isinstance(v, str) else None
+
+
 class TestNormalization(TestCase):
 
     def test_default(self):
@@ -52,5 +70,187 @@ class TestNormalization(TestCase):
         ):
             self.assertEqual(normalizer(source), target)
 
+    def test_compile(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().replace('-', ' ').replace('_', ' ').min_length(3)
+        compiled = normalizer.compile()
+        self.assertIs(normalizer.compile(), compiled)
+
+        for source, target in (
+            ( None, None, ),
+            ( 123, None, ),
+            ( [ 'test', ], None, ),
+            ( ' a_', None, ),
+            ( '  teSt-1_2 ', 'test 1 2', ),
+        ):
+            self.assertEqual(compiled(source), target)
+            self.assertEqual(normalizer(source), target)
+
+        # adding of operation resets compiled function
+        normalizer.upper()
+        self.assertIsNot(normalizer.compile(), compiled)
+        self.assertEqual(normalizer('  teSt-1_2 '), 'TEST 1 2')
+
+        # operations after rejected value receive `None`
+        normalizer = Normalizer().min_length(3).custom(lambda v, args, kwargs: 'short' if v is None else v).upper()
+        self.assertEqual(normalizer('ab'), 'SHORT')
+        self.assertEqual(normalizer('abc'), 'ABC')
+
+        # result type is checked after custom operation
+        normalizer = Normalizer().custom(lambda v, args, kwargs: 1)
+        with self.assertRaises(ValueError):
+            normalizer('test')
+
+    def test_fingerprint(self):
+        normalizer = Normalizer().strip().re_sub(r'\s+', ' ').min_length(3)
+        self.assertEqual(normalizer.fingerprint(), Normalizer().strip().re_sub(r'\s+', ' ').min_length(3).fingerprint())
+        self.assertNotEqual(normalizer.fingerprint(), Normalizer().strip().re_sub(r'\s+', '').min_length(3).fingerprint())
+        self.assertNotEqual(normalizer.fingerprint(), Normalizer().strip().re_sub(r'\s+', ' ', flags=re.I).min_length(3).fingerprint())  # noqa: E501
+        self.assertNotEqual(normalizer.fingerprint(), Normalizer().re_sub(r'\s+', ' ').strip().min_length(3).fingerprint())
+        self.assertNotEqual(Normalizer().custom(str.lower).fingerprint(), Normalizer().custom(str.upper).fingerprint())
+
+        # lambdas and closures of the same name are different by their code, defaults and closure variables
+        def custom(factor):
+            return lambda v, args, kwargs: v * factor
+
+        lower, upper = lambda v, args, kwargs: v.lower(), lambda v, args, kwargs: v.upper()
+        self.assertNotEqual(Normalizer().custom(lower).fingerprint(), Normalizer().custom(upper).fingerprint())
+        self.assertNotEqual(Normalizer().custom(custom(2)).fingerprint(), Normalizer().custom(custom(3)).fingerprint())
+        self.assertEqual(Normalizer().custom(custom(2)).fingerprint(), Normalizer().custom(custom(2)).fingerprint())
+
+        # partial functions are represented by their functions and arguments
+        self.assertEqual(
+            Normalizer().custom(partial(casefold, kwargs=None)).fingerprint(),
+            Normalizer().custom(partial(casefold, kwargs=None)).fingerprint()
+        )
+        self.assertNotEqual(
+            Normalizer().custom(partial(casefold, kwargs=None)).fingerprint(),
+            Normalizer().custom(partial(casefold, kwargs={})).fingerprint()
+        )
+
+        # objects with `repr` by the address in memory can not be fingerprinted
+        with self.assertRaises(TypeError):
+            Normalizer().custom(casefold, object()).fingerprint()
+
+        # fingerprints are the same in other processes (with other hash seeds)
+        code = '\n'.join([
+            'from functools import partial',
+            'from rapidfuzz_collections import Normalizer',
+            'def scale(v, args, kwargs, factor=1):',
+            '    return v * factor',
+            'normalizer = Normalizer().custom(partial(scale, factor=2), frozenset({ "a", "b", "c", }))',
+            'print(normalizer.custom(lambda v, args, kwargs: v, { "x": 1, "y": 2, }).re_sub("a+", "b").fingerprint())',
+        ])
+        path = str(Path(rapidfuzz_collections.__file__).parents[1])
+        fingerprints = {
+            run(
+                [ executable, '-c', code, ],
+                env={ **environ, 'PYTHONHASHSEED': seed, 'PYTHONPATH': path, },
+                capture_output=True,
+                check=True,
+                text=True
+            ).stdout
+            for seed in ( '1', '2', '3', )
+        }
+        self.assertEqual(len(fingerprints), 1)
+        self.assertEqual(len(fingerprints.pop().strip()), 64)
+        self.assertEqual(len(Normalizer().fingerprint()), 64)
+
+    def test_pickle(self):
+        normalizer = Normalizer().isinstance_str().strip().re_sub(r'\s+', ' ', flags=re.I).custom(casefold).min_length(3)
+        loaded = pickle_loads(pickle_dumps(normalizer))
+        self.assertEqual(loaded.fingerprint(), normalizer.fingerprint())
+        for value in ( 'ab', '  Test   Value ', ):
+            self.assertEqual(loaded(value), normalizer(value))
+
+        # functions of custom operations must be picklable
+        with self.assertRaises(Exception):
+            pickle_dumps(Normalizer().custom(lambda v, args, kwargs: v))
+
+    def test_spec(self):
+        normalizer = (
+            Normalizer()
+            .isinstance_str()
+            .strip(' .')
+            .re_sub(r'\s+', ' ', flags=re.IGNORECASE)
+            .endswith(( 'a', 'b', ))
+            .replace('x', 'y', 1)
+            .re_fullmatch(re.compile(r'[a-z ]+', re.IGNORECASE))
+            .min_length(3)
+        )
+        spec = normalizer.to_spec()
+        self.assertEqual(spec['operations'][2], { 'name': 're_sub', 'args': [ r'\s+', ' ', 0, int(re.IGNORECASE), ], })
+        self.assertEqual(spec['operations'][3], { 'name': 'endswith', 'args': [ [ 'a', 'b', ], ], })
+
+        loaded = Normalizer.from_spec(json.loads(json.dumps(spec)))
+        self.assertEqual(loaded.to_spec(), spec)
+        self.assertEqual(loaded.fingerprint(), normalizer.fingerprint())
+        self.assertTupleEqual(loaded.operations, normalizer.operations)
+        for value in ( None, 'ab', ' xA   Ba. ', ' x  b1', ):
+            self.assertEqual(loaded(value), normalizer(value))
+
+        with self.assertRaises(ValueError):
+            Normalizer().custom(casefold).to_spec()
+        with self.assertRaises(ValueError):
+            Normalizer().re_sub('a', lambda match: 'b').to_spec()
+
+        with self.assertRaises(TypeError):
+            Normalizer.from_spec([])
+        with self.assertRaises(ValueError):
+            Normalizer.from_spec({ 'version': 0, 'operations': [], })
+        with self.assertRaises(ValueError):
+            Normalizer.from_spec({ 'version': 1, 'operations': [ { 'name': 'compile', }, ], })
+        with self.assertRaises(ValueError):
+            Normalizer.from_spec({ 'version': 1, 'operations': [ { 'name': 'min_length', 'args': [ 0, ], }, ], })
+        with self.assertRaises(TypeError):
+            Normalizer.from_spec({ 'version': 1, 'operations': [ { 'name': 'strip', 'args': [ 1, ], }, ], })
+
     def test_endswith(self):
         pass
+
+    def test_re_fullmatch(self):
+        normalizer = Normalizer().re_fullmatch(r'[a-z]+\d', flags=re.IGNORECASE)
+        for source, target in (
+            ( None, None, ),
+            ( 123, None, ),
+            ( [ 'test1', ], None, ),
+            ( 'teSt1', 'teSt1', ),
+            ( ' test1', None, ),
+            ( 'test', None, ),
+        ):
+            self.assertEqual(normalizer(source), target)
+
+        with self.assertRaises(TypeError):
+            Normalizer().re_fullmatch(1)
+
+        with self.assertRaises(ValueError):
+            Normalizer().re_fullmatch(re.compile('test'), flags=re.IGNORECASE)
+
+    def test_re_search(self):
+        normalizer = Normalizer().re_search(re.compile(r'\d'))
+        for source, target in (
+            ( None, None, ),
+            ( 123, None, ),
+            ( [ 'test1', ], None, ),
+            ( ' test1 ', ' test1 ', ),
+            ( 'test', None, ),
+        ):
+            self.assertEqual(normalizer(source), target)
+
+    def test_re_sub(self):
+        normalizer = Normalizer().re_sub(r'\s+', ' ').re_sub('T', '_', count=1, flags=re.IGNORECASE)
+        for source, target in (
+            ( None, None, ),
+            ( 123, None, ),
+            ( [ 'test', ], None, ),
+            ( ' teSt1 \t 2  tesT3', ' _eSt1 2 tesT3', ),
+        ):
+            self.assertEqual(normalizer(source), target)
+
+        with self.assertRaises(TypeError):
+            Normalizer().re_sub('test', 1)
+
+        with self.assertRaises(TypeError):
+            Normalizer().re_sub('test', '', count=1.0)
+
+        with self.assertRaises(ValueError):
+            Normalizer().re_sub('test', '', count=-1)
@@ -1,14 +1,36 @@
 
 import operator
 
+from asyncio import run
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor
+)
 from copy import (
     copy,
     deepcopy
 )
-from rapidfuzz.distance import Levenshtein
+from itertools import chain
+from pathlib import Path
+from pickle import (
+    dumps as pickle_dumps,
+    loads as pickle_loads
+)
+from rapidfuzz import fuzz
+from rapidfuzz.distance import (
+    DamerauLevenshtein,
+    Indel,
+    Levenshtein,
+    OSA
+)
+from tempfile import TemporaryDirectory
 from unittest import TestCase
+from unittest.mock import patch
 
 from rapidfuzz_collections import (
+    ChoicesGroupView,
+    ChoicesView,
+    IndexType,
     Normalizer,
     ScorerType,
     Strategy,
@@ -79,7 +101,7 @@ class TestRapidFuzzDict(TestCase):
 
         del rapidfuzz_dict['test2']
         self.assertDictEqual(dict(rapidfuzz_dict), { 'test1': 1, 'test1  ': 11, })
-        self.assertDictEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, })
+        self.assertEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, })
 
     def test__eq__(self):
         rapidfuzz_dict = RapidFuzzDict({ 'test1': 1, 'test2': 2, })
@@ -99,12 +121,12 @@ class TestRapidFuzzDict(TestCase):
         rapidfuzz_dict = RapidFuzzDict({ 'test1': 1, 'test2': 2, 'test1  ': 4, })
         rapidfuzz_dict |= { 'test1': 10, 'test3': 3, }
         self.assertDictEqual(dict(rapidfuzz_dict), { 'test1': 10, 'test2': 2, 'test3': 3, 'test1  ': 4, })
-        self.assertDictEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', }, 'test3': { 'test3', }, })  # noqa: E501
 
         rapidfuzz_dict = RapidFuzzDict({ 'test1': 1, 'test2': 2, 'test1  ': 4, })
         rapidfuzz_dict |= RapidFuzzDict({ 'test1': 10, 'test3': 3, })
         self.assertDictEqual(dict(rapidfuzz_dict), { 'test1': 10, 'test2': 2, 'test1  ': 4, 'test3': 3, })
-        self.assertDictEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', }, 'test3': { 'test3', }, })  # noqa: E501
 
     def test__iter__(self):
         rapidfuzz_dict = RapidFuzzDict({ 'test1': 1, 'test2': 2, })
@@ -139,11 +161,11 @@ class TestRapidFuzzDict(TestCase):
 
         rapidfuzz_dict2 = rapidfuzz_dict1 | { 'test1': 10, 'test3': 3, }
         self.assertDictEqual(dict(rapidfuzz_dict2), { 'test1': 10, 'test2': 2, 'test1  ': 4, 'test3': 3, })
-        self.assertDictEqual(rapidfuzz_dict2.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_dict2.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', }, 'test3': { 'test3', }, })  # noqa: E501
 
         rapidfuzz_dict3 = rapidfuzz_dict1 | RapidFuzzDict({ 'test1': 10, 'test3': 3, })
         self.assertDictEqual(dict(rapidfuzz_dict3), { 'test1': 10, 'test2': 2, 'test1  ': 4, 'test3': 3, })
-        self.assertDictEqual(rapidfuzz_dict3.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_dict3.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', }, 'test3': { 'test3', }, })  # noqa: E501
 
     def test__repr__(self):
         rapidfuzz_dict = RapidFuzzDict({ 'test1': 1, 'test2': 2, })
@@ -170,23 +192,31 @@ class TestRapidFuzzDict(TestCase):
 
         rapidfuzz_dict2 = { 'test1': 10, 'test3': 3, } | rapidfuzz_dict1
         self.assertDictEqual(dict(rapidfuzz_dict2), { 'test1': 1, 'test2': 2, 'test3': 3, 'test1  ': 4, })
-        self.assertDictEqual(rapidfuzz_dict2.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_dict2.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', }, 'test3': { 'test3', }, })  # noqa: E501
 
     def test__setitem__(self):
         rapidfuzz_dict = RapidFuzzDict({ 'test1': 1, 'test2': 2, })
 
         rapidfuzz_dict['test3'] = 3
         self.assertDictEqual(dict(rapidfuzz_dict), { 'test1': 1, 'test2': 2, 'test3': 3, })
-        self.assertDictEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', }, 'test2': { 'test2', }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', }, 'test2': { 'test2', }, 'test3': { 'test3', }, })  # noqa: E501
 
         rapidfuzz_dict['test1'] = 10
         self.assertDictEqual(dict(rapidfuzz_dict), { 'test1': 10, 'test2': 2, 'test3': 3, })
-        self.assertDictEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', }, 'test2': { 'test2', }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', }, 'test2': { 'test2', }, 'test3': { 'test3', }, })  # noqa: E501
 
     def test_choices(self):
         rapidfuzz_dict = RapidFuzzDict({ 1: 1, 1.1: 1.1, 'test1': 'test1', 'test1  ': 'test11', ( 2, 'test2', ): ( 2, 'test2', ), None: None, })  # noqa: E501
 
-        self.assertDictEqual(rapidfuzz_dict.choices, { None: { None, 1, ( 2, 'test2', ), 1.1, }, 'test1': { 'test1', 'test1  ', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_dict.choices, { None: { None, 1, ( 2, 'test2', ), 1.1, }, 'test1': { 'test1', 'test1  ', }, })  # noqa: E501
+
+        # read-only view
+        self.assertIsInstance(rapidfuzz_dict.choices, ChoicesView)
+        self.assertIsInstance(rapidfuzz_dict.choices['test1'], ChoicesGroupView)
+        with self.assertRaises(TypeError):
+            rapidfuzz_dict.choices['test'] = { 'test', }
+        with self.assertRaises(AttributeError):
+            rapidfuzz_dict.choices[None].add('test')
 
     def test_clear(self):
         rapidfuzz_dict = RapidFuzzDict({ 'test1': 1, 'test2': 2, })
@@ -194,7 +224,7 @@ class TestRapidFuzzDict(TestCase):
         rapidfuzz_dict.clear()
 
         self.assertDictEqual(dict(rapidfuzz_dict), {})
-        self.assertDictEqual(rapidfuzz_dict.choices, {})
+        self.assertEqual(rapidfuzz_dict.choices, {})
 
     def test_copy(self):
         rapidfuzz_dict1 = RapidFuzzDict({ 'test1': [ 1, 2, ], })
@@ -257,14 +287,14 @@ class TestRapidFuzzDict(TestCase):
         item = rapidfuzz_dict.pop('test2')
         self.assertEqual(item, 2)
         self.assertDictEqual(dict(rapidfuzz_dict), { 'test1': 1,  'test1  ': 10, })
-        self.assertDictEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, })
+        self.assertEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, })
 
         self.assertRaises(KeyError, lambda: rapidfuzz_dict.pop('test3'))
 
         item = rapidfuzz_dict.pop('test3', 3)
         self.assertEqual(item, 3)
         self.assertDictEqual(dict(rapidfuzz_dict), { 'test1': 1,  'test1  ': 10, })
-        self.assertDictEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, })
+        self.assertEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, })
 
     def test_popitem(self):
         rapidfuzz_dict = RapidFuzzDict({ 'test1': 1, 'test1  ': 10, 'test2': 2, })
@@ -272,17 +302,17 @@ class TestRapidFuzzDict(TestCase):
         item = rapidfuzz_dict.popitem()
         self.assertTupleEqual(item, ( 'test2', 2, ))
         self.assertDictEqual(dict(rapidfuzz_dict), { 'test1': 1, 'test1  ': 10, })
-        self.assertDictEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, })
+        self.assertEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, })
 
         item = rapidfuzz_dict.popitem()
         self.assertTupleEqual(item, ( 'test1  ', 10, ))
         self.assertDictEqual(dict(rapidfuzz_dict), { 'test1': 1, })
-        self.assertDictEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', }, })
+        self.assertEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', }, })
 
         item = rapidfuzz_dict.popitem()
         self.assertTupleEqual(item, ( 'test1', 1, ))
         self.assertDictEqual(dict(rapidfuzz_dict), {})
-        self.assertDictEqual(rapidfuzz_dict.choices, {})
+        self.assertEqual(rapidfuzz_dict.choices, {})
 
         self.assertRaises(KeyError, lambda: rapidfuzz_dict.popitem())
 
@@ -292,19 +322,30 @@ class TestRapidFuzzDict(TestCase):
         item = rapidfuzz_dict.setdefault('test1', 2)
         self.assertEqual(item, 1)
         self.assertDictEqual(dict(rapidfuzz_dict), { 'test1': 1, 'test1  ': 10, 'test2': 2, })
-        self.assertDictEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', }, })
+        self.assertEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', }, })
 
         item = rapidfuzz_dict.setdefault('  test2 ', 20)
         self.assertEqual(item, 20)
         self.assertDictEqual(dict(rapidfuzz_dict), { 'test1': 1, 'test1  ': 10, 'test2': 2, '  test2 ': 20, })
-        self.assertDictEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', '  test2 ', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', '  test2 ', }, })  # noqa: E501
 
     def test_update(self):
         rapidfuzz_dict = RapidFuzzDict({ 'test1': 1, 'test1  ': 10, 'test2': 2, })
 
         rapidfuzz_dict.update({ 'test1  ': 100, '  test2 ': 20, })
         self.assertDictEqual(dict(rapidfuzz_dict), { 'test1': 1, 'test1  ': 100, 'test2': 2, '  test2 ': 20, })
-        self.assertDictEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', '  test2 ', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', '  test2 ', }, })  # noqa: E501
+
+    def test_update_normalizes_only_new_keys(self):
+        calls = []
+        normalizer = Normalizer().custom(lambda v, args, kwargs: calls.append(v) or v).strip()
+        rapidfuzz_dict = RapidFuzzDict({ 'test1': 1, 'test2': 2, }, normalizer=normalizer)
+
+        calls.clear()
+        rapidfuzz_dict.update({ 'test1': 10, ' test3': 3, })
+        rapidfuzz_dict |= { 'test2': 20, 'test4': 4, }
+        self.assertListEqual(calls, [ ' test3', 'test4', ])
+        self.assertEqual(rapidfuzz_dict.choices, { 'test1': { 'test1', }, 'test2': { 'test2', }, 'test3': { ' test3', }, 'test4': { 'test4', }, })  # noqa: E501
 
     def test_values(self):
         rapidfuzz_dict = RapidFuzzDict({ 'test1': 1, 'test2': 2, })
@@ -313,6 +354,427 @@ class TestRapidFuzzDict(TestCase):
         for source, target in zip(rapidfuzz_dict.values(), result_list):
             self.assertEqual(source, target)
 
+    def test_copy_without_normalization(self):
+        calls = []
+        normalizer = Normalizer().custom(lambda v, args, kwargs: calls.append(v) or v).strip()
+        rapidfuzz_dict = RapidFuzzDict({ 'test1': 1, ' test1': 2, 'test2': 3, }, normalizer=normalizer)
+
+        calls.clear()
+        results = [
+            copy(rapidfuzz_dict),
+            deepcopy(rapidfuzz_dict),
+            rapidfuzz_dict.copy(),
+            rapidfuzz_dict | rapidfuzz_dict,
+            rapidfuzz_dict | { 'test1': 4, },
+        ]
+        self.assertListEqual(calls, [])
+
+        for result in results:
+            self.assertEqual(result.choices, RapidFuzzDict(result._data, normalizer=normalizer).choices)
+
+    def test_query_cache(self):
+        calls = []
+        normalizer = Normalizer().custom(lambda v, args, kwargs: calls.append(v) or v).isinstance_str().strip()
+        rapidfuzz_dict = RapidFuzzDict({ 'test1': 1, 'test2': 2, }, normalizer=normalizer, query_cache_size=2)
+
+        calls.clear()
+        for _ in range(3):
+            self.assertTrue(rapidfuzz_dict.fuzzy_contains(' test1 '))
+            self.assertTrue(rapidfuzz_dict.fuzzy_contains(' test2 '))
+        self.assertListEqual(calls, [ ' test1 ', ' test2 ', ])
+        self.assertEqual(rapidfuzz_dict.query_cache_info().hits, 4)
+        self.assertEqual(rapidfuzz_dict.query_cache_info().misses, 2)
+
+        # eviction of the least recently used query
+        rapidfuzz_dict.fuzzy_contains(' test3 ')
+        rapidfuzz_dict.fuzzy_contains(' test1 ')
+        self.assertListEqual(calls, [ ' test1 ', ' test2 ', ' test3 ', ' test1 ', ])
+        self.assertEqual(rapidfuzz_dict.query_cache_info().currsize, 2)
+
+        rapidfuzz_dict.query_cache_clear()
+        self.assertEqual(rapidfuzz_dict.query_cache_info().currsize, 0)
+
+        rapidfuzz_dict.query_cache_size = None
+        self.assertIsNone(rapidfuzz_dict.query_cache_info())
+
+        with self.assertRaises(ValueError):
+            RapidFuzzDict(query_cache_size=0)
+
+        with self.assertRaises(TypeError):
+            RapidFuzzDict(query_cache_size=1.0)
+
+    def test_result_cache(self):
+        rapidfuzz_dict = RapidFuzzDict({ 'test1': 1, 'test2': 2, }, result_cache_size=2)
+
+        for _ in range(3):
+            self.assertEqual(rapidfuzz_dict.fuzzy_get('tst1'), ( 'test1', 1, ))
+            self.assertTrue(rapidfuzz_dict.fuzzy_contains('tst1'))
+        self.assertEqual(rapidfuzz_dict.result_cache_info(), ( 4, 2, 2, 2, ))
+
+        # other arguments of search are cached separately
+        self.assertIsNone(rapidfuzz_dict.fuzzy_get('tst1', score_cutoff=99))
+        self.assertEqual(rapidfuzz_dict.result_cache_info(), ( 4, 3, 2, 2, ))
+
+        # operations which do not change the collection keep the cache
+        self.assertEqual(rapidfuzz_dict.setdefault('test1', 3), 1)
+        rapidfuzz_dict.update()
+        rapidfuzz_dict |= {}
+        self.assertIsNone(rapidfuzz_dict.pop('test3', None))
+        with self.assertRaises(KeyError):
+            del rapidfuzz_dict['test3']
+        with self.assertRaises(TypeError):
+            rapidfuzz_dict |= [ ( 'test3', 3, ), ]
+        self.assertEqual(rapidfuzz_dict.result_cache_info().currsize, 2)
+
+        # any change of collection invalidates the cache
+        rapidfuzz_dict['test3'] = 3
+        self.assertEqual(rapidfuzz_dict.result_cache_info().currsize, 0)
+        self.assertEqual(rapidfuzz_dict.fuzzy_get('tst1'), ( 'test1', 1, ))
+        self.assertEqual(rapidfuzz_dict.result_cache_info(), ( 4, 4, 2, 1, ))
+
+        rapidfuzz_dict.result_cache_clear()
+        self.assertEqual(rapidfuzz_dict.result_cache_info(), ( 0, 0, 2, 0, ))
+
+        rapidfuzz_dict.result_cache_size = None
+        self.assertIsNone(rapidfuzz_dict.result_cache_info())
+
+        with self.assertRaises(ValueError):
+            RapidFuzzDict(result_cache_size=0)
+
+    def test_length_pruning(self):
+        rapidfuzz_dict = RapidFuzzDict(
+            { k: i for i, k in enumerate([ 'a', 'b', 'test', 'tests', 'longer test', 'the longest test', 'tast', ]) },
+            scorer=fuzz.ratio,
+            score_cutoff=80
+        )
+
+        # the length index is built on the first scan and selects only lengths 4-7
+        for _ in range(2):
+            self.assertEqual(rapidfuzz_dict.fuzzy_get('tast1'), ( 'tast', 6, ))
+        self.assertEqual(
+            rapidfuzz_dict._select_choices('tast1', fuzz.ratio, 80, None),
+            [ 'test', 'tests', 'tast', ]
+        )
+
+        # the index is kept in sync with changes
+        index = rapidfuzz_dict._length_index
+        rapidfuzz_dict['tast12'] = 7
+        for _ in range(2):
+            self.assertEqual(rapidfuzz_dict.fuzzy_get('tast1'), ( 'tast12', 7, ))
+        del rapidfuzz_dict['tests']
+        self.assertEqual(rapidfuzz_dict._select_choices('tast1', fuzz.ratio, 80, None), [ 'test', 'tast', 'tast12', ])
+        self.assertIs(rapidfuzz_dict._length_index, index)
+
+        # unknown length bound of the scorer or its arguments: all choices are scanned
+        self.assertEqual(len(rapidfuzz_dict._select_choices('tast1', fuzz.WRatio, 80, None)), len(rapidfuzz_dict._choices))  # noqa: E501
+        self.assertEqual(len(rapidfuzz_dict._select_choices('tast1', fuzz.ratio, 80, { 'processor': str.lower, })), len(rapidfuzz_dict._choices))  # noqa: E501
+
+        # too many choices can pass score_cutoff: all choices are scanned
+        self.assertEqual(len(rapidfuzz_dict._select_choices('tast1', fuzz.ratio, 10, None)), len(rapidfuzz_dict._choices))  # noqa: E501
+
+    def test_qgram_index(self):
+        rapidfuzz_dict = RapidFuzzDict(
+            dict.fromkeys([ 'international', 'national', 'rational', 'internationally', 'banana', 'interxatixnal', ], 1),  # noqa: E501
+            qgram_size=3,
+            scorer=Levenshtein.distance,
+            scorer_type=ScorerType.DISTANCE,
+            score_cutoff=2
+        )
+
+        # only choices with enough common trigrams with the query are scored
+        self.assertEqual(rapidfuzz_dict.fuzzy_get('internatonal'), ( 'international', 1, ))
+        self.assertEqual(list(rapidfuzz_dict._select_choices('internatonal', Levenshtein.distance, 2, None)), [ 'international', ])  # noqa: E501
+
+        # the index is kept in sync with changes of the collection
+        index = rapidfuzz_dict._qgram_index
+        rapidfuzz_dict['internationale'] = 2
+        del rapidfuzz_dict['international']
+        self.assertIs(rapidfuzz_dict._qgram_index, index)
+        self.assertEqual(list(rapidfuzz_dict._select_choices('internatonal', Levenshtein.distance, 2, None)), [ 'internationale', ])  # noqa: E501
+
+        # a choice within `score_cutoff` may have no common trigrams with the query: only lengths are filtered
+        self.assertEqual(list(rapidfuzz_dict._select_choices('natio', Levenshtein.distance, 2, None)), [ 'banana', ])
+
+        # scorers without the bound of the number of edits are not filtered
+        self.assertEqual(len(rapidfuzz_dict._select_choices('internatonal', fuzz.WRatio, 85, None)), len(rapidfuzz_dict._choices))  # noqa: E501
+
+        # lower strictness selects more choices
+        self.assertNotIn('interxatixnal', rapidfuzz_dict._select_choices('internatonal', Levenshtein.distance, 1, None))
+        rapidfuzz_dict.qgram_strictness = 0.5
+        self.assertIn('interxatixnal', rapidfuzz_dict._select_choices('internatonal', Levenshtein.distance, 1, None))
+
+        # matches are not lost by the count filtering
+        for scorer, score_cutoff, scorer_type, qgram_size, choice, query in (
+            ( fuzz.WRatio, 90, ScorerType.SIMILARITY, 3, 'new york', 'york new', ),
+            ( fuzz.ratio, 80, ScorerType.SIMILARITY, 3, 'abcdefghij', 'abXcdXefXghXij', ),
+            ( Indel.normalized_similarity, 0.8, ScorerType.SIMILARITY, 3, 'abcdefghij', 'abXcdXefXghXij', ),
+            ( DamerauLevenshtein.distance, 1, ScorerType.DISTANCE, 2, 'abcdefgh', 'acbdefgh', ),
+            ( OSA.distance, 1, ScorerType.DISTANCE, 2, 'abcdefgh', 'acbdefgh', ),
+        ):
+            rapidfuzz_dict = RapidFuzzDict(
+                dict.fromkeys([ choice, 'zzzzzzzzzz', ], 1),
+                normalizer=Normalizer().isinstance_str(),
+                scorer=scorer,
+                scorer_type=scorer_type,
+                score_cutoff=score_cutoff,
+                qgram_size=qgram_size
+            )
+            self.assertEqual(rapidfuzz_dict.fuzzy_get(query), ( choice, 1, ))
+
+        with self.assertRaises(ValueError):
+            RapidFuzzDict(qgram_size=0)
+        with self.assertRaises(ValueError):
+            RapidFuzzDict(qgram_size=3, qgram_strictness=0)
+
+    def test_bk_tree(self):
+        rapidfuzz_dict = RapidFuzzDict(
+            dict.fromkeys([ 'kitten', 'sitting', 'mitten', 'bitten', 'smitten', 'written', ], 1),
+            scorer=Levenshtein.distance,
+            scorer_type=ScorerType.DISTANCE,
+            score_cutoff=1,
+            index_type=IndexType.BK_TREE
+        )
+
+        # only choices within the distance are found by the tree
+        self.assertEqual(rapidfuzz_dict.fuzzy_get('kiten'), ( 'kitten', 1, ))
+        self.assertEqual(
+            rapidfuzz_dict._search_index('mitten', Levenshtein.distance, 1, None),
+            [ 'kitten', 'mitten', 'bitten', 'smitten', ]
+        )
+
+        # the tree is kept in sync with changes of the collection
+        tree = rapidfuzz_dict._index
+        rapidfuzz_dict['mittens'] = 2
+        del rapidfuzz_dict['kitten']
+        self.assertIs(rapidfuzz_dict._index, tree)
+        self.assertEqual(
+            rapidfuzz_dict._search_index('mitten', Levenshtein.distance, 1, None),
+            [ 'mitten', 'bitten', 'smitten', 'mittens', ]
+        )
+
+        # other scorers do not use the tree
+        self.assertIsNone(rapidfuzz_dict._search_index('mitten', fuzz.WRatio, 90, None))
+        self.assertIsNone(rapidfuzz_dict._search_index('mitten', Levenshtein.distance, 1, { 'weights': ( 1, 1, 2, ), }))
+
+        with self.assertRaises(TypeError):
+            RapidFuzzDict(index_type='bk-tree')
+
+    def test_symspell_index(self):
+        rapidfuzz_dict = RapidFuzzDict(
+            { 'kitten': 1, 'sitting': 2, 'mitten': 3, 'bitten': 4, 'smitten': 5, 'written': 6, },
+            scorer=Levenshtein.distance,
+            scorer_type=ScorerType.DISTANCE,
+            score_cutoff=1,
+            index_type=IndexType.SYMSPELL,
+            symspell_distance=1
+        )
+
+        # only choices within the distance are found by deletions
+        self.assertEqual(rapidfuzz_dict.fuzzy_get('kiten'), ( 'kitten', 1, ))
+        self.assertEqual(
+            set(rapidfuzz_dict._search_index('mitten', Levenshtein.distance, 1, None)),
+            { 'kitten', 'mitten', 'bitten', 'smitten', }
+        )
+        info = rapidfuzz_dict.index_info()
+        self.assertEqual(info.index_type, IndexType.SYMSPELL)
+        self.assertEqual(info.size, 6)
+        self.assertGreater(info.entries, 6)
+        self.assertGreater(info.memory, 0)
+        self.assertFalse(info.overflow)
+
+        # the index is kept in sync with changes of the collection
+        index = rapidfuzz_dict._index
+        rapidfuzz_dict['mittens'] = 7
+        del rapidfuzz_dict['kitten']
+        self.assertIs(rapidfuzz_dict._index, index)
+        self.assertEqual(
+            set(rapidfuzz_dict._search_index('mitten', Levenshtein.distance, 1, None)),
+            { 'mitten', 'bitten', 'smitten', 'mittens', }
+        )
+
+        # greater distances and other scorers do not use the index
+        self.assertIsNone(rapidfuzz_dict._search_index('mitten', Levenshtein.distance, 2, None))
+        self.assertIsNone(rapidfuzz_dict._search_index('mitten', fuzz.WRatio, 90, None))
+
+        # the index overflows the memory cap, so all choices are scanned
+        rapidfuzz_dict.symspell_max_entries = 10
+        self.assertEqual(rapidfuzz_dict.fuzzy_get('smiten'), ( 'smitten', 5, ))
+        self.assertIsNone(rapidfuzz_dict._search_index('mitten', Levenshtein.distance, 1, None))
+        self.assertTrue(rapidfuzz_dict.index_info().overflow)
+
+        with self.assertRaises(ValueError):
+            RapidFuzzDict(symspell_distance=-1)
+
+    def test_fuzzy_top_k(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_dict = RapidFuzzDict(data_dict, normalizer=normalizer, score_cutoff=90)
+
+        self.assertListEqual(rapidfuzz_dict.fuzzy_top_k('Austraia', 5), [ ( 'AUS', 94.11764705882352, 'Australia', ), ( 'AUT', 93.33333333333333, 'Austria', ), ])  # noqa: E501
+        self.assertListEqual(rapidfuzz_dict.fuzzy_top_k('Gondor', 2, score_cutoff=60), [ ( 'AND', 61.53846153846154, 'Andorra', ), ( 'MKD', 60.00000000000001, 'Republic of North Macedonia', ), ])  # noqa: E501
+        self.assertEqual(len(rapidfuzz_dict.fuzzy_top_k('Gondor', 3, score_cutoff=60)), 3)
+        self.assertEqual(len(rapidfuzz_dict.fuzzy_top_k('Gondor', 100, score_cutoff=60)), 6)
+        self.assertListEqual(rapidfuzz_dict.fuzzy_top_k('Gondor', 5), [])
+
+        with self.assertRaises(ValueError):
+            rapidfuzz_dict.fuzzy_top_k('Gondor', 0)
+
+        with self.assertRaises(TypeError):
+            rapidfuzz_dict.fuzzy_top_k('Gondor', '1')
+
+    def test_workers(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_dict = RapidFuzzDict(data_dict, normalizer=normalizer, score_cutoff=60, workers=2)
+        self.assertEqual(rapidfuzz_dict.default_workers, 2)
+
+        values = [ 'Ustralia', 'Gondor', 'Austria', ]
+
+        # chunks of choices are scored in parallel threads with the same results
+        with patch('rapidfuzz_collections.base.PARALLEL_MIN_CHOICES', 1):
+            for value in values:
+                for strategy in Strategy:
+                    self.assertEqual(rapidfuzz_dict.fuzzy_get(value, strategy=strategy), rapidfuzz_dict.fuzzy_get(value, strategy=strategy, workers=1))  # noqa: E501
+                self.assertListEqual(rapidfuzz_dict.get_fuzzy_scores(value), rapidfuzz_dict.get_fuzzy_scores(value, workers=1))  # noqa: E501
+            self.assertListEqual(rapidfuzz_dict.fuzzy_get_many(values), rapidfuzz_dict.fuzzy_get_many(values, workers=1))
+
+        with self.assertRaises(ValueError):
+            rapidfuzz_dict.default_workers = 0
+
+        with self.assertRaises(TypeError):
+            RapidFuzzDict(workers='2')
+
+    def test_async(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_dict = RapidFuzzDict(data_dict, normalizer=normalizer, score_cutoff=90)
+
+        async def main():
+            self.assertTrue(await rapidfuzz_dict.afuzzy_contains('Ustralia'))
+            self.assertFalse(await rapidfuzz_dict.afuzzy_contains('Gondor'))
+            self.assertEqual(await rapidfuzz_dict.afuzzy_get('Ustralia'), rapidfuzz_dict.fuzzy_get('Ustralia'))
+            self.assertListEqual(await rapidfuzz_dict.afuzzy_top_k('Austraia', 2), rapidfuzz_dict.fuzzy_top_k('Austraia', 2))
+            self.assertListEqual(await rapidfuzz_dict.aget_fuzzy_scores('Austraia'), rapidfuzz_dict.get_fuzzy_scores('Austraia'))
+            self.assertListEqual(await rapidfuzz_dict.afuzzy_get_many([ 'Ustralia', 'Gondor', ]), rapidfuzz_dict.fuzzy_get_many([ 'Ustralia', 'Gondor', ]))  # noqa: E501
+            self.assertListEqual(await rapidfuzz_dict.aget_fuzzy_scores_many([ 'Austraia', ]), rapidfuzz_dict.get_fuzzy_scores_many([ 'Austraia', ]))  # noqa: E501
+
+            # results are yielded by chunks
+            chunks = [ chunk async for chunk in rapidfuzz_dict.aget_fuzzy_score_iter('Austraia', chunk_size=100) ]
+            self.assertTrue(all(0 < len(chunk) <= 100 for chunk in chunks))
+            self.assertListEqual(list(chain.from_iterable(chunks)), list(rapidfuzz_dict.get_fuzzy_score_iter('Austraia')))
+
+            # iteration can be stopped before the end
+            iterator = rapidfuzz_dict.aget_fuzzy_score_iter('Austraia', chunk_size=1)
+            self.assertEqual(len(await anext(iterator)), 1)
+            await iterator.aclose()
+
+            with ThreadPoolExecutor(2) as executor:
+                self.assertEqual(await rapidfuzz_dict.afuzzy_get('Ustralia', executor=executor), rapidfuzz_dict.fuzzy_get('Ustralia'))
+                rapidfuzz_dict.default_executor = executor
+                self.assertIs(rapidfuzz_dict.default_executor, executor)
+                self.assertEqual(await rapidfuzz_dict.afuzzy_get('Ustralia'), rapidfuzz_dict.fuzzy_get('Ustralia'))
+                rapidfuzz_dict.default_executor = None
+
+            with self.assertRaises(TypeError):
+                await rapidfuzz_dict.afuzzy_get('Ustralia', executor=2)
+
+            with self.assertRaises(ValueError):
+                await anext(rapidfuzz_dict.aget_fuzzy_score_iter('Austraia', chunk_size=0))
+
+        run(main())
+
+        with self.assertRaises(TypeError):
+            RapidFuzzDict(executor=2)
+
+    def test_save_load(self):
+        calls = []
+
+        def normalize(value, *args, **kwargs):
+            calls.append(value)
+            return value
+
+        normalizer = Normalizer().custom(normalize).isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_dict = RapidFuzzDict(data_dict, normalizer=normalizer, score_cutoff=90)
+
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'collection.rfc'
+            rapidfuzz_dict.save(path)
+
+            calls.clear()
+            loaded = RapidFuzzDict.load(path, normalizer=normalizer, score_cutoff=90)
+            self.assertListEqual(calls, [])
+            self.assertEqual(loaded, rapidfuzz_dict)
+            self.assertEqual(loaded.default_score_cutoff, 90)
+            self.assertEqual(loaded.fuzzy_get('Ustralia'), rapidfuzz_dict.fuzzy_get('Ustralia'))
+            self.assertListEqual(loaded.get_fuzzy_scores('Austraia'), rapidfuzz_dict.get_fuzzy_scores('Austraia'))
+
+            # the normalizer and the scorer must be the same
+            with self.assertRaises(ValueError):
+                RapidFuzzDict.load(path, normalizer=Normalizer().custom(normalize).isinstance_str().strip().min_length(3))
+            with self.assertRaises(ValueError):
+                RapidFuzzDict.load(path, normalizer=normalizer, scorer=fuzz.ratio)
+
+            path.write_bytes(b'test')
+            with self.assertRaises(ValueError):
+                RapidFuzzDict.load(path, normalizer=normalizer)
+
+        # different lambdas of scorers have different fingerprints
+        scorers = [ lambda s1, s2, **kwargs: fuzz.ratio(s1, s2), lambda s1, s2, **kwargs: fuzz.partial_ratio(s1, s2), ]
+        self.assertNotEqual(RapidFuzzDict(scorer=scorers[0]).fingerprint(), RapidFuzzDict(scorer=scorers[1]).fingerprint())  # noqa: E501
+
+    def test_pickle(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().re_sub(r'\s+', ' ').min_length(3)
+        rapidfuzz_dict = RapidFuzzDict(data_dict, normalizer=normalizer, score_cutoff=90, workers=2)
+
+        # the normalizer is not called by unpickling
+        with patch.object(Normalizer, 'compile', side_effect=AssertionError):
+            loaded = pickle_loads(pickle_dumps(rapidfuzz_dict))
+        self.assertEqual(loaded, rapidfuzz_dict)
+        self.assertEqual(loaded.normalizer.fingerprint(), normalizer.fingerprint())
+        self.assertEqual(loaded.default_score_cutoff, 90)
+        self.assertEqual(loaded.default_workers, 2)
+        self.assertEqual(loaded.fuzzy_get('Ustralia'), rapidfuzz_dict.fuzzy_get('Ustralia'))
+        self.assertListEqual(loaded.get_fuzzy_scores('Austraia'), rapidfuzz_dict.get_fuzzy_scores('Austraia'))
+
+        # scorers of `rapidfuzz.distance` are pickled by names
+        rapidfuzz_dict = RapidFuzzDict(data_dict, scorer=Levenshtein.distance, scorer_type=ScorerType.DISTANCE, score_cutoff=2)
+        loaded = pickle_loads(pickle_dumps(rapidfuzz_dict))
+        self.assertIs(loaded.default_scorer, Levenshtein.distance)
+        self.assertEqual(loaded.fuzzy_get('Ustralia'), rapidfuzz_dict.fuzzy_get('Ustralia'))
+
+        with ProcessPoolExecutor(1) as executor:
+            result = executor.submit(operator.methodcaller('fuzzy_get', 'Ustralia'), rapidfuzz_dict).result()
+        self.assertEqual(result, rapidfuzz_dict.fuzzy_get('Ustralia'))
+
+    def test_bulk_normalization(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().re_sub(r'\s+', ' ').min_length(3)
+        expected = RapidFuzzDict(data_dict, normalizer=normalizer)
+        size = len(expected)
+
+        progress = []
+        with (
+            patch('rapidfuzz_collections.base.PARALLEL_NORMALIZE_MIN_VALUES', 1),
+            patch('rapidfuzz_collections.base.NORMALIZE_CHUNK_SIZE', 16)
+        ):
+            # chunks of values are normalized in processes with the same groups of choices
+            rapidfuzz_dict = RapidFuzzDict(data_dict, normalizer=normalizer, workers=2, progress=lambda done, total: progress.append(( done, total, )))  # noqa: E501
+            self.assertListEqual(list(rapidfuzz_dict._choices.items()), list(expected._choices.items()))
+            self.assertEqual(progress[0], ( 16, size, ))
+            self.assertEqual(progress[-1], ( size, size, ))
+
+            # threads on free-threaded builds
+            with patch('rapidfuzz_collections.base._is_gil_enabled', return_value=False):
+                rapidfuzz_dict.normalizer = Normalizer().isinstance_str().strip().min_length(3)
+                expected.normalizer = Normalizer().isinstance_str().strip().min_length(3)
+                self.assertListEqual(list(rapidfuzz_dict._choices.items()), list(expected._choices.items()))
+
+            # a normalizer which can not be pickled is called in this thread
+            progress.clear()
+            rapidfuzz_dict.normalizer = Normalizer().custom(lambda v, args, kwargs: v).isinstance_str().min_length(3)
+            expected.normalizer = Normalizer().isinstance_str().min_length(3)
+            self.assertListEqual(list(rapidfuzz_dict._choices.items()), list(expected._choices.items()))
+            self.assertEqual(progress[-1], ( size, size, ))
+
+        with self.assertRaises(TypeError):
+            RapidFuzzDict(progress=1)
+
     def test_fuzzy_contains(self):
         normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
         rapidfuzz_dict = RapidFuzzDict(data_dict, normalizer=normalizer, score_cutoff=90)
@@ -358,6 +820,23 @@ class TestRapidFuzzDict(TestCase):
         self.assertIsNone(rapidfuzz_dict.fuzzy_get('Gondor', strategy=Strategy.BEST_ONLY_ONE, score_cutoff=60))
         self.assertTupleEqual(rapidfuzz_dict.fuzzy_get('Gondor', strategy=Strategy.FIRST, score_cutoff=60), ( 'Andorra', 'AND', ))  # noqa: E501
 
+    def test_fuzzy_get_many(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_dict = RapidFuzzDict(data_dict, normalizer=normalizer, score_cutoff=90)
+
+        values = [ 'Australia', '   aUstraLia  ', 'Austraia', 'Ustralia', 'Austria', 'Gondor', 'Ustralia', None, ]
+
+        self.assertListEqual(rapidfuzz_dict.fuzzy_get_many([ 'Ustralia', 'Gondor', ]), [ ( 'Australia', 'AUS', ), None, ])
+        self.assertListEqual(rapidfuzz_dict.fuzzy_get_many([]), [])
+
+        for strategy in Strategy:
+            self.assertListEqual(rapidfuzz_dict.fuzzy_get_many(values, strategy=strategy), [ rapidfuzz_dict.fuzzy_get(i, strategy=strategy) for i in values ])  # noqa: E501
+            self.assertListEqual(rapidfuzz_dict.fuzzy_get_many(values, strategy=strategy, score_cutoff=60, workers=-1), [ rapidfuzz_dict.fuzzy_get(i, strategy=strategy, score_cutoff=60) for i in values ])  # noqa: E501
+            self.assertListEqual(rapidfuzz_dict.fuzzy_get_many(values, strategy=strategy, scorer=Levenshtein.distance, scorer_type=ScorerType.DISTANCE, score_cutoff=4), [ rapidfuzz_dict.fuzzy_get(i, strategy=strategy, scorer=Levenshtein.distance, scorer_type=ScorerType.DISTANCE, score_cutoff=4) for i in values ])  # noqa: E501
+
+        self.assertRaises(ValueError, lambda: rapidfuzz_dict.fuzzy_get_many(values, workers=0))
+        self.assertRaises(TypeError, lambda: rapidfuzz_dict.fuzzy_get_many(values, workers=1.0))
+
     def test_get_fuzzy_scores(self):
         normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
         rapidfuzz_dict = RapidFuzzDict(data_dict, normalizer=normalizer, score_cutoff=90)
@@ -372,6 +851,18 @@ class TestRapidFuzzDict(TestCase):
         self.assertListEqual(list(filter(_check, rapidfuzz_dict.get_fuzzy_scores('Austria'))), [ ( 'AUT', 100.0, 'Austria', ), ])  # noqa: E501
         self.assertListEqual(list(filter(_check, rapidfuzz_dict.get_fuzzy_scores('Gondor'))), [])
         self.assertListEqual(list(filter(_check, rapidfuzz_dict.get_fuzzy_scores('Gondor', score_cutoff=60))), [ ( 'AND', 61.53846153846154, 'Andorra', ), ( 'MKD', 60.00000000000001, 'Republic of North Macedonia', ), ( 'MNP', 60.00000000000001, 'Northern Mariana Islands', ), ( 'NFK', 60.00000000000001, 'Norfolk Island', ), ( 'SLV', 60.00000000000001, 'El Salvador', ), ( 'TGO', 60.00000000000001, 'Togo', ), ])  # noqa: E501
+        self.assertListEqual(rapidfuzz_dict.get_fuzzy_scores('Austraia', unscored=False), [ ( 'AUS', 94.11764705882352, 'Australia', ), ( 'AUT', 93.33333333333333, 'Austria', ), ])  # noqa: E501
+
+    def test_get_fuzzy_scores_many(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_dict = RapidFuzzDict(data_dict, normalizer=normalizer, score_cutoff=90)
+
+        values = [ 'Australia', '   aUstraLia  ', 'Austraia', 'Gondor', 'Austraia', None, ]
+
+        self.assertListEqual(rapidfuzz_dict.get_fuzzy_scores_many(values), [ rapidfuzz_dict.get_fuzzy_scores(i) for i in values ])  # noqa: E501
+        self.assertListEqual(rapidfuzz_dict.get_fuzzy_scores_many(values, score_cutoff=60, workers=2), [ rapidfuzz_dict.get_fuzzy_scores(i, score_cutoff=60) for i in values ])  # noqa: E501
+        self.assertListEqual(rapidfuzz_dict.get_fuzzy_scores_many(values, scorer=Levenshtein.distance, scorer_type=ScorerType.DISTANCE, score_cutoff=4), [ rapidfuzz_dict.get_fuzzy_scores(i, scorer=Levenshtein.distance, score_cutoff=4) for i in values ])  # noqa: E501
+        self.assertListEqual(rapidfuzz_dict.get_fuzzy_scores_many([]), [])
 
     def test_get_fuzzy_score_iter(self):
         normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
@@ -1,11 +1,30 @@
 
 import operator
 
+from asyncio import run
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
-from rapidfuzz.distance import Levenshtein
+from itertools import chain
+from pathlib import Path
+from pickle import (
+    dumps as pickle_dumps,
+    loads as pickle_loads
+)
+from rapidfuzz import fuzz
+from rapidfuzz.distance import (
+    DamerauLevenshtein,
+    Indel,
+    Levenshtein,
+    OSA
+)
+from tempfile import TemporaryDirectory
 from unittest import TestCase
+from unittest.mock import patch
 
 from rapidfuzz_collections import (
+    ChoicesGroupView,
+    ChoicesView,
+    IndexType,
     Normalizer,
     ScorerType,
     Strategy,
@@ -90,84 +109,84 @@ class TestRapidFuzzSet(TestCase):
 
         rapidfuzz_set &= { 'test1', }
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', }, })
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', }, })
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set &= RapidFuzzSet({ 'test1', })
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', }, })
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', }, })
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', })
         rapidfuzz_set &= { 'test3', }
         self.assertSetEqual(set(rapidfuzz_set), set())
-        self.assertDictEqual(rapidfuzz_set.choices, {})
+        self.assertEqual(rapidfuzz_set.choices, {})
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', })
         rapidfuzz_set &= frozenset({ 'test3', })
         self.assertSetEqual(set(rapidfuzz_set), set())
-        self.assertDictEqual(rapidfuzz_set.choices, {})
+        self.assertEqual(rapidfuzz_set.choices, {})
 
     def test__ior__(self):
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set |= { 'test1', }
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 'test2', 1, '  test1  ', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set |= frozenset({ 'test1', })
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 'test2', 1, '  test1  ', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set |= RapidFuzzSet({ 'test1', })
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 'test2', 1, '  test1  ', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set |= { 'test3', }
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 'test2', 1, '  test1  ', 'test3', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, 'test3': { 'test3', }, })  # noqa: E501
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set |= frozenset({ 'test3', })
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 'test2', 1, '  test1  ', 'test3', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, 'test3': { 'test3', }, })  # noqa: E501
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set |= RapidFuzzSet({ 'test3', })
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 'test2', 1, '  test1  ', 'test3', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, 'test3': { 'test3', }, })  # noqa: E501
 
     def test__isub__(self):
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set -= { 'test1', }
         self.assertSetEqual(set(rapidfuzz_set), { 'test2', 1, '  test1  ', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set -= frozenset({ 'test1', })
         self.assertSetEqual(set(rapidfuzz_set), { 'test2', 1, '  test1  ', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set -= RapidFuzzSet({ 'test1', })
         self.assertSetEqual(set(rapidfuzz_set), { 'test2', 1, '  test1  ', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set -= { 'test3', }
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 'test2', 1, '  test1  ', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set -= frozenset({ 'test3', })
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 'test2', 1, '  test1  ', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set -= RapidFuzzSet({ 'test3', })
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 'test2', 1, '  test1  ', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
 
     def test__iter__(self):
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', })
@@ -180,32 +199,32 @@ class TestRapidFuzzSet(TestCase):
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set ^= { 'test1', }
         self.assertSetEqual(set(rapidfuzz_set), { 'test2', 1, '  test1  ', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set ^= frozenset({ 'test1', })
         self.assertSetEqual(set(rapidfuzz_set), { 'test2', 1, '  test1  ', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set ^= RapidFuzzSet({ 'test1', })
         self.assertSetEqual(set(rapidfuzz_set), { 'test2', 1, '  test1  ', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, })  # noqa: E501
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set ^= { 'test3', }
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 'test2', 1, '  test1  ', 'test3', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, 'test3': { 'test3', }, })  # noqa: E501
 
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, 'test1', '  test1  ', })
         rapidfuzz_set ^= frozenset({ 'test3', })
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 'test2', 1, '  test1  ', 'test3', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, 'test3': { 'test3', }, })  # noqa: E501
 
         rapidfuzz_set = RapidFuzzSet({'test1', 'test2', 1, 'test1', '  test1  '})
         rapidfuzz_set ^= RapidFuzzSet({ 'test3', })
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 'test2', 1, '  test1  ', 'test3', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1  ', }, 'test2': { 'test2', }, None: { 1, }, 'test3': { 'test3', }, })  # noqa: E501
 
     def test__len__(self):
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, })
@@ -235,15 +254,15 @@ class TestRapidFuzzSet(TestCase):
 
         rapidfuzz_set2 = rapidfuzz_set1 | { 'test2', 'test4', 2, }
         self.assertSetEqual(set(rapidfuzz_set2), { 'test2', 1, 2, '  test1  ', 'test4', 'test1', })
-        self.assertDictEqual(rapidfuzz_set2.choices, { 'test2': { 'test2', }, None: { 1, 2, }, 'test1': { 'test1', '  test1  ', }, 'test4': { 'test4', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set2.choices, { 'test2': { 'test2', }, None: { 1, 2, }, 'test1': { 'test1', '  test1  ', }, 'test4': { 'test4', }, })  # noqa: E501
 
         rapidfuzz_set3 = rapidfuzz_set1 | frozenset({ 'test2', 'test4', 2, })
         self.assertSetEqual(set(rapidfuzz_set3), { 'test2', 1, 2, '  test1  ', 'test4', 'test1', })
-        self.assertDictEqual(rapidfuzz_set3.choices, { 'test2': { 'test2', }, None: { 1, 2, }, 'test1': { 'test1', '  test1  ', }, 'test4': { 'test4', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set3.choices, { 'test2': { 'test2', }, None: { 1, 2, }, 'test1': { 'test1', '  test1  ', }, 'test4': { 'test4', }, })  # noqa: E501
 
         rapidfuzz_set4 = rapidfuzz_set1 | RapidFuzzSet({ 'test3', 'test4', 2, })
         self.assertSetEqual(set(rapidfuzz_set4), { 1, 2, 'test2', 'test4', '  test1  ', 'test1', 'test3', })
-        self.assertDictEqual(rapidfuzz_set4.choices, { None: { 1, 2, }, 'test2': { 'test2', }, 'test4': { 'test4', }, 'test1': { '  test1  ', 'test1', }, 'test3': {'test3'}, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set4.choices, { None: { 1, 2, }, 'test2': { 'test2', }, 'test4': { 'test4', }, 'test1': { '  test1  ', 'test1', }, 'test3': {'test3'}, })  # noqa: E501
 
     def test__rand_(self):
         rapidfuzz_set1 = RapidFuzzSet({ 'test1', 'test2', 'test3', })
@@ -280,11 +299,11 @@ class TestRapidFuzzSet(TestCase):
 
         rapidfuzz_set2 = { 'test2', 'test4', 2, } | rapidfuzz_set1
         self.assertSetEqual(set(rapidfuzz_set2), { 'test2', 1, 2, '  test1  ', 'test4', 'test1', })
-        self.assertDictEqual(rapidfuzz_set2.choices, { 'test2': { 'test2', }, None: { 1, 2, }, 'test1': { 'test1', '  test1  ', }, 'test4': { 'test4', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set2.choices, { 'test2': { 'test2', }, None: { 1, 2, }, 'test1': { 'test1', '  test1  ', }, 'test4': { 'test4', }, })  # noqa: E501
 
         rapidfuzz_set3 = frozenset({ 'test2', 'test4', 2, }) | rapidfuzz_set1
         self.assertSetEqual(set(rapidfuzz_set3), { 'test2', 1, 2, '  test1  ', 'test4', 'test1', })
-        self.assertDictEqual(rapidfuzz_set3.choices, { 'test2': { 'test2', }, None: { 1, 2, }, 'test1': { 'test1', '  test1  ', }, 'test4': { 'test4', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set3.choices, { 'test2': { 'test2', }, None: { 1, 2, }, 'test1': { 'test1', '  test1  ', }, 'test4': { 'test4', }, })  # noqa: E501
 
     def test__rsub__(self):
         rapidfuzz_set1 = RapidFuzzSet({ 'test1', 'test2', 1, })
@@ -299,11 +318,11 @@ class TestRapidFuzzSet(TestCase):
 
         rapidfuzz_set2 = { 'test3', 'test2', } - rapidfuzz_set1
         self.assertSetEqual(set(rapidfuzz_set2), { 'test3', })
-        self.assertDictEqual(rapidfuzz_set2.choices, { 'test3': { 'test3', }, })
+        self.assertEqual(rapidfuzz_set2.choices, { 'test3': { 'test3', }, })
 
         rapidfuzz_set3 = frozenset({ 'test3', 'test2', }) - rapidfuzz_set1
         self.assertSetEqual(set(rapidfuzz_set3), { 'test3', })
-        self.assertDictEqual(rapidfuzz_set3.choices, { 'test3': { 'test3', }, })
+        self.assertEqual(rapidfuzz_set3.choices, { 'test3': { 'test3', }, })
 
     def test__rxor__(self):
         rapidfuzz_set1 = RapidFuzzSet({ 'test1', 'test2', 1, })
@@ -318,11 +337,11 @@ class TestRapidFuzzSet(TestCase):
 
         rapidfuzz_set2 = { 'test3', 'test2', } ^ rapidfuzz_set1
         self.assertSetEqual(set(rapidfuzz_set2), { 1, 'test3', 'test1', })
-        self.assertDictEqual(rapidfuzz_set2.choices, { None: { 1, }, 'test3': { 'test3', }, 'test1': { 'test1', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set2.choices, { None: { 1, }, 'test3': { 'test3', }, 'test1': { 'test1', }, })  # noqa: E501
 
         rapidfuzz_set3 = frozenset({ 'test3', 'test2', }) ^ rapidfuzz_set1
         self.assertSetEqual(set(rapidfuzz_set3), { 1, 'test3', 'test1', })
-        self.assertDictEqual(rapidfuzz_set3.choices, { None: { 1, }, 'test3': { 'test3', }, 'test1': { 'test1', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set3.choices, { None: { 1, }, 'test3': { 'test3', }, 'test1': { 'test1', }, })  # noqa: E501
 
     def test__sub__(self):
         rapidfuzz_set1 = RapidFuzzSet({ 'test1', 'test2', 1, })
@@ -337,15 +356,15 @@ class TestRapidFuzzSet(TestCase):
 
         rapidfuzz_set2 = rapidfuzz_set1 - { 'test3', 'test2', }
         self.assertSetEqual(set(rapidfuzz_set2), { 'test1', 1, })
-        self.assertDictEqual(rapidfuzz_set2.choices, { 'test1': { 'test1', }, None: { 1, }, })
+        self.assertEqual(rapidfuzz_set2.choices, { 'test1': { 'test1', }, None: { 1, }, })
 
         rapidfuzz_set3 = rapidfuzz_set1 - frozenset({ 'test3', 'test2', })
         self.assertSetEqual(set(rapidfuzz_set3), { 'test1', 1, })
-        self.assertDictEqual(rapidfuzz_set3.choices, { 'test1': { 'test1', }, None: { 1, }, })
+        self.assertEqual(rapidfuzz_set3.choices, { 'test1': { 'test1', }, None: { 1, }, })
 
         rapidfuzz_set4 = rapidfuzz_set1 - RapidFuzzSet({ 'test3', 'test2', })
         self.assertSetEqual(set(rapidfuzz_set4), { 'test1', 1, })
-        self.assertDictEqual(rapidfuzz_set4.choices, { 'test1': { 'test1', }, None: { 1, }, })
+        self.assertEqual(rapidfuzz_set4.choices, { 'test1': { 'test1', }, None: { 1, }, })
 
     def test__xor__(self):
         rapidfuzz_set1 = RapidFuzzSet({ 'test1', 'test2', 1, })
@@ -360,43 +379,51 @@ class TestRapidFuzzSet(TestCase):
 
         rapidfuzz_set2 = rapidfuzz_set1 ^ { 'test3', 'test2', }
         self.assertSetEqual(set(rapidfuzz_set2), { 1, 'test3', 'test1', })
-        self.assertDictEqual(rapidfuzz_set2.choices, { None: { 1, }, 'test1': { 'test1', }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set2.choices, { None: { 1, }, 'test1': { 'test1', }, 'test3': { 'test3', }, })  # noqa: E501
 
         rapidfuzz_set3 = rapidfuzz_set1 ^ frozenset({ 'test3', 'test2', })
         self.assertSetEqual(set(rapidfuzz_set3), { 1, 'test3', 'test1', })
-        self.assertDictEqual(rapidfuzz_set3.choices, { None: { 1, }, 'test1': { 'test1', }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set3.choices, { None: { 1, }, 'test1': { 'test1', }, 'test3': { 'test3', }, })  # noqa: E501
 
         rapidfuzz_set4 = rapidfuzz_set1 ^ RapidFuzzSet({ 'test3', 'test2', })
         self.assertSetEqual(set(rapidfuzz_set4), { 1, 'test3', 'test1', })
-        self.assertDictEqual(rapidfuzz_set4.choices, { None: { 1, }, 'test1': { 'test1', }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set4.choices, { None: { 1, }, 'test1': { 'test1', }, 'test3': { 'test3', }, })  # noqa: E501
 
     def test_choices(self):
         rapidfuzz_set = RapidFuzzSet({ '  tEst1', 'teSt2  ', 't3', '  t4  ', 1, 1.1, None, })
 
-        self.assertDictEqual(rapidfuzz_set.choices, { None: { None, 1, 1.1, '  t4  ', 't3'}, 'tEst1': { '  tEst1', }, 'teSt2': { 'teSt2  ', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { None: { None, 1, 1.1, '  t4  ', 't3'}, 'tEst1': { '  tEst1', }, 'teSt2': { 'teSt2  ', }, })  # noqa: E501
+
+        # read-only view
+        self.assertIsInstance(rapidfuzz_set.choices, ChoicesView)
+        self.assertIsInstance(rapidfuzz_set.choices['tEst1'], ChoicesGroupView)
+        with self.assertRaises(TypeError):
+            rapidfuzz_set.choices['test'] = { 'test', }
+        with self.assertRaises(AttributeError):
+            rapidfuzz_set.choices[None].add('test')
 
     def test_add(self):
         rapidfuzz_set = RapidFuzzSet()
 
         rapidfuzz_set.add('test1')
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', }, })
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', }, })
 
         rapidfuzz_set.add(1)
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 1, })
-        self.assertDictEqual(rapidfuzz_set.choices, { None: { 1, }, 'test1': { 'test1', }, })
+        self.assertEqual(rapidfuzz_set.choices, { None: { 1, }, 'test1': { 'test1', }, })
 
         rapidfuzz_set.add(None)
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 1, None, })
-        self.assertDictEqual(rapidfuzz_set.choices, { None: { 1, None, }, 'test1': { 'test1', }, })
+        self.assertEqual(rapidfuzz_set.choices, { None: { 1, None, }, 'test1': { 'test1', }, })
 
         rapidfuzz_set.add('test1   ')
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 1, None, 'test1   ', })
-        self.assertDictEqual(rapidfuzz_set.choices, { None: { 1, None, }, 'test1': { 'test1', 'test1   ', }, })
+        self.assertEqual(rapidfuzz_set.choices, { None: { 1, None, }, 'test1': { 'test1', 'test1   ', }, })
 
         rapidfuzz_set.add('test1')
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 1, None, 'test1   ', })
-        self.assertDictEqual(rapidfuzz_set.choices, { None: { 1, None, }, 'test1': { 'test1', 'test1   ', }, })
+        self.assertEqual(rapidfuzz_set.choices, { None: { 1, None, }, 'test1': { 'test1', 'test1   ', }, })
 
     def test_clear(self):
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 1, })
@@ -404,7 +431,7 @@ class TestRapidFuzzSet(TestCase):
         rapidfuzz_set.clear()
 
         self.assertSetEqual(set(rapidfuzz_set), set())
-        self.assertDictEqual(rapidfuzz_set.choices, {})
+        self.assertEqual(rapidfuzz_set.choices, {})
 
     def test_copy(self):
         rapidfuzz_set1 = RapidFuzzSet({ ( 'test1', ), })
@@ -461,11 +488,11 @@ class TestRapidFuzzSet(TestCase):
 
         rapidfuzz_set.discard('teSt134')
         self.assertSetEqual(set(rapidfuzz_set), { '   test1', 1, 'test1', '  tEst2 ', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { '   test1', 'test1', }, None: { 1, }, 'tEst2': { '  tEst2 ', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { '   test1', 'test1', }, None: { 1, }, 'tEst2': { '  tEst2 ', }, })  # noqa: E501
 
         rapidfuzz_set.discard('   test1')
         self.assertSetEqual(set(rapidfuzz_set), { '  tEst2 ', 'test1', 1, })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', }, 'tEst2': { '  tEst2 ', }, None: { 1, }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', }, 'tEst2': { '  tEst2 ', }, None: { 1, }, })  # noqa: E501
 
     def test_intersection(self):
         rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', 'test3', })
@@ -562,7 +589,7 @@ class TestRapidFuzzSet(TestCase):
         item = rapidfuzz_set.pop()
         self.assertEqual(item, 'test1')
         self.assertSetEqual(set(rapidfuzz_set), set())
-        self.assertDictEqual(rapidfuzz_set.choices, {})
+        self.assertEqual(rapidfuzz_set.choices, {})
 
         self.assertRaises(KeyError, lambda: rapidfuzz_set.pop())
 
@@ -571,11 +598,11 @@ class TestRapidFuzzSet(TestCase):
 
         rapidfuzz_set.remove('test2')
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', '  test1', 1, })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1', }, None: { 1, }, })
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', '  test1', }, None: { 1, }, })
 
         rapidfuzz_set.remove('test1')
         self.assertSetEqual(set(rapidfuzz_set), { '  test1', 1, })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { '  test1', }, None: { 1, }, })
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { '  test1', }, None: { 1, }, })
 
         self.assertRaises(KeyError, lambda: rapidfuzz_set.remove('test3'))
 
@@ -640,7 +667,468 @@ class TestRapidFuzzSet(TestCase):
 
         rapidfuzz_set.update(RapidFuzzSet({ 'test1', 'test3', }), { 'test2', 'test4', })
         self.assertSetEqual(set(rapidfuzz_set), { 'test1', 'test1  ', 'test2', 'test3', 'test4', })
-        self.assertDictEqual(rapidfuzz_set.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', }, 'test3': { 'test3', }, 'test4': { 'test4', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', 'test1  ', }, 'test2': { 'test2', }, 'test3': { 'test3', }, 'test4': { 'test4', }, })  # noqa: E501
+
+    def test_update_normalizes_only_delta(self):
+        calls = []
+        normalizer = Normalizer().custom(lambda v, args, kwargs: calls.append(v) or v).strip()
+        rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', ' test2', }, normalizer=normalizer)
+
+        calls.clear()
+        rapidfuzz_set |= { 'test1', 'test3', }
+        self.assertListEqual(calls, [ 'test3', ])
+
+        calls.clear()
+        rapidfuzz_set -= { 'test3', 'test4', }
+        self.assertListEqual(calls, [ 'test3', ])
+
+        calls.clear()
+        rapidfuzz_set &= { 'test1', 'test2', }
+        self.assertListEqual(calls, [ ' test2', ])
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', }, 'test2': { 'test2', }, })
+
+        calls.clear()
+        rapidfuzz_set ^= { 'test2', 'test5', }
+        self.assertListEqual(sorted(calls), [ 'test2', 'test5', ])
+        self.assertEqual(rapidfuzz_set.choices, { 'test1': { 'test1', }, 'test5': { 'test5', }, })
+
+    def test_set_algebra_reuses_choices(self):
+        calls = []
+        normalizer = Normalizer().custom(lambda v, args, kwargs: calls.append(v) or v).strip()
+        rapidfuzz_set1 = RapidFuzzSet({ 'test1', 'test2', ' test2', }, normalizer=normalizer)
+        rapidfuzz_set2 = RapidFuzzSet({ 'test2', 'test3', }, normalizer=normalizer)
+
+        calls.clear()
+        self.assertEqual((rapidfuzz_set1 & rapidfuzz_set2).choices, { 'test2': { 'test2', }, })
+        self.assertEqual((rapidfuzz_set1 | rapidfuzz_set2).choices, { 'test1': { 'test1', }, 'test2': { 'test2', ' test2', }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual((rapidfuzz_set1 - rapidfuzz_set2).choices, { 'test1': { 'test1', }, 'test2': { ' test2', }, })
+        self.assertEqual((rapidfuzz_set1 ^ rapidfuzz_set2).choices, { 'test1': { 'test1', }, 'test2': { ' test2', }, 'test3': { 'test3', }, })  # noqa: E501
+        self.assertEqual(rapidfuzz_set1.union(rapidfuzz_set2, rapidfuzz_set1).choices, (rapidfuzz_set1 | rapidfuzz_set2).choices)
+        self.assertEqual(rapidfuzz_set1.intersection(rapidfuzz_set2).choices, (rapidfuzz_set1 & rapidfuzz_set2).choices)
+        self.assertEqual(rapidfuzz_set1.difference(rapidfuzz_set2).choices, (rapidfuzz_set1 - rapidfuzz_set2).choices)
+        self.assertListEqual(calls, [])
+
+        # only elements from a plain set, which are not in collection, are normalized
+        self.assertEqual((rapidfuzz_set1 | { 'test1', 'test4', }).choices, { 'test1': { 'test1', }, 'test2': { 'test2', ' test2', }, 'test4': { 'test4', }, })  # noqa: E501
+        self.assertEqual((rapidfuzz_set1 & { 'test1', 'test4', }).choices, { 'test1': { 'test1', }, })
+        self.assertListEqual(calls, [ 'test4', ])
+
+        # different normalizer
+        rapidfuzz_set3 = RapidFuzzSet({ 'TEST1', }, normalizer=Normalizer().lower())
+        self.assertEqual((rapidfuzz_set3 | rapidfuzz_set1).choices, { 'test1': { 'TEST1', 'test1', }, 'test2': { 'test2', }, ' test2': { ' test2', }, })  # noqa: E501
+
+    def test_copy_without_normalization(self):
+        calls = []
+        normalizer = Normalizer().custom(lambda v, args, kwargs: calls.append(v) or v).strip()
+        rapidfuzz_set = RapidFuzzSet({ 'test1', ' test1', 'test2', }, normalizer=normalizer)
+
+        calls.clear()
+        results = [
+            copy(rapidfuzz_set),
+            rapidfuzz_set.copy(),
+        ]
+        self.assertListEqual(calls, [])
+
+        for result in results:
+            self.assertEqual(result.choices, RapidFuzzSet(result._data, normalizer=normalizer).choices)
+
+    def test_query_cache(self):
+        calls = []
+        normalizer = Normalizer().custom(lambda v, args, kwargs: calls.append(v) or v).isinstance_str().strip()
+        rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', }, normalizer=normalizer, query_cache_size=2)
+
+        calls.clear()
+        for _ in range(3):
+            self.assertTrue(rapidfuzz_set.fuzzy_contains(' test1 '))
+            self.assertTrue(rapidfuzz_set.fuzzy_contains(' test2 '))
+        self.assertListEqual(calls, [ ' test1 ', ' test2 ', ])
+        self.assertEqual(rapidfuzz_set.query_cache_info().hits, 4)
+        self.assertEqual(rapidfuzz_set.query_cache_info().misses, 2)
+
+        # eviction of the least recently used query
+        rapidfuzz_set.fuzzy_contains(' test3 ')
+        rapidfuzz_set.fuzzy_contains(' test1 ')
+        self.assertListEqual(calls, [ ' test1 ', ' test2 ', ' test3 ', ' test1 ', ])
+        self.assertEqual(rapidfuzz_set.query_cache_info().currsize, 2)
+
+        rapidfuzz_set.query_cache_clear()
+        self.assertEqual(rapidfuzz_set.query_cache_info().currsize, 0)
+
+        rapidfuzz_set.query_cache_size = None
+        self.assertIsNone(rapidfuzz_set.query_cache_info())
+
+        with self.assertRaises(ValueError):
+            RapidFuzzSet(query_cache_size=0)
+
+        with self.assertRaises(TypeError):
+            RapidFuzzSet(query_cache_size=1.0)
+
+    def test_result_cache(self):
+        rapidfuzz_set = RapidFuzzSet({ 'test1', 'test2', }, result_cache_size=2)
+
+        for _ in range(3):
+            self.assertEqual(rapidfuzz_set.fuzzy_get('tst1'), 'test1')
+            self.assertTrue(rapidfuzz_set.fuzzy_contains('tst1'))
+        self.assertEqual(rapidfuzz_set.result_cache_info(), ( 4, 2, 2, 2, ))
+
+        # other arguments of search are cached separately
+        self.assertIsNone(rapidfuzz_set.fuzzy_get('tst1', score_cutoff=99))
+        self.assertEqual(rapidfuzz_set.result_cache_info(), ( 4, 3, 2, 2, ))
+
+        # operations which do not change the collection keep the cache
+        rapidfuzz_set.add('test1')
+        rapidfuzz_set.discard('test3')
+        rapidfuzz_set |= { 'test1', }
+        rapidfuzz_set &= { 'test1', 'test2', }
+        rapidfuzz_set -= { 'test3', }
+        rapidfuzz_set ^= set()
+        rapidfuzz_set.update({ 'test2', })
+        rapidfuzz_set.difference_update({ 'test3', })
+        with self.assertRaises(KeyError):
+            rapidfuzz_set.remove('test3')
+        for operation in ( '__iand__', '__ior__', '__isub__', '__ixor__', ):
+            with self.assertRaises(TypeError):
+                getattr(rapidfuzz_set, operation)([ 'test3', ])
+        self.assertEqual(rapidfuzz_set.result_cache_info().currsize, 2)
+
+        # any change of collection invalidates the cache
+        rapidfuzz_set.add('test3')
+        self.assertEqual(rapidfuzz_set.result_cache_info().currsize, 0)
+        self.assertEqual(rapidfuzz_set.fuzzy_get('tst1'), 'test1')
+        self.assertEqual(rapidfuzz_set.result_cache_info(), ( 4, 4, 2, 1, ))
+
+        rapidfuzz_set.result_cache_clear()
+        self.assertEqual(rapidfuzz_set.result_cache_info(), ( 0, 0, 2, 0, ))
+
+        rapidfuzz_set.result_cache_size = None
+        self.assertIsNone(rapidfuzz_set.result_cache_info())
+
+        with self.assertRaises(ValueError):
+            RapidFuzzSet(result_cache_size=0)
+
+    def test_length_pruning(self):
+        rapidfuzz_set = RapidFuzzSet(
+            [ 'a', 'b', 'test', 'tests', 'longer test', 'the longest test', 'tast', ],
+            scorer=fuzz.ratio,
+            score_cutoff=80
+        )
+
+        # the length index is built on the first scan and selects only lengths 4-7
+        for _ in range(2):
+            self.assertEqual(rapidfuzz_set.fuzzy_get('tast1'), 'tast')
+        self.assertEqual(
+            set(rapidfuzz_set._select_choices('tast1', fuzz.ratio, 80, None)),
+            { 'test', 'tests', 'tast', }
+        )
+
+        # the index is kept in sync with changes
+        index = rapidfuzz_set._length_index
+        rapidfuzz_set.add('tast12')
+        for _ in range(2):
+            self.assertEqual(rapidfuzz_set.fuzzy_get('tast1'), 'tast12')
+        rapidfuzz_set.remove('tests')
+        self.assertEqual(set(rapidfuzz_set._select_choices('tast1', fuzz.ratio, 80, None)), { 'test', 'tast', 'tast12', })  # noqa: E501
+        self.assertIs(rapidfuzz_set._length_index, index)
+
+        # unknown length bound of the scorer or its arguments: all choices are scanned
+        self.assertEqual(len(rapidfuzz_set._select_choices('tast1', fuzz.WRatio, 80, None)), len(rapidfuzz_set._choices))  # noqa: E501
+        self.assertEqual(len(rapidfuzz_set._select_choices('tast1', fuzz.ratio, 80, { 'processor': str.lower, })), len(rapidfuzz_set._choices))  # noqa: E501
+
+        # too many choices can pass score_cutoff: all choices are scanned
+        self.assertEqual(len(rapidfuzz_set._select_choices('tast1', fuzz.ratio, 10, None)), len(rapidfuzz_set._choices))  # noqa: E501
+
+    def test_qgram_index(self):
+        rapidfuzz_set = RapidFuzzSet(
+            [ 'international', 'national', 'rational', 'internationally', 'banana', 'interxatixnal', ],
+            qgram_size=3,
+            scorer=Levenshtein.distance,
+            scorer_type=ScorerType.DISTANCE,
+            score_cutoff=2
+        )
+
+        # only choices with enough common trigrams with the query are scored
+        self.assertEqual(rapidfuzz_set.fuzzy_get('internatonal'), 'international')
+        self.assertEqual(list(rapidfuzz_set._select_choices('internatonal', Levenshtein.distance, 2, None)), [ 'international', ])  # noqa: E501
+
+        # the index is kept in sync with changes of the collection
+        index = rapidfuzz_set._qgram_index
+        rapidfuzz_set.add('internationale')
+        rapidfuzz_set.discard('international')
+        self.assertIs(rapidfuzz_set._qgram_index, index)
+        self.assertEqual(list(rapidfuzz_set._select_choices('internatonal', Levenshtein.distance, 2, None)), [ 'internationale', ])  # noqa: E501
+
+        # a choice within `score_cutoff` may have no common trigrams with the query: only lengths are filtered
+        self.assertEqual(list(rapidfuzz_set._select_choices('natio', Levenshtein.distance, 2, None)), [ 'banana', ])
+
+        # scorers without the bound of the number of edits are not filtered
+        self.assertEqual(len(rapidfuzz_set._select_choices('internatonal', fuzz.WRatio, 85, None)), len(rapidfuzz_set._choices))  # noqa: E501
+
+        # lower strictness selects more choices
+        self.assertNotIn('interxatixnal', rapidfuzz_set._select_choices('internatonal', Levenshtein.distance, 1, None))
+        rapidfuzz_set.qgram_strictness = 0.5
+        self.assertIn('interxatixnal', rapidfuzz_set._select_choices('internatonal', Levenshtein.distance, 1, None))
+
+        # matches are not lost by the count filtering
+        for scorer, score_cutoff, scorer_type, qgram_size, choice, query in (
+            ( fuzz.WRatio, 90, ScorerType.SIMILARITY, 3, 'new york', 'york new', ),
+            ( fuzz.ratio, 80, ScorerType.SIMILARITY, 3, 'abcdefghij', 'abXcdXefXghXij', ),
+            ( Indel.normalized_similarity, 0.8, ScorerType.SIMILARITY, 3, 'abcdefghij', 'abXcdXefXghXij', ),
+            ( DamerauLevenshtein.distance, 1, ScorerType.DISTANCE, 2, 'abcdefgh', 'acbdefgh', ),
+            ( OSA.distance, 1, ScorerType.DISTANCE, 2, 'abcdefgh', 'acbdefgh', ),
+        ):
+            rapidfuzz_set = RapidFuzzSet(
+                [ choice, 'zzzzzzzzzz', ],
+                normalizer=Normalizer().isinstance_str(),
+                scorer=scorer,
+                scorer_type=scorer_type,
+                score_cutoff=score_cutoff,
+                qgram_size=qgram_size
+            )
+            self.assertEqual(rapidfuzz_set.fuzzy_get(query), choice)
+
+        with self.assertRaises(ValueError):
+            RapidFuzzSet(qgram_size=0)
+        with self.assertRaises(ValueError):
+            RapidFuzzSet(qgram_size=3, qgram_strictness=0)
+
+    def test_bk_tree(self):
+        rapidfuzz_set = RapidFuzzSet(
+            [ 'kitten', 'sitting', 'mitten', 'bitten', 'smitten', 'written', ],
+            scorer=Levenshtein.distance,
+            scorer_type=ScorerType.DISTANCE,
+            score_cutoff=1,
+            index_type=IndexType.BK_TREE
+        )
+
+        # only choices within the distance are found by the tree
+        self.assertEqual(rapidfuzz_set.fuzzy_get('kiten'), 'kitten')
+        self.assertEqual(
+            set(rapidfuzz_set._search_index('mitten', Levenshtein.distance, 1, None)),
+            { 'kitten', 'mitten', 'bitten', 'smitten', }
+        )
+
+        # the tree is kept in sync with changes of the collection
+        tree = rapidfuzz_set._index
+        rapidfuzz_set.add('mittens')
+        rapidfuzz_set.discard('kitten')
+        self.assertIs(rapidfuzz_set._index, tree)
+        self.assertEqual(
+            set(rapidfuzz_set._search_index('mitten', Levenshtein.distance, 1, None)),
+            { 'mitten', 'bitten', 'smitten', 'mittens', }
+        )
+
+        # other scorers do not use the tree
+        self.assertIsNone(rapidfuzz_set._search_index('mitten', fuzz.WRatio, 90, None))
+        self.assertIsNone(rapidfuzz_set._search_index('mitten', Levenshtein.distance, 1, { 'weights': ( 1, 1, 2, ), }))
+
+        with self.assertRaises(TypeError):
+            RapidFuzzSet(index_type='bk-tree')
+
+    def test_symspell_index(self):
+        rapidfuzz_set = RapidFuzzSet(
+            [ 'kitten', 'sitting', 'mitten', 'bitten', 'smitten', 'written', ],
+            scorer=Levenshtein.distance,
+            scorer_type=ScorerType.DISTANCE,
+            score_cutoff=1,
+            index_type=IndexType.SYMSPELL,
+            symspell_distance=1
+        )
+
+        # only choices within the distance are found by deletions
+        self.assertEqual(rapidfuzz_set.fuzzy_get('kiten'), 'kitten')
+        self.assertEqual(
+            set(rapidfuzz_set._search_index('mitten', Levenshtein.distance, 1, None)),
+            { 'kitten', 'mitten', 'bitten', 'smitten', }
+        )
+        info = rapidfuzz_set.index_info()
+        self.assertEqual(info.index_type, IndexType.SYMSPELL)
+        self.assertEqual(info.size, 6)
+        self.assertGreater(info.entries, 6)
+        self.assertGreater(info.memory, 0)
+        self.assertFalse(info.overflow)
+
+        # the index is kept in sync with changes of the collection
+        index = rapidfuzz_set._index
+        rapidfuzz_set.add('mittens')
+        rapidfuzz_set.discard('kitten')
+        self.assertIs(rapidfuzz_set._index, index)
+        self.assertEqual(
+            set(rapidfuzz_set._search_index('mitten', Levenshtein.distance, 1, None)),
+            { 'mitten', 'bitten', 'smitten', 'mittens', }
+        )
+
+        # greater distances and other scorers do not use the index
+        self.assertIsNone(rapidfuzz_set._search_index('mitten', Levenshtein.distance, 2, None))
+        self.assertIsNone(rapidfuzz_set._search_index('mitten', fuzz.WRatio, 90, None))
+
+        # the index overflows the memory cap, so all choices are scanned
+        rapidfuzz_set.symspell_max_entries = 10
+        self.assertEqual(rapidfuzz_set.fuzzy_get('smiten'), 'smitten')
+        self.assertIsNone(rapidfuzz_set._search_index('mitten', Levenshtein.distance, 1, None))
+        self.assertTrue(rapidfuzz_set.index_info().overflow)
+
+        with self.assertRaises(ValueError):
+            RapidFuzzSet(symspell_distance=-1)
+
+    def test_fuzzy_top_k(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_set = RapidFuzzSet(data_tuple, normalizer=normalizer, score_cutoff=90)
+
+        self.assertListEqual(rapidfuzz_set.fuzzy_top_k('Austraia', 5), [ ( 'Australia', 94.11764705882352, ), ( 'Austria', 93.33333333333333, ), ])  # noqa: E501
+        self.assertListEqual(rapidfuzz_set.fuzzy_top_k('Gondor', 1, score_cutoff=60), [ ( 'Andorra', 61.53846153846154, ), ])  # noqa: E501
+        self.assertEqual(len(rapidfuzz_set.fuzzy_top_k('Gondor', 3, score_cutoff=60)), 3)
+        self.assertEqual(len(rapidfuzz_set.fuzzy_top_k('Gondor', 100, score_cutoff=60)), 6)
+        self.assertListEqual(rapidfuzz_set.fuzzy_top_k('Gondor', 5), [])
+
+        with self.assertRaises(ValueError):
+            rapidfuzz_set.fuzzy_top_k('Gondor', 0)
+
+        with self.assertRaises(TypeError):
+            rapidfuzz_set.fuzzy_top_k('Gondor', '1')
+
+    def test_workers(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_set = RapidFuzzSet(data_tuple, normalizer=normalizer, score_cutoff=60, workers=2)
+        self.assertEqual(rapidfuzz_set.default_workers, 2)
+
+        values = [ 'Ustralia', 'Gondor', 'Austria', ]
+
+        # chunks of choices are scored in parallel threads with the same results
+        with patch('rapidfuzz_collections.base.PARALLEL_MIN_CHOICES', 1):
+            for value in values:
+                for strategy in Strategy:
+                    self.assertEqual(rapidfuzz_set.fuzzy_get(value, strategy=strategy), rapidfuzz_set.fuzzy_get(value, strategy=strategy, workers=1))  # noqa: E501
+                self.assertSetEqual(set(rapidfuzz_set.get_fuzzy_scores(value)), set(rapidfuzz_set.get_fuzzy_scores(value, workers=1)))  # noqa: E501
+            self.assertListEqual(rapidfuzz_set.fuzzy_get_many(values), rapidfuzz_set.fuzzy_get_many(values, workers=1))
+
+        with self.assertRaises(ValueError):
+            rapidfuzz_set.default_workers = 0
+
+        with self.assertRaises(TypeError):
+            RapidFuzzSet(workers='2')
+
+    def test_async(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_set = RapidFuzzSet(data_tuple, normalizer=normalizer, score_cutoff=90)
+
+        async def main():
+            self.assertTrue(await rapidfuzz_set.afuzzy_contains('Ustralia'))
+            self.assertFalse(await rapidfuzz_set.afuzzy_contains('Gondor'))
+            self.assertEqual(await rapidfuzz_set.afuzzy_get('Ustralia'), rapidfuzz_set.fuzzy_get('Ustralia'))
+            self.assertListEqual(await rapidfuzz_set.afuzzy_top_k('Austraia', 2), rapidfuzz_set.fuzzy_top_k('Austraia', 2))
+            self.assertListEqual(await rapidfuzz_set.aget_fuzzy_scores('Austraia'), rapidfuzz_set.get_fuzzy_scores('Austraia'))
+            self.assertListEqual(await rapidfuzz_set.afuzzy_get_many([ 'Ustralia', 'Gondor', ]), rapidfuzz_set.fuzzy_get_many([ 'Ustralia', 'Gondor', ]))  # noqa: E501
+            self.assertListEqual(await rapidfuzz_set.aget_fuzzy_scores_many([ 'Austraia', ]), rapidfuzz_set.get_fuzzy_scores_many([ 'Austraia', ]))  # noqa: E501
+
+            # results are yielded by chunks
+            chunks = [ chunk async for chunk in rapidfuzz_set.aget_fuzzy_score_iter('Austraia', chunk_size=100) ]
+            self.assertTrue(all(0 < len(chunk) <= 100 for chunk in chunks))
+            self.assertListEqual(list(chain.from_iterable(chunks)), list(rapidfuzz_set.get_fuzzy_score_iter('Austraia')))
+
+            # iteration can be stopped before the end
+            iterator = rapidfuzz_set.aget_fuzzy_score_iter('Austraia', chunk_size=1)
+            self.assertEqual(len(await anext(iterator)), 1)
+            await iterator.aclose()
+
+            with ThreadPoolExecutor(2) as executor:
+                self.assertEqual(await rapidfuzz_set.afuzzy_get('Ustralia', executor=executor), rapidfuzz_set.fuzzy_get('Ustralia'))
+                rapidfuzz_set.default_executor = executor
+                self.assertIs(rapidfuzz_set.default_executor, executor)
+                self.assertEqual(await rapidfuzz_set.afuzzy_get('Ustralia'), rapidfuzz_set.fuzzy_get('Ustralia'))
+                rapidfuzz_set.default_executor = None
+
+            with self.assertRaises(TypeError):
+                await rapidfuzz_set.afuzzy_get('Ustralia', executor=2)
+
+            with self.assertRaises(ValueError):
+                await anext(rapidfuzz_set.aget_fuzzy_score_iter('Austraia', chunk_size=0))
+
+        run(main())
+
+        with self.assertRaises(TypeError):
+            RapidFuzzSet(executor=2)
+
+    def test_save_load(self):
+        calls = []
+
+        def normalize(value, *args, **kwargs):
+            calls.append(value)
+            return value
+
+        normalizer = Normalizer().custom(normalize).isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_set = RapidFuzzSet(data_tuple, normalizer=normalizer, score_cutoff=90)
+
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'collection.rfc'
+            rapidfuzz_set.save(path)
+
+            calls.clear()
+            loaded = RapidFuzzSet.load(path, normalizer=normalizer, score_cutoff=90)
+            self.assertListEqual(calls, [])
+            self.assertEqual(loaded, rapidfuzz_set)
+            self.assertEqual(loaded.default_score_cutoff, 90)
+            self.assertEqual(loaded.fuzzy_get('Ustralia'), rapidfuzz_set.fuzzy_get('Ustralia'))
+            self.assertSetEqual(set(loaded.get_fuzzy_scores('Austraia')), set(rapidfuzz_set.get_fuzzy_scores('Austraia')))
+
+            # the normalizer and the scorer must be the same
+            with self.assertRaises(ValueError):
+                RapidFuzzSet.load(path, normalizer=Normalizer().custom(normalize).isinstance_str().strip().min_length(3))
+            with self.assertRaises(ValueError):
+                RapidFuzzSet.load(path, normalizer=normalizer, scorer=fuzz.ratio)
+
+            path.write_bytes(b'test')
+            with self.assertRaises(ValueError):
+                RapidFuzzSet.load(path, normalizer=normalizer)
+
+    def test_pickle(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().re_sub(r'\s+', ' ').min_length(3)
+        rapidfuzz_set = RapidFuzzSet(data_tuple, normalizer=normalizer, score_cutoff=90, workers=2)
+
+        # the normalizer is not called by unpickling
+        with patch.object(Normalizer, 'compile', side_effect=AssertionError):
+            loaded = pickle_loads(pickle_dumps(rapidfuzz_set))
+        self.assertEqual(loaded, rapidfuzz_set)
+        self.assertEqual(loaded.normalizer.fingerprint(), normalizer.fingerprint())
+        self.assertEqual(loaded.default_score_cutoff, 90)
+        self.assertEqual(loaded.default_workers, 2)
+        self.assertEqual(loaded.fuzzy_get('Ustralia'), rapidfuzz_set.fuzzy_get('Ustralia'))
+        self.assertSetEqual(set(loaded.get_fuzzy_scores('Austraia')), set(rapidfuzz_set.get_fuzzy_scores('Austraia')))
+
+        # scorers of `rapidfuzz.distance` are pickled by names
+        rapidfuzz_set = RapidFuzzSet(data_tuple, scorer=Levenshtein.distance, scorer_type=ScorerType.DISTANCE, score_cutoff=2)
+        loaded = pickle_loads(pickle_dumps(rapidfuzz_set))
+        self.assertIs(loaded.default_scorer, Levenshtein.distance)
+        self.assertEqual(loaded.fuzzy_get('Ustralia'), rapidfuzz_set.fuzzy_get('Ustralia'))
+
+    def test_bulk_normalization(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().re_sub(r'\s+', ' ').min_length(3)
+        expected = RapidFuzzSet(data_tuple, normalizer=normalizer)
+        size = len(expected)
+
+        progress = []
+        with (
+            patch('rapidfuzz_collections.base.PARALLEL_NORMALIZE_MIN_VALUES', 1),
+            patch('rapidfuzz_collections.base.NORMALIZE_CHUNK_SIZE', 16)
+        ):
+            # chunks of values are normalized in processes with the same groups of choices
+            rapidfuzz_set = RapidFuzzSet(data_tuple, normalizer=normalizer, workers=2, progress=lambda done, total: progress.append(( done, total, )))  # noqa: E501
+            self.assertListEqual(list(rapidfuzz_set._choices.items()), list(expected._choices.items()))
+            self.assertEqual(progress[0], ( 16, size, ))
+            self.assertEqual(progress[-1], ( size, size, ))
+
+            # values which can not be pickled are normalized in this thread, from the chunk of the first of them
+            values = [ *data_tuple[:40], lambda: 0, *data_tuple[40:], ]
+            progress.clear()
+            rapidfuzz_set = RapidFuzzSet(values, normalizer=normalizer, workers=2, progress=lambda done, total: progress.append(( done, total, )))  # noqa: E501
+            expected = RapidFuzzSet(values, normalizer=normalizer)
+            self.assertListEqual(list(rapidfuzz_set._choices.items()), list(expected._choices.items()))
+            self.assertEqual(progress[-1], ( len(values), len(values), ))
+
+            # threads on free-threaded builds
+            with patch('rapidfuzz_collections.base._is_gil_enabled', return_value=False):
+                rapidfuzz_set.normalizer = Normalizer().isinstance_str().strip().min_length(3)
+                expected.normalizer = Normalizer().isinstance_str().strip().min_length(3)
+                self.assertListEqual(list(rapidfuzz_set._choices.items()), list(expected._choices.items()))
 
     def test_fuzzy_contains(self):
         normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
@@ -687,6 +1175,23 @@ class TestRapidFuzzSet(TestCase):
         self.assertIsNone(rapidfuzz_set.fuzzy_get('Gondor', strategy=Strategy.BEST_ONLY_ONE, score_cutoff=60))
         self.assertEqual(rapidfuzz_set.fuzzy_get('Gondor', strategy=Strategy.FIRST, score_cutoff=61), 'Andorra')  # noqa: E501
 
+    def test_fuzzy_get_many(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_set = RapidFuzzSet(data_tuple, normalizer=normalizer, score_cutoff=90)
+
+        values = [ 'Australia', '   aUstraLia  ', 'Austraia', 'Ustralia', 'Austria', 'Gondor', 'Ustralia', None, ]
+
+        self.assertListEqual(rapidfuzz_set.fuzzy_get_many([ 'Ustralia', 'Gondor', ]), [ 'Australia', None, ])
+        self.assertListEqual(rapidfuzz_set.fuzzy_get_many([]), [])
+
+        for strategy in Strategy:
+            self.assertListEqual(rapidfuzz_set.fuzzy_get_many(values, strategy=strategy), [ rapidfuzz_set.fuzzy_get(i, strategy=strategy) for i in values ])  # noqa: E501
+            self.assertListEqual(rapidfuzz_set.fuzzy_get_many(values, strategy=strategy, score_cutoff=60, workers=-1), [ rapidfuzz_set.fuzzy_get(i, strategy=strategy, score_cutoff=60) for i in values ])  # noqa: E501
+            self.assertListEqual(rapidfuzz_set.fuzzy_get_many(values, strategy=strategy, scorer=Levenshtein.distance, scorer_type=ScorerType.DISTANCE, score_cutoff=4), [ rapidfuzz_set.fuzzy_get(i, strategy=strategy, scorer=Levenshtein.distance, scorer_type=ScorerType.DISTANCE, score_cutoff=4) for i in values ])  # noqa: E501
+
+        self.assertRaises(ValueError, lambda: rapidfuzz_set.fuzzy_get_many(values, workers=0))
+        self.assertRaises(TypeError, lambda: rapidfuzz_set.fuzzy_get_many(values, workers=1.0))
+
     def test_get_fuzzy_scores(self):
         normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
         rapidfuzz_set = RapidFuzzSet(data_tuple, normalizer=normalizer, score_cutoff=90)
@@ -701,6 +1206,18 @@ class TestRapidFuzzSet(TestCase):
         self.assertSetEqual(set(filter(_check, rapidfuzz_set.get_fuzzy_scores('Austria'))), { ( 'Austria', 100.0, ), })
         self.assertSetEqual(set(filter(_check, rapidfuzz_set.get_fuzzy_scores('Gondor'))), set())
         self.assertSetEqual(set(filter(_check, rapidfuzz_set.get_fuzzy_scores('Gondor', score_cutoff=60))), { ( 'Andorra', 61.53846153846154, ), ( 'El Salvador', 60.00000000000001, ), ( 'Norfolk Island', 60.00000000000001, ), ( 'Northern Mariana Islands', 60.00000000000001, ), ( 'Republic of North Macedonia', 60.00000000000001, ), ( 'Togo', 60.00000000000001, ), })  # noqa: E501
+        self.assertListEqual(rapidfuzz_set.get_fuzzy_scores('Austraia', unscored=False), [ ( 'Australia', 94.11764705882352, ), ( 'Austria', 93.33333333333333, ), ])  # noqa: E501
+
+    def test_get_fuzzy_scores_many(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_set = RapidFuzzSet(data_tuple, normalizer=normalizer, score_cutoff=90)
+
+        values = [ 'Australia', '   aUstraLia  ', 'Austraia', 'Gondor', 'Austraia', None, ]
+
+        self.assertListEqual(rapidfuzz_set.get_fuzzy_scores_many(values), [ rapidfuzz_set.get_fuzzy_scores(i) for i in values ])  # noqa: E501
+        self.assertListEqual(rapidfuzz_set.get_fuzzy_scores_many(values, score_cutoff=60, workers=2), [ rapidfuzz_set.get_fuzzy_scores(i, score_cutoff=60) for i in values ])  # noqa: E501
+        self.assertListEqual(rapidfuzz_set.get_fuzzy_scores_many(values, scorer=Levenshtein.distance, scorer_type=ScorerType.DISTANCE, score_cutoff=4), [ rapidfuzz_set.get_fuzzy_scores(i, scorer=Levenshtein.distance, score_cutoff=4) for i in values ])  # noqa: E501
+        self.assertListEqual(rapidfuzz_set.get_fuzzy_scores_many([]), [])
 
     def test_get_fuzzy_score_iter(self):
         normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
@@ -1,14 +1,26 @@
 
 import operator
 
+from asyncio import run
+from concurrent.futures import ThreadPoolExecutor
 from copy import (
     copy,
     deepcopy
 )
+from itertools import chain
+from pathlib import Path
+from pickle import (
+    dumps as pickle_dumps,
+    loads as pickle_loads
+)
+from rapidfuzz import fuzz
 from rapidfuzz.distance import Levenshtein
+from tempfile import TemporaryDirectory
 from unittest import TestCase
+from unittest.mock import patch
 
 from rapidfuzz_collections import (
+    IndexType,
     Normalizer,
     ScorerType,
     Strategy,
@@ -173,6 +185,357 @@ class TestRapidFuzzTuple(TestCase):
         self.assertEqual(rapidfuzz_tuple.index('test1', 1), 1)
         self.assertEqual(rapidfuzz_tuple.index('test1', 1, 4), 1)
 
+    def test_index_values(self):
+        rapidfuzz_tuple = RapidFuzzTuple([ 'test1', ' test1', 'test2', [ 1, ], 'test1', ], index_values=True)
+
+        self.assertTrue(rapidfuzz_tuple.index_values)
+        self.assertFalse(RapidFuzzTuple().index_values)
+        self.assertTrue(( rapidfuzz_tuple + ( 'test3', ) ).index_values)
+
+        self.assertDictEqual(rapidfuzz_tuple._choice_indexes, { 'test1': [ 0, 1, 4, ], 'test2': [ 2, ], None: [ 3, ], })
+        self.assertDictEqual(rapidfuzz_tuple._value_indexes, { 'test1': [ 0, 4, ], ' test1': [ 1, ], 'test2': [ 2, ], })
+        self.assertTrue([ 1, ] in rapidfuzz_tuple)
+        self.assertFalse([ 2, ] in rapidfuzz_tuple)
+        self.assertEqual(rapidfuzz_tuple.count('test1'), 2)
+        self.assertEqual(rapidfuzz_tuple.index(' test1'), 1)
+        self.assertEqual(rapidfuzz_tuple.index([ 1, ]), 3)
+        self.assertRaises(ValueError, lambda: rapidfuzz_tuple.index('test3'))
+        self.assertEqual(rapidfuzz_tuple.fuzzy_index('TEST2'), 2)
+        self.assertEqual(rapidfuzz_tuple.fuzzy_count('test1', score_cutoff=100), 3)
+
+    def test_copy_without_normalization(self):
+        calls = []
+        normalizer = Normalizer().custom(lambda v, args, kwargs: calls.append(v) or v).strip()
+        rapidfuzz_tuple = RapidFuzzTuple(( 'test1', ' test1', 'test2', ), normalizer=normalizer)
+
+        calls.clear()
+        results = [
+            copy(rapidfuzz_tuple),
+            deepcopy(rapidfuzz_tuple),
+            rapidfuzz_tuple + rapidfuzz_tuple,
+            rapidfuzz_tuple * 2,
+            2 * rapidfuzz_tuple,
+        ]
+        self.assertListEqual(calls, [])
+
+        for result in results:
+            self.assertEqual(result.choices, RapidFuzzTuple(result._data, normalizer=normalizer).choices)
+
+    def test_query_cache(self):
+        calls = []
+        normalizer = Normalizer().custom(lambda v, args, kwargs: calls.append(v) or v).isinstance_str().strip()
+        rapidfuzz_tuple = RapidFuzzTuple(( 'test1', 'test2', ), normalizer=normalizer, query_cache_size=2)
+
+        calls.clear()
+        for _ in range(3):
+            self.assertTrue(rapidfuzz_tuple.fuzzy_contains(' test1 '))
+            self.assertTrue(rapidfuzz_tuple.fuzzy_contains(' test2 '))
+        self.assertListEqual(calls, [ ' test1 ', ' test2 ', ])
+        self.assertEqual(rapidfuzz_tuple.query_cache_info().hits, 4)
+        self.assertEqual(rapidfuzz_tuple.query_cache_info().misses, 2)
+
+        # eviction of the least recently used query
+        rapidfuzz_tuple.fuzzy_contains(' test3 ')
+        rapidfuzz_tuple.fuzzy_contains(' test1 ')
+        self.assertListEqual(calls, [ ' test1 ', ' test2 ', ' test3 ', ' test1 ', ])
+        self.assertEqual(rapidfuzz_tuple.query_cache_info().currsize, 2)
+
+        # unhashable query is not cached
+        self.assertFalse(rapidfuzz_tuple.fuzzy_contains([ 'test1', ]))
+        self.assertEqual(rapidfuzz_tuple.query_cache_info().currsize, 2)
+
+        rapidfuzz_tuple.query_cache_clear()
+        self.assertEqual(rapidfuzz_tuple.query_cache_info().currsize, 0)
+
+        rapidfuzz_tuple.query_cache_size = None
+        self.assertIsNone(rapidfuzz_tuple.query_cache_info())
+
+        with self.assertRaises(ValueError):
+            RapidFuzzTuple(query_cache_size=0)
+
+        with self.assertRaises(TypeError):
+            RapidFuzzTuple(query_cache_size=1.0)
+
+    def test_result_cache(self):
+        rapidfuzz_tuple = RapidFuzzTuple(( 'test1', 'test2', ), result_cache_size=2)
+
+        for _ in range(3):
+            self.assertEqual(rapidfuzz_tuple.fuzzy_get('tst1'), 'test1')
+            self.assertTrue(rapidfuzz_tuple.fuzzy_contains('tst1'))
+        self.assertEqual(rapidfuzz_tuple.result_cache_info(), ( 4, 2, 2, 2, ))
+
+        # other arguments of search are cached separately
+        self.assertIsNone(rapidfuzz_tuple.fuzzy_get('tst1', score_cutoff=99))
+        self.assertEqual(rapidfuzz_tuple.result_cache_info(), ( 4, 3, 2, 2, ))
+
+        rapidfuzz_tuple.result_cache_clear()
+        self.assertEqual(rapidfuzz_tuple.result_cache_info(), ( 0, 0, 2, 0, ))
+
+        rapidfuzz_tuple.result_cache_size = None
+        self.assertIsNone(rapidfuzz_tuple.result_cache_info())
+
+        with self.assertRaises(ValueError):
+            RapidFuzzTuple(result_cache_size=0)
+
+    def test_length_pruning(self):
+        rapidfuzz_tuple = RapidFuzzTuple(
+            [ 'a', 'b', 'test', 'tests', 'longer test', 'the longest test', 'tast', ],
+            scorer=fuzz.ratio,
+            score_cutoff=80
+        )
+
+        # the length index is built on the first scan and selects only lengths 4-7
+        for _ in range(2):
+            self.assertEqual(rapidfuzz_tuple.fuzzy_get('tast1'), 'tast')
+        self.assertEqual(
+            rapidfuzz_tuple._select_choices('tast1', fuzz.ratio, 80, None),
+            [ 'test', 'tests', 'tast', ]
+        )
+
+        # positions of pruned choices are mapped to positions of collection
+        self.assertEqual(rapidfuzz_tuple.fuzzy_index('tast1'), 6)
+        self.assertEqual(rapidfuzz_tuple.get_fuzzy_scores('tast1')[0], ( 'tast', 88.88888888888889, 6, ))
+
+        # unknown length bound of the scorer or its arguments: all choices are scanned
+        self.assertEqual(len(rapidfuzz_tuple._select_choices('tast1', fuzz.WRatio, 80, None)), len(rapidfuzz_tuple._choice_indexes))  # noqa: E501
+        self.assertEqual(len(rapidfuzz_tuple._select_choices('tast1', fuzz.ratio, 80, { 'processor': str.lower, })), len(rapidfuzz_tuple._choice_indexes))  # noqa: E501
+
+        # too many choices can pass score_cutoff: all choices are scanned
+        self.assertEqual(len(rapidfuzz_tuple._select_choices('tast1', fuzz.ratio, 10, None)), len(rapidfuzz_tuple._choice_indexes))  # noqa: E501
+
+    def test_bk_tree(self):
+        rapidfuzz_tuple = RapidFuzzTuple(
+            [ 'kitten', 'sitting', 'mitten', 'bitten', 'smitten', 'written', ],
+            scorer=Levenshtein.distance,
+            scorer_type=ScorerType.DISTANCE,
+            score_cutoff=1,
+            index_type=IndexType.BK_TREE
+        )
+
+        # only choices within the distance are found by the tree
+        self.assertEqual(rapidfuzz_tuple.fuzzy_get('kiten'), 'kitten')
+        self.assertEqual(
+            rapidfuzz_tuple._search_index('mitten', Levenshtein.distance, 1, None),
+            [ 'kitten', 'mitten', 'bitten', 'smitten', ]
+        )
+        self.assertEqual(rapidfuzz_tuple.fuzzy_count('mitten'), 4)
+
+        # other scorers do not use the tree
+        self.assertIsNone(rapidfuzz_tuple._search_index('mitten', fuzz.WRatio, 90, None))
+        self.assertIsNone(rapidfuzz_tuple._search_index('mitten', Levenshtein.distance, 1, { 'weights': ( 1, 1, 2, ), }))  # noqa: E501
+
+        with self.assertRaises(TypeError):
+            RapidFuzzTuple(index_type='bk-tree')
+
+    def test_fuzzy_top_k(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_tuple = RapidFuzzTuple(data_tuple, normalizer=normalizer, score_cutoff=90)
+
+        self.assertListEqual(rapidfuzz_tuple.fuzzy_top_k('Austraia', 5), [ ( 'Australia', 94.11764705882352, 14, ), ( 'Austria', 93.33333333333333, 15, ), ])  # noqa: E501
+        self.assertListEqual(rapidfuzz_tuple.fuzzy_top_k('Gondor', 2, score_cutoff=60), [ ( 'Andorra', 61.53846153846154, 5, ), ( 'Republic of North Macedonia', 60.00000000000001, 143, ), ])  # noqa: E501
+        self.assertEqual(len(rapidfuzz_tuple.fuzzy_top_k('Gondor', 3, score_cutoff=60)), 3)
+        self.assertEqual(len(rapidfuzz_tuple.fuzzy_top_k('Gondor', 100, score_cutoff=60)), 6)
+        self.assertListEqual(rapidfuzz_tuple.fuzzy_top_k('Gondor', 5), [])
+
+        with self.assertRaises(ValueError):
+            rapidfuzz_tuple.fuzzy_top_k('Gondor', 0)
+
+        with self.assertRaises(TypeError):
+            rapidfuzz_tuple.fuzzy_top_k('Gondor', '1')
+
+    def test_dedupe_scoring(self):
+        scored = []
+
+        def scorer(s1, s2, **kwargs):
+            scored.append(s2)
+            return fuzz.ratio(s1, s2, **kwargs)
+
+        rapidfuzz_tuple = RapidFuzzTuple(
+            [ 'Test', 'Best', 'test', 'rest', 'TEST', 'best', ],
+            normalizer=Normalizer().casefold(),
+            scorer=scorer,
+            score_cutoff=70
+        )
+
+        # every unique normalized value is scored once, results are expanded to all positions
+        self.assertEqual(rapidfuzz_tuple._get_unique_choices(), [ 'test', 'best', 'rest', ])
+        self.assertEqual(
+            rapidfuzz_tuple.get_fuzzy_scores('tesst', unscored=False),
+            [ ( 'Test', 88.88888888888889, 0, ), ( 'test', 88.88888888888889, 2, ), ( 'TEST', 88.88888888888889, 4, ), ]  # noqa: E501
+        )
+        self.assertEqual(sorted(scored), [ 'best', 'rest', 'test', ])
+
+        self.assertEqual(
+            rapidfuzz_tuple.get_fuzzy_scores('est', unscored=False),
+            [
+                ( 'Test', 85.71428571428572, 0, ),
+                ( 'Best', 85.71428571428572, 1, ),
+                ( 'test', 85.71428571428572, 2, ),
+                ( 'rest', 85.71428571428572, 3, ),
+                ( 'TEST', 85.71428571428572, 4, ),
+                ( 'best', 85.71428571428572, 5, ),
+            ]
+        )
+        self.assertEqual(list(rapidfuzz_tuple.get_fuzzy_score_iter('bestt')), [ ( 'Best', 88.88888888888889, 1, ), ( 'best', 88.88888888888889, 5, ), ])  # noqa: E501
+
+        # elements with equal normalized values are yielded together while values are scored
+        self.assertEqual(
+            [ index for choice, score, index in rapidfuzz_tuple.get_fuzzy_score_iter('est') ],
+            [ 0, 2, 4, 1, 5, 3, ]
+        )
+        scored.clear()
+        iterator = rapidfuzz_tuple.get_fuzzy_score_iter('est', scorer=scorer)
+        self.assertEqual(next(iterator), ( 'Test', 85.71428571428572, 0, ))
+        self.assertEqual(next(iterator), ( 'test', 85.71428571428572, 2, ))
+        self.assertEqual(scored, [ 'test', ])
+        self.assertEqual(rapidfuzz_tuple.fuzzy_top_k('est', 4), [ ( 'Test', 85.71428571428572, 0, ), ( 'Best', 85.71428571428572, 1, ), ( 'test', 85.71428571428572, 2, ), ( 'rest', 85.71428571428572, 3, ), ])  # noqa: E501
+        self.assertEqual(rapidfuzz_tuple.fuzzy_count('bestt'), 2)
+
+        # the best normalized value has several positions: the first one is found, but it is not the only one
+        self.assertEqual(rapidfuzz_tuple.fuzzy_index('bestt'), 1)
+        self.assertEqual(rapidfuzz_tuple.fuzzy_index('bestt', strategy=Strategy.FIRST), 1)
+        self.assertIsNone(rapidfuzz_tuple.fuzzy_index('bestt', strategy=Strategy.BEST_ONLY_ONE))
+        self.assertEqual(rapidfuzz_tuple.fuzzy_index('restt', strategy=Strategy.BEST_ONLY_ONE), 3)
+
+    def test_workers(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_tuple = RapidFuzzTuple(data_tuple, normalizer=normalizer, score_cutoff=60, workers=2)
+        self.assertEqual(rapidfuzz_tuple.default_workers, 2)
+
+        values = [ 'Ustralia', 'Gondor', 'Austria', ]
+
+        # chunks of choices are scored in parallel threads with the same results
+        with patch('rapidfuzz_collections.base.PARALLEL_MIN_CHOICES', 1):
+            for value in values:
+                for strategy in Strategy:
+                    self.assertEqual(rapidfuzz_tuple.fuzzy_get(value, strategy=strategy), rapidfuzz_tuple.fuzzy_get(value, strategy=strategy, workers=1))  # noqa: E501
+                self.assertListEqual(rapidfuzz_tuple.get_fuzzy_scores(value), rapidfuzz_tuple.get_fuzzy_scores(value, workers=1))  # noqa: E501
+            self.assertListEqual(rapidfuzz_tuple.fuzzy_get_many(values), rapidfuzz_tuple.fuzzy_get_many(values, workers=1))
+
+        with self.assertRaises(ValueError):
+            rapidfuzz_tuple.default_workers = 0
+
+        with self.assertRaises(TypeError):
+            RapidFuzzTuple(workers='2')
+
+    def test_async(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_tuple = RapidFuzzTuple(data_tuple, normalizer=normalizer, score_cutoff=90)
+
+        async def main():
+            self.assertTrue(await rapidfuzz_tuple.afuzzy_contains('Ustralia'))
+            self.assertFalse(await rapidfuzz_tuple.afuzzy_contains('Gondor'))
+            self.assertEqual(await rapidfuzz_tuple.afuzzy_get('Ustralia'), rapidfuzz_tuple.fuzzy_get('Ustralia'))
+            self.assertListEqual(await rapidfuzz_tuple.afuzzy_top_k('Austraia', 2), rapidfuzz_tuple.fuzzy_top_k('Austraia', 2))
+            self.assertListEqual(await rapidfuzz_tuple.aget_fuzzy_scores('Austraia'), rapidfuzz_tuple.get_fuzzy_scores('Austraia'))
+            self.assertListEqual(await rapidfuzz_tuple.afuzzy_get_many([ 'Ustralia', 'Gondor', ]), rapidfuzz_tuple.fuzzy_get_many([ 'Ustralia', 'Gondor', ]))  # noqa: E501
+            self.assertListEqual(await rapidfuzz_tuple.aget_fuzzy_scores_many([ 'Austraia', ]), rapidfuzz_tuple.get_fuzzy_scores_many([ 'Austraia', ]))  # noqa: E501
+            self.assertEqual(await rapidfuzz_tuple.afuzzy_index('Ustralia'), rapidfuzz_tuple.fuzzy_index('Ustralia'))
+            self.assertEqual(await rapidfuzz_tuple.afuzzy_count('Austraia'), rapidfuzz_tuple.fuzzy_count('Austraia'))
+
+            # results are yielded by chunks
+            chunks = [ chunk async for chunk in rapidfuzz_tuple.aget_fuzzy_score_iter('Austraia', chunk_size=100) ]
+            self.assertTrue(all(0 < len(chunk) <= 100 for chunk in chunks))
+            self.assertListEqual(list(chain.from_iterable(chunks)), list(rapidfuzz_tuple.get_fuzzy_score_iter('Austraia')))
+
+            # iteration can be stopped before the end
+            iterator = rapidfuzz_tuple.aget_fuzzy_score_iter('Austraia', chunk_size=1)
+            self.assertEqual(len(await anext(iterator)), 1)
+            await iterator.aclose()
+
+            with ThreadPoolExecutor(2) as executor:
+                self.assertEqual(await rapidfuzz_tuple.afuzzy_get('Ustralia', executor=executor), rapidfuzz_tuple.fuzzy_get('Ustralia'))
+                rapidfuzz_tuple.default_executor = executor
+                self.assertIs(rapidfuzz_tuple.default_executor, executor)
+                self.assertEqual(await rapidfuzz_tuple.afuzzy_get('Ustralia'), rapidfuzz_tuple.fuzzy_get('Ustralia'))
+                rapidfuzz_tuple.default_executor = None
+
+            with self.assertRaises(TypeError):
+                await rapidfuzz_tuple.afuzzy_get('Ustralia', executor=2)
+
+            with self.assertRaises(ValueError):
+                await anext(rapidfuzz_tuple.aget_fuzzy_score_iter('Austraia', chunk_size=0))
+
+        run(main())
+
+        with self.assertRaises(TypeError):
+            RapidFuzzTuple(executor=2)
+
+    def test_save_load(self):
+        calls = []
+
+        def normalize(value, *args, **kwargs):
+            calls.append(value)
+            return value
+
+        normalizer = Normalizer().custom(normalize).isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_tuple = RapidFuzzTuple(data_tuple, normalizer=normalizer, score_cutoff=90)
+
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'collection.rfc'
+            rapidfuzz_tuple.save(path)
+
+            calls.clear()
+            loaded = RapidFuzzTuple.load(path, normalizer=normalizer, score_cutoff=90)
+            self.assertListEqual(calls, [])
+            self.assertEqual(loaded, rapidfuzz_tuple)
+            self.assertEqual(loaded.default_score_cutoff, 90)
+            self.assertEqual(loaded.fuzzy_get('Ustralia'), rapidfuzz_tuple.fuzzy_get('Ustralia'))
+            self.assertListEqual(loaded.get_fuzzy_scores('Austraia'), rapidfuzz_tuple.get_fuzzy_scores('Austraia'))
+
+            # the normalizer and the scorer must be the same
+            with self.assertRaises(ValueError):
+                RapidFuzzTuple.load(path, normalizer=Normalizer().custom(normalize).isinstance_str().strip().min_length(3))
+            with self.assertRaises(ValueError):
+                RapidFuzzTuple.load(path, normalizer=normalizer, scorer=fuzz.ratio)
+
+            path.write_bytes(b'test')
+            with self.assertRaises(ValueError):
+                RapidFuzzTuple.load(path, normalizer=normalizer)
+
+    def test_pickle(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().re_sub(r'\s+', ' ').min_length(3)
+        rapidfuzz_tuple = RapidFuzzTuple(data_tuple, normalizer=normalizer, score_cutoff=90, workers=2, index_values=True)
+
+        # the normalizer is not called by unpickling
+        with patch.object(Normalizer, 'compile', side_effect=AssertionError):
+            loaded = pickle_loads(pickle_dumps(rapidfuzz_tuple))
+        self.assertEqual(loaded, rapidfuzz_tuple)
+        self.assertEqual(loaded.normalizer.fingerprint(), normalizer.fingerprint())
+        self.assertEqual(loaded.default_score_cutoff, 90)
+        self.assertEqual(loaded.default_workers, 2)
+        self.assertEqual(loaded.fuzzy_get('Ustralia'), rapidfuzz_tuple.fuzzy_get('Ustralia'))
+        self.assertListEqual(loaded.get_fuzzy_scores('Austraia'), rapidfuzz_tuple.get_fuzzy_scores('Austraia'))
+        self.assertTrue(loaded.index_values)
+
+        # scorers of `rapidfuzz.distance` are pickled by names
+        rapidfuzz_tuple = RapidFuzzTuple(data_tuple, scorer=Levenshtein.distance, scorer_type=ScorerType.DISTANCE, score_cutoff=2)
+        loaded = pickle_loads(pickle_dumps(rapidfuzz_tuple))
+        self.assertIs(loaded.default_scorer, Levenshtein.distance)
+        self.assertEqual(loaded.fuzzy_get('Ustralia'), rapidfuzz_tuple.fuzzy_get('Ustralia'))
+
+    def test_bulk_normalization(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().re_sub(r'\s+', ' ').min_length(3)
+        expected = RapidFuzzTuple(data_tuple, normalizer=normalizer)
+        size = len(expected)
+
+        progress = []
+        with (
+            patch('rapidfuzz_collections.base.PARALLEL_NORMALIZE_MIN_VALUES', 1),
+            patch('rapidfuzz_collections.base.NORMALIZE_CHUNK_SIZE', 16)
+        ):
+            # chunks of values are normalized in processes with the same groups of choices
+            rapidfuzz_tuple = RapidFuzzTuple(data_tuple, normalizer=normalizer, workers=2, progress=lambda done, total: progress.append(( done, total, )))  # noqa: E501
+            self.assertEqual(rapidfuzz_tuple._choices, expected._choices)
+            self.assertEqual(progress[0], ( 16, size, ))
+            self.assertEqual(progress[-1], ( size, size, ))
+
+            # threads on free-threaded builds
+            with patch('rapidfuzz_collections.base._is_gil_enabled', return_value=False):
+                rapidfuzz_tuple.normalizer = Normalizer().isinstance_str().strip().min_length(3)
+                expected.normalizer = Normalizer().isinstance_str().strip().min_length(3)
+                self.assertEqual(rapidfuzz_tuple._choices, expected._choices)
+
     def test_fuzzy_contains(self):
         normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
         rapidfuzz_tuple = RapidFuzzTuple(data_tuple, normalizer=normalizer, score_cutoff=90)
@@ -236,6 +599,23 @@ class TestRapidFuzzTuple(TestCase):
         self.assertIsNone(rapidfuzz_tuple.fuzzy_get('Gondor', strategy=Strategy.BEST_ONLY_ONE, score_cutoff=60))
         self.assertEqual(rapidfuzz_tuple.fuzzy_get('Gondor', strategy=Strategy.FIRST, score_cutoff=60), 'Andorra')  # noqa: E501
 
+    def test_fuzzy_get_many(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_tuple = RapidFuzzTuple(data_tuple, normalizer=normalizer, score_cutoff=90)
+
+        values = [ 'Australia', '   aUstraLia  ', 'Austraia', 'Ustralia', 'Austria', 'Gondor', 'Ustralia', None, ]
+
+        self.assertListEqual(rapidfuzz_tuple.fuzzy_get_many([ 'Ustralia', 'Gondor', ]), [ 'Australia', None, ])
+        self.assertListEqual(rapidfuzz_tuple.fuzzy_get_many([]), [])
+
+        for strategy in Strategy:
+            self.assertListEqual(rapidfuzz_tuple.fuzzy_get_many(values, strategy=strategy), [ rapidfuzz_tuple.fuzzy_get(i, strategy=strategy) for i in values ])  # noqa: E501
+            self.assertListEqual(rapidfuzz_tuple.fuzzy_get_many(values, strategy=strategy, score_cutoff=60, workers=-1), [ rapidfuzz_tuple.fuzzy_get(i, strategy=strategy, score_cutoff=60) for i in values ])  # noqa: E501
+            self.assertListEqual(rapidfuzz_tuple.fuzzy_get_many(values, strategy=strategy, scorer=Levenshtein.distance, scorer_type=ScorerType.DISTANCE, score_cutoff=4), [ rapidfuzz_tuple.fuzzy_get(i, strategy=strategy, scorer=Levenshtein.distance, scorer_type=ScorerType.DISTANCE, score_cutoff=4) for i in values ])  # noqa: E501
+
+        self.assertRaises(ValueError, lambda: rapidfuzz_tuple.fuzzy_get_many(values, workers=0))
+        self.assertRaises(TypeError, lambda: rapidfuzz_tuple.fuzzy_get_many(values, workers=1.0))
+
     def test_fuzzy_index(self):
         normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
         rapidfuzz_tuple = RapidFuzzTuple(data_tuple, normalizer=normalizer, score_cutoff=90)
@@ -277,6 +657,18 @@ class TestRapidFuzzTuple(TestCase):
         self.assertTupleEqual(tuple(filter(_check, rapidfuzz_tuple.get_fuzzy_scores('Austria'))), ( ('Austria', 100.0, 15, ), ))  # noqa: E501
         self.assertTupleEqual(tuple(filter(_check, rapidfuzz_tuple.get_fuzzy_scores('Gondor'))), tuple())
         self.assertTupleEqual(tuple(filter(_check, rapidfuzz_tuple.get_fuzzy_scores('Gondor', score_cutoff=60))), ( ( 'Andorra', 61.53846153846154, 5, ), ( 'Republic of North Macedonia', 60.00000000000001, 143, ), ( 'Northern Mariana Islands', 60.00000000000001, 149, ), ( 'Norfolk Island', 60.00000000000001, 161, ), ( 'El Salvador', 60.00000000000001, 200, ), ( 'Togo', 60.00000000000001, 217, ), ))  # noqa: E501
+        self.assertListEqual(rapidfuzz_tuple.get_fuzzy_scores('Austraia', unscored=False), [ ( 'Australia', 94.11764705882352, 14, ), ( 'Austria', 93.33333333333333, 15, ), ])  # noqa: E501
+
+    def test_get_fuzzy_scores_many(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        rapidfuzz_tuple = RapidFuzzTuple(data_tuple, normalizer=normalizer, score_cutoff=90)
+
+        values = [ 'Australia', '   aUstraLia  ', 'Austraia', 'Gondor', 'Austraia', None, ]
+
+        self.assertListEqual(rapidfuzz_tuple.get_fuzzy_scores_many(values), [ rapidfuzz_tuple.get_fuzzy_scores(i) for i in values ])  # noqa: E501
+        self.assertListEqual(rapidfuzz_tuple.get_fuzzy_scores_many(values, score_cutoff=60, workers=2), [ rapidfuzz_tuple.get_fuzzy_scores(i, score_cutoff=60) for i in values ])  # noqa: E501
+        self.assertListEqual(rapidfuzz_tuple.get_fuzzy_scores_many(values, scorer=Levenshtein.distance, scorer_type=ScorerType.DISTANCE, score_cutoff=4), [ rapidfuzz_tuple.get_fuzzy_scores(i, scorer=Levenshtein.distance, score_cutoff=4) for i in values ])  # noqa: E501
+        self.assertListEqual(rapidfuzz_tuple.get_fuzzy_scores_many([]), [])
 
     def test_get_fuzzy_score_iter(self):
         normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
@@ -0,0 +1,170 @@
+from rapidfuzz import fuzz
+from rapidfuzz.distance import Levenshtein
+from sys import (
+    getswitchinterval,
+    setswitchinterval
+)
+from threading import Thread
+from unittest import TestCase
+
+from rapidfuzz_collections import (
+    IndexType,
+    Normalizer,
+    RapidFuzzDict,
+    RapidFuzzFrozenSet,
+    RapidFuzzList,
+    SnapshotCollection
+)
+
+from data import (
+    data_dict,
+    data_tuple
+)
+
+
+class TestSnapshotCollection(TestCase):
+
+    def test_init(self):
+        rapidfuzz_dict = RapidFuzzDict(data_dict)
+        collection = SnapshotCollection(rapidfuzz_dict)
+
+        self.assertIs(collection.snapshot, rapidfuzz_dict)
+        self.assertEqual(len(collection), len(data_dict))
+        self.assertIn('Australia', collection)
+        self.assertListEqual(list(collection), list(data_dict))
+        self.assertEqual(repr(collection), f"SnapshotCollection({rapidfuzz_dict!r})")
+
+        with self.assertRaises(TypeError):
+            SnapshotCollection(dict(data_dict))
+
+        with self.assertRaises(AttributeError):
+            collection.clear()
+
+    def test_write(self):
+        normalizer = Normalizer().isinstance_str().strip().casefold().min_length(3)
+        collection = SnapshotCollection(RapidFuzzDict(data_dict, normalizer=normalizer, score_cutoff=90))
+        snapshot = collection.snapshot
+        iterator = collection.get_fuzzy_score_iter('Austraia')
+
+        with collection.write() as draft:
+            draft['Gondor'] = 'GND'
+            del draft['Australia']
+            # readers see the old snapshot until the end of changes
+            self.assertIs(collection.snapshot, snapshot)
+            self.assertEqual(collection.fuzzy_get('Ustralia'), ( 'Australia', 'AUS', ))
+
+        self.assertIsNot(collection.snapshot, snapshot)
+        self.assertEqual(collection.fuzzy_get('Gondr'), ( 'Gondor', 'GND', ))
+        self.assertIsNone(collection.fuzzy_get('Ustralia'))
+        self.assertEqual(collection.snapshot.default_score_cutoff, 90)
+
+        # the old snapshot is not changed
+        self.assertNotIn('Gondor', snapshot)
+        self.assertListEqual(list(iterator), list(snapshot.get_fuzzy_score_iter('Austraia')))
+        self.assertIn('Australia', [ key for value, score, key in snapshot.get_fuzzy_score_iter('Austraia') ])  # noqa: E501
+
+        # changes are discarded on error
+        with self.assertRaises(KeyError):
+            with collection.write() as draft:
+                draft['Mordor'] = 'MRD'
+                del draft['Australia']
+        self.assertNotIn('Mordor', collection)
+
+    def test_publish(self):
+        collection = SnapshotCollection(RapidFuzzFrozenSet(data_tuple))
+        snapshot = collection.snapshot | RapidFuzzFrozenSet([ 'Gondor', ])
+        collection.publish(snapshot)
+        self.assertIs(collection.snapshot, snapshot)
+        self.assertTrue(collection.fuzzy_contains('Gondr'))
+
+        with self.assertRaises(TypeError):
+            collection.publish(frozenset(data_tuple))
+
+    def test_concurrent_access(self):
+        collection = SnapshotCollection(RapidFuzzList(data_tuple, score_cutoff=80))
+        errors = []
+
+        def read():
+            try:
+                for _ in range(20):
+                    for value, score, index in collection.get_fuzzy_score_iter('Austraia'):
+                        pass
+                    collection.fuzzy_get('Austraia')
+            except Exception as e:
+                errors.append(e)
+
+        def write():
+            try:
+                for i in range(20):
+                    with collection.write() as draft:
+                        draft.append(f'Austraia {i}')
+                        draft.pop(0)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [ Thread(target=read) for _ in range(4) ] + [ Thread(target=write) for _ in range(2) ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertListEqual(errors, [])
+        self.assertEqual(len(collection), len(data_tuple))
+
+    def test_readers_do_not_change_snapshots(self):
+        collection = SnapshotCollection(RapidFuzzDict(
+            data_dict,
+            scorer=Levenshtein.distance,
+            scorer_kwargs=None,
+            score_cutoff=2,
+            index_type=IndexType.BK_TREE,
+            qgram_size=3,
+            result_cache_size=16
+        ))
+        errors = []
+        snapshots = []
+        values = [ 'Austraia', 'Ustralia', 'Gondor', 'Republic of Korea', 'Germany', ]
+
+        def read():
+            try:
+                for i in range(200):
+                    value = values[i % len(values)]
+                    collection.fuzzy_get(value)
+                    collection.fuzzy_get(value, scorer=fuzz.ratio, score_cutoff=80)
+                    collection.fuzzy_get(value, scorer=Levenshtein.normalized_similarity, score_cutoff=0.8)
+                    collection.get_fuzzy_scores(value, scorer=Levenshtein.distance, score_cutoff=3)
+            except Exception as e:
+                errors.append(e)
+
+        def write(name):
+            try:
+                for i in range(50):
+                    with collection.write() as draft:
+                        draft[f'{name} {i}'] = i
+                    snapshots.append(collection.snapshot)
+            except Exception as e:
+                errors.append(e)
+
+        interval = getswitchinterval()
+        setswitchinterval(1e-6)
+        try:
+            threads = [ Thread(target=read) for _ in range(8) ]
+            threads += [ Thread(target=write, args=( name, )) for name in ( 'Gondor', 'Rohan', ) ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            setswitchinterval(interval)
+
+        self.assertListEqual(errors, [])
+        self.assertEqual(len(collection), len(data_dict) + 100)
+
+        # indexes are built before publishing and caches are not filled by readers
+        for snapshot in snapshots:
+            self.assertIsNotNone(snapshot._index)
+            self.assertIsNotNone(snapshot._qgram_index)
+            self.assertIsNotNone(snapshot._length_index)
+            self.assertEqual(len(snapshot._result_cache), 0)
+            self.assertEqual(len(snapshot._length_index._selections), 0)
+        self.assertEqual(collection.fuzzy_get('Gondor 7'), ( 'Gondor 7', 7, ))